@@ -10,45 +10,87 @@ analyze_ai_patterns.py file.
 Version: 5.0.0 (Breaking Changes - Deprecated Dimension Removal)
 """
 
-# Core analyzer and result classes
-from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
-from ai_pattern_analyzer.core.results import (
-    AnalysisResults,
-    DetailedAnalysis,
-    # Optional: individual issue types for detailed analysis
-    VocabInstance,
-    HeadingIssue,
-    UniformParagraph,
-    EmDashInstance,
-    TransitionInstance,
-    SentenceBurstinessIssue,
-    SyntacticIssue,
-    FormattingIssue,
-    HighPredictabilitySegment
-)
+import importlib
+from typing import TYPE_CHECKING
 
-# Scoring system
-from ai_pattern_analyzer.scoring.dual_score import (
-    DualScore,
-    ScoreCategory,
-    ScoreDimension,
-    ImprovementAction,
-    THRESHOLDS
-)
-from ai_pattern_analyzer.scoring.dual_score_calculator import calculate_dual_score
+# Public names resolved lazily on first attribute access (PEP 562), so
+# `import ai_pattern_analyzer` and CLI startup stay cheap. Heavy ML libraries
+# (torch, transformers, spacy, textacy, scipy, nltk) are only imported by the
+# dimension modules that DimensionLoader loads for the selected profile.
+_LAZY_EXPORTS = {
+    # Core analyzer and result classes
+    'AIPatternAnalyzer': 'ai_pattern_analyzer.core.analyzer',
+    'AnalysisResults': 'ai_pattern_analyzer.core.results',
+    'DetailedAnalysis': 'ai_pattern_analyzer.core.results',
+    'VocabInstance': 'ai_pattern_analyzer.core.results',
+    'HeadingIssue': 'ai_pattern_analyzer.core.results',
+    'UniformParagraph': 'ai_pattern_analyzer.core.results',
+    'EmDashInstance': 'ai_pattern_analyzer.core.results',
+    'TransitionInstance': 'ai_pattern_analyzer.core.results',
+    'SentenceBurstinessIssue': 'ai_pattern_analyzer.core.results',
+    'SyntacticIssue': 'ai_pattern_analyzer.core.results',
+    'FormattingIssue': 'ai_pattern_analyzer.core.results',
+    'HighPredictabilitySegment': 'ai_pattern_analyzer.core.results',
+    # Scoring system
+    'DualScore': 'ai_pattern_analyzer.scoring.dual_score',
+    'ScoreCategory': 'ai_pattern_analyzer.scoring.dual_score',
+    'ScoreDimension': 'ai_pattern_analyzer.scoring.dual_score',
+    'ImprovementAction': 'ai_pattern_analyzer.scoring.dual_score',
+    'THRESHOLDS': 'ai_pattern_analyzer.scoring.dual_score',
+    'calculate_dual_score': 'ai_pattern_analyzer.scoring.dual_score_calculator',
+    # History tracking
+    'HistoricalScore': 'ai_pattern_analyzer.history.tracker',
+    'ScoreHistory': 'ai_pattern_analyzer.history.tracker',
+    # CLI formatters
+    'format_report': 'ai_pattern_analyzer.cli.formatters',
+    'format_detailed_report': 'ai_pattern_analyzer.cli.formatters',
+    'format_dual_score_report': 'ai_pattern_analyzer.cli.formatters',
+}
 
-# History tracking
-from ai_pattern_analyzer.history.tracker import (
-    HistoricalScore,
-    ScoreHistory
-)
+if TYPE_CHECKING:
+    from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+    from ai_pattern_analyzer.core.results import (
+        AnalysisResults,
+        DetailedAnalysis,
+        VocabInstance,
+        HeadingIssue,
+        UniformParagraph,
+        EmDashInstance,
+        TransitionInstance,
+        SentenceBurstinessIssue,
+        SyntacticIssue,
+        FormattingIssue,
+        HighPredictabilitySegment
+    )
+    from ai_pattern_analyzer.scoring.dual_score import (
+        DualScore,
+        ScoreCategory,
+        ScoreDimension,
+        ImprovementAction,
+        THRESHOLDS
+    )
+    from ai_pattern_analyzer.scoring.dual_score_calculator import calculate_dual_score
+    from ai_pattern_analyzer.history.tracker import HistoricalScore, ScoreHistory
+    from ai_pattern_analyzer.cli.formatters import (
+        format_report,
+        format_detailed_report,
+        format_dual_score_report
+    )
+
+
+def __getattr__(name):
+    """Import public names on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# CLI formatters
-from ai_pattern_analyzer.cli.formatters import (
-    format_report,
-    format_detailed_report,
-    format_dual_score_report
-)
 
 __all__ = [
     # Core
@@ -0,0 +1,165 @@
+"""
+Scaling benchmark command (`ai-pattern-benchmark`).
+
+Usage:
+    ai-pattern-benchmark run [OPTIONS]
+    ai-pattern-benchmark compare BASELINE CURRENT [--tolerance F]
+    ai-pattern-benchmark memory [--chapters N] [--words N] [--profile P] [--mode M]
+
+See core/benchmark.py for what is measured and how runs are compared.
+"""
+
+import sys
+
+import click
+
+from ai_pattern_analyzer.core.benchmark import (
+    DEFAULT_BOOK_CHAPTERS,
+    DEFAULT_CHAPTER_WORDS,
+    DEFAULT_MODES,
+    DEFAULT_PROFILES,
+    DEFAULT_SIZES,
+    DEFAULT_TOLERANCE,
+    compare,
+    format_comparison,
+    format_memory_report,
+    format_report,
+    has_regressions,
+    load_report,
+    measure_results_memory,
+    run_benchmarks,
+    save_report,
+)
+
+
+def _int_list(ctx, param, value):
+    """Parse a comma-separated list of word counts."""
+    try:
+        sizes = [int(part.replace('_', '')) for part in value.split(',') if part.strip()]
+    except ValueError:
+        raise click.BadParameter('expected comma-separated word counts, e.g. 1000,10000')
+    if not sizes or min(sizes) <= 0:
+        raise click.BadParameter('word counts must be positive')
+    return sizes
+
+
+def _choice_list(choices):
+    """Click callback parsing a comma-separated subset of choices."""
+    def parse(ctx, param, value):
+        items = [part.strip() for part in value.split(',') if part.strip()]
+        unknown = [item for item in items if item not in choices]
+        if unknown or not items:
+            raise click.BadParameter(f"choose from {', '.join(choices)}")
+        return items
+    return parse
+
+
+@click.group(context_settings=dict(help_option_names=['-h', '--help']))
+def main():
+    """Measure how dimensions and the analysis pipeline scale with document size, and result memory."""
+
+
+@main.command()
+@click.option('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES), callback=_int_list,
+              show_default=True, help='Document sizes in words (comma-separated)')
+@click.option('--profiles', default=','.join(DEFAULT_PROFILES), show_default=True,
+              callback=_choice_list(('fast', 'balanced', 'full')),
+              help='Dimension profiles for pipeline series (comma-separated)')
+@click.option('--modes', default=','.join(DEFAULT_MODES), show_default=True,
+              callback=_choice_list(('fast', 'adaptive', 'sampling', 'full')),
+              help='Analysis modes (comma-separated)')
+@click.option('--repeat', type=click.IntRange(1, 20), default=1, show_default=True,
+              help='Runs per measurement; the best time is kept')
+@click.option('--source', type=click.Path(exists=True, dir_okay=False), default=None, metavar='FILE',
+              help='Repeat this markdown file to each size instead of generating documents')
+@click.option('--pipeline-only', is_flag=True, help='Skip per-dimension series')
+@click.option('--output', '-o', type=click.Path(dir_okay=False, writable=True), default=None,
+              metavar='FILE', help='Save the report as JSON (e.g. a new baseline)')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), default=None, metavar='FILE',
+              help='Compare against this report; exit 1 on regressions')
+@click.option('--tolerance', type=click.FloatRange(min=0.0), default=DEFAULT_TOLERANCE, show_default=True,
+              help='Relative slowdown per size treated as a regression')
+def run(sizes, profiles, modes, repeat, source, pipeline_only, output, baseline, tolerance):
+    """Run the scaling benchmarks.
+
+    Examples:
+
+      # Quick check of the fast profile
+      ai-pattern-benchmark run --sizes 1000,10000,100000 --profiles fast --modes full
+
+      # Record a baseline, then check a change against it
+      ai-pattern-benchmark run -o benchmark-baseline.json
+      ai-pattern-benchmark run --baseline benchmark-baseline.json
+    """
+    text = None
+    if source:
+        with open(source, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+    # Progress on stderr; the tables go to stdout
+    report = run_benchmarks(
+        sizes=sizes, profiles=profiles, modes=modes, repeat=repeat, source=text,
+        dimensions=not pipeline_only, progress=lambda line: click.echo(line, err=True)
+    )
+    click.echo(format_report(report))
+
+    if output:
+        save_report(report, output)
+        click.echo(f"\nBenchmark report written to {output}", err=True)
+
+    if baseline:
+        rows = compare(_load(baseline), report, tolerance)
+        click.echo()
+        click.echo(format_comparison(rows))
+        if has_regressions(rows):
+            sys.exit(1)
+
+
+@main.command(name='compare')
+@click.argument('baseline', type=click.Path(exists=True, dir_okay=False))
+@click.argument('current', type=click.Path(exists=True, dir_okay=False))
+@click.option('--tolerance', type=click.FloatRange(min=0.0), default=DEFAULT_TOLERANCE, show_default=True,
+              help='Relative slowdown per size treated as a regression')
+def compare_command(baseline, current, tolerance):
+    """Print a comparison table of two saved reports; exit 1 on regressions."""
+    rows = compare(_load(baseline), _load(current), tolerance)
+    click.echo(format_comparison(rows))
+    if has_regressions(rows):
+        sys.exit(1)
+
+
+@main.command()
+@click.option('--chapters', type=click.IntRange(1, 1000), default=DEFAULT_BOOK_CHAPTERS, show_default=True,
+              help='Documents in the batch')
+@click.option('--words', type=click.IntRange(100), default=DEFAULT_CHAPTER_WORDS, show_default=True,
+              help='Words per document')
+@click.option('--profile', type=click.Choice(['fast', 'balanced', 'full']), default='fast', show_default=True,
+              help='Dimension profile')
+@click.option('--mode', type=click.Choice(['fast', 'adaptive', 'sampling', 'full']), default='full',
+              show_default=True, help='Analysis mode')
+def memory(chapters, words, profile, mode):
+    """Compare the memory of a batch of results: compact vs plain lists and dicts.
+
+    Examples:
+
+      # A 100k-word book in 20 chapters
+      ai-pattern-benchmark memory
+
+      # A 1M-word batch
+      ai-pattern-benchmark memory --chapters 100 --words 10000
+    """
+    report = measure_results_memory(chapters=chapters, words=words, profile=profile, mode=mode,
+                                    progress=lambda line: click.echo(line, err=True))
+    click.echo(format_memory_report(report))
+
+
+def _load(path):
+    """Load a report, turning format errors into a usage error."""
+    try:
+        return load_report(path)
+    except (ValueError, OSError) as e:
+        raise click.UsageError(str(e))
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,7 @@ Formats analysis results for display:
 - TSV output (for spreadsheet import)
 - Detailed reports with line numbers and suggestions
 - Dual score reports with optimization paths
+- Batch timing summaries
 
 Extracted from analyze_ai_patterns.py (lines 5886-6887)
 """
@@ -14,8 +15,10 @@ Extracted from analyze_ai_patterns.py (lines 5886-6887)
 import json
 import sys
 from dataclasses import asdict
-from typing import Optional
+from typing import List, Optional
 
+from ai_pattern_analyzer.core.batch import BatchFileResult
+from ai_pattern_analyzer.core.compact import json_default
 from ai_pattern_analyzer.core.results import (
     AnalysisResults,
     DetailedAnalysis,
@@ -23,9 +26,6 @@ from ai_pattern_analyzer.core.results import (
 from ai_pattern_analyzer.scoring.dual_score import DualScore
 from ai_pattern_analyzer.history.tracker import ScoreHistory
 
-# Required dependency
-import textstat
-
 
 def format_dual_score_report(dual_score: DualScore, history: Optional[ScoreHistory] = None,
                              output_format: str = 'text', as_detailed_section: bool = False,
@@ -651,11 +651,12 @@ def format_report(results: AnalysisResults,
     """
 
     if output_format == 'json':
-        data = asdict(results)
+        # Serialize the stored values directly (no asdict() deep copy)
+        data = results.to_dict(shallow=True)
         # Include mode if provided
         if mode:
             data['analysis_mode'] = mode
-        return json.dumps(data, indent=2)
+        return json.dumps(data, indent=2, default=json_default)
 
     elif output_format == 'tsv':
         # TSV header and row
@@ -1571,3 +1572,38 @@ Use --scores-detailed for complete breakdown and optimization path.
 
 {'=' * 80}
 """
+
+
+def format_batch_summary(outcomes: List[BatchFileResult], elapsed_seconds: float, jobs: int) -> str:
+    """
+    Format per-file timings and throughput for a batch run.
+
+    Args:
+        outcomes: Batch results in input order
+        elapsed_seconds: Wall time of the whole batch
+        jobs: Worker processes used
+    """
+    from pathlib import Path
+
+    succeeded = sum(1 for outcome in outcomes if outcome.ok)
+    files_per_min = len(outcomes) / elapsed_seconds * 60 if elapsed_seconds > 0 else 0.0
+    name_width = max((len(Path(o.file_path).name) for o in outcomes), default=0)
+
+    lines = [
+        f"Completed {succeeded} of {len(outcomes)} files in {elapsed_seconds:.1f}s "
+        f"({files_per_min:.1f} files/min, {jobs} job{'s' if jobs != 1 else ''})",
+        "",
+        "Per-file timings:",
+    ]
+    for outcome in outcomes:
+        status = "" if outcome.ok else f"  FAILED: {outcome.error}"
+        lines.append(f"  {Path(outcome.file_path).name:<{name_width}}  {outcome.elapsed_seconds:7.2f}s{status}")
+
+    if outcomes:
+        slowest = max(outcomes, key=lambda outcome: outcome.elapsed_seconds)
+        total_file_time = sum(outcome.elapsed_seconds for outcome in outcomes)
+        lines.append("")
+        lines.append(f"Slowest: {Path(slowest.file_path).name} ({slowest.elapsed_seconds:.2f}s); "
+                     f"summed file time {total_file_time:.1f}s")
+
+    return '\n'.join(lines)
@@ -7,6 +7,11 @@ After installation, it's accessible via the `analyze-ai-patterns` command.
 Usage:
     analyze-ai-patterns FILE [OPTIONS]
     analyze-ai-patterns --batch DIR [OPTIONS]
+    analyze-ai-patterns serve [OPTIONS]
+
+While an analysis daemon (`analyze-ai-patterns serve`, cli/serve.py) runs,
+single-file and batch analyses are forwarded to it; --no-daemon analyzes in
+this process.
 
 Extension Points:
     - Refactored from argparse to Click for better UX (Story 1.4.10)
@@ -16,15 +21,21 @@ Extension Points:
 
 import sys
 import os
+import time
 from pathlib import Path
 import click
 
 from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.batch import analyze_files, resolve_jobs
+from ai_pattern_analyzer.core.daemon import DaemonUnavailable, find_daemon
+from ai_pattern_analyzer.core.profiler import StageProfiler
+from ai_pattern_analyzer.core.result_cache import DEFAULT_CACHE_DIR
 from ai_pattern_analyzer.cli.formatters import (
     format_report,
     format_detailed_report,
-    format_dual_score_report
+    format_dual_score_report,
+    format_batch_summary
 )
 
 
@@ -82,7 +93,8 @@ def show_mode_help():
 │ Use When: Specific requirements, testing, research                      │
 │ Options:  --samples N (1-20, default: 5)                                │
 │           --sample-size CHARS (500-10000, default: 2000)                │
-│           --sample-strategy even|weighted|adaptive (default: even)      │
+│           --sample-strategy even|weighted|adaptive|convergent           │
+│           --sample-ci WIDTH (convergent: target CI, default: 0.1)       │
 │                                                                           │
 │ Example:  analyze-ai-patterns chapter.md --mode sampling \\              │
 │             --samples 7 --sample-size 3000 --sample-strategy weighted   │
@@ -99,6 +111,16 @@ def show_mode_help():
 │ Example:  analyze-ai-patterns chapter.md --mode full                    │
 └─────────────────────────────────────────────────────────────────────────┘
 
+┌─────────────────────────────────────────────────────────────────────────┐
+│ STREAMING MODE - Whole Books, Flat Memory                                │
+├─────────────────────────────────────────────────────────────────────────┤
+│ Speed:    Linear in document length, progress printed per chunk         │
+│ Coverage: 100% of document, read in 64k-character chunks                │
+│ Use When: Anthologies and book builds, CI logs                          │
+│                                                                           │
+│ Example:  analyze-ai-patterns book.md --mode streaming                  │
+└─────────────────────────────────────────────────────────────────────────┘
+
 ╔═══════════════════════════════════════════════════════════════════════════╗
 ║                         PERFORMANCE COMPARISON                            ║
 ╚═══════════════════════════════════════════════════════════════════════════╝
@@ -112,6 +134,7 @@ For a 90-page chapter (~180,000 characters):
 │ ADAPTIVE     │  30-240s    │   10-20%   │ Book chapters (RECOMMENDED) │
 │ SAMPLING     │  60-300s    │  Custom    │ Custom requirements         │
 │ FULL         │ 5-20 min    │   100%     │ Final validation            │
+│ STREAMING    │ 5-20 min    │   100%     │ Books, flat memory          │
 └──────────────┴─────────────┴────────────┴─────────────────────────────┘
 
 ╔═══════════════════════════════════════════════════════════════════════════╗
@@ -143,7 +166,9 @@ For complete documentation: docs/analysis-modes-guide.md
     ''')
 
 
-def create_analysis_config(mode, samples, sample_size, sample_strategy, profile='balanced'):
+def create_analysis_config(mode, samples, sample_size, sample_strategy, profile='balanced',
+                           backend='eager', onnx_model_dir=None, cache_dir=None, profiling=False,
+                           sample_ci=0.1):
     """
     Create AnalysisConfig from CLI arguments.
 
@@ -153,6 +178,11 @@ def create_analysis_config(mode, samples, sample_size, sample_strategy, profile=
         sample_size: Characters per sample section
         sample_strategy: Sampling strategy
         profile: Dimension profile (fast/balanced/full)
+        backend: Model inference backend (eager/int8/onnx)
+        onnx_model_dir: Root directory of exported ONNX models (onnx backend)
+        cache_dir: Per-dimension result cache directory (None = no cache)
+        profiling: Record per-stage timings in results.metadata['profile']
+        sample_ci: Target relative CI half-width of the convergent sampling strategy
 
     Returns:
         AnalysisConfig instance
@@ -162,7 +192,12 @@ def create_analysis_config(mode, samples, sample_size, sample_strategy, profile=
         sampling_sections=samples,
         sampling_chars_per_section=sample_size,
         sampling_strategy=sample_strategy,
-        dimension_profile=profile
+        sampling_ci_width=sample_ci,
+        dimension_profile=profile,
+        inference_backend=backend,
+        onnx_model_dir=onnx_model_dir,
+        cache_dir=cache_dir,
+        profiling=profiling
     )
 
 
@@ -213,6 +248,12 @@ def show_dry_run_config(file_path: str, config: AnalysisConfig, detailed, show_s
         print(f"Expected time: {30 + config.sampling_sections * 10}-{60 + config.sampling_sections * 20} seconds")
         print(f"Coverage: ~{(total / file_size * 100):.1f}%")
 
+    elif config.mode == AnalysisMode.STREAMING:
+        chunks = max(1, -(-file_size // config.stream_chunk_chars))
+        print(f"Behavior: Analyze entire document in ~{chunks} chunks of {config.stream_chunk_chars:,} chars")
+        print(f"Expected time: {pages * 2:.0f}-{pages * 10:.0f} seconds")
+        print("Coverage: 100%")
+
     elif config.mode == AnalysisMode.FULL:
         print("Behavior: Analyze entire document, no truncation")
         print(f"Expected time: {pages * 2:.0f}-{pages * 10:.0f} seconds")
@@ -254,8 +295,8 @@ def show_coverage_stats(result, config: AnalysisConfig, file_path: str):
         if config.mode == AnalysisMode.FAST:
             est_coverage = min(2000 * 12 / file_size * 100, 100)  # 12 dimensions × 2000 chars
             print(f"Mode: FAST (estimated ~{est_coverage:.1f}% coverage)")
-        elif config.mode == AnalysisMode.FULL:
-            print(f"Mode: FULL (100% coverage)")
+        elif config.mode in [AnalysisMode.FULL, AnalysisMode.STREAMING]:
+            print(f"Mode: {config.mode.value.upper()} (100% coverage)")
         elif config.mode in [AnalysisMode.SAMPLING, AnalysisMode.ADAPTIVE]:
             total = config.sampling_sections * config.sampling_chars_per_section
             est_coverage = min(total / file_size * 100, 100)
@@ -357,7 +398,9 @@ def handle_history_commands(file, show_history_full, compare_history,
 
 def run_single_file_analysis(file, mode, samples, sample_size, sample_strategy, profile,
                              dry_run, show_coverage, detection_target, quality_target,
-                             history_notes, no_track_history, no_score_summary, format):
+                             history_notes, no_track_history, no_score_summary, format,
+                             backend='eager', onnx_model_dir=None, cache_dir=None,
+                             timings=False, timings_trace=None, sample_ci=0.1, daemon=None):
     """
     Run analysis on a single file.
 
@@ -375,24 +418,37 @@ def run_single_file_analysis(file, mode, samples, sample_size, sample_strategy,
         no_track_history: Disable history tracking flag
         no_score_summary: Suppress score summary flag
         format: Output format
+        backend: Model inference backend (eager/int8/onnx)
+        onnx_model_dir: Root directory of exported ONNX models (onnx backend)
+        cache_dir: Per-dimension result cache directory (None = no cache)
+        timings: Print the per-stage profile table to stderr
+        timings_trace: Write the per-stage profile as a Chrome trace to this path
+        sample_ci: Target relative CI half-width of the convergent sampling strategy
+        daemon: DaemonClient to forward the analysis to (None = analyze here);
+            the daemon also saves the score history. Falls back to analyzing
+            here if the daemon is unreachable or busy
 
     Returns:
-        List of results and calculated dual score
+        List of results and calculated dual score (None when forwarded; the
+        report calculates it)
     """
     import time
 
     try:
         # Create config
-        config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile)
-
-        # Parse domain terms if needed (handled in main function)
-        analyzer = AIPatternAnalyzer(config=config)
+        config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile,
+                                        backend, onnx_model_dir, cache_dir,
+                                        profiling=bool(timings or timings_trace), sample_ci=sample_ci)
 
-        # Dry run
+        # Dry run (before loading any dimensions)
         if dry_run:
             show_dry_run_config(file, config, False, False)
             return [], None
 
+        # Parse domain terms if needed (handled in main function)
+        # Forwarded analyses use the daemon's resident analyzer
+        analyzer = None if daemon else AIPatternAnalyzer(config=config)
+
         # Display mode info (only for text format, to avoid breaking JSON/TSV output)
         if format == 'text':
             print(f"\nAnalyzing: {file}")
@@ -402,6 +458,8 @@ def run_single_file_analysis(file, mode, samples, sample_size, sample_strategy,
                 print(f" (sampling: {config.sampling_sections} × {config.sampling_chars_per_section} chars, {config.sampling_strategy})")
             else:
                 print()
+            if daemon:
+                print(f"Analysis daemon: {daemon.address}")
 
             if show_coverage:
                 print("Coverage statistics will be shown after analysis")
@@ -409,18 +467,44 @@ def run_single_file_analysis(file, mode, samples, sample_size, sample_strategy,
 
         # Run analysis with timing
         start_time = time.time()
-        result = analyzer.analyze_file(file, config=config)
+        result = None
+        if daemon:
+            score = None
+            if not no_score_summary and format == 'text':
+                score = {'detection_target': detection_target, 'quality_target': quality_target,
+                         'track_history': not no_track_history, 'history_notes': history_notes}
+            try:
+                result = daemon.analyze_file(file, config, deadline_seconds=config.max_analysis_time_seconds,
+                                             score=score)
+            except DaemonUnavailable as e:
+                print(f"Warning: {e}; analyzing locally", file=sys.stderr)
+                analyzer = AIPatternAnalyzer(config=config)
+                start_time = time.time()
+        if result is None and config.mode == AnalysisMode.STREAMING:
+            # Progress on stderr keeps JSON/TSV output on stdout intact
+            for result in analyzer.analyze_iter(file, config=config):
+                print(f"Streaming: {result.stream_progress:.0%} ({result.total_words:,} words, "
+                      f"{time.time() - start_time:.1f}s)", file=sys.stderr)
+        elif result is None:
+            result = analyzer.analyze_file(file, config=config)
         elapsed = time.time() - start_time
 
         # Add mode info to results metadata (for history tracking)
-        if not hasattr(result, 'metadata'):
-            result.metadata = {}
         result.metadata['analysis_mode'] = config.mode.value
         result.metadata['analysis_time_seconds'] = elapsed
 
+        # Per-stage profile on stderr keeps JSON/TSV output on stdout intact
+        if 'profile' in result.metadata:
+            profiler = StageProfiler.from_dict(result.metadata['profile'])
+            if timings:
+                print(f"\nStage timings for {file}:\n{profiler.format_table()}", file=sys.stderr)
+            if timings_trace:
+                profiler.write_chrome_trace(timings_trace)
+                print(f"Chrome trace written to {timings_trace}", file=sys.stderr)
+
         # Calculate dual score for history and optimization (if score summary shown)
         calculated_dual_score = None
-        if not no_score_summary and format == 'text':
+        if analyzer is not None and not no_score_summary and format == 'text':
             try:
                 calculated_dual_score = analyzer.calculate_dual_score(
                     result,
@@ -453,7 +537,9 @@ def run_single_file_analysis(file, mode, samples, sample_size, sample_strategy,
         sys.exit(1)
 
 
-def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, profile, dry_run):
+def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, profile, dry_run,
+                       backend='eager', onnx_model_dir=None, jobs=1, cache_dir=None, sample_ci=0.1,
+                       daemon=None):
     """
     Run batch analysis on directory.
 
@@ -464,17 +550,24 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
         sample_size: Sample size in characters
         sample_strategy: Sampling strategy
         dry_run: Dry run flag
+        backend: Model inference backend (eager/int8/onnx)
+        onnx_model_dir: Root directory of exported ONNX models (onnx backend)
+        jobs: Worker processes (1 = serial, 0 = one per CPU); each worker
+            loads the models once and analyzes many files
+        cache_dir: Per-dimension result cache directory shared by all workers
+            (None = no cache); unchanged files skip cached dimensions
+        sample_ci: Target relative CI half-width of the convergent sampling strategy
+        daemon: DaemonClient to forward single-job batches to (None = analyze
+            here); falls back to analyzing here if it is unreachable or busy
 
     Returns:
-        List of results and None for dual_score
+        List of results (in file order, failed files omitted) and None for dual_score
     """
     # Create config once (applies to all files)
-    config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile)
-
-    # Parse domain terms if needed (handled in main function)
-    analyzer = AIPatternAnalyzer(config=config)
+    config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile,
+                                    backend, onnx_model_dir, cache_dir, sample_ci=sample_ci)
 
-    # Dry run for batch
+    # Dry run for batch (before loading any dimensions)
     if dry_run:
         print(f"\nBatch Analysis Configuration (DRY RUN)")
         print(f"Directory: {batch_dir}")
@@ -482,6 +575,9 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
         if config.mode in [AnalysisMode.SAMPLING, AnalysisMode.ADAPTIVE]:
             print(f"Sampling: {config.sampling_sections} × {config.sampling_chars_per_section} chars ({config.sampling_strategy})")
         print(f"\nMode will be applied to all .md files in directory")
+        print(f"Jobs: {resolve_jobs(jobs)}")
+        if config.cache_dir:
+            print(f"Result cache: {config.cache_dir}")
         return [], None
 
     batch_path = Path(batch_dir)
@@ -499,27 +595,62 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
     if config.mode in [AnalysisMode.SAMPLING, AnalysisMode.ADAPTIVE]:
         print(f"Sampling: {config.sampling_sections} × {config.sampling_chars_per_section} chars")
     print(f"Files to analyze: {len(md_files)}")
+    jobs = min(resolve_jobs(jobs), len(md_files))
+    if jobs > 1:
+        print(f"Jobs: {jobs} worker processes")
+    elif daemon:
+        print(f"Analysis daemon: {daemon.address}")
     print()
 
-    results = []
-    for md_file in md_files:
+    def report_progress(outcome):
+        name = Path(outcome.file_path).name
+        if outcome.ok:
+            print(f"Analyzed: {name} ✓ ({outcome.elapsed_seconds:.2f}s)", flush=True)
+        else:
+            print(f"Error analyzing {outcome.file_path}: {outcome.error}", file=sys.stderr)
+
+    file_paths = [str(md_file) for md_file in md_files]
+    start = time.perf_counter()
+    outcomes = None
+    if daemon and jobs == 1:
+        # Each file keeps the local per-file time budget
+        budget = config.max_analysis_time_seconds * len(file_paths) if config.max_analysis_time_seconds else None
         try:
-            print(f"Analyzing: {md_file.name}...", end=' ', flush=True)
+            outcomes = daemon.analyze_files(file_paths, config, deadline_seconds=budget)
+            for outcome in outcomes:
+                report_progress(outcome)
+        except DaemonUnavailable as e:
+            print(f"Warning: {e}; analyzing locally", file=sys.stderr)
+            start = time.perf_counter()
+
+    if outcomes is None:
+        # Serial runs use one in-process analyzer; workers build their own
+        analyzer = AIPatternAnalyzer(config=config) if jobs == 1 else None
+        outcomes = analyze_files(file_paths, config, jobs=jobs, analyzer=analyzer, on_result=report_progress)
+    elapsed = time.perf_counter() - start
 
-            result = analyzer.analyze_file(str(md_file), config=config)
-            results.append(result)
+    print()
+    print(format_batch_summary(outcomes, elapsed, jobs))
 
-            print("✓")
-        except Exception as e:
-            print(f"Error analyzing {md_file}: {e}", file=sys.stderr)
+    results = [outcome.result for outcome in outcomes if outcome.ok]
+    return results, None
 
-    print(f"\nCompleted {len(results)} of {len(md_files)} files")
 
-    return results, None
+class AnalyzeCommand(click.Command):
+    """The analyze command, which also runs `analyze-ai-patterns serve` (cli/serve.py)."""
+
+    def main(self, args=None, prog_name=None, **extra):
+        args = sys.argv[1:] if args is None else list(args)
+        # FILE must exist, so `serve` is dispatched before it is parsed as one
+        if args[:1] == ['serve'] and not os.path.exists('serve'):
+            from ai_pattern_analyzer.cli.serve import serve
+            prog_name = prog_name or os.path.basename(sys.argv[0]) or 'analyze-ai-patterns'
+            return serve.main(args[1:], prog_name=f"{prog_name} serve", **extra)
+        return super().main(args, prog_name=prog_name, **extra)
 
 
 # Click command definition
-@click.command(context_settings=dict(help_option_names=['-h', '--help']))
+@click.command(cls=AnalyzeCommand, context_settings=dict(help_option_names=['-h', '--help']))
 @click.argument('file', required=False, type=click.Path(exists=True))
 @click.option('--batch', metavar='DIR', type=click.Path(exists=True, file_okay=False, dir_okay=True),
               help='Analyze all .md files in directory')
@@ -553,9 +684,10 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
               help='Add notes for this iteration (e.g., "Fixed AI vocabulary")')
 @click.option('--no-score-summary', is_flag=True,
               help='Suppress score summary display in output')
-@click.option('--mode', '-m', type=click.Choice(['fast', 'adaptive', 'sampling', 'full']),
+@click.option('--mode', '-m', type=click.Choice(['fast', 'adaptive', 'sampling', 'full', 'streaming']),
               default='adaptive',
-              help='Analysis mode: fast (5-15s), adaptive (30-240s, RECOMMENDED), sampling (60-300s), full (5-20min)')
+              help='Analysis mode: fast (5-15s), adaptive (30-240s, RECOMMENDED), sampling (60-300s), full (5-20min), '
+                   'streaming (whole file in chunks, flat memory, progress on stderr)')
 @click.option('--profile', '-p', type=click.Choice(['fast', 'balanced', 'full']),
               default='balanced',
               help='Dimension profile: fast (4 dims, ~100ms), balanced (8 dims, ~200ms, DEFAULT), full (12 dims, ~4-6s)')
@@ -563,22 +695,48 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
               help='Number of sections to sample (default: 5, range: 1-20)')
 @click.option('--sample-size', type=click.IntRange(500, 10000), default=2000, metavar='CHARS',
               help='Characters per sample section (default: 2000, range: 500-10000)')
-@click.option('--sample-strategy', type=click.Choice(['even', 'weighted', 'adaptive']),
+@click.option('--sample-strategy', type=click.Choice(['even', 'weighted', 'adaptive', 'convergent']),
               default='even',
-              help='Sampling distribution: even, weighted (40%% begin/40%% end), adaptive')
+              help='Sampling distribution: even, weighted (40%% begin/40%% end), adaptive, '
+                   'convergent (stratified samples until each dimension\'s key metric settles)')
+@click.option('--sample-ci', type=click.FloatRange(0.01, 1.0), default=0.1, show_default=True, metavar='WIDTH',
+              help='Convergent sampling: stop once the 95%% confidence interval half-width is within '
+                   'WIDTH of the metric mean (relative)')
+@click.option('--backend', type=click.Choice(['eager', 'int8', 'onnx']), default='eager',
+              help='Model inference backend for predictability/sentiment: eager (fp32, DEFAULT), '
+                   'int8 (dynamic quantization), onnx (ONNX Runtime, needs --onnx-model-dir)')
+@click.option('--onnx-model-dir', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              default=None, metavar='DIR',
+              help='Directory with exported ONNX models (predictability/, sentiment/ subdirectories)')
+@click.option('--jobs', '-j', type=click.IntRange(min=0), default=1, metavar='N',
+              help='Batch worker processes (default: 1; 0 = one per CPU). '
+                   'Each worker loads the models once')
+@click.option('--cache', 'use_cache', is_flag=True,
+              help=f'Reuse per-dimension results for unchanged content from {DEFAULT_CACHE_DIR}/')
+@click.option('--cache-dir', type=click.Path(file_okay=False, dir_okay=True), default=None, metavar='DIR',
+              help='Result cache directory (implies --cache)')
+@click.option('--timings', is_flag=True,
+              help='Print wall/CPU time, peak memory and model-load time per dimension and '
+                   'shared artifact (stages run sequentially while profiling)')
+@click.option('--timings-trace', type=click.Path(dir_okay=False, writable=True), default=None,
+              metavar='FILE',
+              help='Write the per-stage profile as a Chrome trace (chrome://tracing); implies profiling')
 @click.option('--dry-run', is_flag=True,
               help='Show configuration without running analysis')
 @click.option('--show-coverage', is_flag=True,
               help='Display coverage statistics (samples, chars analyzed, coverage %%)')
 @click.option('--help-modes', is_flag=True, is_eager=True, expose_value=False, callback=lambda ctx, param, value: (show_mode_help(), ctx.exit()) if value else None,
               help='Show detailed information about analysis modes and exit')
+@click.option('--no-daemon', is_flag=True,
+              help='Analyze in this process even if an analysis daemon (analyze-ai-patterns serve) is running')
 @click.option('--no-track-history', is_flag=True, hidden=True,
               help='Disable history tracking (internal use)')
 def main(file, batch, detailed, format, domain_terms, output, show_scores,
          detection_target, quality_target, show_history, show_history_full,
          show_dimension_trends, show_raw_metric_trends, compare_history,
          export_history, history_notes, no_score_summary, mode, profile, samples,
-         sample_size, sample_strategy, dry_run, show_coverage, no_track_history):
+         sample_size, sample_strategy, sample_ci, backend, onnx_model_dir, jobs, use_cache, cache_dir,
+         timings, timings_trace, dry_run, show_coverage, no_daemon, no_track_history):
     """Analyze manuscripts for AI-generated content patterns.
 
     Examples:
@@ -604,6 +762,18 @@ def main(file, batch, detailed, format, domain_terms, output, show_scores,
       # Batch analyze directory
       analyze-ai-patterns --batch manuscript/sections --format tsv
 
+      # Batch analyze on 8 worker processes
+      analyze-ai-patterns --batch manuscript/sections --jobs 8
+
+      # Re-run a batch, recomputing only changed chapters
+      analyze-ai-patterns --batch manuscript/sections --cache
+
+      # Where does the time go? Per-stage table plus a chrome://tracing file
+      analyze-ai-patterns chapter-01.md --timings --timings-trace chapter-01.trace.json
+
+      # Keep the models loaded; later runs forward to the daemon
+      analyze-ai-patterns serve
+
     For detailed mode information: analyze-ai-patterns --help-modes
     """
     # Validate inputs
@@ -633,6 +803,13 @@ def main(file, batch, detailed, format, domain_terms, output, show_scores,
         click.echo("Warning: --show-scores mode not supported for batch analysis. Using standard mode.", err=True)
         show_scores = False
 
+    if backend == 'onnx' and not onnx_model_dir:
+        raise click.UsageError('--backend onnx requires --onnx-model-dir')
+
+    if (timings or timings_trace) and (batch or detailed or mode == 'streaming'):
+        click.echo("Warning: --timings is only supported for standard single-file analysis; ignored.", err=True)
+        timings, timings_trace = False, None
+
     # Validate mode arguments
     if mode == 'fast' and (samples != 5 or sample_size != 2000):
         click.echo("Warning: --samples and --sample-size are ignored in 'fast' mode", err=True)
@@ -658,16 +835,19 @@ def main(file, batch, detailed, format, domain_terms, output, show_scores,
     # Parse domain terms
     domain_patterns = parse_domain_terms(domain_terms) if domain_terms else None
 
-    # Create config for analyzer (used by all modes)
-    config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile)
+    # Result cache: --cache-dir implies --cache
+    if use_cache and not cache_dir:
+        cache_dir = DEFAULT_CACHE_DIR
 
-    # Initialize analyzer
-    analyzer = AIPatternAnalyzer(domain_terms=domain_patterns, config=config)
+    # Create config for analyzer (used by all modes)
+    config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile,
+                                    backend, onnx_model_dir, cache_dir, sample_ci=sample_ci)
 
     # Detailed analysis mode
     if detailed:
         try:
-            detailed_result = analyzer.analyze_file_detailed(file)
+            analyzer = AIPatternAnalyzer(domain_terms=domain_patterns, config=config)
+            detailed_result = analyzer.analyze_file_detailed(file, config=config)
             output_text = format_detailed_report(detailed_result, format)
 
             if output:
@@ -681,13 +861,21 @@ def main(file, batch, detailed, format, domain_terms, output, show_scores,
             click.echo(f"Error: {e}", err=True)
             sys.exit(1)
 
+    # Forward to a running analysis daemon (profiling needs the local stages)
+    daemon = None
+    if not (no_daemon or dry_run or timings or timings_trace):
+        daemon = find_daemon()
+
     # Standard analysis mode
     if batch:
-        results, calculated_dual_score = run_batch_analysis(batch, mode, samples, sample_size, sample_strategy, profile, dry_run)
+        results, calculated_dual_score = run_batch_analysis(batch, mode, samples, sample_size, sample_strategy, profile, dry_run,
+                                                            backend, onnx_model_dir, jobs, cache_dir, sample_ci,
+                                                            daemon)
     else:
         results, calculated_dual_score = run_single_file_analysis(
             file, mode, samples, sample_size, sample_strategy, profile, dry_run, show_coverage,
-            detection_target, quality_target, history_notes, no_track_history, no_score_summary, format
+            detection_target, quality_target, history_notes, no_track_history, no_score_summary, format,
+            backend, onnx_model_dir, cache_dir, timings, timings_trace, sample_ci, daemon
         )
 
     # Format and output
@@ -0,0 +1,119 @@
+"""
+Analysis daemon command (`analyze-ai-patterns serve`).
+
+Usage:
+    analyze-ai-patterns serve [--socket PATH | --port N] [--preload PROFILES] [OPTIONS]
+
+Keeps analyzers and their models resident and serves analysis requests;
+`analyze-ai-patterns FILE` forwards to it while it runs. See core/daemon.py
+for the API.
+"""
+
+import os
+import signal
+import sys
+
+import click
+
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+from ai_pattern_analyzer.core.daemon import (
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_REQUEST_TIMEOUT,
+    AnalysisDaemon,
+    default_address,
+    default_state_file,
+)
+
+PROFILES = ('fast', 'balanced', 'full')
+
+
+def _profile_list(ctx, param, value):
+    """Parse a comma-separated list of profiles ("none" = empty)."""
+    items = [part.strip() for part in value.split(',') if part.strip()]
+    if items == ['none']:
+        return []
+    unknown = [item for item in items if item not in PROFILES]
+    if unknown:
+        raise click.BadParameter(f"choose from {', '.join(PROFILES)} or none")
+    return items
+
+
+def _stop(signum, frame):
+    raise KeyboardInterrupt
+
+
+@click.command(context_settings=dict(help_option_names=['-h', '--help']))
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False), default=None, metavar='PATH',
+              help='Listen on this Unix socket (default: ~/.cache/ai-pattern-analyzer/daemon.sock)')
+@click.option('--port', type=click.IntRange(0, 65535), default=None, metavar='N',
+              help='Listen on 127.0.0.1:N instead of a Unix socket (0 = any free port)')
+@click.option('--preload', default='balanced', show_default=True, callback=_profile_list, metavar='PROFILES',
+              help='Profiles to load and warm at startup (comma-separated; "none" = on first request)')
+@click.option('--backend', type=click.Choice(['eager', 'int8', 'onnx']), default='eager',
+              help='Default model inference backend for requests that do not set one')
+@click.option('--onnx-model-dir', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              default=None, metavar='DIR',
+              help='Directory with exported ONNX models (onnx backend)')
+@click.option('--cache-dir', type=click.Path(file_okay=False, dir_okay=True), default=None, metavar='DIR',
+              help='Per-dimension result cache for all requests (default: no cache)')
+@click.option('--workers', type=click.IntRange(min=1), default=1, show_default=True, metavar='N',
+              help='Worker threads (each resident analyzer still runs one request at a time)')
+@click.option('--queue-size', type=click.IntRange(min=1), default=DEFAULT_QUEUE_SIZE, show_default=True,
+              metavar='N', help='Requests that may wait for a worker; more are refused with 503')
+@click.option('--request-timeout', type=click.FloatRange(min=1.0), default=DEFAULT_REQUEST_TIMEOUT,
+              show_default=True, metavar='SECONDS',
+              help='Deadline of requests that do not set deadline_seconds')
+@click.option('--log-requests', is_flag=True,
+              help='Log every request to stderr')
+def serve(socket_path, port, preload, backend, onnx_model_dir, cache_dir, workers, queue_size, request_timeout,
+          log_requests):
+    """Run the local analysis daemon with resident, warm analyzers.
+
+    While it runs, `analyze-ai-patterns FILE` and `--batch DIR` send their
+    analyses to it instead of loading the models themselves.
+
+    Examples:
+
+      # Serve on the default Unix socket with the balanced profile warm
+      analyze-ai-patterns serve
+
+      # Serve on a local port, warming the fast and full profiles
+      analyze-ai-patterns serve --port 8765 --preload fast,full
+
+      # Query it directly
+      curl --unix-socket ~/.cache/ai-pattern-analyzer/daemon.sock http://localhost/metrics
+    """
+    if socket_path and port is not None:
+        raise click.UsageError('--socket and --port are mutually exclusive')
+    if backend == 'onnx' and not onnx_model_dir:
+        raise click.UsageError('--backend onnx requires --onnx-model-dir')
+
+    if socket_path:
+        address = f"unix:{os.path.abspath(socket_path)}"
+    elif port is not None:
+        address = f"127.0.0.1:{port}"
+    else:
+        address = default_address()
+
+    config = AnalysisConfig(inference_backend=backend, onnx_model_dir=onnx_model_dir,
+                            cache_dir=os.path.abspath(cache_dir) if cache_dir else None)
+    try:
+        daemon = AnalysisDaemon(address, config=config, workers=workers, queue_size=queue_size,
+                                request_timeout=request_timeout, state_file=default_state_file(),
+                                log_requests=log_requests)
+    except OSError as e:
+        click.echo(f"Error: cannot listen on {address}: {e}", err=True)
+        sys.exit(1)
+
+    try:
+        if preload:
+            click.echo(f"Loading profiles: {', '.join(preload)}", err=True)
+            daemon.preload(preload)
+        signal.signal(signal.SIGTERM, _stop)
+        click.echo(f"Analysis daemon listening on {daemon.address} (pid {os.getpid()}); "
+                   f"Ctrl+C to stop", err=True)
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        click.echo("\nStopping analysis daemon", err=True)
+    finally:
+        daemon.close()
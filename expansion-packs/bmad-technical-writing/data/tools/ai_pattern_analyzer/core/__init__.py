@@ -2,7 +2,29 @@
 Core analysis engine module.
 """
 
-from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
-from ai_pattern_analyzer.core.results import AnalysisResults, DetailedAnalysis
+import importlib
+from typing import TYPE_CHECKING
+
+# Resolved lazily so importing core submodules (e.g. analysis_config) does not
+# pull in the analyzer and its dependencies
+_LAZY_EXPORTS = {
+    'AIPatternAnalyzer': 'ai_pattern_analyzer.core.analyzer',
+    'AnalysisResults': 'ai_pattern_analyzer.core.results',
+    'DetailedAnalysis': 'ai_pattern_analyzer.core.results',
+}
+
+if TYPE_CHECKING:
+    from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+    from ai_pattern_analyzer.core.results import AnalysisResults, DetailedAnalysis
 
 __all__ = ['AIPatternAnalyzer', 'AnalysisResults', 'DetailedAnalysis']
+
+
+def __getattr__(name):
+    """Import public names on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -16,7 +16,7 @@ class AnalysisMode(str, Enum):
     ADAPTIVE = "adaptive"   # Adapt to document length (recommended)
     SAMPLING = "sampling"   # Sample N sections, aggregate
     FULL = "full"          # Analyze entire document
-    STREAMING = "streaming" # Progressive analysis (future)
+    STREAMING = "streaming" # Progressive chunked analysis, bounded memory
 
 
 @dataclass
@@ -31,11 +31,51 @@ class AnalysisConfig:
         mode: Analysis mode (FAST, ADAPTIVE, SAMPLING, FULL, STREAMING)
         sampling_sections: Number of sections to sample (default: 5)
         sampling_chars_per_section: Characters per sample (default: 2000)
-        sampling_strategy: Strategy for sample selection (even, weighted, adaptive)
+        sampling_strategy: Strategy for sample selection (even, weighted, adaptive,
+            convergent - draw until each dimension's key metric settles, see
+            core/sampling.py)
+        sampling_ci_width: Convergent strategy: target 95% confidence-interval
+            half-width relative to the metric's mean (default: 0.1)
+        sampling_min_samples: Convergent strategy: samples drawn before testing
+            convergence, and batch size of batched model dimensions (default: 3)
+        sampling_max_samples: Convergent strategy: sample budget, i.e. number of
+            document strata (default: 16)
         max_text_length: Optional hard limit on text length
-        max_analysis_time_seconds: Optional timeout for analysis
+        max_analysis_time_seconds: Overall budget per analyzed document; dimensions
+            still running when it passes are cancelled and reported unfinished
+            (default: 300, None = no limit)
         dimension_overrides: Dict of dimension-specific config overrides
         enable_detailed_analysis: Enable detailed metrics (default: True)
+        gltr_context_overlap: Tokens of context carried into each new GLTR
+            window when a text exceeds the model context (default: 256)
+        gltr_batch_token_budget: Max padded tokens per batched GLTR forward
+            call when scoring multiple samples (default: 4096)
+        inference_backend: Model backend for predictability and sentiment
+            ("eager" fp32, "int8" dynamic quantization, "onnx" ONNX Runtime)
+        onnx_model_dir: Directory of exported ONNX models, with
+            predictability/ and sentiment/ subdirectories (onnx backend only)
+        sentiment_batch_size: Chunks per batched sentiment forward pass (default: 32)
+        spacy_batch_size: Texts per nlp.pipe batch in the shared spaCy service (default: 8)
+        spacy_n_process: Worker processes for nlp.pipe (default: 1, in-process)
+        dimension_workers: Dimensions analyzed concurrently per document
+            (default: 4; 1 = sequential, in declaration order)
+        dimension_executor: Pool for concurrent dimensions ("thread" shares
+            artifacts and releases the GIL in torch/spaCy; "process" isolates
+            pure-Python dimensions but builds artifacts per worker)
+        dimension_timeout_seconds: Wall-clock budget per dimension; an overrun
+            is reported as available=False (default: None, no budget)
+        cache_dir: Directory of the on-disk per-dimension result cache
+            (default: None, caching disabled; CLI --cache uses .ai-analysis-cache)
+        cache_max_bytes: Result cache size above which least recently used
+            entries are evicted (default: 256 MiB)
+        incremental_sections: Analyze section-capable dimensions per heading
+            section, reusing cached section states so re-runs only re-process
+            edited sections (default: False)
+        stream_chunk_chars: Target characters per chunk read by STREAMING
+            mode / analyze_iter() (default: 65536)
+        profiling: Record wall/CPU time, peak allocation and model-load time
+            per artifact and dimension in results.metadata['profile']; stages
+            then run sequentially (default: False, see core/profiler.py)
 
         # Dimension loading configuration (Story 1.4.11)
         dimension_profile: Profile for dimension loading (fast/balanced/full/custom)
@@ -46,12 +86,46 @@ class AnalysisConfig:
     mode: AnalysisMode = AnalysisMode.ADAPTIVE
     sampling_sections: int = 5
     sampling_chars_per_section: int = 2000
-    sampling_strategy: str = "even"  # "even", "weighted", "adaptive"
+    sampling_strategy: str = "even"  # "even", "weighted", "adaptive", "convergent"
+    sampling_ci_width: float = 0.1
+    sampling_min_samples: int = 3
+    sampling_max_samples: int = 16
     max_text_length: Optional[int] = None
     max_analysis_time_seconds: Optional[int] = 300
     dimension_overrides: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     enable_detailed_analysis: bool = True
 
+    # GLTR sliding-window configuration (texts longer than the model context)
+    gltr_context_overlap: int = 256
+    gltr_batch_token_budget: int = 4096
+
+    # Transformer inference backend (CPU throughput vs. fp32 reference accuracy)
+    inference_backend: str = "eager"  # "eager", "int8", "onnx"
+    onnx_model_dir: Optional[str] = None
+
+    # Sentiment inference batching
+    sentiment_batch_size: int = 32
+
+    # Shared spaCy pipeline batching (syntactic, advanced lexical)
+    spacy_batch_size: int = 8
+    spacy_n_process: int = 1
+
+    # Dimension scheduling (shared artifacts, concurrent dimensions)
+    dimension_workers: int = 4
+    dimension_executor: str = "thread"  # "thread", "process"
+    dimension_timeout_seconds: Optional[float] = None
+
+    # On-disk per-dimension result cache (incremental re-runs)
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = 256 * 1024 * 1024
+    incremental_sections: bool = False
+
+    # STREAMING mode chunking (AIPatternAnalyzer.analyze_iter)
+    stream_chunk_chars: int = 64 * 1024
+
+    # Per-stage profiling (core/profiler.py)
+    profiling: bool = False
+
     # Dimension loading configuration (Story 1.4.11)
     dimension_profile: str = "balanced"  # Profile: fast, balanced, full, or custom
     dimensions_to_load: Optional[List[str]] = None  # Override profile with explicit list
@@ -76,7 +150,7 @@ class AnalysisConfig:
                 * text > 50000 chars: Use sampling (return None to trigger sampling)
             - SAMPLING mode: Return None (triggers extract_samples)
             - FULL mode: Return None (no limit)
-            - STREAMING mode: Return None (future implementation)
+            - STREAMING mode: Return None (each streamed chunk is analyzed whole)
             - Check dimension_overrides for custom limits
         """
         # Check for dimension-specific override
@@ -105,7 +179,7 @@ class AnalysisConfig:
             return None  # No limit - analyze entire document
 
         elif self.mode == AnalysisMode.STREAMING:
-            return None  # Future: progressive analysis
+            return None  # Chunks are bounded by stream_chunk_chars
 
         else:
             return 2000  # Fallback to safe default
@@ -125,7 +199,7 @@ class AnalysisConfig:
             - ADAPTIVE mode: Sample if text > 50,000 chars
             - SAMPLING mode: Always sample
             - FULL mode: Never sample
-            - STREAMING mode: Never sample (progressive, not sampled)
+            - STREAMING mode: Never sample (every chunk is analyzed)
         """
         if self.mode == AnalysisMode.FAST:
             return False  # FAST mode truncates, doesn't sample
@@ -162,6 +236,9 @@ class AnalysisConfig:
                - "even": Extract from evenly spaced positions
                - "weighted": Weight toward beginning/end (intro + conclusion important)
                - "adaptive": Detect section boundaries (headings), sample each
+               - "convergent": One paragraph-aligned sample per stratum of
+                 sampling_max_samples strata, in drawing order (dimensions
+                 stop drawing once their metric converges, see core/sampling.py)
             3. Each sample is sampling_chars_per_section long (default 2000)
 
         Example:
@@ -177,6 +254,10 @@ class AnalysisConfig:
             # Text is smaller than one sample - return entire text
             return [(0, text)]
 
+        if self.sampling_strategy == "convergent":
+            from ai_pattern_analyzer.core.sampling import stratified_samples
+            return stratified_samples(text, self.sampling_max_samples, self.sampling_chars_per_section)
+
         if self.sampling_strategy == "even":
             # Evenly spaced samples
             section_size = text_length // self.sampling_sections
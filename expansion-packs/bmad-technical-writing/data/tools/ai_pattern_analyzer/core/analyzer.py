@@ -13,7 +13,7 @@ import json
 import sys
 import statistics
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, TextIO, Tuple
 from datetime import datetime
 from dataclasses import asdict
 
@@ -23,7 +23,15 @@ from ai_pattern_analyzer.core.results import (
     VocabInstance, HeadingIssue, UniformParagraph,
     EmDashInstance, TransitionInstance
 )
-from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import Deadline
+from ai_pattern_analyzer.core.document_context import DocumentContext
+from ai_pattern_analyzer.core.findings import Findings
+from ai_pattern_analyzer.core.profiler import StageProfiler, stage
+from ai_pattern_analyzer.core.scheduler import DimensionScheduler
+from ai_pattern_analyzer.core.result_cache import DimensionResultCache, content_hash, result_key
+from ai_pattern_analyzer.core.sections import SectionStateCache, analyze_by_sections
+from ai_pattern_analyzer.core.streaming import StreamingAnalysis, iter_chunks, iter_file_text
 
 # Scoring and history
 from ai_pattern_analyzer.scoring.dual_score import (
@@ -31,11 +39,15 @@ from ai_pattern_analyzer.scoring.dual_score import (
     ImprovementAction, THRESHOLDS
 )
 from ai_pattern_analyzer.history.tracker import ScoreHistory, HistoricalScore
+from ai_pattern_analyzer.utils import markdown_service
+from ai_pattern_analyzer.utils.line_index import LineIndex
+from ai_pattern_analyzer.utils.pattern_matching import FORMULAIC_TRANSITIONS, lexicon_matcher
 from ai_pattern_analyzer.utils.text_processing import safe_divide, safe_ratio
 
 # Registry-based dimension loading (Story 1.4.11)
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
 from ai_pattern_analyzer.core.dimension_loader import DimensionLoader
+from ai_pattern_analyzer.dimensions.perplexity import AI_VOCAB_REPLACEMENTS as PERPLEXITY_VOCAB_REPLACEMENTS
 
 # Dual score calculator
 from ai_pattern_analyzer.scoring.dual_score_calculator import calculate_dual_score as _calculate_dual_score
@@ -59,40 +71,9 @@ class AIPatternAnalyzer:
     5. Track history over time
     """
 
-    # Replacement suggestions for AI vocabulary (for detailed mode)
-    AI_VOCAB_REPLACEMENTS = {
-        r'\bdelv(e|es|ing)\b': ['explore', 'examine', 'investigate', 'look at', 'dig into'],
-        r'\brobust(ness)?\b': ['reliable', 'powerful', 'solid', 'effective', 'well-designed'],
-        r'\bleverag(e|es|ing)\b': ['use', 'apply', 'take advantage of', 'employ', 'work with'],
-        r'\bharness(es|ing)?\b': ['use', 'apply', 'employ', 'tap into', 'utilize'],
-        r'\bfacilitat(e|es|ing)\b': ['enable', 'help', 'make easier', 'allow', 'support'],
-        r'\bunderscore(s|d|ing)?\b': ['emphasize', 'highlight', 'stress', 'point out', 'show'],
-        r'\bpivotal\b': ['key', 'important', 'critical', 'essential', 'crucial'],
-        r'\bseamless(ly)?\b': ['smooth', 'easy', 'straightforward', 'effortless', 'natural'],
-        r'\bholistic(ally)?\b': ['complete', 'comprehensive', 'full', 'thorough', 'whole'],
-        r'\bcomprehensive(ly)?\b': ['thorough', 'complete', 'detailed', 'full', 'extensive'],
-        r'\boptimiz(e|es|ing|ation)\b': ['improve', 'enhance', 'fine-tune', 'make better', 'refine'],
-        r'\bstreamlin(e|ed|ing)\b': ['simplify', 'improve', 'make efficient', 'refine', 'enhance'],
-        r'\butiliz(e|es|ation|ing)\b': ['use', 'employ', 'apply', 'work with'],
-        r'\bunpack(s|ing)?\b': ['explain', 'explore', 'break down', 'examine', 'analyze'],
-        r'\bmyriad\b': ['many', 'countless', 'numerous', 'various', 'multiple'],
-        r'\bplethora\b': ['many', 'abundance', 'wealth', 'plenty', 'lots'],
-        r'\bparamount\b': ['critical', 'essential', 'crucial', 'vital', 'key'],
-        r'\bquintessential\b': ['typical', 'classic', 'perfect example', 'ideal', 'archetypal'],
-        r'\binnovative\b': ['new', 'creative', 'novel', 'original', 'fresh'],
-        r'\bcutting-edge\b': ['advanced', 'modern', 'latest', 'state-of-the-art', 'new'],
-        r'\brevolutionary\b': ['groundbreaking', 'major', 'significant', 'transformative', 'game-changing'],
-        r'\bgame-changing\b': ['significant', 'major', 'important', 'transformative', 'impactful'],
-        r'\btransformative\b': ['significant', 'major', 'powerful', 'game-changing', 'impactful'],
-        r'\bdive deep\b': ['explore thoroughly', 'examine closely', 'investigate', 'look closely at', 'study'],
-        r'\bdeep dive\b': ['thorough look', 'detailed examination', 'close look', 'in-depth analysis', 'careful study'],
-        r'\becosystem\b': ['environment', 'system', 'network', 'platform', 'framework'],
-        r'\blandscape\b': ['field', 'area', 'space', 'domain', 'world'],
-        r'\bparadigm\s+shift\b': ['major change', 'fundamental shift', 'big change', 'transformation', 'sea change'],
-        r'\bsynerg(y|istic)\b': ['cooperation', 'collaboration', 'combined effect', 'teamwork', 'partnership'],
-        r'\bcommence(s|d)?\b': ['start', 'begin', 'initiate', 'launch', 'kick off'],
-        r'\bendeavor(s)?\b': ['effort', 'project', 'attempt', 'undertaking', 'initiative'],
-    }
+    # Replacement suggestions for AI vocabulary (for detailed mode); the same
+    # lexicon the perplexity dimension records matches of
+    AI_VOCAB_REPLACEMENTS = PERPLEXITY_VOCAB_REPLACEMENTS
 
     # Transition replacements (for detailed mode)
     TRANSITION_REPLACEMENTS = {
@@ -141,9 +122,8 @@ class AIPatternAnalyzer:
         # HTML comment pattern (metadata blocks to ignore)
         self._html_comment_pattern = re.compile(r'<!--.*?-->', re.DOTALL)
 
-        # Phase 3: AST parser and cache (marko)
+        # Phase 3: AST parser (marko); parsed ASTs are shared via utils/markdown_service.py
         self._markdown_parser = None
-        self._ast_cache = {}
 
         # Story 1.4.11: Config-driven dimension loading via DimensionLoader
         # Register custom profiles from config if provided
@@ -178,6 +158,15 @@ class AIPatternAnalyzer:
         if loaded_count == 0:
             raise RuntimeError("No dimensions loaded - cannot perform analysis")
 
+        # Builds shared artifacts once and runs dimensions concurrently
+        self.scheduler = DimensionScheduler()
+
+        # On-disk result caches, opened on first use per cache_dir
+        self._result_caches: Dict[str, DimensionResultCache] = {}
+
+        # Section states for config.incremental_sections, kept across calls
+        self.section_states = SectionStateCache()
+
     # ========================================================================
     # AST PARSING HELPERS (marko)
     # ========================================================================
@@ -189,20 +178,9 @@ class AIPatternAnalyzer:
         return self._markdown_parser
 
     def _parse_to_ast(self, text: str, cache_key: Optional[str] = None):
-        """Parse markdown to AST with caching."""
-
-        if cache_key and cache_key in self._ast_cache:
-            return self._ast_cache[cache_key]
-
-        parser = self._get_markdown_parser()
-        if parser is None:
-            return None
-
+        """Parse markdown to AST via the shared, content-keyed AST cache (cache_key is ignored)."""
         try:
-            ast = parser.parse(text)
-            if cache_key:
-                self._ast_cache[cache_key] = ast
-            return ast
+            return markdown_service.parse(text)
         except Exception as e:
             import warnings
             warnings.warn(f"Markdown parsing failed: {e}. Falling back to regex analysis.", UserWarning)
@@ -260,17 +238,19 @@ class AIPatternAnalyzer:
     def analyze_file(
         self,
         file_path: str,
-        config: Optional[AnalysisConfig] = None
+        config: Optional[AnalysisConfig] = None,
+        deadline: Optional[Deadline] = None
     ) -> AnalysisResults:
         """
         Analyze a single markdown file for AI patterns.
 
-        This is the main entry point that orchestrates all dimension analyses,
-        calculates scores, and produces comprehensive results.
+        Thin reader over analyze_text(), which runs the in-memory pipeline
+        (STREAMING mode: the last analyze_iter() snapshot).
 
         Args:
             file_path: Path to markdown file to analyze
             config: Analysis configuration (None = current behavior, uses DEFAULT_CONFIG)
+            deadline: Overall time budget (None = config.max_analysis_time_seconds)
 
         Returns:
             AnalysisResults object with complete analysis
@@ -278,44 +258,222 @@ class AIPatternAnalyzer:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        # Story 1.4.6: Infrastructure only - config parameter added, threaded to all dimensions
-        config = config or DEFAULT_CONFIG
-
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        if (config or DEFAULT_CONFIG).mode == AnalysisMode.STREAMING:
+            results = None
+            for results in self.analyze_iter(file_path, config=config, deadline=deadline):
+                pass
+            return results
+
         with open(path, 'r', encoding='utf-8') as f:
             text = f.read()
 
+        return self.analyze_text(text, config=config, file_path=file_path, deadline=deadline)
+
+    def analyze_stream(
+        self,
+        stream: TextIO,
+        config: Optional[AnalysisConfig] = None,
+        file_path: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ) -> AnalysisResults:
+        """
+        Analyze markdown read from a text stream (e.g. sys.stdin, io.StringIO).
+
+        Args:
+            stream: Readable text stream (read to EOF, not closed)
+            config: Analysis configuration (None = current behavior, uses DEFAULT_CONFIG)
+            file_path: Label for results.file_path (default: stream.name or '<stream>')
+            deadline: Overall time budget (None = config.max_analysis_time_seconds)
+
+        Returns:
+            AnalysisResults object with complete analysis
+        """
+        if file_path is None:
+            name = getattr(stream, 'name', None)
+            file_path = name if isinstance(name, str) else '<stream>'
+
+        return self.analyze_text(stream.read(), config=config, file_path=file_path, deadline=deadline)
+
+    def analyze_text(
+        self,
+        text: str,
+        config: Optional[AnalysisConfig] = None,
+        file_path: str = '<text>',
+        deadline: Optional[Deadline] = None,
+        findings: Optional[Findings] = None
+    ) -> AnalysisResults:
+        """
+        Analyze markdown text for AI patterns, entirely in memory.
+
+        This is the main entry point that orchestrates all dimension analyses,
+        calculates scores, and produces comprehensive results. It touches no
+        filesystem, so it is safe on read-only or tmpfs-constrained hosts.
+
+        Args:
+            text: Markdown content to analyze
+            config: Analysis configuration (None = current behavior, uses DEFAULT_CONFIG)
+            file_path: Label stored in results.file_path (no file is read)
+            deadline: Overall time budget, passed to every dimension
+                (None = a new Deadline of config.max_analysis_time_seconds)
+            findings: Recorder built from this text; dimensions record match
+                locations in it for analyze_file_detailed() (see core/findings.py)
+
+        Returns:
+            AnalysisResults object with complete analysis. Dimensions cut off
+            by the deadline are listed in results.unfinished_dimensions and
+            report {'available': False, 'unfinished': True}. With
+            config.profiling, results.metadata['profile'] holds per-stage
+            timings (see core/profiler.py). Sampled dimensions report their
+            sample count and metric confidence interval in
+            results.metadata['sampling'] (see core/sampling.py).
+        """
+        # Story 1.4.6: Infrastructure only - config parameter added, threaded to all dimensions
+        config = config or DEFAULT_CONFIG
+        if deadline is None:
+            deadline = Deadline(config.max_analysis_time_seconds)
+
         # Strip HTML comments (metadata blocks) before analysis
-        text = self._strip_html_comments(text)
+        if findings is not None:
+            text = findings.bind(self._html_comment_pattern)
+        else:
+            text = self._strip_html_comments(text)
+
+        profiler = StageProfiler() if config.profiling else None
+
+        # Tokenize once; every dimension shares the same words/sentences/paragraphs
+        with stage(profiler, 'document_context', 'context'):
+            context = DocumentContext.from_text(text)
 
         # Split into lines for detailed analysis
-        lines = text.splitlines()
+        lines = list(context.lines)
 
         # Run all dimension analyses (Story 1.4.11: Registry-based analysis)
-        word_count = self._count_words(text)
+        word_count = context.prose_word_count
 
-        # Registry-based dimension analysis loop
-        dimension_results = {}
-        for dim_name, dim in self.dimensions.items():
-            try:
-                # Prepare kwargs based on dimension needs
-                kwargs = {'config': config}
+        # Prepare kwargs based on dimension needs
+        dimension_kwargs = {}
+        for dim_name in self.dimensions:
+            kwargs = {'context': context}
+            if findings is not None:
+                kwargs['findings'] = findings
 
-                # Dimension-specific kwargs
-                if dim_name in ['structure', 'formatting']:
-                    kwargs['word_count'] = word_count
+            # Dimension-specific kwargs
+            if dim_name in ['structure', 'formatting']:
+                kwargs['word_count'] = word_count
 
-                # Execute analysis
-                result = dim.analyze(text, lines, **kwargs)
-                dimension_results[dim_name] = result
+            dimension_kwargs[dim_name] = kwargs
 
-            except Exception as e:
-                print(f"Warning: {dim_name} analysis failed: {e}", file=sys.stderr)
-                dimension_results[dim_name] = {'available': False, 'error': str(e)}
+        # Registry-based dimension analysis: shared artifacts built once, independent
+        # dimensions run concurrently (config.dimension_workers/_executor/_timeout_seconds)
+        try:
+            with markdown_service.analysis_scope():
+                dimension_results = self._run_dimensions(text, lines, config, dimension_kwargs, deadline,
+                                                         profiler)
+        finally:
+            if profiler is not None:
+                profiler.close()
+        unfinished = [name for name, result in dimension_results.items() if result.get('unfinished')]
+        if unfinished:
+            print(f"Warning: {deadline.describe()}; unfinished dimensions: {', '.join(unfinished)}",
+                  file=sys.stderr)
+
+        results = self._build_results(file_path, word_count, dimension_results, unfinished)
+        sampling = {name: result['sampling'] for name, result in dimension_results.items() if result.get('sampling')}
+        if sampling:
+            results.metadata['sampling'] = sampling
+        if profiler is not None:
+            results.metadata['profile'] = profiler.to_dict()
+        return results
+
+    def analyze_iter(
+        self,
+        file_path: str,
+        config: Optional[AnalysisConfig] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Iterator[AnalysisResults]:
+        """
+        Analyze a file progressively in bounded memory (AnalysisMode.STREAMING).
+
+        The file is read in chunks of about config.stream_chunk_chars characters
+        (memory-mapped when very large); each dimension keeps only a running
+        state, so memory stays flat however long the file is. See
+        core/streaming.py for how chunk metrics are combined.
+
+        Args:
+            file_path: Path to markdown file to analyze
+            config: Analysis configuration (None = DEFAULT_CONFIG; the chunk
+                size applies whatever the mode)
+            deadline: Overall time budget for the whole file
+                (None = a new Deadline of config.max_analysis_time_seconds)
+
+        Yields:
+            AnalysisResults for the text read so far, after every chunk;
+            stream_progress is the fraction of the file read (1.0 on the last
+            snapshot). Streaming stops early once the deadline passes.
 
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        config = config or DEFAULT_CONFIG
+        if deadline is None:
+            deadline = Deadline(config.max_analysis_time_seconds)
+
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        file_size = path.stat().st_size
+
+        stream = StreamingAnalysis(self.dimensions, config)
+        bytes_read = 0
+        chunks = iter_chunks(iter_file_text(str(path), config.stream_chunk_chars), config.stream_chunk_chars)
+        chunk = next(chunks, None)
+        if chunk is None:
+            results = self.analyze_text('', config=config, file_path=file_path, deadline=deadline)
+            results.stream_progress = 1.0
+            yield results
+            return
+
+        while chunk is not None:
+            following = next(chunks, None)
+            bytes_read += len(chunk.encode('utf-8'))
+            text = self._strip_html_comments(chunk)
+            context = DocumentContext.from_text(text)
+            dimension_kwargs = {}
+            for dim_name in self.dimensions:
+                kwargs = {'context': context}
+                if dim_name in ['structure', 'formatting']:
+                    kwargs['word_count'] = context.prose_word_count
+                dimension_kwargs[dim_name] = kwargs
+
+            with markdown_service.analysis_scope():
+                stream.add_chunk(text, list(context.lines), dimension_kwargs, self.scheduler, deadline,
+                                 word_count=context.prose_word_count)
+
+            unfinished = stream.unfinished
+            if unfinished:
+                print(f"Warning: {deadline.describe()}; stopped streaming {file_path} at "
+                      f"{bytes_read:,} of {file_size:,} bytes; unfinished dimensions: "
+                      f"{', '.join(unfinished)}", file=sys.stderr)
+            results = self._build_results(file_path, stream.word_count, stream.dimension_results(),
+                                          unfinished)
+            results.stream_progress = 1.0 if following is None else min(1.0, bytes_read / file_size)
+            yield results
+            if unfinished:
+                return
+            chunk = following
+
+    def _build_results(
+        self,
+        file_path: str,
+        word_count: int,
+        dimension_results: Dict[str, Dict[str, Any]],
+        unfinished: List[str]
+    ) -> AnalysisResults:
+        """Score raw dimension results and assemble the AnalysisResults."""
         # Story 1.10.1: Enrich dimension results with tier/weight/score metadata
         dimension_results = self._enrich_dimension_results(dimension_results)
 
@@ -483,41 +641,100 @@ class AIPatternAnalyzer:
         # Store dimension results for dynamic reporting (Story 1.10)
         results.dimension_results = dimension_results
         results.dimension_count = len(dimension_results)  # Number of dimensions analyzed
+        results.unfinished_dimensions = unfinished
 
         return results
 
-    def analyze_text(
+    def _run_dimensions(
         self,
         text: str,
-        config: Optional[AnalysisConfig] = None
-    ) -> AnalysisResults:
+        lines: List[str],
+        config: AnalysisConfig,
+        dimension_kwargs: Dict[str, Dict[str, Any]],
+        deadline: Optional[Deadline] = None,
+        profiler: Optional[StageProfiler] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Analyze text directly for AI patterns (without file I/O).
+        Run every loaded dimension, serving cached results when config.cache_dir is set.
 
-        This method provides the same analysis as analyze_file but operates on
-        text strings directly. Useful for testing and integration scenarios.
+        Only dimensions whose (text, dimension, version, config) key misses the
+        cache are scheduled; their successful results are stored. Failed or
+        timed-out results (available=False) are never cached.
 
-        Args:
-            text: Text content to analyze
-            config: Analysis configuration (None = current behavior, uses DEFAULT_CONFIG)
+        With config.incremental_sections, section-capable dimensions merge
+        per-section states instead (see core/sections.py), so only edited
+        sections are re-processed.
+
+        A profiler records every dimension analyzed (cached results are not
+        stages) and makes the scheduler run sequentially.
 
         Returns:
-            AnalysisResults object with complete analysis
+            Dimension name -> raw result dict, in profile order
         """
-        import tempfile
-        from pathlib import Path
+        cache = self._get_result_cache(config)
+        if cache is None and not config.incremental_sections:
+            return self.scheduler.run(self.dimensions, text, lines, config, dimension_kwargs, deadline,
+                                      profiler)
+
+        keys = {}
+        results = {}
+        if cache is not None:
+            text_hash = content_hash(text)
+            keys = {
+                dim_name: result_key(text_hash, dim_name, dim.version, config)
+                for dim_name, dim in self.dimensions.items()
+            }
+            for dim_name, key in keys.items():
+                cached = cache.get(key)
+                if cached is not None:
+                    results[dim_name] = cached
+
+        missing = {name: dim for name, dim in self.dimensions.items() if name not in results}
+        computed = {}
+        if config.incremental_sections:
+            for dim_name, dim in list(missing.items()):
+                if not dim.supports_sections or (deadline is not None and deadline.expired):
+                    continue
+                try:
+                    with stage(profiler, dim_name, 'dimension'):
+                        result = analyze_by_sections(dim, text, config, self.section_states, store=cache)
+                except Exception as e:
+                    print(f"Warning: {dim_name} section analysis failed, analyzing whole text: {e}",
+                          file=sys.stderr)
+                    continue
+                if result is not None:
+                    computed[dim_name] = result
+                    del missing[dim_name]
+
+        if missing:
+            computed.update(self.scheduler.run(missing, text, lines, config, dimension_kwargs, deadline,
+                                               profiler))
+
+        for dim_name, result in computed.items():
+            results[dim_name] = result
+            if cache is not None and isinstance(result, dict) and result.get('available') is not False:
+                try:
+                    cache.put(keys[dim_name], dim_name, result)
+                except Exception as e:
+                    print(f"Warning: could not cache {dim_name} result: {e}", file=sys.stderr)
 
-        # Create a temporary file and delegate to analyze_file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
-            f.write(text)
-            temp_file = f.name
+        return {dim_name: results[dim_name] for dim_name in self.dimensions}
 
-        try:
-            results = self.analyze_file(temp_file, config=config)
-            return results
-        finally:
-            # Clean up temp file
-            Path(temp_file).unlink(missing_ok=True)
+    def _get_result_cache(self, config: AnalysisConfig) -> Optional[DimensionResultCache]:
+        """Return the result cache for config.cache_dir (None if caching is disabled or unavailable)."""
+        if not config.cache_dir:
+            return None
+
+        cache = self._result_caches.get(config.cache_dir)
+        if cache is None:
+            try:
+                cache = DimensionResultCache(config.cache_dir, max_bytes=config.cache_max_bytes)
+            except Exception as e:
+                print(f"Warning: result cache disabled ({config.cache_dir}): {e}", file=sys.stderr)
+                return None
+            self._result_caches[config.cache_dir] = cache
+        cache.max_bytes = config.cache_max_bytes
+        return cache
 
     def _enrich_dimension_results(self, dimension_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1096,15 +1313,22 @@ class AIPatternAnalyzer:
     # DETAILED ANALYSIS (LINE-BY-LINE)
     # ========================================================================
 
-    def analyze_file_detailed(self, file_path: str) -> DetailedAnalysis:
+    def analyze_file_detailed(self, file_path: str, config: Optional[AnalysisConfig] = None) -> DetailedAnalysis:
         """
         Analyze file with detailed line-by-line diagnostics.
 
         This method provides actionable feedback for each AI pattern detected,
         including line numbers, context, and specific suggestions for improvement.
 
+        Single pass: the standard analysis records match locations (AI
+        vocabulary, transitions, em-dashes, GLTR token ranks, spaCy sentences)
+        in a Findings recorder, and line-level findings are built from those
+        records. Anything a dimension did not record (sampled or truncated
+        analysis, cached result) is computed from the lines instead.
+
         Args:
             file_path: Path to markdown file to analyze
+            config: Analysis configuration (None = current behavior, uses DEFAULT_CONFIG)
 
         Returns:
             DetailedAnalysis object with line-by-line findings
@@ -1118,38 +1342,40 @@ class AIPatternAnalyzer:
 
         with open(path, 'r', encoding='utf-8') as f:
             text = f.read()
-            self.lines = text.splitlines()
 
-        # Run standard analysis for summary
-        standard_results = self.analyze_file(file_path)
+        # Run standard analysis for summary, recording match locations as it goes
+        findings = Findings(text)
+        self.lines = findings.lines
+        standard_results = self.analyze_text(text, config=config, file_path=file_path, findings=findings)
 
         # Run detailed analyses using dimension analyzers
         html_checker = self._is_line_in_html_comment
 
-        # Call dimension analyzers' analyze_detailed methods
-        vocab_instances = self._analyze_ai_vocabulary_detailed()
+        # Line-level findings from the recorded matches (line scans if not recorded)
+        vocab_instances = self._analyze_ai_vocabulary_detailed(findings)
         heading_issues = self._analyze_headings_detailed()
         uniform_paras = self._analyze_sentence_uniformity_detailed()
-        em_dash_instances = self._analyze_em_dashes_detailed()
-        transition_instances = self._analyze_transitions_detailed()
+        em_dash_instances = self._analyze_em_dashes_detailed(findings)
+        transition_instances = self._analyze_transitions_detailed(findings)
 
         # Advanced detailed analyses (using new dimensions dict pattern)
         burstiness_dim = self.dimensions.get('burstiness')
         burstiness_issues = burstiness_dim.analyze_detailed(self.lines, html_checker) if burstiness_dim and hasattr(burstiness_dim, 'analyze_detailed') else []
 
         syntactic_dim = self.dimensions.get('syntactic')
-        syntactic_issues = syntactic_dim.analyze_detailed(self.lines, html_checker) if syntactic_dim and hasattr(syntactic_dim, 'analyze_detailed') else []
+        syntactic_issues = syntactic_dim.analyze_detailed(self.lines, html_checker, findings=findings) if syntactic_dim and hasattr(syntactic_dim, 'analyze_detailed') else []
 
         # Story 2.0: Removed deprecated 'stylometric' dimension
         # Stylometric functionality replaced by ReadabilityDimension and TransitionMarkerDimension
 
         formatting_dim = self.dimensions.get('formatting')
-        formatting_issues = formatting_dim.analyze_detailed(self.lines, html_checker) if formatting_dim and hasattr(formatting_dim, 'analyze_detailed') else []
+        formatting_detailed = formatting_dim.analyze_detailed(self.lines, html_checker, findings=findings) if formatting_dim and hasattr(formatting_dim, 'analyze_detailed') else {}
+        formatting_issues = formatting_detailed.get('formatting_issues', [])
 
         # Story 2.0: High predictability segments come from PredictabilityDimension (GLTR analysis)
         # Removed fallback to 'advanced_lexical' (deprecated AdvancedDimension split in Story 1.4.5)
         predictability_dim = self.dimensions.get('predictability')
-        high_pred_segments = predictability_dim.analyze_detailed(self.lines, html_checker) if predictability_dim and hasattr(predictability_dim, 'analyze_detailed') else []
+        high_pred_segments = predictability_dim.analyze_detailed(self.lines, html_checker, findings=findings, config=config) if predictability_dim and hasattr(predictability_dim, 'analyze_detailed') else []
 
         # Build summary dict from standard results
         summary = {
@@ -1192,32 +1418,67 @@ class AIPatternAnalyzer:
             high_predictability_segments=high_pred_segments[:10] if isinstance(high_pred_segments, list) else [],
         )
 
-    def _analyze_ai_vocabulary_detailed(self) -> List[VocabInstance]:
-        """Detect AI vocabulary with line numbers and context."""
-        instances = []
+    def _recorded_matches(self, findings: Optional[Findings], key: str):
+        """
+        Matches recorded under key, located on their source lines.
 
-        for line_num, line in enumerate(self.lines, start=1):
-            # Skip HTML comments (metadata), headings, and code blocks
+        Matches on HTML comment, heading and code fence lines are dropped, as
+        the line scans skip those lines.
+
+        Returns:
+            List of (line_number, line, column, match) in text order, or None
+            if nothing was recorded (the caller scans the lines instead)
+        """
+        recorded = findings.get(key) if findings is not None else None
+        if recorded is None:
+            return None
+
+        located = []
+        for match in recorded:
+            line_index = findings.line_index(match[0])
+            if line_index >= len(findings.lines):
+                continue
+            line = findings.lines[line_index]
             if self._is_line_in_html_comment(line):
                 continue
             if line.strip().startswith('#') or line.strip().startswith('```'):
                 continue
+            located.append((line_index + 1, line, findings.column(match[0]), match))
+        return located
 
-            for pattern, suggestions in self.AI_VOCAB_REPLACEMENTS.items():
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    word = match.group()
-                    # Extract context (20 chars each side)
-                    start = max(0, match.start() - 20)
-                    end = min(len(line), match.end() + 20)
-                    context = f"...{line[start:end]}..."
-
-                    instances.append(VocabInstance(
-                        line_number=line_num,
-                        word=word,
-                        context=context,
-                        full_line=line.strip(),
-                        suggestions=suggestions[:5]  # Top 5 suggestions
-                    ))
+    def _analyze_ai_vocabulary_detailed(self, findings: Optional[Findings] = None) -> List[VocabInstance]:
+        """Detect AI vocabulary with line numbers and context (from recorded matches if any)."""
+        instances = []
+        suggestions_of = list(self.AI_VOCAB_REPLACEMENTS.values())
+
+        recorded = self._recorded_matches(findings, 'ai_vocab_replacements')
+        if recorded is not None:
+            # Same matches, in the same order, as the line scan below
+            located = sorted(
+                (line_num - 1, pattern_idx, column, word)
+                for line_num, line, column, (_, _, word, pattern_idx) in recorded
+                if column + len(word) <= len(line)
+            )
+        else:
+            # One scan of all lines; skip HTML comments (metadata), headings, and code blocks
+            matcher = lexicon_matcher(ai_vocab_replacements=tuple(self.AI_VOCAB_REPLACEMENTS))
+            index = LineIndex.of(self.lines, self._is_line_in_html_comment)
+            located = index.scan(matcher, 'ai_vocab_replacements', headings=True, fences=True)
+
+        for line_idx, pattern_idx, column, word in located:
+            line = self.lines[line_idx]
+            # Extract context (20 chars each side)
+            start = max(0, column - 20)
+            end = min(len(line), column + len(word) + 20)
+            context = f"...{line[start:end]}..."
+
+            instances.append(VocabInstance(
+                line_number=line_idx + 1,
+                word=word,
+                context=context,
+                full_line=line.strip(),
+                suggestions=suggestions_of[pattern_idx][:5]  # Top 5 suggestions
+            ))
 
         return instances
 
@@ -1226,7 +1487,9 @@ class AIPatternAnalyzer:
         issues = []
         heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$')
 
-        for line_num, line in enumerate(self.lines, start=1):
+        # Only lines starting with '#' can be headings
+        for line_idx in LineIndex.of(self.lines, self._is_line_in_html_comment).headings.indices():
+            line_num, line = line_idx + 1, self.lines[line_idx]
             match = heading_pattern.match(line.strip())
             if not match:
                 continue
@@ -1349,68 +1612,77 @@ class AIPatternAnalyzer:
 
         return uniform_paragraphs
 
-    def _analyze_em_dashes_detailed(self) -> List[EmDashInstance]:
-        """Detect em-dash usage with line numbers."""
+    def _analyze_em_dashes_detailed(self, findings: Optional[Findings] = None) -> List[EmDashInstance]:
+        """Detect em-dash usage with line numbers (from recorded matches if any)."""
         instances = []
         em_dash_pattern = re.compile(r'—|--')
 
-        for line_num, line in enumerate(self.lines, start=1):
-            # Skip HTML comments, headings, code blocks
-            if self._is_line_in_html_comment(line):
-                continue
-            if line.strip().startswith('#') or line.strip().startswith('```'):
-                continue
-
-            for match in em_dash_pattern.finditer(line):
-                # Extract context (40 chars each side)
-                start = max(0, match.start() - 40)
-                end = min(len(line), match.end() + 40)
-                context = f"...{line[start:end]}..."
-
+        recorded = self._recorded_matches(findings, 'em_dashes')
+        if recorded is not None:
+            for line_num, line, column, (start, end) in recorded:
                 instances.append(EmDashInstance(
                     line_number=line_num,
-                    context=context,
+                    context=f"...{line[max(0, column - 40):column + (end - start) + 40]}...",
                     problem='Em-dash overuse (ChatGPT uses 10x more than humans)',
                     suggestion='Replace with: comma, semicolon, period (new sentence), or parentheses'
                 ))
+            return instances
+
+        # One scan of all lines; skip HTML comments, headings, code blocks
+        index = LineIndex.of(self.lines, self._is_line_in_html_comment)
+        for line_idx, column, match in index.finditer(em_dash_pattern, headings=True, fences=True):
+            line = self.lines[line_idx]
+            # Extract context (40 chars each side)
+            start = max(0, column - 40)
+            end = min(len(line), column + len(match.group()) + 40)
+            context = f"...{line[start:end]}..."
+
+            instances.append(EmDashInstance(
+                line_number=line_idx + 1,
+                context=context,
+                problem='Em-dash overuse (ChatGPT uses 10x more than humans)',
+                suggestion='Replace with: comma, semicolon, period (new sentence), or parentheses'
+            ))
 
         return instances
 
-    def _analyze_transitions_detailed(self) -> List[TransitionInstance]:
-        """Detect formulaic transitions with line numbers."""
+    def _analyze_transitions_detailed(self, findings: Optional[Findings] = None) -> List[TransitionInstance]:
+        """Detect formulaic transitions with line numbers (from recorded matches if any)."""
         instances = []
-
-        formulaic_patterns = [
-            r'\bFurthermore,\b', r'\bMoreover,\b', r'\bAdditionally,\b',
-            r'\bIn addition,\b', r'\bIt is important to note that\b',
-            r'\bIt is worth mentioning that\b', r'\bWhen it comes to\b',
-            r'\bOne of the key aspects\b', r'\bFirst and foremost,\b',
-        ]
-
-        for line_num, line in enumerate(self.lines, start=1):
-            # Skip HTML comments, headings, code blocks
-            if self._is_line_in_html_comment(line):
-                continue
-            if line.strip().startswith('#') or line.strip().startswith('```'):
-                continue
-
-            for pattern in formulaic_patterns:
-                for match in re.finditer(pattern, line):
-                    phrase = match.group()
-                    # Extract context
-                    start = max(0, match.start() - 20)
-                    end = min(len(line), match.end() + 60)
-                    context = f"...{line[start:end]}..."
-
-                    # Get suggestions from TRANSITION_REPLACEMENTS
-                    suggestions = self.TRANSITION_REPLACEMENTS.get(phrase, ['Rephrase naturally'])
-
-                    instances.append(TransitionInstance(
-                        line_number=line_num,
-                        phrase=phrase,
-                        context=context,
-                        problem='Formulaic AI transition (humans use simpler connectives)',
-                        suggestions=suggestions[:5]
-                    ))
+        replacements = {phrase.lower(): values for phrase, values in self.TRANSITION_REPLACEMENTS.items()}
+
+        recorded = self._recorded_matches(findings, 'formulaic_transitions')
+        if recorded is not None:
+            for line_num, line, column, (_, _, phrase) in recorded:
+                start = max(0, column - 20)
+                end = min(len(line), column + len(phrase) + 60)
+                instances.append(TransitionInstance(
+                    line_number=line_num,
+                    transition=phrase,
+                    context=f"...{line[start:end]}...",
+                    suggestions=replacements.get(phrase.lower(), ['Rephrase naturally'])[:5]
+                ))
+            return instances
+
+        # One scan of all lines with the standard pass's patterns (PerplexityDimension);
+        # skip HTML comments, headings, code blocks
+        matcher = lexicon_matcher(formulaic_transitions=tuple(FORMULAIC_TRANSITIONS))
+        index = LineIndex.of(self.lines, self._is_line_in_html_comment)
+        for line_idx, _, column, phrase in index.scan(matcher, 'formulaic_transitions', headings=True, fences=True):
+            line = self.lines[line_idx]
+            # Extract context
+            start = max(0, column - 20)
+            end = min(len(line), column + len(phrase) + 60)
+            context = f"...{line[start:end]}..."
+
+            # Get suggestions from TRANSITION_REPLACEMENTS
+            suggestions = replacements.get(phrase.lower(), ['Rephrase naturally'])
+
+            instances.append(TransitionInstance(
+                line_number=line_idx + 1,
+                transition=phrase,
+                context=context,
+                suggestions=suggestions[:5]
+            ))
 
         return instances
@@ -0,0 +1,173 @@
+"""
+Batch analysis of many files, serially or on a process pool.
+
+With jobs > 1, files fan out to a spawn-based process pool. Each worker
+builds one AIPatternAnalyzer and warms its dimensions' models in the pool
+initializer, so model loading is paid once per worker rather than per file.
+
+- Results come back in input order, whatever order workers finish in.
+- A file that raises is reported as failed; the batch continues.
+- If a worker process dies (e.g. out of memory), the pool is rebuilt and the
+  unfinished files are retried once; files that fail twice are reported failed.
+- Every file carries its own wall time, for the batch timing summary.
+"""
+
+import os
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.results import AnalysisResults
+
+# Attempts per file when a worker process crashes (not when analysis raises)
+MAX_POOL_ATTEMPTS = 2
+
+# Per-worker analyzer, built once by _init_worker
+_worker_analyzer = None
+_worker_config = None
+
+
+@dataclass
+class BatchFileResult:
+    """Outcome of analyzing one file in a batch."""
+    file_path: str
+    elapsed_seconds: float
+    result: Optional[AnalysisResults] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was analyzed successfully."""
+        return self.error is None
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Map a --jobs value to a worker count (0 = one per CPU)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def analyze_files(
+    file_paths: List[str],
+    config: Optional[AnalysisConfig] = None,
+    jobs: int = 1,
+    domain_terms: Optional[List[str]] = None,
+    analyzer=None,
+    on_result: Optional[Callable[[BatchFileResult], None]] = None
+) -> List[BatchFileResult]:
+    """
+    Analyze files and return one BatchFileResult per path, in input order.
+
+    Args:
+        file_paths: Files to analyze
+        config: Analysis configuration applied to every file
+        jobs: Worker processes (1 = serial in this process, 0 = one per CPU)
+        domain_terms: Domain term patterns for each worker's analyzer
+        analyzer: Analyzer to use for serial runs (built from config if None)
+        on_result: Called with each BatchFileResult as soon as it finishes
+            (completion order - useful for progress output)
+
+    Returns:
+        List of BatchFileResult in the order of file_paths
+    """
+    config = config or DEFAULT_CONFIG
+    jobs = min(resolve_jobs(jobs), len(file_paths)) if file_paths else 1
+
+    if jobs <= 1:
+        if analyzer is None:
+            from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+            analyzer = AIPatternAnalyzer(domain_terms=domain_terms, config=config)
+        results = []
+        for file_path in file_paths:
+            outcome = _analyze_one(analyzer, file_path, config)
+            if on_result:
+                on_result(outcome)
+            results.append(outcome)
+        return results
+
+    return _analyze_in_pool(file_paths, config, jobs, domain_terms, on_result)
+
+
+def _analyze_in_pool(file_paths, config, jobs, domain_terms, on_result) -> List[BatchFileResult]:
+    """Fan files out to a process pool, rebuilding it if a worker dies."""
+    outcomes = {}
+    attempts = {file_path: 0 for file_path in file_paths}
+    pending = list(file_paths)
+
+    while pending:
+        crashed = []
+        # spawn: forking a parent that already loaded torch/spaCy threads can deadlock
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(pending)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(config, domain_terms)
+        ) as pool:
+            futures = {pool.submit(_analyze_in_worker, file_path): file_path for file_path in pending}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    outcome = future.result()
+                except BrokenProcessPool:
+                    attempts[file_path] += 1
+                    if attempts[file_path] < MAX_POOL_ATTEMPTS:
+                        crashed.append(file_path)
+                        continue
+                    outcome = BatchFileResult(file_path, 0.0, error='worker process crashed')
+                except Exception as e:
+                    outcome = BatchFileResult(file_path, 0.0, error=str(e))
+
+                outcomes[file_path] = outcome
+                if on_result:
+                    on_result(outcome)
+
+        if crashed:
+            print(f"Warning: worker process crashed; retrying {len(crashed)} file(s)", file=sys.stderr)
+        pending = [file_path for file_path in file_paths if file_path in crashed]
+
+    return [outcomes[file_path] for file_path in file_paths]
+
+
+def _init_worker(config: AnalysisConfig, domain_terms: Optional[List[str]]) -> None:
+    """Pool initializer: build this worker's analyzer and load its models once."""
+    global _worker_analyzer, _worker_config
+
+    # N workers x default torch intra-op threads would oversubscribe the CPUs
+    os.environ.setdefault('OMP_NUM_THREADS', '1')
+
+    from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+    _worker_config = config
+    _worker_analyzer = AIPatternAnalyzer(domain_terms=domain_terms, config=config)
+    warm_up_dimensions(_worker_analyzer, config)
+
+
+def warm_up_dimensions(analyzer, config: AnalysisConfig) -> None:
+    """Load every dimension's models up front (a failed warm-up only warns)."""
+    for dim_name, dim in analyzer.dimensions.items():
+        try:
+            dim.warm_up(config)
+        except Exception as e:
+            # The dimension reports the same failure per file; keep the process alive
+            print(f"Warning: {dim_name} warm-up failed: {e}", file=sys.stderr)
+
+
+def _analyze_in_worker(file_path: str) -> BatchFileResult:
+    """Analyze one file with this worker's resident analyzer."""
+    return _analyze_one(_worker_analyzer, file_path, _worker_config)
+
+
+def _analyze_one(analyzer, file_path: str, config: AnalysisConfig) -> BatchFileResult:
+    """Analyze one file, capturing its wall time and any error."""
+    start = time.perf_counter()
+    try:
+        result = analyzer.analyze_file(file_path, config=config)
+        return BatchFileResult(file_path, time.perf_counter() - start, result=result)
+    except Exception as e:
+        return BatchFileResult(file_path, time.perf_counter() - start, error=str(e))
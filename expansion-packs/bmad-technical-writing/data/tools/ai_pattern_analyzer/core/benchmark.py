@@ -0,0 +1,528 @@
+"""
+Scaling benchmarks for every dimension and the full analysis pipeline.
+
+The performance tests only assert loose wall-clock budgets for one document
+size, which cannot tell a linear dimension from one that accidentally became
+quadratic. This harness measures at several document sizes (1k to 1M words
+by default) and fits the scaling exponent of each series:
+
+- dimension:<name>@<mode>:   one dimension's analyze() on the document
+- pipeline:<profile>@<mode>: AIPatternAnalyzer.analyze_file() end to end
+
+The exponent k of time ~ words^k (least squares in log-log space) is about 1
+for linear work; above SUPERLINEAR_EXPONENT a series is flagged. Results are
+saved as a baseline JSON; a later run is compared against it with a relative
+regression tolerance (see compare()).
+
+Documents are generated deterministically (markdown with headings, lists,
+code blocks and AI-typical vocabulary), or built from a source file
+repeated to the requested word count.
+
+measure_results_memory() compares the memory of a book-sized batch of
+AnalysisResults in the compact representation (core/compact.py) with the
+same values stored as a plain dataclass of lists and dicts, as results were
+kept before.
+
+Usage:
+    >>> report = run_benchmarks(sizes=(1_000, 10_000), profiles=('fast',), modes=('full',))
+    >>> save_report(report, 'benchmark-baseline.json')
+    >>> rows = compare(load_report('benchmark-baseline.json'), report)
+    >>> print(format_comparison(rows))
+
+See cli/benchmark.py for the `ai-pattern-benchmark` command.
+"""
+
+import gc
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from dataclasses import asdict, fields, make_dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+
+REPORT_VERSION = 1
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_PROFILES = ('fast', 'balanced', 'full')
+DEFAULT_MODES = ('adaptive', 'full')
+
+# Series scaling faster than this are flagged (quadratic work fits ~2.0)
+SUPERLINEAR_EXPONENT = 1.5
+
+# Relative slowdown per size above which a comparison reports a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Measurements shorter than this are too noisy to compare or fit
+MIN_COMPARABLE_SECONDS = 0.005
+
+# Default results-memory batch: a 100k-word book in 20 chapters
+DEFAULT_BOOK_CHAPTERS = 20
+DEFAULT_CHAPTER_WORDS = 5_000
+
+_TOPICS = ('cache', 'index', 'queue', 'parser', 'scheduler', 'buffer', 'session', 'pipeline')
+_WORDS = (
+    'the', 'a', 'system', 'keeps', 'entries', 'until', 'memory', 'runs', 'low', 'and', 'then',
+    'evicts', 'older', 'ones', 'while', 'requests', 'wait', 'for', 'results', 'from', 'disk',
+    'each', 'worker', 'reads', 'small', 'batches', 'so', 'latency', 'stays', 'flat', 'under',
+    'load', 'we', 'measured', 'this', 'on', 'real', 'traffic', 'last', 'week',
+)
+_AI_PHRASES = (
+    'We delve into', 'Furthermore,', 'Moreover,', 'It is important to note that',
+    'a robust', 'a seamless', 'leverage', 'a pivotal', 'In addition,', 'holistic',
+)
+
+
+def generate_document(words: int, seed: int = 0) -> str:
+    """
+    Generate a deterministic markdown document of about `words` words.
+
+    Sections of a few paragraphs each, with varied sentence and paragraph
+    lengths, occasional lists, code blocks and AI-typical phrases.
+    """
+    rng = random.Random(seed)
+    parts = [f"# Benchmark Document ({words:,} words)\n\n"]
+    count = 0
+    section = 0
+    while count < words:
+        section += 1
+        topic = rng.choice(_TOPICS)
+        parts.append(f"## Section {section}: The {topic}\n\n")
+        for _ in range(rng.randint(2, 5)):
+            sentences = []
+            for _ in range(rng.randint(2, 7)):
+                body = [rng.choice(_WORDS) for _ in range(rng.randint(4, 28))]
+                if rng.random() < 0.2:
+                    body.insert(0, rng.choice(_AI_PHRASES))
+                body.insert(1 if len(body) > 1 else 0, topic)
+                sentence = ' '.join(body)
+                sentences.append(sentence[0].upper() + sentence[1:] + '.')
+                count += len(sentence.split())
+            parts.append(' '.join(sentences) + "\n\n")
+        if rng.random() < 0.3:
+            parts.append(''.join(f"- The {topic} {rng.choice(_WORDS)} {rng.choice(_WORDS)}\n"
+                                 for _ in range(rng.randint(2, 5))) + "\n")
+            count += 4
+        if rng.random() < 0.15:
+            parts.append(f"```python\n{topic}.put(key, value)\n```\n\n")
+    return ''.join(parts)
+
+
+def document_of_size(words: int, source: Optional[str] = None, seed: int = 0) -> str:
+    """
+    Document of about `words` words: generated, or `source` repeated and cut at a paragraph.
+
+    Args:
+        words: Target word count
+        source: Markdown text to repeat (None = generate_document())
+        seed: Seed for generated documents
+    """
+    if source is None:
+        return generate_document(words, seed)
+
+    source_words = len(source.split())
+    if source_words == 0:
+        raise ValueError("Benchmark source document has no words")
+    paragraphs = source.rstrip('\n').split('\n\n')
+    parts = []
+    count = 0
+    while count < words:
+        for paragraph in paragraphs:
+            parts.append(paragraph)
+            count += len(paragraph.split())
+            if count >= words:
+                break
+    return '\n\n'.join(parts) + '\n'
+
+
+def fit_exponent(points: Sequence[Tuple[float, float]]) -> Optional[float]:
+    """
+    Scaling exponent k of seconds ~ words^k by least squares on log-log points.
+
+    Args:
+        points: (words, seconds) pairs
+
+    Returns:
+        The fitted exponent, or None with fewer than two usable points
+        (measurements under MIN_COMPARABLE_SECONDS are ignored)
+    """
+    usable = [(math.log(w), math.log(s)) for w, s in points if w > 0 and s >= MIN_COMPARABLE_SECONDS]
+    if len({x for x, _ in usable}) < 2:
+        return None
+    mean_x = sum(x for x, _ in usable) / len(usable)
+    mean_y = sum(y for _, y in usable) / len(usable)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in usable)
+    variance = sum((x - mean_x) ** 2 for x, _ in usable)
+    return covariance / variance
+
+
+def _timed(func, repeat: int) -> float:
+    """Best wall time of `repeat` calls."""
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _benchmark_config(profile: str, mode: str) -> AnalysisConfig:
+    return AnalysisConfig(mode=AnalysisMode(mode), dimension_profile=profile,
+                          max_analysis_time_seconds=None)
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    profiles: Iterable[str] = DEFAULT_PROFILES,
+    modes: Iterable[str] = DEFAULT_MODES,
+    repeat: int = 1,
+    source: Optional[str] = None,
+    dimensions: bool = True,
+    progress=None
+) -> Dict[str, Any]:
+    """
+    Measure dimensions and the pipeline at every size, profile and mode.
+
+    Each dimension is measured once per mode (with the first profile that
+    loads it); the pipeline once per profile and mode. Models are loaded by a
+    warm-up run, so timings exclude one-time model loading.
+
+    Args:
+        sizes: Document sizes in words
+        profiles: Dimension profiles for pipeline series
+        modes: Analysis modes (AnalysisMode values)
+        repeat: Runs per measurement (the best is kept)
+        source: Markdown text to repeat instead of generated documents
+        dimensions: Also measure each dimension on its own
+        progress: Optional callable receiving a status line per measurement
+
+    Returns:
+        Report dict (see save_report()) with 'series' of
+        {'sizes': {words: seconds}, 'exponent': k}
+    """
+    from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+    from ai_pattern_analyzer.core.document_context import DocumentContext
+
+    sizes = sorted(set(sizes))
+    profiles = list(profiles)
+    modes = list(modes)
+    report_progress = progress or (lambda line: None)
+    series: Dict[str, Dict[str, float]] = {}
+
+    def record(key: str, words: int, seconds: float) -> None:
+        series.setdefault(key, {})[str(words)] = seconds
+        report_progress(f"{key} {words:,} words: {seconds:.3f}s")
+
+    analyzers = {}
+    measured = set()
+    with tempfile.TemporaryDirectory(prefix='ai-pattern-benchmark-') as workdir:
+        for words in sizes:
+            text = document_of_size(words, source)
+            path = os.path.join(workdir, f'document-{words}.md')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+            for profile in profiles:
+                for mode in modes:
+                    config = _benchmark_config(profile, mode)
+                    analyzer = analyzers.get((profile, mode))
+                    if analyzer is None:
+                        analyzer = analyzers[(profile, mode)] = AIPatternAnalyzer(config=config)
+                        analyzer.analyze_text(text, config=config)  # warm-up: load models
+
+                    record(f'pipeline:{profile}@{mode}', words,
+                           _timed(lambda: analyzer.analyze_file(path, config=config), repeat))
+
+                    if not dimensions:
+                        continue
+                    stripped = analyzer._strip_html_comments(text)
+                    context = DocumentContext.from_text(stripped)
+                    lines = list(context.lines)
+                    for name, dim in analyzer.dimensions.items():
+                        key = f'dimension:{name}@{mode}'
+                        if (key, words) in measured:
+                            continue
+                        measured.add((key, words))
+                        kwargs = {'config': config, 'context': context}
+                        if name in ('structure', 'formatting'):
+                            kwargs['word_count'] = context.prose_word_count
+                        record(key, words, _timed(lambda: dim.analyze(stripped, lines, **kwargs), repeat))
+
+    return {
+        'version': REPORT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'source': 'generated' if source is None else 'file',
+        'repeat': repeat,
+        'series': {
+            key: {'sizes': points, 'exponent': fit_exponent([(int(w), s) for w, s in points.items()])}
+            for key, points in series.items()
+        },
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    """Write a benchmark report as JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """
+    Read a benchmark report written by save_report().
+
+    Raises:
+        ValueError: If the file is not a benchmark report of this version
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    if not isinstance(report, dict) or report.get('version') != REPORT_VERSION or 'series' not in report:
+        raise ValueError(f"{path} is not a version {REPORT_VERSION} benchmark report")
+    return report
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """
+    Compare two reports series by series and size by size.
+
+    A size regresses when it is slower than baseline * (1 + tolerance) (both
+    above MIN_COMPARABLE_SECONDS); a series regresses when its exponent
+    crosses SUPERLINEAR_EXPONENT.
+
+    Returns:
+        One row per (series, size) plus one exponent row per series:
+        {'series', 'size' (words, or 'exponent'), 'baseline', 'current',
+        'ratio', 'status'} with status 'ok', 'faster', 'regression', 'new'
+        or 'missing'
+    """
+    rows = []
+    base_series = baseline.get('series', {})
+    current_series = current.get('series', {})
+    for key in sorted(set(base_series) | set(current_series)):
+        base_points = base_series.get(key, {}).get('sizes', {})
+        current_points = current_series.get(key, {}).get('sizes', {})
+        for size in sorted(set(base_points) | set(current_points), key=int):
+            before = base_points.get(size)
+            after = current_points.get(size)
+            rows.append(_compare_row(key, int(size), before, after, tolerance))
+
+        before = base_series.get(key, {}).get('exponent')
+        after = current_series.get(key, {}).get('exponent')
+        if after is not None and after > SUPERLINEAR_EXPONENT and (before is None or before <= SUPERLINEAR_EXPONENT):
+            status = 'regression'
+        elif before is None or after is None:
+            status = 'new' if before is None else 'missing'
+        else:
+            status = 'ok'
+        rows.append({'series': key, 'size': 'exponent', 'baseline': before, 'current': after,
+                     'ratio': None, 'status': status})
+    return rows
+
+
+def _compare_row(key: str, size: int, before: Optional[float], after: Optional[float],
+                 tolerance: float) -> Dict[str, Any]:
+    row = {'series': key, 'size': size, 'baseline': before, 'current': after, 'ratio': None}
+    if before is None:
+        row['status'] = 'new'
+    elif after is None:
+        row['status'] = 'missing'
+    else:
+        row['ratio'] = after / before if before > 0 else None
+        if before < MIN_COMPARABLE_SECONDS and after < MIN_COMPARABLE_SECONDS:
+            row['status'] = 'ok'
+        elif after > before * (1 + tolerance):
+            row['status'] = 'regression'
+        elif after < before / (1 + tolerance):
+            row['status'] = 'faster'
+        else:
+            row['status'] = 'ok'
+    return row
+
+
+def has_regressions(rows: List[Dict[str, Any]]) -> bool:
+    """Whether any compare() row is a regression."""
+    return any(row['status'] == 'regression' for row in rows)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Text table of compare() rows."""
+    def number(value: Optional[float], fmt: str) -> str:
+        return '-' if value is None else format(value, fmt)
+
+    header = f"{'SERIES':<36} {'SIZE':>10} {'BASELINE':>10} {'CURRENT':>10} {'RATIO':>7}  STATUS"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        if row['size'] == 'exponent':
+            size, fmt = 'exponent', '.2f'
+        else:
+            size, fmt = f"{row['size']:,}", '.3f'
+        status = row['status'].upper() if row['status'] == 'regression' else row['status']
+        lines.append(f"{row['series']:<36} {size:>10} {number(row['baseline'], fmt):>10} "
+                     f"{number(row['current'], fmt):>10} {number(row['ratio'], '.2f'):>7}  {status}")
+    regressions = sum(1 for row in rows if row['status'] == 'regression')
+    lines.append('-' * len(header))
+    lines.append(f"{regressions} regression(s) at tolerance" if regressions else "No regressions")
+    return '\n'.join(lines)
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Text table of one report: seconds per size and the fitted exponent per series."""
+    sizes = sorted({int(size) for series in report['series'].values() for size in series['sizes']})
+    header = f"{'SERIES':<36} " + ' '.join(f"{size:>10,}" for size in sizes) + f" {'EXPONENT':>9}"
+    lines = [header, '-' * len(header)]
+    for key, series in sorted(report['series'].items()):
+        cells = ' '.join(
+            f"{series['sizes'][str(size)]:>10.3f}" if str(size) in series['sizes'] else f"{'-':>10}"
+            for size in sizes
+        )
+        exponent = series.get('exponent')
+        flag = ' !' if exponent is not None and exponent > SUPERLINEAR_EXPONENT else ''
+        lines.append(f"{key:<36} {cells} {'-' if exponent is None else format(exponent, '.2f'):>9}{flag}")
+    return '\n'.join(lines)
+
+
+def _deep_size(root: Any) -> int:
+    """Bytes of root and every object reachable through containers and attributes, each counted once."""
+    seen = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, int, float, array, type)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            if hasattr(obj, '__dict__'):
+                stack.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                slots = getattr(cls, '__slots__', ())
+                for name in (slots,) if isinstance(slots, str) else slots:
+                    if hasattr(obj, name):
+                        stack.append(getattr(obj, name))
+    return total
+
+
+def _traced_peak(func) -> int:
+    """Peak bytes allocated while func() runs (tracemalloc)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_results_memory(
+    chapters: int = DEFAULT_BOOK_CHAPTERS,
+    words: int = DEFAULT_CHAPTER_WORDS,
+    profile: str = 'fast',
+    mode: str = 'full',
+    progress=None
+) -> Dict[str, Any]:
+    """
+    Compare the memory of a batch of results in the compact and list representations.
+
+    Analyzes `chapters` generated documents of `words` words each, then
+    measures both representations of the same results:
+
+    - compact: the AnalysisResults as analyzed (__slots__, IntSeries series,
+      Records detail payloads), formatted with json_default
+    - list: the same values in a plain dataclass of lists and dicts,
+      formatted through dataclasses.asdict() (the previous JSON path)
+
+    Args:
+        chapters: Documents in the batch
+        words: Words per document
+        profile: Dimension profile
+        mode: Analysis mode (AnalysisMode value)
+        progress: Optional callable receiving a status line per document
+
+    Returns:
+        Report dict with per-representation 'retained_bytes' (deep size of
+        the whole batch) and 'serialize_peak_bytes' (peak allocation while
+        formatting each result as JSON), and the compact/list ratios
+    """
+    from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+    from ai_pattern_analyzer.core.compact import json_default
+    from ai_pattern_analyzer.core.results import AnalysisResults
+
+    report_progress = progress or (lambda line: None)
+    config = _benchmark_config(profile, mode)
+    analyzer = AIPatternAnalyzer(config=config)
+    results = []
+    for chapter in range(chapters):
+        text = generate_document(words, seed=chapter)
+        results.append(analyzer.analyze_text(text, config=config))
+        report_progress(f"analyzed chapter {chapter + 1}/{chapters} ({words:,} words)")
+
+    list_results_class = make_dataclass('ListAnalysisResults', [(f.name, Any) for f in fields(AnalysisResults)])
+    list_results = [list_results_class(**result.to_dict()) for result in results]
+
+    def serialize_compact():
+        for result in results:
+            json.dumps(result.to_dict(shallow=True), indent=2, default=json_default)
+
+    def serialize_list():
+        for result in list_results:
+            json.dumps(asdict(result), indent=2)
+
+    representations = {
+        'compact': {'retained_bytes': _deep_size(results), 'serialize_peak_bytes': _traced_peak(serialize_compact)},
+        'list': {'retained_bytes': _deep_size(list_results), 'serialize_peak_bytes': _traced_peak(serialize_list)},
+    }
+    compact, plain = representations['compact'], representations['list']
+    return {
+        'version': REPORT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'documents': chapters,
+        'words_per_document': words,
+        'profile': profile,
+        'mode': mode,
+        'representations': representations,
+        'retained_ratio': compact['retained_bytes'] / plain['retained_bytes'],
+        'serialize_peak_ratio': compact['serialize_peak_bytes'] / plain['serialize_peak_bytes'],
+    }
+
+
+def format_memory_report(report: Dict[str, Any]) -> str:
+    """Text table of a measure_results_memory() report."""
+    representations = report['representations']
+    header = f"{'REPRESENTATION':<16} {'RETAINED':>14} {'PER DOCUMENT':>14} {'JSON PEAK':>14}"
+    lines = [
+        f"{report['documents']} documents x {report['words_per_document']:,} words "
+        f"({report['profile']} profile, {report['mode']} mode)",
+        header,
+        '-' * len(header),
+    ]
+    for name in ('list', 'compact'):
+        entry = representations[name]
+        lines.append(f"{name:<16} {entry['retained_bytes']:>14,} "
+                     f"{entry['retained_bytes'] // max(1, report['documents']):>14,} "
+                     f"{entry['serialize_peak_bytes']:>14,}")
+    lines.append('-' * len(header))
+    lines.append(f"compact/list: retained {report['retained_ratio']:.2f}, "
+                 f"JSON peak {report['serialize_peak_ratio']:.2f}")
+    return '\n'.join(lines)
@@ -0,0 +1,207 @@
+"""
+Compact storage for analysis results.
+
+A batch run keeps one AnalysisResults per file until it is reported. Stored
+as plain Python objects, every per-sentence and per-section series is a list
+(an 8-byte pointer per value, plus an int object for values above 256), every
+per-heading detail record is a dict, and every result carries a __dict__ of
+some 250 fields. This module provides the compact equivalents:
+
+- IntSeries: array('I')-backed series of non-negative integers (4 bytes per
+  value) that prints, compares and serializes like a list
+- Records: detail records stored column by column, materialized as dicts
+  only when an item is read
+- slotted(): gives a dataclass __slots__ (dataclass(slots=True) needs
+  Python 3.10)
+- to_plain() / json_default(): turn them back into lists and dicts when a
+  formatter asks for a dict or JSON
+
+NumPy is an optional dependency here, so the series use the standard
+library's array; the dimensions only produce integer series.
+
+Usage:
+    >>> lengths = IntSeries([12, 7, 31])
+    >>> lengths == [12, 7, 31], statistics.mean(lengths)
+    (True, 16.666666666666668)
+    >>> json.dumps({'lengths': lengths}, default=json_default)
+    '{"lengths": [12, 7, 31]}'
+"""
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Iterable, Iterator
+
+# 'I' is a 4-byte unsigned int on all supported platforms
+_TYPECODE = 'I'
+_MAX_VALUE = 2 ** (8 * array(_TYPECODE).itemsize) - 1
+
+
+class IntSeries(array):
+    """
+    Series of non-negative integers in a typed array.
+
+    Behaves as the list it replaces where the analyzers and formatters use
+    it: iteration, indexing, slicing (which returns an IntSeries), len(),
+    statistics, equality with lists and a list-style repr.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, values: Iterable[int] = ()):
+        return super().__new__(cls, _TYPECODE, values)
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        return IntSeries(item) if isinstance(index, slice) else item
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return self.tolist() == other
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        if isinstance(other, list):
+            return self.tolist() != other
+        return super().__ne__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    def __copy__(self) -> 'IntSeries':
+        return IntSeries(self)
+
+    def __deepcopy__(self, memo) -> 'IntSeries':
+        return IntSeries(self)
+
+
+def compact_ints(values: Any) -> Any:
+    """
+    IntSeries of values, or values unchanged if they are not all ints in the
+    array's range (floats, bools, negative numbers, None).
+    """
+    if isinstance(values, IntSeries) or values is None:
+        return values
+    if not all(type(value) is int and 0 <= value <= _MAX_VALUE for value in values):
+        return values
+    return IntSeries(values)
+
+
+class Records(Sequence):
+    """
+    Read-only sequence of detail records (dicts with the same keys).
+
+    Each key's values are stored as one column - an IntSeries for integer
+    values, a tuple otherwise - instead of one dict per record. Reading an
+    item builds its dict; equality with a list of dicts and repr behave as
+    for that list.
+    """
+
+    __slots__ = ('_keys', '_columns', '_length')
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        """
+        Args:
+            records: Dicts that all have the keys of the first one
+        """
+        records = records if isinstance(records, list) else list(records)
+        self._keys = tuple(records[0]) if records else ()
+        self._length = len(records)
+        columns = []
+        for key in self._keys:
+            values = [record[key] for record in records]
+            column = compact_ints(values)
+            columns.append(tuple(values) if column is values else column)
+        self._columns = tuple(columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('record index out of range')
+        return {key: column[index] for key, column in zip(self._keys, self._columns)}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for values in zip(*self._columns):
+            yield dict(zip(self._keys, values))
+
+    def column(self, key: str) -> Sequence:
+        """All values of one key, without building the records."""
+        return self._columns[self._keys.index(key)]
+
+    def __eq__(self, other):
+        if isinstance(other, Records):
+            return self._keys == other._keys and self._columns == other._columns
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def slotted(cls):
+    """
+    Class decorator giving a dataclass __slots__ (apply above @dataclass).
+
+    The backport of dataclass(slots=True): the class is re-created with a
+    slot per field, so instances have no per-instance __dict__. Field
+    defaults already live in the generated __init__.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Copy of value with compact containers as lists and dataclasses as dicts.
+
+    Like dataclasses.asdict() for nested values: dicts, lists and tuples are
+    copied, other values (strings, numbers, ...) are shared.
+    """
+    if isinstance(value, IntSeries):
+        return value.tolist()
+    if isinstance(value, Records):
+        return list(value)
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    if isinstance(value, tuple):
+        items = [to_plain(item) for item in value]
+        return type(value)(*items) if hasattr(value, '_fields') else tuple(items)
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: to_plain(getattr(value, f.name)) for f in fields(value)}
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """
+    json.dumps() default= hook for compact containers and dataclasses.
+
+    Serializes results without first copying them into plain dicts.
+
+    Raises:
+        TypeError: For any other non-serializable value (as json.dumps does)
+    """
+    if isinstance(value, IntSeries):
+        return value.tolist()
+    if isinstance(value, Records):
+        return list(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
@@ -0,0 +1,894 @@
+"""
+Local analysis daemon: resident analyzers behind a JSON API.
+
+Every `analyze-ai-patterns` run first imports the dimensions and loads their
+models (spaCy, the predictability and sentiment transformers), which costs
+seconds. The analysis of one chapter after that is often far quicker.
+`analyze-ai-patterns serve` starts an AnalysisDaemon instead. It keeps one
+warm analyzer per dimension profile and backend, and serves JSON requests
+on a local HTTP port or a Unix socket:
+
+    POST /analyze-text   {"text": "...", "config": {...}}
+    POST /analyze-file   {"path": "/abs/chapter.md", "config": {...}, "score": {...}}
+    POST /batch          {"paths": ["/abs/a.md", ...], "config": {...}}
+    GET  /health
+    GET  /metrics        Prometheus text exposition format
+
+- POST bodies must be sent with "Content-Type: application/json"; other
+  types get 415.
+- "config" holds AnalysisConfig fields (REQUEST_CONFIG_FIELDS); unset
+  fields take the daemon's defaults. The result cache directory is the
+  daemon's own (`serve --cache-dir`), not a request field.
+- Requests wait in a bounded queue for a worker. When the queue is full,
+  the daemon answers 503 at once instead of letting requests pile up.
+- Every request has a deadline: "deadline_seconds", or the daemon's
+  request timeout by default. A request still queued at its deadline gets
+  504 without being analyzed. A running one is stopped cooperatively
+  (core/deadline.py) and returns its partial result, with the cut-off
+  dimensions in unfinished_dimensions.
+
+The daemon records its address in a state file. find_daemon() reads that
+file, or the AI_PATTERN_DAEMON environment variable, and checks /health.
+The CLI uses it to forward analyses to a running daemon through
+DaemonClient.
+
+The daemon only listens on a loopback address or a Unix socket (mode
+0600). Requests name files on the daemon's machine, and there is no
+authentication. Requiring a JSON content type keeps web pages from posting
+to the daemon: browsers cannot send one cross-origin without a preflight,
+which the daemon does not answer.
+
+Usage:
+    >>> daemon = AnalysisDaemon('unix:/tmp/analyzer.sock', workers=1, queue_size=16)
+    >>> daemon.preload(['balanced'])
+    >>> daemon.serve_forever()
+
+    >>> client = find_daemon()
+    >>> results = client.analyze_file('/abs/chapter-01.md', AnalysisConfig())
+"""
+
+import http.client
+import ipaddress
+import json
+import os
+import queue
+import socket
+import stat
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from ai_pattern_analyzer.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.batch import BatchFileResult, warm_up_dimensions
+from ai_pattern_analyzer.core.compact import json_default
+from ai_pattern_analyzer.core.deadline import Deadline
+from ai_pattern_analyzer.core.result_cache import RESULT_CONFIG_FIELDS
+from ai_pattern_analyzer.core.results import AnalysisResults
+
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_REQUEST_TIMEOUT = 300.0
+
+# Environment variable naming the daemon address (overrides the state file)
+DAEMON_ENV = 'AI_PATTERN_DAEMON'
+
+# How long the client waits for /health before analyzing locally
+HEALTH_TIMEOUT_SECONDS = 0.5
+
+# How long a running analysis may overrun its deadline while it stops
+DEADLINE_GRACE_SECONDS = 5.0
+
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+# AnalysisConfig fields a request may set
+REQUEST_CONFIG_FIELDS = RESULT_CONFIG_FIELDS + (
+    'dimension_profile',
+    'dimensions_to_load',
+    'max_analysis_time_seconds',
+    'incremental_sections',
+)
+
+ENDPOINTS = ('/analyze-text', '/analyze-file', '/batch', '/health', '/metrics')
+
+
+class DaemonError(Exception):
+    """A request the daemon refused or failed, with its HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class DaemonUnavailable(DaemonError):
+    """The daemon cannot take the request (not reachable, or queue full)."""
+
+
+def state_dir() -> Path:
+    """Directory of the daemon's state file and default socket."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join('~', '.cache')
+    return Path(cache_home).expanduser() / 'ai-pattern-analyzer'
+
+
+def default_state_file() -> Path:
+    """State file recording the running daemon's address."""
+    return state_dir() / 'daemon.json'
+
+
+def default_address() -> str:
+    """Unix socket in state_dir(), or 127.0.0.1:DEFAULT_PORT without Unix sockets."""
+    if hasattr(socket, 'AF_UNIX'):
+        return f"unix:{state_dir() / 'daemon.sock'}"
+    return f"http://127.0.0.1:{DEFAULT_PORT}"
+
+
+def parse_address(address: str) -> Tuple[str, Any]:
+    """
+    Split a daemon address into its transport and location.
+
+    Args:
+        address: "unix:/path/to.sock", "http://127.0.0.1:8765" or "127.0.0.1:8765"
+
+    Returns:
+        ('unix', socket path) or ('tcp', (host, port))
+
+    Raises:
+        ValueError: If the address is neither form
+    """
+    if address.startswith('unix:'):
+        return 'unix', address[len('unix:'):]
+    location = address[len('http://'):] if address.startswith('http://') else address
+    host, separator, port = location.rstrip('/').rpartition(':')
+    if not separator or not host or not port.isdigit():
+        raise ValueError(f"Invalid daemon address: {address!r} (expected unix:PATH or HOST:PORT)")
+    return 'tcp', (host, int(port))
+
+
+def is_loopback_host(host: str) -> bool:
+    """Whether host names this machine's loopback interface."""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def config_to_request(config: AnalysisConfig) -> Dict[str, Any]:
+    """The request "config" object for an AnalysisConfig."""
+    values = {}
+    for name in REQUEST_CONFIG_FIELDS:
+        value = getattr(config, name)
+        values[name] = getattr(value, 'value', value)  # Enums by value
+    return values
+
+
+def config_from_request(values: Optional[Dict[str, Any]], base: AnalysisConfig = DEFAULT_CONFIG) -> AnalysisConfig:
+    """
+    AnalysisConfig for a request "config" object, with unset fields from base.
+
+    Raises:
+        DaemonError: 400 for an unknown field or an invalid value
+    """
+    if values is None:
+        return base
+    if not isinstance(values, dict):
+        raise DaemonError(400, '"config" must be an object')
+    unknown = sorted(set(values) - set(REQUEST_CONFIG_FIELDS))
+    if unknown:
+        raise DaemonError(400, f"Unsupported config fields: {', '.join(unknown)}")
+    values = dict(values)
+    try:
+        if 'mode' in values:
+            values['mode'] = AnalysisMode(values['mode'])
+        return replace(base, **values)
+    except (TypeError, ValueError) as e:
+        raise DaemonError(400, f"Invalid config: {e}")
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+class DaemonMetrics:
+    """Request counters and timings behind GET /metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests: Dict[Tuple[str, int], int] = defaultdict(int)
+        self.durations: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        self.files_analyzed = 0
+        self.busy_workers = 0
+        self.analyzer_load_seconds: Dict[Tuple[str, str], float] = {}
+
+    def observe(self, endpoint: str, status: int, seconds: float) -> None:
+        """Record one answered request."""
+        with self._lock:
+            self.requests[(endpoint, status)] += 1
+            duration = self.durations[endpoint]
+            duration[0] += 1
+            duration[1] += seconds
+
+    def add(self, name: str, amount: int = 1) -> None:
+        """Add to an integer counter or gauge attribute."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def render(self, queue_depth: int, queue_capacity: int, workers: int) -> str:
+        """Metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            """samples: (name suffix, labels, value) tuples."""
+            lines.append(f"# HELP ai_pattern_daemon_{name} {help_text}")
+            lines.append(f"# TYPE ai_pattern_daemon_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ','.join(f'{key}="{label}"' for key, label in labels)
+                lines.append(f"ai_pattern_daemon_{name}{suffix}{{{label_text}}} {value}" if labels
+                             else f"ai_pattern_daemon_{name}{suffix} {value}")
+
+        with self._lock:
+            metric('requests_total', 'counter', 'Requests answered, by endpoint and HTTP status.',
+                   [('', (('endpoint', endpoint), ('status', status)), count)
+                    for (endpoint, status), count in sorted(self.requests.items())])
+            durations = sorted(self.durations.items())
+            metric('request_duration_seconds', 'summary', 'Request wall time including queueing.',
+                   [('_sum', (('endpoint', endpoint),), f"{total:.6f}") for endpoint, (_, total) in durations]
+                   + [('_count', (('endpoint', endpoint),), count) for endpoint, (count, _) in durations])
+            metric('queue_depth', 'gauge', 'Requests waiting for a worker.', [('', (), queue_depth)])
+            metric('queue_capacity', 'gauge', 'Requests that may wait before new ones get 503.',
+                   [('', (), queue_capacity)])
+            metric('workers', 'gauge', 'Analysis worker threads.', [('', (), workers)])
+            metric('busy_workers', 'gauge', 'Workers analyzing a request.', [('', (), self.busy_workers)])
+            metric('files_analyzed_total', 'counter', 'Texts and files analyzed.',
+                   [('', (), self.files_analyzed)])
+            metric('analyzer_load_seconds', 'gauge', 'Time to load and warm each resident analyzer.',
+                   [('', (('profile', profile), ('backend', backend)), f"{seconds:.3f}")
+                    for (profile, backend), seconds in sorted(self.analyzer_load_seconds.items())])
+            metric('uptime_seconds', 'gauge', 'Seconds since the daemon started.',
+                   [('', (), f"{time.time() - self.started:.1f}")])
+        return '\n'.join(lines) + '\n'
+
+
+class _ResidentAnalyzer:
+    """A warm analyzer and the lock serializing its analyses."""
+
+    __slots__ = ('analyzer', 'lock')
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.lock = threading.Lock()
+
+
+class _Job:
+    """One queued request: its work, deadline and outcome."""
+
+    __slots__ = ('work', 'deadline', 'started', 'done', 'status', 'payload')
+
+    def __init__(self, work: Callable[[Deadline], Dict[str, Any]], deadline: Deadline):
+        self.work = work
+        self.deadline = deadline
+        self.started = False
+        self.done = threading.Event()
+        self.status = 500
+        self.payload: Dict[str, Any] = {}
+
+    def finish(self, status: int, payload: Dict[str, Any]) -> None:
+        self.status = status
+        self.payload = payload
+        self.done.set()
+
+
+def _build_analyzer(config: AnalysisConfig, domain_terms: Optional[List[str]]):
+    """Default analyzer factory: an AIPatternAnalyzer with its models loaded."""
+    from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+    analyzer = AIPatternAnalyzer(domain_terms=domain_terms, config=config)
+    warm_up_dimensions(analyzer, config)
+    return analyzer
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Hands each HTTP request to the server's AnalysisDaemon."""
+
+    def do_GET(self):
+        self.server.analysis_daemon.handle(self, 'GET')
+
+    def do_POST(self):
+        self.server.analysis_daemon.handle(self, 'POST')
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.analysis_daemon.log_requests:
+            super().log_message(format, *args)
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+if hasattr(socket, 'AF_UNIX'):
+    from socketserver import UnixStreamServer
+
+    class _UnixServer(ThreadingMixIn, UnixStreamServer):
+        daemon_threads = True
+
+        def server_bind(self):
+            super().server_bind()
+            os.chmod(self.server_address, stat.S_IRUSR | stat.S_IWUSR)
+
+
+class AnalysisDaemon:
+    """
+    Serves analysis requests with resident, warm analyzers.
+
+    Analyzers are built on first use (or by preload()) per dimension
+    profile, explicit dimension list, inference backend and domain terms,
+    and kept for the daemon's lifetime. Each analyzer analyzes one request
+    at a time, so with several workers the extra workers only help with
+    requests for different profiles.
+    """
+
+    def __init__(self, address: Optional[str] = None, config: Optional[AnalysisConfig] = None,
+                 workers: int = 1, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                 state_file: Optional[Path] = None, log_requests: bool = False,
+                 analyzer_factory: Optional[Callable] = None):
+        """
+        Bind the server (requests are served once serve_forever() or start() runs).
+
+        Args:
+            address: "unix:PATH" or "HOST:PORT" with a loopback HOST (port
+                0 = any free port; default: default_address())
+            config: Defaults for fields a request's "config" does not set,
+                and the result cache directory (config.cache_dir)
+            workers: Worker threads analyzing queued requests
+            queue_size: Requests that may wait for a worker; more get 503
+            request_timeout: Deadline of requests without "deadline_seconds"
+            state_file: Where to record the address for find_daemon()
+                (None = no state file)
+            log_requests: Log each request to stderr
+            analyzer_factory: Builds an analyzer from (config, domain_terms)
+                (default: AIPatternAnalyzer with warmed-up models)
+
+        Raises:
+            ValueError: If HOST is not a loopback address
+            OSError: If the address is in use (e.g. another daemon is running)
+        """
+        self.config = config or DEFAULT_CONFIG
+        self.workers = workers
+        self.queue_size = queue_size
+        self.request_timeout = request_timeout
+        self.state_file = Path(state_file) if state_file else None
+        self.log_requests = log_requests
+        self.metrics = DaemonMetrics()
+        self._analyzer_factory = analyzer_factory or _build_analyzer
+        self._analyzers: Dict[Tuple, _ResidentAnalyzer] = {}
+        self._analyzers_lock = threading.Lock()
+        self._queue: 'queue.Queue[Optional[_Job]]' = queue.Queue(maxsize=queue_size)
+        self._threads: List[threading.Thread] = []
+        self._serving = False
+        self._server = self._bind(address or default_address())
+
+    def _bind(self, address: str):
+        transport, location = parse_address(address)
+        if transport == 'unix':
+            if not hasattr(socket, 'AF_UNIX'):
+                raise OSError('Unix sockets are not supported on this platform; use a port')
+            Path(location).parent.mkdir(parents=True, exist_ok=True)
+            self._remove_stale_socket(location)
+            server = _UnixServer(location, _RequestHandler)
+            self.address = f"unix:{location}"
+        else:
+            if not is_loopback_host(location[0]):
+                raise ValueError(f"Refusing to listen on {location[0]}: the daemon has no authentication, "
+                                 f"use a loopback address or a Unix socket")
+            server = _TCPServer(location, _RequestHandler)
+            host, port = server.server_address[:2]
+            self.address = f"http://{host}:{port}"
+        server.analysis_daemon = self
+        return server
+
+    @staticmethod
+    def _remove_stale_socket(path: str) -> None:
+        """Remove a socket file left by a daemon that exited without cleaning up."""
+        if not os.path.exists(path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+        finally:
+            probe.close()
+        raise OSError(f"An analysis daemon is already listening on {path}")
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def preload(self, profiles: Sequence[str]) -> None:
+        """Build and warm the analyzers of these dimension profiles now."""
+        for profile in profiles:
+            self.resident_analyzer(replace(self.config, dimension_profile=profile))
+
+    def serve_forever(self) -> None:
+        """Serve requests in this thread until close() (or KeyboardInterrupt)."""
+        self._start_workers()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._serving = False
+
+    def start(self) -> threading.Thread:
+        """Serve requests on a background thread; returns the thread."""
+        self._start_workers()
+        thread = threading.Thread(target=self._server.serve_forever, name='analysis-daemon', daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        return thread
+
+    def _start_workers(self) -> None:
+        if self._serving:
+            return
+        self._serving = True
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f'analysis-worker-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if self.state_file:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self.state_file.write_text(json.dumps({
+                'address': self.address, 'pid': os.getpid(), 'started': self.metrics.started
+            }))
+
+    def close(self) -> None:
+        """Stop serving, stop the workers and remove the socket and state file."""
+        if self._serving:
+            self._server.shutdown()
+        self._serving = False
+        self._server.server_close()
+        for _ in range(self.workers):
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+        transport, location = parse_address(self.address)
+        if transport == 'unix' and os.path.exists(location):
+            os.unlink(location)
+        if self.state_file and self.state_file.exists():
+            try:
+                if json.loads(self.state_file.read_text()).get('address') == self.address:
+                    self.state_file.unlink()
+            except (OSError, ValueError):
+                pass
+
+    def __enter__(self) -> 'AnalysisDaemon':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Analyzers and workers
+    # ------------------------------------------------------------------
+
+    def resident_analyzer(self, config: AnalysisConfig,
+                          domain_terms: Optional[List[str]] = None) -> _ResidentAnalyzer:
+        """The warm analyzer for config's dimensions and backend, built on first use."""
+        key = (config.dimension_profile, tuple(config.dimensions_to_load or ()),
+               config.inference_backend, config.onnx_model_dir, tuple(domain_terms or ()))
+        with self._analyzers_lock:
+            resident = self._analyzers.get(key)
+            if resident is None:
+                start = time.perf_counter()
+                resident = _ResidentAnalyzer(self._analyzer_factory(config, domain_terms))
+                self._analyzers[key] = resident
+                self.metrics.analyzer_load_seconds[(config.dimension_profile, config.inference_backend)] = (
+                    time.perf_counter() - start
+                )
+        return resident
+
+    def _work(self) -> None:
+        """Worker thread: analyze queued jobs until a None sentinel."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if job.deadline.expired:
+                job.finish(504, {'error': 'Request deadline exceeded while queued'})
+                continue
+            job.started = True
+            self.metrics.add('busy_workers')
+            try:
+                job.finish(200, job.work(job.deadline))
+            except DaemonError as e:
+                job.finish(e.status, {'error': str(e)})
+            except FileNotFoundError as e:
+                job.finish(404, {'error': str(e)})
+            except Exception as e:
+                job.finish(500, {'error': f"{type(e).__name__}: {e}"})
+            finally:
+                self.metrics.add('busy_workers', -1)
+
+    def _submit(self, work: Callable[[Deadline], Dict[str, Any]], deadline: Deadline) -> Tuple[int, Dict[str, Any]]:
+        """Queue work and wait for its outcome until the deadline."""
+        job = _Job(work, deadline)
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            return 503, {'error': f"Request queue is full ({self.queue_size} waiting); retry later"}
+
+        if not job.done.wait(deadline.remaining()):
+            # Queued jobs are skipped; a running analysis stops at its next check
+            # and its partial result is still returned if it arrives in time
+            deadline.cancel()
+            if not job.done.wait(DEADLINE_GRACE_SECONDS if job.started else 0):
+                return 504, {'error': f"Request deadline of {deadline.seconds:g}s exceeded"}
+        return job.status, job.payload
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        """Answer one HTTP request."""
+        start = time.perf_counter()
+        endpoint = urlsplit(handler.path).path.rstrip('/') or '/'
+        try:
+            status, payload = self._dispatch(handler, method, endpoint)
+        except DaemonError as e:
+            status, payload = e.status, {'error': str(e)}
+
+        if isinstance(payload, str):
+            body, content_type = payload.encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            body, content_type = json.dumps(payload, default=json_default).encode('utf-8'), 'application/json'
+        # Recorded before answering, so a client sees its request in /metrics
+        self.metrics.observe(endpoint if endpoint in ENDPOINTS else 'other', status,
+                             time.perf_counter() - start)
+
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(body)))
+        if status == 503:
+            handler.send_header('Retry-After', '1')
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _dispatch(self, handler, method: str, endpoint: str) -> Tuple[int, Any]:
+        if endpoint not in ENDPOINTS:
+            raise DaemonError(404, f"Unknown endpoint {endpoint}; expected one of {', '.join(ENDPOINTS)}")
+        if endpoint == '/health':
+            return 200, self.health()
+        if endpoint == '/metrics':
+            return 200, self.metrics.render(self._queue.qsize(), self.queue_size, self.workers)
+        if method != 'POST':
+            raise DaemonError(405, f"{endpoint} expects POST")
+
+        request = self._read_json(handler)
+        deadline = self._request_deadline(request)
+        config = config_from_request(request.get('config'), self.config)
+        domain_terms = request.get('domain_terms')
+        if domain_terms is not None and not (
+                isinstance(domain_terms, list) and all(isinstance(term, str) for term in domain_terms)):
+            raise DaemonError(400, '"domain_terms" must be a list of regex strings')
+
+        if endpoint == '/analyze-text':
+            text = request.get('text')
+            if not isinstance(text, str):
+                raise DaemonError(400, '"text" must be a string')
+            work = lambda deadline: self._analyze_text(text, request.get('file_path') or '<text>',
+                                                       config, domain_terms, deadline)
+        elif endpoint == '/analyze-file':
+            path = request.get('path')
+            if not isinstance(path, str):
+                raise DaemonError(400, '"path" must be a string')
+            work = lambda deadline: self._analyze_file(path, config, domain_terms, request.get('score'), deadline)
+        else:
+            paths = request.get('paths')
+            if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+                raise DaemonError(400, '"paths" must be a list of strings')
+            work = lambda deadline: self._analyze_batch(paths, config, domain_terms, deadline)
+        return self._submit(work, deadline)
+
+    @staticmethod
+    def _read_json(handler) -> Dict[str, Any]:
+        if handler.headers.get_content_type() != 'application/json':
+            raise DaemonError(415, 'Request body must be sent with Content-Type: application/json')
+        try:
+            length = int(handler.headers.get('Content-Length') or 0)
+        except ValueError:
+            raise DaemonError(400, 'Invalid Content-Length')
+        if length > MAX_REQUEST_BYTES:
+            raise DaemonError(413, f"Request body exceeds {MAX_REQUEST_BYTES} bytes")
+        try:
+            request = json.loads(handler.rfile.read(length) or b'{}')
+        except ValueError as e:
+            raise DaemonError(400, f"Request body is not valid JSON: {e}")
+        if not isinstance(request, dict):
+            raise DaemonError(400, 'Request body must be a JSON object')
+        return request
+
+    def _request_deadline(self, request: Dict[str, Any]) -> Deadline:
+        seconds = request.get('deadline_seconds', self.request_timeout)
+        if isinstance(seconds, bool) or not isinstance(seconds, (int, float)) or seconds <= 0:
+            raise DaemonError(400, '"deadline_seconds" must be a positive number')
+        return Deadline(seconds, reason=f"request deadline of {seconds:g}s exceeded")
+
+    @staticmethod
+    def _analysis_deadline(config: AnalysisConfig, deadline: Deadline) -> Deadline:
+        """The analysis budget of one text, within the request deadline."""
+        return Deadline(config.max_analysis_time_seconds, parent=deadline,
+                        reason=f"Analysis exceeded {config.max_analysis_time_seconds}s time limit"
+                        if config.max_analysis_time_seconds else None)
+
+    def _analyze_text(self, text, file_path, config, domain_terms, deadline) -> Dict[str, Any]:
+        resident = self.resident_analyzer(config, domain_terms)
+        start = time.perf_counter()
+        with resident.lock:
+            results = resident.analyzer.analyze_text(text, config=config, file_path=file_path,
+                                                     deadline=self._analysis_deadline(config, deadline))
+        self.metrics.add('files_analyzed')
+        return {'result': results.to_dict(shallow=True), 'elapsed_seconds': time.perf_counter() - start}
+
+    def _analyze_file(self, path, config, domain_terms, score, deadline) -> Dict[str, Any]:
+        """
+        Analyze one file; with "score", also calculate its dual score and (if
+        score["track_history"]) add it to the file's score history, as the
+        CLI's single-file analysis does.
+        """
+        resident = self.resident_analyzer(config, domain_terms)
+        start = time.perf_counter()
+        with resident.lock:
+            results = resident.analyzer.analyze_file(path, config=config,
+                                                     deadline=self._analysis_deadline(config, deadline))
+        elapsed = time.perf_counter() - start
+        self.metrics.add('files_analyzed')
+        results.metadata['analysis_mode'] = config.mode.value
+        results.metadata['analysis_time_seconds'] = elapsed
+
+        response = {'result': results.to_dict(shallow=True), 'elapsed_seconds': elapsed}
+        if isinstance(score, dict):
+            try:
+                dual_score = resident.analyzer.calculate_dual_score(
+                    results,
+                    detection_target=score.get('detection_target', 30.0),
+                    quality_target=score.get('quality_target', 85.0)
+                )
+                response['dual_score'] = dual_score
+                if score.get('track_history'):
+                    with resident.lock:
+                        history = resident.analyzer.load_score_history(path)
+                        history.add_score(dual_score, notes=score.get('history_notes', ''))
+                        resident.analyzer.save_score_history(history)
+            except Exception as e:
+                response['warnings'] = [f"Could not calculate/save score history: {e}"]
+        return response
+
+    def _analyze_batch(self, paths, config, domain_terms, deadline) -> Dict[str, Any]:
+        """Analyze files in order; files not started before the deadline are reported failed."""
+        resident = self.resident_analyzer(config, domain_terms)
+        outcomes = []
+        start = time.perf_counter()
+        for path in paths:
+            if deadline.expired:
+                outcomes.append({'file_path': path, 'elapsed_seconds': 0.0, 'result': None,
+                                 'error': 'Request deadline exceeded before this file was analyzed'})
+                continue
+            file_start = time.perf_counter()
+            try:
+                with resident.lock:
+                    results = resident.analyzer.analyze_file(path, config=config,
+                                                             deadline=self._analysis_deadline(config, deadline))
+                self.metrics.add('files_analyzed')
+                outcomes.append({'file_path': path, 'elapsed_seconds': time.perf_counter() - file_start,
+                                 'result': results.to_dict(shallow=True), 'error': None})
+            except Exception as e:
+                outcomes.append({'file_path': path, 'elapsed_seconds': time.perf_counter() - file_start,
+                                 'result': None, 'error': str(e)})
+        return {'results': outcomes, 'elapsed_seconds': time.perf_counter() - start}
+
+    def health(self) -> Dict[str, Any]:
+        """Status returned by GET /health."""
+        from ai_pattern_analyzer import __version__
+
+        with self._analyzers_lock:
+            analyzers = sorted({key[0] for key in self._analyzers})
+        return {
+            'status': 'ok',
+            'version': __version__,
+            'pid': os.getpid(),
+            'address': self.address,
+            'analyzers': analyzers,
+            'workers': self.workers,
+            'queue_depth': self._queue.qsize(),
+            'queue_size': self.queue_size,
+            'uptime_seconds': round(time.time() - self.metrics.started, 1),
+        }
+
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix socket."""
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__('localhost', timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class DaemonClient:
+    """
+    Client of a running AnalysisDaemon.
+
+    Analysis methods return the same objects as the in-process API
+    (AnalysisResults, BatchFileResult). Paths are sent as absolute paths,
+    since the daemon resolves them against its own working directory.
+    """
+
+    def __init__(self, address: str):
+        """
+        Args:
+            address: "unix:PATH" or "HOST:PORT" of the daemon
+
+        Raises:
+            ValueError: If the address is neither form
+        """
+        self.address = address
+        self._transport, self._location = parse_address(address)
+
+    def _connection(self, timeout: Optional[float]) -> http.client.HTTPConnection:
+        if self._transport == 'unix':
+            return _UnixHTTPConnection(self._location, timeout=timeout)
+        host, port = self._location
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def request(self, method: str, endpoint: str, body: Optional[Dict[str, Any]] = None,
+                timeout: Optional[float] = None) -> Any:
+        """
+        Send one request and return the decoded response.
+
+        Returns:
+            The JSON response, or the text for text responses (/metrics)
+
+        Raises:
+            DaemonUnavailable: If the daemon is unreachable or its queue is full
+            DaemonError: For any other error response
+        """
+        connection = self._connection(timeout)
+        try:
+            payload = None if body is None else json.dumps(body).encode('utf-8')
+            headers = {'Content-Type': 'application/json'} if payload is not None else {}
+            connection.request(method, endpoint, body=payload, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+        except socket.timeout:
+            raise DaemonError(504, f"No response from the analysis daemon at {self.address} in time")
+        except OSError as e:
+            raise DaemonUnavailable(503, f"Analysis daemon at {self.address} is unreachable: {e}")
+        finally:
+            connection.close()
+
+        if response.headers.get_content_type() == 'application/json':
+            decoded = json.loads(data)
+        else:
+            decoded = data.decode('utf-8')
+        if response.status != 200:
+            message = decoded.get('error', response.reason) if isinstance(decoded, dict) else decoded
+            error = DaemonUnavailable if response.status == 503 else DaemonError
+            raise error(response.status, message)
+        return decoded
+
+    def _analysis_request(self, endpoint: str, body: Dict[str, Any], config: Optional[AnalysisConfig],
+                          deadline_seconds: Optional[float]) -> Dict[str, Any]:
+        if config is not None:
+            body['config'] = config_to_request(config)
+        timeout = None
+        if deadline_seconds is not None:
+            body['deadline_seconds'] = deadline_seconds
+            timeout = deadline_seconds + 2 * DEADLINE_GRACE_SECONDS
+        response = self.request('POST', endpoint, body, timeout=timeout)
+        for warning in response.get('warnings', ()):
+            print(f"Warning: {warning}", file=sys.stderr)
+        return response
+
+    def health(self, timeout: Optional[float] = HEALTH_TIMEOUT_SECONDS) -> Dict[str, Any]:
+        """GET /health."""
+        return self.request('GET', '/health', timeout=timeout)
+
+    def metrics(self) -> str:
+        """GET /metrics (Prometheus text format)."""
+        return self.request('GET', '/metrics', timeout=HEALTH_TIMEOUT_SECONDS * 10)
+
+    def analyze_text(self, text: str, config: Optional[AnalysisConfig] = None, file_path: str = '<text>',
+                     deadline_seconds: Optional[float] = None) -> AnalysisResults:
+        """Analyze text on the daemon (see AIPatternAnalyzer.analyze_text)."""
+        response = self._analysis_request('/analyze-text', {'text': text, 'file_path': file_path},
+                                          config, deadline_seconds)
+        return AnalysisResults.from_dict(response['result'])
+
+    def analyze_file(self, file_path: str, config: Optional[AnalysisConfig] = None,
+                     deadline_seconds: Optional[float] = None,
+                     score: Optional[Dict[str, Any]] = None) -> AnalysisResults:
+        """
+        Analyze a file on the daemon (see AIPatternAnalyzer.analyze_file).
+
+        Args:
+            score: {"detection_target", "quality_target", "track_history",
+                "history_notes"} to have the daemon calculate the dual score
+                and save it to the file's score history
+        """
+        body = {'path': os.path.abspath(file_path)}
+        if score is not None:
+            body['score'] = score
+        response = self._analysis_request('/analyze-file', body, config, deadline_seconds)
+        results = AnalysisResults.from_dict(response['result'])
+        results.file_path = file_path
+        return results
+
+    def analyze_files(self, file_paths: Sequence[str], config: Optional[AnalysisConfig] = None,
+                      deadline_seconds: Optional[float] = None) -> List[BatchFileResult]:
+        """Analyze files on the daemon, in order (see core.batch.analyze_files)."""
+        response = self._analysis_request('/batch', {'paths': [os.path.abspath(path) for path in file_paths]},
+                                          config, deadline_seconds)
+        outcomes = []
+        for file_path, outcome in zip(file_paths, response['results']):
+            result = None
+            if outcome['result'] is not None:
+                result = AnalysisResults.from_dict(outcome['result'])
+                result.file_path = file_path
+            outcomes.append(BatchFileResult(file_path, outcome['elapsed_seconds'], result=result,
+                                            error=outcome['error']))
+        return outcomes
+
+
+def find_daemon(state_file: Optional[Path] = None) -> Optional[DaemonClient]:
+    """
+    Client of the running daemon, or None if there is none.
+
+    The address comes from the AI_PATTERN_DAEMON environment variable, else
+    from the state file the daemon wrote. A daemon of another version is not
+    used, since its results could differ.
+    """
+    from ai_pattern_analyzer import __version__
+
+    address = os.environ.get(DAEMON_ENV)
+    if not address:
+        try:
+            address = json.loads((state_file or default_state_file()).read_text()).get('address')
+        except (OSError, ValueError, AttributeError):
+            return None
+    if not address:
+        return None
+
+    try:
+        client = DaemonClient(address)
+        health = client.health()
+    except (ValueError, DaemonError):
+        return None
+    if health.get('version') != __version__:
+        print(f"Warning: analysis daemon at {address} runs version {health.get('version')} "
+              f"(this is {__version__}); analyzing locally", file=sys.stderr)
+        return None
+    return client
@@ -0,0 +1,123 @@
+"""
+Analysis deadlines with cooperative cancellation.
+
+A Deadline is created once per analyze_text() call from
+AnalysisConfig.max_analysis_time_seconds and passed to every
+DimensionStrategy.analyze() as the `deadline` keyword argument. Long-running
+code checks it at safe points - between samples, between model batches - and
+stops by raising DeadlineExceeded. The DimensionScheduler stops waiting when
+the deadline passes, cancels the deadline so still-running dimensions stop at
+their next check, and reports them as unfinished.
+
+Code below analyze() that does not take a deadline parameter (model batch
+loops, for example) reads the active one with check_deadline(); the scheduler
+and the GLTR worker thread install it with deadline_scope().
+
+Child deadlines (Deadline(seconds, parent=...)) expire at the earlier of
+their own budget and their parent's, e.g. a per-dimension timeout inside the
+global analysis budget.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_deadline: ContextVar[Optional['Deadline']] = ContextVar('ai_pattern_analyzer_deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised at a cancellation check once the analysis deadline has passed."""
+
+
+class Deadline:
+    """
+    Wall-clock budget that can also be cancelled explicitly.
+
+    Usage:
+        >>> deadline = Deadline(300)
+        >>> for sample in samples:
+        ...     deadline.check()
+        ...     analyze(sample)
+    """
+
+    def __init__(self, seconds: Optional[float] = None, parent: Optional['Deadline'] = None,
+                 reason: Optional[str] = None):
+        """
+        Args:
+            seconds: Budget from now (None = no time limit, only cancellation)
+            parent: Enclosing deadline; this one expires no later than it
+            reason: Message for DeadlineExceeded (default derived from seconds)
+        """
+        self.seconds = seconds
+        self.parent = parent
+        self.reason = reason
+        self._expires_at = None if seconds is None else time.monotonic() + seconds
+        self._cancelled = threading.Event()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None if unbounded."""
+        if self._cancelled.is_set():
+            return 0.0
+        remaining = None
+        if self._expires_at is not None:
+            remaining = max(0.0, self._expires_at - time.monotonic())
+        if self.parent is not None:
+            parent_remaining = self.parent.remaining()
+            if parent_remaining is not None:
+                remaining = parent_remaining if remaining is None else min(remaining, parent_remaining)
+        return remaining
+
+    @property
+    def expired(self) -> bool:
+        """True once the budget has run out or the deadline was cancelled."""
+        return self.remaining() == 0.0
+
+    def cancel(self) -> None:
+        """Expire now; code checking this deadline stops at its next check."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the deadline has expired."""
+        if self.expired:
+            raise DeadlineExceeded(self.describe())
+
+    def describe(self) -> str:
+        """Human-readable reason, for warnings and result errors."""
+        if self.reason:
+            return self.reason
+        if self.seconds is None and self.parent is not None:
+            return self.parent.describe()
+        if self.seconds is None:
+            return "analysis cancelled"
+        return f"analysis deadline of {self.seconds:g}s exceeded"
+
+    def __getstate__(self):
+        # Process workers get the time left; cancellation does not cross processes
+        return {'seconds': self.remaining(), 'reason': self.describe()}
+
+    def __setstate__(self, state):
+        self.__init__(state['seconds'], reason=state['reason'])
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline installed by the innermost deadline_scope(), if any."""
+    return _current_deadline.get()
+
+
+def check_deadline(deadline: Optional[Deadline] = None) -> None:
+    """Raise DeadlineExceeded if deadline (default: current_deadline()) has expired."""
+    deadline = deadline or _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Install deadline as current_deadline() for the calling thread."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,148 @@
+"""
+Per-document shared analysis context.
+
+Most dimensions re-derive the same basics (words, sentences, paragraphs,
+code-free prose) from the raw text with their own regexes. DocumentContext
+computes them once per document in AIPatternAnalyzer and is passed to every
+DimensionStrategy.analyze() call as the `context` keyword argument.
+
+All spans are (start, end) character offsets into `text`. The tokenization
+rules match the regexes the dimensions used before, so switching a dimension
+to the context does not change its metrics:
+
+- word_spans:      r'\\b\\w+\\b' over text
+- sentence_spans:  non-blank segments between r'[.!?]+' terminators
+- paragraph_spans: non-blank blocks separated by r'\\n\\s*\\n' (stripped)
+- prose_text:      text with fenced code blocks removed
+- prose_word_count: r"\\b[\\w'-]+\\b" matches in prose_text
+
+The context describes one exact string. Dimensions analyzing a truncated or
+sampled view must check applies_to() and fall back to their own tokenization.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+Span = Tuple[int, int]
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+PROSE_WORD_PATTERN = re.compile(r"\b[\w'-]+\b")
+SENTENCE_TERMINATOR_PATTERN = re.compile(r'[.!?]+')
+PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]*?```')
+
+
+@dataclass(frozen=True)
+class DocumentContext:
+    """
+    Immutable tokenization of one document, shared by all dimensions.
+
+    Attributes:
+        text: Analyzed text (HTML comments already stripped)
+        lines: text.splitlines()
+        line_offsets: Start offset of each line in text
+        prose_text: text with fenced code blocks removed
+        prose_word_count: Words in prose_text (apostrophes/hyphens kept in words)
+        word_spans: Word spans in text
+        sentence_spans: Sentence spans in text (stripped)
+        paragraph_spans: Paragraph spans in text (stripped)
+    """
+    text: str
+    lines: Tuple[str, ...]
+    line_offsets: Tuple[int, ...]
+    prose_text: str
+    prose_word_count: int
+    word_spans: Tuple[Span, ...]
+    sentence_spans: Tuple[Span, ...]
+    paragraph_spans: Tuple[Span, ...]
+
+    @classmethod
+    def from_text(cls, text: str) -> 'DocumentContext':
+        """Tokenize a document once."""
+        lines = tuple(text.splitlines())
+        prose_text = CODE_BLOCK_PATTERN.sub('', text)
+
+        return cls(
+            text=text,
+            lines=lines,
+            line_offsets=_line_offsets(text, lines),
+            prose_text=prose_text,
+            prose_word_count=sum(1 for _ in PROSE_WORD_PATTERN.finditer(prose_text)),
+            word_spans=tuple(m.span() for m in WORD_PATTERN.finditer(text)),
+            sentence_spans=_split_spans(text, SENTENCE_TERMINATOR_PATTERN),
+            paragraph_spans=_split_spans(text, PARAGRAPH_BREAK_PATTERN)
+        )
+
+    @property
+    def word_count(self) -> int:
+        """Number of words in text."""
+        return len(self.word_spans)
+
+    def words(self) -> List[str]:
+        """Words in text, in order."""
+        text = self.text
+        return [text[start:end] for start, end in self.word_spans]
+
+    def sentences(self) -> List[str]:
+        """Stripped sentences in text, in order."""
+        text = self.text
+        return [text[start:end] for start, end in self.sentence_spans]
+
+    def paragraphs(self) -> List[str]:
+        """Stripped paragraphs in text, in order."""
+        text = self.text
+        return [text[start:end] for start, end in self.paragraph_spans]
+
+    def applies_to(self, text: str) -> bool:
+        """Return True if this context describes exactly `text`."""
+        return text is self.text or (len(text) == len(self.text) and text == self.text)
+
+
+def context_for(text: str, context: Optional[DocumentContext]) -> Optional[DocumentContext]:
+    """Return context if it describes `text` (not a truncated/sampled view), else None."""
+    if context is not None and context.applies_to(text):
+        return context
+    return None
+
+
+def _line_offsets(text: str, lines: Tuple[str, ...]) -> Tuple[int, ...]:
+    """Start offset of each splitlines() line (handles \\r\\n and other breaks)."""
+    offsets = []
+    position = 0
+    for line in lines:
+        offsets.append(position)
+        position += len(line)
+        # Skip the line break that splitlines() removed
+        if text.startswith('\r\n', position):
+            position += 2
+        elif position < len(text):
+            position += 1
+    return tuple(offsets)
+
+
+def _split_spans(text: str, separator: re.Pattern) -> Tuple[Span, ...]:
+    """
+    Spans of the non-blank pieces of re.split(separator, text), stripped.
+
+    Matches `[p.strip() for p in re.split(separator, text) if p.strip()]`
+    without materializing the pieces.
+    """
+    spans = []
+    start = 0
+    for match in separator.finditer(text):
+        _append_stripped(spans, text, start, match.start())
+        start = match.end()
+    _append_stripped(spans, text, start, len(text))
+    return tuple(spans)
+
+
+def _append_stripped(spans: List[Span], text: str, start: int, end: int) -> None:
+    """Append text[start:end] with surrounding whitespace trimmed, if non-blank."""
+    piece = text[start:end]
+    stripped = piece.lstrip()
+    if not stripped:
+        return
+    start += len(piece) - len(stripped)
+    end = start + len(stripped.rstrip())
+    spans.append((start, end))
@@ -171,7 +171,8 @@ class DynamicReporter:
             total_weight = 0.0
 
             for dim_name, dim_result in dimension_results.items():
-                if dim_result['tier'] == tier:
+                # Failed dimensions are not enriched (no tier/score)
+                if dim_result.get('tier') == tier:
                     score = dim_result['score']
                     weight = dim_result['weight']
                     impact_level = self._determine_impact_level(score)
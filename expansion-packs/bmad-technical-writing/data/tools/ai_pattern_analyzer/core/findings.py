@@ -0,0 +1,133 @@
+"""
+Match locations recorded by the standard pass, for single-pass detailed analysis.
+
+analyze_file_detailed() used to run the standard analysis and then re-scan
+every line with its own detectors (and, for GLTR and spaCy, re-run the models
+on the lines). Instead, analyze_text() can be given a Findings recorder:
+dimensions that analyze the whole text directly record where their matches
+are (character offsets in the analyzed text, plus whatever per-match data the
+detailed report needs), and the detailed report maps those offsets to source
+lines with a bisect index.
+
+Offsets are recorded in the analyzed text, i.e. after HTML comments were
+stripped; Findings keeps the stripped spans so offsets map back to the source
+file. Dimensions that sampled or truncated the text, or whose result came
+from a cache, record nothing - detailed analysis then computes those findings
+from the lines as before.
+
+Usage:
+    >>> findings = Findings(source_text)
+    >>> analyzer.analyze_text(source_text, findings=findings)
+    >>> for start, end, word, pattern_idx in findings.get('ai_vocab_replacements', []):
+    ...     line_number = findings.line_number(start)
+"""
+
+from bisect import bisect_right
+from typing import Any, List, Optional, Pattern, Tuple
+
+
+class OffsetMap:
+    """Maps offsets in a text with spans removed back to the original text."""
+
+    __slots__ = ('_starts', '_shifts')
+
+    def __init__(self):
+        # Offsets >= _starts[i] (in the stripped text) shift by _shifts[i]
+        self._starts = [0]
+        self._shifts = [0]
+
+    def _removed(self, stripped_offset: int, total_removed: int) -> None:
+        self._starts.append(stripped_offset)
+        self._shifts.append(total_removed)
+
+    def to_original(self, offset: int) -> int:
+        """Original-text offset of a stripped-text offset."""
+        return offset + self._shifts[bisect_right(self._starts, offset) - 1]
+
+
+def strip_matches(pattern: Pattern, text: str) -> Tuple[str, OffsetMap]:
+    """
+    Remove every match of pattern from text, keeping an offset map.
+
+    Args:
+        pattern: Compiled pattern of the spans to remove
+        text: Original text
+
+    Returns:
+        (pattern.sub('', text), OffsetMap from the stripped text to text)
+    """
+    offsets = OffsetMap()
+    parts = []
+    position = 0
+    removed = 0
+    for match in pattern.finditer(text):
+        parts.append(text[position:match.start()])
+        offsets._removed(match.start() - removed, removed + match.end() - match.start())
+        removed += match.end() - match.start()
+        position = match.end()
+    parts.append(text[position:])
+    return ''.join(parts), offsets
+
+
+class Findings:
+    """
+    Per-analysis recorder of match locations, passed to dimensions as kwargs['findings'].
+
+    Each dimension records under its own keys; values are lists of tuples whose
+    first item is an offset in the analyzed text (see the module docstring).
+    """
+
+    def __init__(self, source_text: str):
+        self.source_text = source_text
+        self.lines = source_text.splitlines()
+        self.analyzed_text: Optional[str] = None
+        self._offsets = OffsetMap()
+        self._line_starts = [0]
+        for line in source_text.splitlines(keepends=True):
+            self._line_starts.append(self._line_starts[-1] + len(line))
+        self._records = {}
+
+    def bind(self, comment_pattern: Pattern) -> str:
+        """
+        Strip HTML comments from the source text, keeping the offset map.
+
+        Args:
+            comment_pattern: Compiled HTML comment pattern of the analyzer
+
+        Returns:
+            The analyzed text (source text without HTML comments)
+        """
+        self.analyzed_text, self._offsets = strip_matches(comment_pattern, self.source_text)
+        return self.analyzed_text
+
+    def records(self, text: str) -> bool:
+        """Whether matches found in text (as passed to a dimension) should be recorded."""
+        return text is self.analyzed_text or text == self.analyzed_text
+
+    def record(self, key: str, value: List[Any]) -> None:
+        """Store the recording for key (replacing any previous one)."""
+        self._records[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Recording for key, or default if nothing was recorded."""
+        return self._records.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def source_offset(self, offset: int) -> int:
+        """Source-text offset of an analyzed-text offset."""
+        return self._offsets.to_original(offset)
+
+    def line_index(self, offset: int) -> int:
+        """0-based source line of an analyzed-text offset."""
+        return bisect_right(self._line_starts, self.source_offset(offset)) - 1
+
+    def line_number(self, offset: int) -> int:
+        """1-based source line of an analyzed-text offset."""
+        return self.line_index(offset) + 1
+
+    def column(self, offset: int) -> int:
+        """Column of an analyzed-text offset within its source line."""
+        source = self.source_offset(offset)
+        return source - self._line_starts[bisect_right(self._line_starts, source) - 1]
@@ -0,0 +1,237 @@
+"""
+Per-stage profiling of an analysis run (AnalysisConfig.profiling, CLI --timings).
+
+results.execution_time and the CLI's analysis_time_seconds say how long a
+file took, not where the time went. With profiling enabled, every pipeline
+stage - the DocumentContext, each shared artifact the scheduler builds and
+each dimension - is recorded as a StageProfile:
+
+- wall_seconds / cpu_seconds: elapsed and process CPU time
+- peak_alloc_bytes: peak tracemalloc allocation above the stage's baseline
+- model_load_seconds / inference_seconds: time spent loading models (spaCy,
+  GLTR, sentiment) inside the stage versus everything else
+- samples_analyzed: samples the dimension reported (None if not sampled)
+
+A profiled run executes its stages one at a time on the calling thread:
+process CPU time and the (process-wide) tracemalloc peak are then
+attributable to a single stage. Timings include tracemalloc's overhead, so
+compare profiled runs with each other rather than with unprofiled ones.
+
+The profile is stored in results.metadata['profile'] (see to_dict()) and
+can be rendered as a text table or written as a Chrome trace for
+chrome://tracing / Perfetto.
+
+Usage:
+    >>> config = AnalysisConfig(profiling=True)
+    >>> results = analyzer.analyze_text(text, config=config)
+    >>> profile = StageProfiler.from_dict(results.metadata['profile'])
+    >>> print(profile.format_table())
+    >>> profile.write_chrome_trace('analysis.trace.json')
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Stage kinds, in the order they appear in a run
+STAGE_KINDS = ('context', 'artifact', 'dimension')
+
+_active = threading.local()
+
+
+@dataclass
+class StageProfile:
+    """Measurements for one pipeline stage."""
+    name: str
+    kind: str
+    start_seconds: float = 0.0  # Offset from the start of the profiled run
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_alloc_bytes: int = 0
+    model_load_seconds: float = 0.0
+    samples_analyzed: Optional[int] = None
+    model_loads: List[Tuple[float, float]] = field(default_factory=list)  # (start offset, seconds)
+
+    @property
+    def inference_seconds(self) -> float:
+        """Wall time not spent loading models."""
+        return max(0.0, self.wall_seconds - self.model_load_seconds)
+
+
+class StageProfiler:
+    """
+    Records StageProfiles for one analysis run.
+
+    Stages must not overlap (the scheduler runs them sequentially when
+    profiling); model_load() may be entered anywhere inside a stage.
+    """
+
+    def __init__(self):
+        self.stages: List[StageProfile] = []
+        self._origin = time.perf_counter()
+        self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str, kind: str) -> Iterator[StageProfile]:
+        """
+        Measure the enclosed block as one stage.
+
+        Yields:
+            The StageProfile being recorded (set samples_analyzed on it)
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+        profile = StageProfile(name=name, kind=kind, start_seconds=self._elapsed())
+        previous = getattr(_active, 'stage', None)
+        _active.stage = (self, profile)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield profile
+        finally:
+            profile.wall_seconds = time.perf_counter() - wall_start
+            profile.cpu_seconds = time.process_time() - cpu_start
+            profile.peak_alloc_bytes = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+            _active.stage = previous
+            self.stages.append(profile)
+
+    def close(self) -> None:
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._origin
+
+    # ========================================================================
+    # OUTPUT
+    # ========================================================================
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable profile (results.metadata['profile'])."""
+        stages = []
+        for stage in self.stages:
+            entry = asdict(stage)
+            entry['model_loads'] = [list(load) for load in stage.model_loads]
+            entry['inference_seconds'] = stage.inference_seconds
+            stages.append(entry)
+        return {
+            'stages': stages,
+            'total_wall_seconds': sum(stage.wall_seconds for stage in self.stages),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StageProfiler':
+        """Rebuild a profiler from to_dict() output (for formatting stored profiles)."""
+        profiler = cls()
+        for entry in data.get('stages', []):
+            entry = {key: value for key, value in entry.items() if key != 'inference_seconds'}
+            entry['model_loads'] = [tuple(load) for load in entry.get('model_loads', [])]
+            profiler.stages.append(StageProfile(**entry))
+        return profiler
+
+    def format_table(self) -> str:
+        """Text table of every stage, in run order, with totals."""
+        header = (f"{'STAGE':<24} {'KIND':<10} {'WALL s':>8} {'CPU s':>8} {'PEAK MiB':>9} "
+                  f"{'LOAD s':>8} {'INFER s':>8} {'SAMPLES':>7}")
+        rows = [header, '-' * len(header)]
+        for stage in self.stages:
+            samples = '' if stage.samples_analyzed is None else str(stage.samples_analyzed)
+            rows.append(
+                f"{stage.name:<24} {stage.kind:<10} {stage.wall_seconds:>8.3f} "
+                f"{stage.cpu_seconds:>8.3f} {stage.peak_alloc_bytes / (1024 * 1024):>9.2f} "
+                f"{stage.model_load_seconds:>8.3f} {stage.inference_seconds:>8.3f} {samples:>7}"
+            )
+        rows.append('-' * len(header))
+        total_wall = sum(stage.wall_seconds for stage in self.stages)
+        total_cpu = sum(stage.cpu_seconds for stage in self.stages)
+        rows.append(f"{'TOTAL':<24} {'':<10} {total_wall:>8.3f} {total_cpu:>8.3f}")
+        return '\n'.join(rows)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format document: one complete ('X') event per stage and model load."""
+        pid = os.getpid()
+        events = []
+        for stage in self.stages:
+            tid = STAGE_KINDS.index(stage.kind) if stage.kind in STAGE_KINDS else len(STAGE_KINDS)
+            events.append({
+                'name': stage.name,
+                'cat': stage.kind,
+                'ph': 'X',
+                'ts': stage.start_seconds * 1e6,
+                'dur': stage.wall_seconds * 1e6,
+                'pid': pid,
+                'tid': tid,
+                'args': {
+                    'cpu_seconds': stage.cpu_seconds,
+                    'peak_alloc_bytes': stage.peak_alloc_bytes,
+                    'model_load_seconds': stage.model_load_seconds,
+                    'inference_seconds': stage.inference_seconds,
+                    'samples_analyzed': stage.samples_analyzed,
+                },
+            })
+            for start, seconds in stage.model_loads:
+                events.append({
+                    'name': f'{stage.name} model load',
+                    'cat': 'model_load',
+                    'ph': 'X',
+                    'ts': start * 1e6,
+                    'dur': seconds * 1e6,
+                    'pid': pid,
+                    'tid': tid,
+                })
+        for kind in STAGE_KINDS:
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid,
+                           'tid': STAGE_KINDS.index(kind), 'args': {'name': f'{kind} stages'}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write chrome_trace() as JSON to path."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+@contextmanager
+def model_load() -> Iterator[None]:
+    """
+    Attribute the enclosed block to model loading of the active stage.
+
+    A no-op outside a profiled stage, so model loaders can always use it;
+    a nested model_load() is counted once, by the outermost block.
+    """
+    active = getattr(_active, 'stage', None)
+    if active is None or getattr(_active, 'loading', False):
+        # Not profiling, or nested in another model load (counted there)
+        yield
+        return
+    profiler, profile = active
+    start = time.perf_counter()
+    offset = profiler._elapsed()
+    _active.loading = True
+    try:
+        yield
+    finally:
+        _active.loading = False
+        seconds = time.perf_counter() - start
+        profile.model_load_seconds += seconds
+        profile.model_loads.append((offset, seconds))
+
+
+@contextmanager
+def stage(profiler: Optional[StageProfiler], name: str, kind: str) -> Iterator[Optional[StageProfile]]:
+    """profiler.stage(name, kind), or a no-op yielding None when profiler is None."""
+    if profiler is None:
+        yield None
+        return
+    with profiler.stage(name, kind) as profile:
+        yield profile
@@ -0,0 +1,198 @@
+"""
+Content-addressed on-disk cache of per-dimension results.
+
+Re-running a batch re-analyzes every chapter, and the ML dimensions dominate
+that cost. DimensionResultCache stores each dimension's raw output dict in
+SQLite under a key derived from:
+
+- the analyzed text (SHA-256, after HTML comment stripping)
+- the dimension name and version (DimensionStrategy.version - by default a
+  digest of the dimension's module source and of the shared helper modules
+  it builds on, so code changes invalidate)
+- the package version
+- the AnalysisConfig fields that change that dimension's output
+  (RESULT_CONFIG_FIELDS plus its dimension_overrides entry)
+
+Profile and scheduling fields are not part of the key. Upgrading from the
+fast to the full profile therefore reuses the four fast dimensions and
+computes only the missing ones.
+
+The cache is bounded by total payload size. Entries are evicted least
+recently used first. Several processes (e.g. --jobs workers) may share one
+cache directory; SQLite WAL mode serializes their writes. Payloads are
+stored as JSON (compact containers as lists, as the daemon serializes them),
+so reading a cache directory never executes code from it.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+from ai_pattern_analyzer.core.compact import json_default
+
+DEFAULT_CACHE_DIR = '.ai-analysis-cache'
+CACHE_DB_NAME = 'dimension-results.sqlite3'
+
+# AnalysisConfig fields that change what a dimension returns for the same text
+RESULT_CONFIG_FIELDS = (
+    'mode',
+    'sampling_sections',
+    'sampling_chars_per_section',
+    'sampling_strategy',
+    'sampling_ci_width',
+    'sampling_min_samples',
+    'sampling_max_samples',
+    'max_text_length',
+    'gltr_context_overlap',
+    'inference_backend',
+    'onnx_model_dir',
+)
+
+# After eviction the cache is trimmed to this fraction of max_bytes, so a
+# full cache does not evict on every single insert
+EVICTION_TARGET_RATIO = 0.9
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of the analyzed text."""
+    return hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def config_fingerprint(config: AnalysisConfig, dimension_name: str) -> str:
+    """Canonical JSON of the config fields that affect `dimension_name`'s output."""
+    fields = {}
+    for name in RESULT_CONFIG_FIELDS:
+        value = getattr(config, name)
+        fields[name] = getattr(value, 'value', value)  # Enums by value
+    fields['overrides'] = config.dimension_overrides.get(dimension_name, {})
+    return json.dumps(fields, sort_keys=True, default=str)
+
+
+def result_key(text_hash: str, dimension_name: str, dimension_version: str,
+               config: AnalysisConfig) -> str:
+    """Cache key for one dimension's result on one text."""
+    from ai_pattern_analyzer import __version__
+
+    parts = [text_hash, dimension_name, dimension_version, __version__,
+             config_fingerprint(config, dimension_name)]
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+class DimensionResultCache:
+    """
+    SQLite-backed LRU cache of dimension result dicts.
+
+    Usage:
+        >>> cache = DimensionResultCache('.ai-analysis-cache', max_bytes=64 * 1024 * 1024)
+        >>> key = result_key(content_hash(text), 'burstiness', dim.version, config)
+        >>> cache.get(key) or cache.put(key, 'burstiness', dim.analyze(text, lines))
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Open (creating if needed) the cache database in cache_dir.
+
+        Args:
+            cache_dir: Directory holding the SQLite database
+            max_bytes: Total payload size above which LRU entries are evicted
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.path = os.path.join(cache_dir, CACHE_DB_NAME)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                ' key TEXT PRIMARY KEY,'
+                ' dimension TEXT NOT NULL,'
+                ' payload BLOB NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' last_used REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)')
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key (marking it recently used), or None."""
+        with self._lock:
+            row = self._conn.execute('SELECT payload FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            with self._conn:
+                self._conn.execute('UPDATE results SET last_used = ? WHERE key = ?', (time.time(), key))
+
+        try:
+            result = json.loads(row[0])
+        except Exception as e:
+            print(f"Warning: discarding unreadable cache entry: {e}", file=sys.stderr)
+            self.delete(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, dimension_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a result, evicting least recently used entries over max_bytes. Returns result."""
+        payload = json.dumps(result, default=json_default, separators=(',', ':')).encode('utf-8')
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO results (key, dimension, payload, size, last_used) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, dimension_name, payload, len(payload), time.time())
+            )
+            self._evict()
+        return result
+
+    def delete(self, key: str) -> None:
+        """Remove one entry."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM results WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM results')
+
+    def total_bytes(self) -> int:
+        """Total payload size of all entries."""
+        with self._lock:
+            return self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        """Delete LRU entries until the cache fits (caller holds the lock and transaction)."""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * EVICTION_TARGET_RATIO)
+        doomed = []
+        for key, size in self._conn.execute('SELECT key, size FROM results ORDER BY last_used ASC'):
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany('DELETE FROM results WHERE key = ?', doomed)
@@ -3,10 +3,17 @@ Core result data structures for AI pattern analysis.
 
 This module contains all dataclasses used to represent analysis results,
 detailed findings, and exception types.
+
+The dataclasses have __slots__, and AnalysisResults stores its integer
+series as IntSeries (see core/compact.py), so a batch of results stays
+small; to_dict() converts a result to plain dicts and lists when a formatter
+needs them.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ai_pattern_analyzer.core.compact import compact_ints, slotted, to_plain
 
 
 # ============================================================================
@@ -32,6 +39,7 @@ class InsufficientDataError(AnalysisError):
 # DETAILED MODE DATACLASSES
 # ============================================================================
 
+@slotted
 @dataclass
 class VocabInstance:
     """Single AI vocabulary instance with location"""
@@ -42,6 +50,7 @@ class VocabInstance:
     suggestions: List[str]
 
 
+@slotted
 @dataclass
 class HeadingIssue:
     """Heading issue with location"""
@@ -52,6 +61,7 @@ class HeadingIssue:
     suggestion: str
 
 
+@slotted
 @dataclass
 class UniformParagraph:
     """Paragraph with uniform sentence lengths"""
@@ -65,6 +75,7 @@ class UniformParagraph:
     suggestion: str
 
 
+@slotted
 @dataclass
 class EmDashInstance:
     """Em-dash instance with location"""
@@ -74,6 +85,7 @@ class EmDashInstance:
     problem: str = ""  # Optional problem description
 
 
+@slotted
 @dataclass
 class TransitionInstance:
     """Formulaic transition with location"""
@@ -83,6 +95,7 @@ class TransitionInstance:
     suggestions: List[str]
 
 
+@slotted
 @dataclass
 class SentenceBurstinessIssue:
     """Sentence uniformity problem with location"""
@@ -96,6 +109,7 @@ class SentenceBurstinessIssue:
     suggestion: str
 
 
+@slotted
 @dataclass
 class SyntacticIssue:
     """Syntactic complexity issue with location"""
@@ -107,6 +121,7 @@ class SyntacticIssue:
     suggestion: str
 
 
+@slotted
 @dataclass
 class FormattingIssue:
     """Bold/italic overuse with location"""
@@ -118,6 +133,7 @@ class FormattingIssue:
     suggestion: str
 
 
+@slotted
 @dataclass
 class HighPredictabilitySegment:
     """High GLTR score (AI-like) section"""
@@ -129,6 +145,7 @@ class HighPredictabilitySegment:
     suggestion: str
 
 
+@slotted
 @dataclass
 class DetailedAnalysis:
     """Comprehensive detailed analysis results"""
@@ -151,6 +168,14 @@ class DetailedAnalysis:
 # ANALYSIS RESULTS
 # ============================================================================
 
+# AnalysisResults fields holding integer series, stored as IntSeries
+_SERIES_FIELDS = ('sentence_lengths', 'em_dash_positions', 'subsection_counts', 'h4_counts')
+
+# Tuple fields (JSON decodes them as lists)
+_TUPLE_FIELDS = ('sentence_range', 'paragraph_range')
+
+
+@slotted
 @dataclass
 class AnalysisResults:
     """Structured container for analysis results"""
@@ -177,7 +202,7 @@ class AnalysisResults:
     short_sentences_count: int  # <=10 words
     medium_sentences_count: int  # 11-25 words
     long_sentences_count: int  # >=30 words
-    sentence_lengths: List[int]
+    sentence_lengths: Sequence[int]  # IntSeries
 
     # Paragraph variation
     paragraph_mean_words: float
@@ -233,7 +258,7 @@ class AnalysisResults:
     list_item_length_variance: float = 0.0  # Uniformity of list item lengths
 
     # NEW: Punctuation clustering analysis
-    em_dash_positions: List[int] = field(default_factory=list)  # Paragraph positions
+    em_dash_positions: Sequence[int] = field(default_factory=list)  # Paragraph positions (IntSeries)
     em_dash_cascading_score: float = 0.0  # Detects declining pattern (AI marker)
     oxford_comma_count: int = 0  # "a, b, and c" pattern
     non_oxford_comma_count: int = 0  # "a, b and c" pattern
@@ -333,13 +358,13 @@ class AnalysisResults:
     heading_length_assessment: Optional[str] = None  # EXCELLENT/GOOD/FAIR/POOR
 
     # Subsection asymmetry analysis
-    subsection_counts: Optional[List[int]] = None  # H3 counts under each H2
+    subsection_counts: Optional[Sequence[int]] = None  # H3 counts under each H2 (IntSeries)
     subsection_cv: Optional[float] = None  # Coefficient of variation (CV <0.3 = AI-like, ≥0.6 = human)
     subsection_uniform_count: Optional[int] = None  # Count of sections with 3-4 subsections (AI signature)
     subsection_assessment: Optional[str] = None  # EXCELLENT/GOOD/FAIR/POOR
 
     # H4 subsection asymmetry analysis (H4 counts under each H3)
-    h4_counts: Optional[List[int]] = None  # H4 counts under each H3
+    h4_counts: Optional[Sequence[int]] = None  # H4 counts under each H3 (IntSeries)
     h4_subsection_cv: Optional[float] = None  # Coefficient of variation for H4 distribution
     h4_uniform_count: Optional[int] = None  # Count of H3 sections with 2-3 H4s (AI signature)
     h4_assessment: Optional[str] = None  # EXCELLENT/GOOD/FAIR/POOR
@@ -465,3 +490,41 @@ class AnalysisResults:
     overall_score: float = 0.0  # Numeric overall score (0-100)
     execution_time: float = 0.0  # Analysis execution time in seconds
     dimension_count: int = 0  # Number of dimensions analyzed - MUST be 12 in v5.0.0
+    unfinished_dimensions: List[str] = field(default_factory=list)  # Cut off by the analysis deadline
+    stream_progress: Optional[float] = None  # Fraction of the file read (analyze_iter snapshots)
+    metadata: Dict[str, Any] = field(default_factory=dict)  # Run info (analysis mode, timings, profile)
+
+    def __post_init__(self):
+        for name in _SERIES_FIELDS:
+            setattr(self, name, compact_ints(getattr(self, name)))
+
+    def to_dict(self, shallow: bool = False) -> Dict[str, Any]:
+        """
+        Field values by name, like dataclasses.asdict(results).
+
+        Args:
+            shallow: Return the stored values themselves instead of plain
+                copies (no copying; serialize with
+                json.dumps(..., default=compact.json_default))
+
+        Returns:
+            Dict of field name to value; unless shallow, compact series and
+            records are lists and nested dicts are copies
+        """
+        if shallow:
+            return {f.name: getattr(self, f.name) for f in fields(self)}
+        return {f.name: to_plain(getattr(self, f.name)) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AnalysisResults':
+        """
+        Rebuild results from to_dict() output decoded from JSON (e.g. a
+        daemon response): the range fields become tuples again and unknown
+        keys are ignored.
+        """
+        names = {f.name for f in fields(cls)}
+        values = {key: value for key, value in data.items() if key in names}
+        for name in _TUPLE_FIELDS:
+            if isinstance(values.get(name), list):
+                values[name] = tuple(values[name])
+        return cls(**values)
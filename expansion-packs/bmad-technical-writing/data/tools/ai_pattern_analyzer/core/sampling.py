@@ -0,0 +1,239 @@
+"""
+Convergence-driven sampling for sampled analysis.
+
+The fixed sampling strategies ("even", "weighted", "adaptive") analyze
+config.sampling_sections samples at fixed offsets, whether two samples would
+have been enough or twelve are needed. The "convergent" strategy instead lays
+out config.sampling_max_samples stratified, paragraph-aligned samples - one
+per equal stratum of the document - in a low-discrepancy order, so that every
+prefix of the order is spread over the whole document. Each dimension then
+draws samples one at a time (or in rounds, for batched model dimensions) until
+the 95% confidence interval of its key metric
+(DimensionStrategy.sampling_metric) is narrower than config.sampling_ci_width
+relative to the metric's mean, or the samples run out.
+
+Homogeneous documents settle after config.sampling_min_samples samples; varied
+ones get up to the whole budget. Every sampled analysis, whatever the
+strategy, reports the achieved interval and sample count in its result under
+'sampling' (collected into results.metadata['sampling'] by the analyzer).
+
+Usage:
+    >>> draw = SampleDraw(samples, config, ('ai_vocabulary', 'per_1k'))
+    >>> sample_results = []
+    >>> for position, sample_text in draw.draw(sample_results):
+    ...     sample_results.append(analyze(sample_text))
+    >>> draw.summary(sample_results)
+    {'strategy': 'convergent', 'metric': 'ai_vocabulary.per_1k', 'samples': 4, ...}
+"""
+
+import math
+import statistics
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+CONFIDENCE_LEVEL = 0.95
+
+# Two-sided 95% Student t critical values by degrees of freedom; 1.96 above 30
+_T_CRITICAL_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+
+def t_critical(degrees_of_freedom: int) -> float:
+    """Two-sided 95% t critical value (inf below 1 degree of freedom)."""
+    if degrees_of_freedom < 1:
+        return math.inf
+    if degrees_of_freedom > len(_T_CRITICAL_95):
+        return 1.96
+    return _T_CRITICAL_95[degrees_of_freedom - 1]
+
+
+def confidence_interval(values: Sequence[float]) -> Tuple[float, float]:
+    """
+    Mean and 95% confidence-interval half-width of the mean of values.
+
+    Returns:
+        (mean, half_width); half_width is inf with fewer than 2 values
+        (mean is 0.0 without values)
+    """
+    if not values:
+        return 0.0, math.inf
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, math.inf
+    return mean, t_critical(len(values) - 1) * statistics.stdev(values) / math.sqrt(len(values))
+
+
+def spread_order(count: int) -> List[int]:
+    """
+    Indices 0..count-1 in van der Corput order (0, count/2, count/4, 3count/4, ...).
+
+    Every prefix of the order is spread evenly over the range, so samples
+    drawn in this order stay stratified however early the drawing stops.
+    """
+    order = []
+    seen = set()
+    k = 0
+    # Every stratum is hit within the first 4 * count points of the sequence
+    while len(order) < count and k < 4 * count:
+        point, denominator, n = 0.0, 1.0, k
+        while n:
+            denominator *= 2
+            point += (n % 2) / denominator
+            n //= 2
+        index = int(point * count)
+        if index not in seen:
+            seen.add(index)
+            order.append(index)
+        k += 1
+    order.extend(index for index in range(count) if index not in seen)
+    return order
+
+
+def _paragraph_aligned(text: str, start: int, limit: int, chars: int) -> Tuple[int, str]:
+    """
+    Sample of up to chars characters starting at the first paragraph in [start, limit).
+
+    The sample starts after the first blank line at or after start (or at
+    start if the stratum has none) and ends at the last paragraph break in
+    its second half (or is cut at chars if there is none).
+    """
+    if start > 0:
+        boundary = text.find('\n\n', start - 1, limit)
+        if boundary != -1:
+            start = boundary + 2
+    end = min(start + chars, len(text))
+    if end < len(text):
+        boundary = text.rfind('\n\n', start + chars // 2, end)
+        if boundary != -1:
+            end = boundary
+    return start, text[start:end]
+
+
+def stratified_samples(text: str, count: int, chars: int) -> List[Tuple[int, str]]:
+    """
+    One paragraph-aligned sample per equal stratum of text, in spread_order().
+
+    Args:
+        text: Full text to sample from
+        count: Number of strata (the sample budget)
+        chars: Characters per sample
+
+    Returns:
+        List of (start_position, sample_text) tuples in drawing order
+    """
+    count = max(1, min(count, len(text) // max(1, chars) or 1))
+    stratum = len(text) / count
+    return [
+        _paragraph_aligned(text, int(index * stratum), int((index + 1) * stratum), chars)
+        for index in spread_order(count)
+    ]
+
+
+def metric_value(result: Any, path: Sequence[str]) -> Optional[float]:
+    """Numeric value at a key path of a per-sample result dict (None if absent)."""
+    value = result
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+class SampleDraw:
+    """
+    Draws the samples of one dimension's sampled analysis.
+
+    With the "convergent" strategy, drawing stops as soon as the key metric's
+    confidence interval is narrow enough; with any other strategy every
+    sample is drawn, as before. Instances are per analyze() call (dimension
+    instances are shared between threads).
+    """
+
+    def __init__(self, samples: Sequence[Tuple[int, str]], config, metric: Optional[Sequence[str]]):
+        """
+        Args:
+            samples: (position, sample_text) in drawing order (config.extract_samples())
+            config: AnalysisConfig of the analysis
+            metric: Key path of the convergence metric in a per-sample result,
+                None to draw config.sampling_sections samples under "convergent"
+        """
+        self.config = config
+        self.metric = tuple(metric) if metric else None
+        self.convergent = config.sampling_strategy == 'convergent'
+        if self.convergent and self.metric is None:
+            samples = samples[:max(1, config.sampling_sections)]
+        self.samples = list(samples)
+        self.drawn: List[Tuple[int, str]] = []
+
+    def _values(self, sample_results: Sequence[Any]) -> List[float]:
+        values = [metric_value(result, self.metric) for result in sample_results]
+        return [value for value in values if value is not None]
+
+    def interval(self, sample_results: Sequence[Any]) -> Tuple[float, float]:
+        """Mean and CI half-width of the metric over sample_results."""
+        if self.metric is None:
+            return 0.0, math.inf
+        return confidence_interval(self._values(sample_results))
+
+    def converged(self, sample_results: Sequence[Any]) -> bool:
+        """Whether the metric's relative CI half-width is within config.sampling_ci_width."""
+        if self.metric is None or len(sample_results) < max(2, self.config.sampling_min_samples):
+            return False
+        mean, half_width = self.interval(sample_results)
+        return half_width <= self.config.sampling_ci_width * abs(mean)
+
+    def draw(self, sample_results: List[Any]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield samples one at a time; the caller appends each sample's result
+        to sample_results before taking the next.
+        """
+        for sample in self.samples:
+            if self.convergent and self.converged(sample_results):
+                return
+            self.drawn.append(sample)
+            yield sample
+
+    def rounds(self, sample_results: List[Any]) -> Iterator[List[Tuple[int, str]]]:
+        """
+        Yield samples in batches (for dimensions that analyze samples in one
+        batched model call); the caller extends sample_results with each
+        batch's results before taking the next.
+
+        Without convergence the single batch holds every sample; otherwise
+        batches hold config.sampling_min_samples samples, and a batch without
+        any usable metric value (e.g. a failed model) ends the drawing.
+        """
+        size = max(1, self.config.sampling_min_samples) if self.convergent else len(self.samples)
+        position = 0
+        values = None
+        while position < len(self.samples):
+            if self.convergent and self.metric is not None:
+                count = len(self._values(sample_results))
+                if count == values or self.converged(sample_results):
+                    return
+                values = count
+            batch = self.samples[position:position + size]
+            position += len(batch)
+            self.drawn.extend(batch)
+            yield batch
+
+    def summary(self, sample_results: Sequence[Any]) -> Dict[str, Any]:
+        """Achieved interval and sample count, reported under the result's 'sampling' key."""
+        mean, half_width = self.interval(sample_results)
+        finite = math.isfinite(half_width)
+        return {
+            'strategy': self.config.sampling_strategy,
+            'metric': '.'.join(self.metric) if self.metric else None,
+            'samples': len(self.drawn),
+            'budget': len(self.samples),
+            'confidence': CONFIDENCE_LEVEL,
+            'mean': round(mean, 4) if self.metric else None,
+            'ci_half_width': round(half_width, 4) if finite else None,
+            'ci_relative_width': round(half_width / abs(mean), 4) if finite and mean else None,
+            'target_relative_width': self.config.sampling_ci_width if self.convergent else None,
+            'converged': self.converged(sample_results) if self.metric else False,
+        }
@@ -0,0 +1,490 @@
+"""
+Dependency-aware dimension scheduler.
+
+AIPatternAnalyzer used to run every loaded dimension one after another,
+each re-deriving what it needed from the raw text. DimensionScheduler runs
+them as a small dependency graph:
+
+1. Each shared artifact a dimension declares in required_artifacts is built
+   exactly once per document, before any dimension that needs it runs.
+2. Dimensions run concurrently on a thread or process pool; a dimension
+   starts as soon as its artifacts are ready.
+3. A per-dimension wall-clock budget turns an overrun into an
+   {'available': False} result instead of blocking the whole file.
+
+Results are always returned in the order of the input dimensions dict.
+
+Artifacts (the DocumentContext - prose text, words, sentences, paragraphs -
+is always built up front by AIPatternAnalyzer and passed as `context`):
+
+- markdown_ast:   marko AST of the full text (from the shared markdown_service cache)
+- spacy_docs:     spaCy Docs for every consumer's prepared samples, parsed in
+                  one nlp.pipe pass into the shared spacy_service Doc cache
+- language_model: GLTR language model loaded for config.inference_backend
+
+Threads (the default executor) suit this workload: torch inference and spaCy
+parsing release the GIL, and artifacts are shared in memory. A process pool
+isolates the pure-Python regex dimensions, but each worker builds the
+artifacts it needs itself.
+
+Python cannot kill a running thread. Each thread-run dimension therefore
+gets its own child Deadline of the per-dimension budget (inside the analysis
+deadline); when the dimension overruns, that child is cancelled, so the thread
+stops at its next cancellation check, and its late result is discarded.
+Timed-out threads give their pool slot back immediately.
+
+The analysis Deadline (core/deadline.py) bounds the whole run. When it
+passes, every dimension still pending is reported unfinished
+({'available': False, 'unfinished': True}), the deadline is cancelled so
+dimension threads stop at their next cancellation check, and process-pool
+workers are terminated.
+
+A run given a StageProfiler (core/profiler.py) executes sequentially on the
+calling thread, so each artifact's and dimension's CPU time and allocation
+peak are measured in isolation.
+"""
+
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+from ai_pattern_analyzer.core.deadline import Deadline, DeadlineExceeded, deadline_scope
+from ai_pattern_analyzer.core.profiler import StageProfiler, stage
+
+# Collector polling interval while a dimension budget is being enforced
+POLL_INTERVAL_SECONDS = 0.05
+
+EXECUTOR_TYPES = ('thread', 'process')
+
+
+def _build_markdown_ast(text: str, config: AnalysisConfig, consumers: List[Any]) -> Any:
+    """Parse the full text to a marko AST once for all consumers (via the shared AST cache)."""
+    from ai_pattern_analyzer.utils import markdown_service
+    return markdown_service.parse(text)
+
+
+def _build_spacy_docs(text: str, config: AnalysisConfig, consumers: List[Any]) -> List[Any]:
+    """Parse every consumer's prepared samples in one nlp.pipe pass (warms the Doc cache)."""
+    from ai_pattern_analyzer.utils import spacy_service
+
+    samples = []
+    for dim in consumers:
+        prepared = dim._prepare_text(text, config, dim.dimension_name)
+        if isinstance(prepared, list):
+            samples.extend(sample_text for _, sample_text in prepared)
+        else:
+            samples.append(prepared)
+
+    unique = list(dict.fromkeys(spacy_service.strip_code_blocks(sample) for sample in samples))
+    return spacy_service.parse_many(
+        unique,
+        batch_size=config.spacy_batch_size,
+        n_process=config.spacy_n_process
+    )
+
+
+def _build_language_model(text: str, config: AnalysisConfig, consumers: List[Any]) -> None:
+    """Load the language model each consumer scores tokens with."""
+    for dim in consumers:
+        dim.warm_up(config)
+
+
+ARTIFACT_BUILDERS: Dict[str, Callable[[str, AnalysisConfig, List[Any]], Any]] = {
+    'markdown_ast': _build_markdown_ast,
+    'spacy_docs': _build_spacy_docs,
+    'language_model': _build_language_model,
+}
+
+ARTIFACT_NAMES = tuple(ARTIFACT_BUILDERS)
+
+
+def _analyze_in_worker(dim_name: str, text: str, lines: List[str], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point: load one dimension and analyze with local artifacts."""
+    from ai_pattern_analyzer.core.dimension_loader import DimensionLoader
+    from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+
+    if not DimensionRegistry.has(dim_name):
+        DimensionLoader().load_dimensions([dim_name])
+    dim = DimensionRegistry.get(dim_name)
+
+    kwargs = dict(kwargs)
+    config = kwargs.pop('config')
+    with deadline_scope(kwargs.get('deadline')):
+        kwargs['artifacts'] = DimensionScheduler.build_artifacts({dim_name: dim}, text, config)
+        return dim.analyze(text, lines, config=config, **kwargs)
+
+
+def _wait_seconds(timeout: Optional[float], deadline: Optional[Deadline]) -> Optional[float]:
+    """The shorter of a dimension timeout and the time left before deadline (None = unbounded)."""
+    remaining = deadline.remaining() if deadline is not None else None
+    if timeout is None:
+        return remaining
+    return timeout if remaining is None else min(timeout, remaining)
+
+
+class _Permit:
+    """One pool slot held by a dimension thread; releasable once, by either side."""
+
+    def __init__(self, slots: threading.Semaphore):
+        self._slots = slots
+        self._lock = threading.Lock()
+        self._held = False
+
+    def acquire(self) -> None:
+        self._slots.acquire()
+        with self._lock:
+            self._held = True
+
+    def release(self) -> None:
+        with self._lock:
+            if self._held:
+                self._held = False
+                self._slots.release()
+
+
+class DimensionScheduler:
+    """
+    Build shared artifacts once and run dimensions concurrently with budgets.
+
+    Usage:
+        >>> scheduler = DimensionScheduler()
+        >>> results = scheduler.run(analyzer.dimensions, text, lines, config,
+        ...                         {'structure': {'word_count': 120}})
+    """
+
+    def __init__(self):
+        """Initialize without pools; a process pool is created on first use."""
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_workers = 0
+        # Submitted process-pool futures not yet done (cancelled on shutdown)
+        self._process_futures: Set[Future] = set()
+
+    # ========================================================================
+    # PUBLIC API
+    # ========================================================================
+
+    def run(
+        self,
+        dimensions: Dict[str, Any],
+        text: str,
+        lines: List[str],
+        config: AnalysisConfig,
+        dimension_kwargs: Optional[Dict[str, Dict[str, Any]]] = None,
+        deadline: Optional[Deadline] = None,
+        profiler: Optional[StageProfiler] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze text with every dimension.
+
+        Args:
+            dimensions: Dimension name -> DimensionStrategy, in result order
+            text: Full text to analyze
+            lines: Text split into lines
+            config: Analysis configuration (dimension_workers, dimension_executor,
+                dimension_timeout_seconds select how dimensions run)
+            dimension_kwargs: Extra analyze() kwargs per dimension name
+                (e.g. context, word_count)
+            deadline: Budget for the whole run, also passed to every analyze()
+                (None = no overall limit)
+            profiler: Records every artifact and dimension as a stage; the
+                run is then sequential, whatever config selects
+
+        Returns:
+            Dimension name -> result dict, in the order of `dimensions`.
+            Failed or timed-out dimensions report {'available': False, 'error': ...};
+            dimensions cut off by the deadline also carry 'unfinished': True
+        """
+        dimension_kwargs = dimension_kwargs or {}
+        calls = {
+            name: {'config': config, **dimension_kwargs.get(name, {})}
+            for name in dimensions
+        }
+        if deadline is not None:
+            for kwargs in calls.values():
+                kwargs['deadline'] = deadline
+        workers = max(1, min(config.dimension_workers, len(dimensions)))
+        timeout = config.dimension_timeout_seconds
+        bounded = deadline is not None and deadline.remaining() is not None
+
+        if config.dimension_executor not in EXECUTOR_TYPES:
+            raise ValueError(
+                f"Unknown dimension_executor '{config.dimension_executor}'. "
+                f"Valid: {', '.join(EXECUTOR_TYPES)}"
+            )
+
+        if profiler is not None:
+            results = self._run_sequential(dimensions, text, lines, config, calls, profiler)
+        elif config.dimension_executor == 'process' and workers > 1:
+            results = self._run_processes(dimensions, text, lines, config, calls, workers, timeout, deadline)
+        elif workers > 1 or timeout or bounded:
+            results = self._run_threads(dimensions, text, lines, config, calls, workers, timeout, deadline)
+        else:
+            results = self._run_sequential(dimensions, text, lines, config, calls)
+
+        return {name: results[name] for name in dimensions}
+
+    @staticmethod
+    def build_artifacts(dimensions: Dict[str, Any], text: str, config: AnalysisConfig,
+                        profiler: Optional[StageProfiler] = None) -> Dict[str, Any]:
+        """Build every artifact the dimensions require, once each (sequentially)."""
+        artifacts = {}
+        for name, consumers in DimensionScheduler._artifact_consumers(dimensions).items():
+            with stage(profiler, name, 'artifact') as profile:
+                artifacts[name] = DimensionScheduler._build_artifact(name, text, config, consumers)
+                if profile is not None and name == 'spacy_docs' and artifacts[name] is not None:
+                    profile.samples_analyzed = len(artifacts[name])
+        return artifacts
+
+    def shutdown(self) -> None:
+        """Shut down the process pool, if one was started, cancelling queued dimensions."""
+        if self._process_pool is not None:
+            # shutdown(cancel_futures=True) needs Python 3.9; cancel() is a no-op
+            # for futures a worker has already picked up
+            for future in list(self._process_futures):
+                future.cancel()
+            self._process_futures.clear()
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+            self._process_pool_workers = 0
+
+    # ========================================================================
+    # EXECUTION STRATEGIES
+    # ========================================================================
+
+    def _run_sequential(self, dimensions, text, lines, config, calls,
+                        profiler=None) -> Dict[str, Dict[str, Any]]:
+        """Run dimensions one after another on the calling thread."""
+        artifacts = self.build_artifacts(dimensions, text, config, profiler)
+
+        results = {}
+        for name, dim in dimensions.items():
+            deadline = calls[name].get('deadline')
+            if deadline is not None and deadline.expired:
+                results[name] = self._unfinished(deadline)
+                continue
+            try:
+                with stage(profiler, name, 'dimension') as profile, deadline_scope(deadline):
+                    results[name] = dim.analyze(text, lines, artifacts=artifacts, **calls[name])
+                    if profile is not None and isinstance(results[name], dict):
+                        profile.samples_analyzed = results[name].get('samples_analyzed')
+            except DeadlineExceeded:
+                results[name] = self._unfinished(deadline)
+            except Exception as e:
+                results[name] = self._failure(name, e)
+        return results
+
+    def _run_threads(self, dimensions, text, lines, config, calls, workers, timeout,
+                     deadline=None) -> Dict[str, Dict[str, Any]]:
+        """Run artifact builders and dimensions on daemon threads sharing `workers` slots."""
+        slots = threading.Semaphore(workers)
+        artifacts: Dict[str, Any] = {}
+        artifact_ready: Dict[str, threading.Event] = {}
+
+        def build(name: str, consumers: List[Any], ready: threading.Event) -> None:
+            permit = _Permit(slots)
+            permit.acquire()
+            try:
+                artifacts[name] = self._build_artifact(name, text, config, consumers)
+            finally:
+                permit.release()
+                ready.set()
+
+        for name, consumers in self._artifact_consumers(dimensions).items():
+            artifact_ready[name] = threading.Event()
+            self._start_thread(f'artifact-{name}', build, name, consumers, artifact_ready[name])
+
+        budgets: Dict[str, Deadline] = {}
+
+        def analyze(name: str, dim: Any, kwargs: Dict[str, Any], future: Future, permit: _Permit) -> None:
+            # Wait for artifacts before taking a slot, so builders are never starved
+            for artifact in dim.required_artifacts:
+                if artifact in artifact_ready:
+                    artifact_ready[artifact].wait(_wait_seconds(timeout, deadline))
+            permit.acquire()
+            try:
+                # The dimension's own budget, cancelled by _collect() when it overruns
+                budget = budgets[name] = Deadline(timeout or None, parent=deadline)
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    with deadline_scope(budget):
+                        future.set_result(dim.analyze(text, lines, artifacts=dict(artifacts),
+                                                      **{**kwargs, 'deadline': budget}))
+                except BaseException as e:
+                    future.set_exception(e)
+            finally:
+                permit.release()
+
+        futures: Dict[str, Future] = {}
+        permits: Dict[str, _Permit] = {}
+        for name, dim in dimensions.items():
+            futures[name] = Future()
+            permits[name] = _Permit(slots)
+            self._start_thread(f'dimension-{name}', analyze, name, dim, calls[name], futures[name], permits[name])
+
+        def on_timeout(name: str) -> None:
+            # Stop the thread at its next check, and give its slot to the next dimension now
+            if name in budgets:
+                budgets[name].cancel()
+            permits[name].release()
+
+        return self._collect(futures, timeout, deadline, on_timeout=on_timeout)
+
+    def _run_processes(self, dimensions, text, lines, config, calls, workers, timeout,
+                       deadline=None) -> Dict[str, Dict[str, Any]]:
+        """Run dimensions in a process pool; each worker builds its own artifacts."""
+        from ai_pattern_analyzer.core.dimension_loader import DIMENSION_MODULE_MAP
+
+        pool = self._get_process_pool(workers)
+        futures: Dict[str, Future] = {}
+        inline = {}
+        for name, dim in dimensions.items():
+            if name in DIMENSION_MODULE_MAP:
+                futures[name] = pool.submit(_analyze_in_worker, name, text, lines, calls[name])
+                self._process_futures.add(futures[name])
+                futures[name].add_done_callback(self._process_futures.discard)
+            else:
+                # Runtime-registered dimensions cannot be re-imported in a worker
+                inline[name] = dim
+
+        results = self._run_sequential(inline, text, lines, config, calls)
+        results.update(self._collect(futures, timeout, deadline, on_deadline=self._kill_process_pool))
+        return results
+
+    # ========================================================================
+    # HELPERS
+    # ========================================================================
+
+    @staticmethod
+    def _artifact_consumers(dimensions: Dict[str, Any]) -> Dict[str, List[Any]]:
+        """Artifact name -> dimensions that require it (unknown names are ignored)."""
+        consumers: Dict[str, List[Any]] = {}
+        for dim in dimensions.values():
+            for artifact in getattr(dim, 'required_artifacts', ()):
+                if artifact in ARTIFACT_BUILDERS:
+                    consumers.setdefault(artifact, []).append(dim)
+        return consumers
+
+    @staticmethod
+    def _build_artifact(name: str, text: str, config: AnalysisConfig, consumers: List[Any]) -> Any:
+        """Build one artifact; on failure warn and return None (consumers fall back)."""
+        try:
+            return ARTIFACT_BUILDERS[name](text, config, consumers)
+        except Exception as e:
+            print(f"Warning: building shared artifact '{name}' failed: {e}", file=sys.stderr)
+            return None
+
+    @staticmethod
+    def _start_thread(name: str, target: Callable, *args) -> None:
+        """Start a daemon thread (never blocks interpreter exit if it overruns)."""
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+
+    def _collect(
+        self,
+        futures: Dict[str, Future],
+        timeout: Optional[float],
+        deadline: Optional[Deadline] = None,
+        on_timeout: Optional[Callable[[str], None]] = None,
+        on_deadline: Optional[Callable[[], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for dimension futures, enforcing `timeout` from when each starts running.
+
+        Start times are observed by polling Future.running(), so budgets are
+        accurate to POLL_INTERVAL_SECONDS. Once `deadline` passes, every pending
+        dimension is reported unfinished, on_timeout is called for each, the
+        deadline is cancelled and on_deadline is called.
+        """
+        results = {}
+        pending = {future: name for name, future in futures.items()}
+        started_at: Dict[str, float] = {}
+        polling = bool(timeout) or (deadline is not None and deadline.remaining() is not None)
+
+        while pending:
+            done, _ = wait(
+                pending,
+                timeout=POLL_INTERVAL_SECONDS if polling else None,
+                return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    results[name] = future.result()
+                except DeadlineExceeded:
+                    if timeout and not (deadline is not None and deadline.expired):
+                        results[name] = self._timed_out(name, timeout)  # Its own budget ran out
+                    else:
+                        results[name] = self._unfinished(deadline)
+                except Exception as e:
+                    results[name] = self._failure(name, e)
+
+            if pending and deadline is not None and deadline.expired:
+                for future, name in pending.items():
+                    future.cancel()  # Not started yet: never run it
+                    results[name] = self._unfinished(deadline)
+                    if on_timeout:
+                        on_timeout(name)
+                deadline.cancel()
+                if on_deadline:
+                    on_deadline()
+                break
+
+            if not timeout:
+                continue
+
+            now = time.perf_counter()
+            for future, name in list(pending.items()):
+                if future.running():
+                    started_at.setdefault(name, now)
+                if name in started_at and now - started_at[name] > timeout:
+                    del pending[future]
+                    results[name] = self._timed_out(name, timeout)
+                    if on_timeout:
+                        on_timeout(name)
+
+        return results
+
+    @staticmethod
+    def _unfinished(deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """Result dict for a dimension cut off by the analysis deadline."""
+        reason = deadline.describe() if deadline is not None else "analysis cancelled"
+        return {'available': False, 'unfinished': True, 'error': reason}
+
+    @staticmethod
+    def _timed_out(name: str, timeout: float) -> Dict[str, Any]:
+        """Result dict for a dimension that overran its per-dimension budget."""
+        print(f"Warning: {name} analysis exceeded {timeout}s budget", file=sys.stderr)
+        return {'available': False, 'error': f'timed out after {timeout}s'}
+
+    @staticmethod
+    def _failure(name: str, error: BaseException) -> Dict[str, Any]:
+        """Result dict for a dimension that raised."""
+        print(f"Warning: {name} analysis failed: {error}", file=sys.stderr)
+        return {'available': False, 'error': str(error)}
+
+    def _kill_process_pool(self) -> None:
+        """Terminate the pool's workers (e.g. stuck in inference past the deadline)."""
+        pool = self._process_pool
+        if pool is None:
+            return
+        # ProcessPoolExecutor has no public way to stop busy workers
+        for process in list((getattr(pool, '_processes', None) or {}).values()):
+            process.terminate()
+        self.shutdown()
+
+    def _get_process_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return the cached process pool, recreating it if the worker count changed."""
+        if self._process_pool is None or self._process_pool_workers != workers:
+            self.shutdown()
+            # spawn: forking a process that already runs torch threads can deadlock
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            self._process_pool_workers = workers
+        return self._process_pool
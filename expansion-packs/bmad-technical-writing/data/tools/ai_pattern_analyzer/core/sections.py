@@ -0,0 +1,323 @@
+"""
+Section-level incremental analysis with mergeable metric state.
+
+Editing one chapter section should not re-analyze the whole chapter. The
+document is split at heading boundaries into sections; dimensions that opt in
+(DimensionStrategy.supports_sections) compute a small partial state per
+section - counts, sums and sums of squares, pattern hits - and merge the
+states into document-level metrics. Section states are cached by section
+content hash, so a re-run only re-processes sections whose text changed.
+
+Sections are cut only before an ATX heading line that follows an empty line,
+outside fenced code and outside any ``` pair (prose stripping pairs ```
+anywhere in a line, not only at line starts). The cut therefore sits on a
+blank-line paragraph break, so paragraph and sentence splitting inside each
+section is exactly the splitting of the whole document, and merged metrics
+match a from-scratch analyze() of the same text.
+
+Only dimensions whose metrics are sums over paragraphs or pattern matches
+can opt in. Context-dependent metrics (GLTR token ranks, MTLD, spaCy parses)
+stay whole-document; the result cache covers those when the text is unchanged.
+"""
+
+import hashlib
+import math
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+from ai_pattern_analyzer.core.result_cache import content_hash
+
+HEADING_PATTERN = re.compile(r'#{1,6}(\s|$)')
+FENCE_PATTERN = re.compile(r'\s*(```|~~~)')
+BACKTICK_FENCE = '```'
+
+# Default bound of the in-memory section state cache
+DEFAULT_MAX_SECTION_STATES = 4096
+
+# Bits of precision for correctly rounded square roots (matches statistics)
+_SQRT_BIT_WIDTH = 2 * sys.float_info.mant_dig + 3
+
+
+@dataclass(frozen=True)
+class Section:
+    """One heading-delimited section of a document."""
+    index: int
+    start_line: int
+    text: str
+    hash: str
+
+
+def split_sections(text: str) -> List[Section]:
+    """
+    Split text into heading-delimited sections.
+
+    Concatenating the texts of the returned sections gives back text exactly.
+
+    Args:
+        text: Document text
+
+    Returns:
+        List of Section in document order (one section if there are no cuts)
+    """
+    cuts = [(0, 0)] + section_cuts(text)
+
+    sections = []
+    for index, (start, first_line) in enumerate(cuts):
+        end = cuts[index + 1][0] if index + 1 < len(cuts) else len(text)
+        section_text = text[start:end]
+        sections.append(Section(index, first_line + 1, section_text, content_hash(section_text)))
+    return sections
+
+
+def section_cuts(text: str, headings_only: bool = True) -> List[Tuple[int, int]]:
+    """
+    Offsets where text can be cut without changing paragraph splitting.
+
+    Args:
+        text: Document text
+        headings_only: Cut only before headings (False: before any line that
+            follows an empty line, still outside fenced code)
+
+    A cut is never placed between two ``` that prose stripping
+    (document_context.CODE_BLOCK_PATTERN) pairs, even mid-line, so each part
+    strips exactly the code the whole text does.
+
+    Returns:
+        (character offset, 0-based line number) of each cut, in order,
+        excluding the start of text
+    """
+    cuts = []
+    in_fence = False
+    unpaired_backticks = False  # An odd number of ``` so far
+    offset = 0
+    previous = None
+    for line_number, line in enumerate(text.split('\n')):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        elif (not in_fence and not unpaired_backticks and previous == '' and line
+                and (not headings_only or HEADING_PATTERN.match(line))):
+            cuts.append((offset, line_number))
+        if line.count(BACKTICK_FENCE) % 2:
+            unpaired_backticks = not unpaired_backticks
+        offset += len(line) + 1
+        previous = line
+    return cuts
+
+
+class MomentStats:
+    """
+    Mergeable count, sum, sum of squares, min and max of integer samples.
+
+    mean and stdev are computed exactly and equal statistics.mean() and
+    statistics.stdev() over the same samples.
+    """
+
+    __slots__ = ('count', 'total', 'total_sq', 'min', 'max')
+
+    def __init__(self, count: int = 0, total: int = 0, total_sq: int = 0,
+                 min: Optional[int] = None, max: Optional[int] = None):
+        self.count = count
+        self.total = total
+        self.total_sq = total_sq
+        self.min = min
+        self.max = max
+
+    @classmethod
+    def of(cls, values: Iterable[int]) -> 'MomentStats':
+        """Statistics of values."""
+        stats = cls()
+        for value in values:
+            stats.add(value)
+        return stats
+
+    def add(self, value: int) -> None:
+        """Add one sample."""
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+
+    def merge(self, other: 'MomentStats') -> 'MomentStats':
+        """Return the statistics of both sample sets (neither is modified)."""
+        bounds_min = [v for v in (self.min, other.min) if v is not None]
+        bounds_max = [v for v in (self.max, other.max) if v is not None]
+        return MomentStats(
+            self.count + other.count,
+            self.total + other.total,
+            self.total_sq + other.total_sq,
+            min(bounds_min) if bounds_min else None,
+            max(bounds_max) if bounds_max else None,
+        )
+
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean (requires count > 0)."""
+        return self.total / self.count
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation (requires count > 1)."""
+        n = self.count
+        variance = Fraction(n * self.total_sq - self.total * self.total, n * (n - 1))
+        return _sqrt_fraction(variance)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MomentStats):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (f"MomentStats(count={self.count}, total={self.total}, total_sq={self.total_sq}, "
+                f"min={self.min}, max={self.max})")
+
+    def as_list(self) -> List[Optional[int]]:
+        """[count, total, total_sq, min, max] - the plain form kept in section states."""
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+def merge_moments(stats: Iterable[Union[MomentStats, Sequence[Optional[int]]]]) -> MomentStats:
+    """Merge any number of MomentStats or their as_list() forms."""
+    merged = MomentStats()
+    for item in stats:
+        merged = merged.merge(item if isinstance(item, MomentStats) else MomentStats(*item))
+    return merged
+
+
+def _sqrt_fraction(value: Fraction) -> float:
+    """Correctly rounded square root of a non-negative Fraction (as statistics.stdev)."""
+    n, m = value.numerator, value.denominator
+    q = (n.bit_length() - m.bit_length() - _SQRT_BIT_WIDTH) // 2
+    if q >= 0:
+        numerator = _isqrt_frac_round_to_odd(n, m << 2 * q) << q
+        denominator = 1
+    else:
+        numerator = _isqrt_frac_round_to_odd(n << -2 * q, m)
+        denominator = 1 << -q
+    return numerator / denominator
+
+
+def _isqrt_frac_round_to_odd(n: int, m: int) -> int:
+    """Square root of n/m, rounded to odd (exact results stay exact)."""
+    a = math.isqrt(n // m)
+    return a | (a * a * m != n)
+
+
+def section_state_key(section_hash: str, dimension_name: str, dimension_version: str) -> str:
+    """Cache key for one dimension's state of one section."""
+    from ai_pattern_analyzer import __version__
+
+    parts = [section_hash, dimension_name, dimension_version, __version__, 'section']
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+class SectionStateCache:
+    """
+    Bounded in-memory LRU of section states, shared across analyze calls.
+
+    Usage:
+        >>> states = SectionStateCache()
+        >>> analyze_by_sections(dim, text, config, states)  # every section computed
+        >>> analyze_by_sections(dim, edited, config, states)  # only edited sections
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_SECTION_STATES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        """Return the state for key (marking it recently used), or None."""
+        with self._lock:
+            state = self._entries.get(key)
+            if state is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return state
+
+    def put(self, key: str, state: Any) -> None:
+        """Store a state, evicting the least recently used beyond max_entries."""
+        with self._lock:
+            self._entries[key] = state
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every state."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def analyze_by_sections(dim, text: str, config: AnalysisConfig, states: SectionStateCache,
+                        store=None) -> Optional[Dict[str, Any]]:
+    """
+    Analyze text with a section-capable dimension, reusing cached section states.
+
+    Args:
+        dim: DimensionStrategy with supports_sections True
+        text: Full text (as passed to analyze())
+        config: Analysis configuration
+        states: In-memory section state cache
+        store: Optional DimensionResultCache persisting states across runs
+
+    Returns:
+        The dict analyze() would return, or None if config samples the text
+        (sampled analysis is not section-based; call analyze() instead)
+    """
+    prepared = dim._prepare_text(text, config, dim.dimension_name)
+    if not isinstance(prepared, str):
+        return None
+
+    section_states = []
+    for section in split_sections(prepared):
+        key = section_state_key(section.hash, dim.dimension_name, dim.version)
+        state = states.get(key)
+        if state is None and store is not None:
+            state = store.get(key)
+            if state is not None:
+                states.put(key, state)
+        if state is None:
+            state = dim.analyze_section(section.text)
+            states.put(key, state)
+            if store is not None:
+                try:
+                    store.put(key, f"{dim.dimension_name}:section", state)
+                except Exception as e:
+                    print(f"Warning: could not cache {dim.dimension_name} section state: {e}",
+                          file=sys.stderr)
+        section_states.append(state)
+
+    total_text_length = len(text)
+    analyzed_length = len(prepared)
+    return {
+        **dim.merge_sections(section_states),
+        'available': True,
+        'analysis_mode': config.mode.value,
+        'samples_analyzed': 1,
+        'sampling': None,
+        'total_text_length': total_text_length,
+        'analyzed_text_length': analyzed_length,
+        'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
+    }
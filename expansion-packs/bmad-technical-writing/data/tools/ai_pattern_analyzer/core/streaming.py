@@ -0,0 +1,370 @@
+"""
+Bounded-memory streaming analysis (AnalysisMode.STREAMING).
+
+AIPatternAnalyzer.analyze_iter() reads a manuscript in chunks of about
+AnalysisConfig.stream_chunk_chars characters (memory-mapped for files of
+STREAM_MMAP_THRESHOLD_BYTES or more) and yields an AnalysisResults snapshot
+after every chunk. Memory stays flat however long the file is: only the
+current chunk and a constant-size running state per dimension are held.
+
+Chunks are cut where split_sections() cuts - before a heading that follows
+an empty line, outside fenced code - or, when a section is longer than a
+chunk, at any blank-line paragraph break outside fenced code. Chunks never
+end inside an HTML comment or between two ``` that prose stripping pairs
+mid-line, so word counts equal a whole-file analysis. Only a single paragraph longer than
+MAX_CHUNK_FACTOR chunks is cut at a plain line break.
+
+Running state per dimension:
+- Section-capable dimensions (DimensionStrategy.supports_sections) fold each
+  chunk's analyze_section() state into one merge_section_states() state.
+  Chunks end on paragraph breaks, so these metrics equal a whole-file
+  analysis (burstiness omits the per-sentence length list).
+- Every other dimension analyzes each chunk as one sample, and RunningMetrics
+  folds the chunk metrics the way _aggregate_sampled_metrics() aggregates
+  samples, so its metrics are those of a sampled analysis whose samples
+  cover the whole file.
+"""
+
+import codecs
+import io
+import mmap
+import os
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+from ai_pattern_analyzer.core.deadline import Deadline
+from ai_pattern_analyzer.core.sections import section_cuts
+
+# Files at least this large are memory-mapped instead of read through a buffer
+STREAM_MMAP_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# A paragraph longer than this many chunks is cut at a line break
+MAX_CHUNK_FACTOR = 4
+
+# Items kept per list metric of dimensions folded by RunningMetrics
+STREAM_LIST_LIMIT = 100
+
+# Per-dimension metadata fields, recomputed for the stream (not aggregated)
+_METADATA_FIELDS = ('available', 'analysis_mode', 'samples_analyzed', 'sampling', 'total_text_length',
+                    'analyzed_text_length', 'coverage_percentage')
+
+
+def iter_file_text(path: str, block_chars: int,
+                   mmap_threshold: int = STREAM_MMAP_THRESHOLD_BYTES) -> Iterator[str]:
+    """
+    Read a UTF-8 file as text blocks, with universal newlines like open().
+
+    Args:
+        path: File to read
+        block_chars: Characters (bytes, when memory-mapped) per block
+        mmap_threshold: Memory-map files of at least this many bytes
+
+    Yields:
+        Consecutive blocks of the file's text
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return
+    if size < mmap_threshold:
+        with open(path, 'r', encoding='utf-8') as f:
+            while True:
+                block = f.read(block_chars)
+                if not block:
+                    return
+                yield block
+
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for start in range(0, size, block_chars):
+            block = decoder.decode(mapped[start:start + block_chars])
+            if block:
+                yield block
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def iter_chunks(blocks: Iterable[str], chunk_chars: int) -> Iterator[str]:
+    """
+    Regroup text blocks into chunks that end on section or paragraph breaks.
+
+    Concatenating the chunks gives back the concatenated blocks exactly.
+
+    Args:
+        blocks: Text blocks (e.g. from iter_file_text())
+        chunk_chars: Target chunk length in characters
+
+    Yields:
+        Chunks of about chunk_chars characters (the last one may be shorter)
+    """
+    buffer = ''
+    for block in blocks:
+        buffer += block
+        while len(buffer) >= chunk_chars:
+            cut = _chunk_cut(buffer, chunk_chars)
+            if cut is None:
+                break
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+
+def _chunk_cut(buffer: str, chunk_chars: int) -> Optional[int]:
+    """Offset to end the next chunk at, or None to read more text first."""
+    window = min(len(buffer), MAX_CHUNK_FACTOR * chunk_chars)
+    oversized = len(buffer) >= MAX_CHUNK_FACTOR * chunk_chars
+    limit = window
+    comment = buffer.rfind('<!--', 0, window)
+    if comment != -1:
+        close = buffer.find('-->', comment + 4)
+        if close == -1 or close + 3 > window:
+            limit = comment  # Never split an HTML comment; it is stripped per chunk
+
+    # Complete lines only: a partial last line could look like a heading
+    region = buffer[:buffer.rfind('\n', 0, limit) + 1]
+
+    heading_cuts = section_cuts(region)
+    if heading_cuts and heading_cuts[-1][0] >= chunk_chars // 2:
+        return heading_cuts[-1][0]
+    paragraph_cuts = section_cuts(region, headings_only=False)
+    if paragraph_cuts:
+        return paragraph_cuts[-1][0]
+    if oversized:
+        return len(region) or buffer.rfind('\n', 0, window) + 1 or window
+    return None
+
+
+class RunningMetrics:
+    """
+    Constant-size running aggregate of metric dicts.
+
+    Folds dicts one at a time with the rules of
+    DimensionStrategy._aggregate_sampled_metrics(): numbers are averaged,
+    booleans decided by majority, strings by the most common value, lists
+    concatenated without duplicates (up to list_limit items) and dicts
+    aggregated per key.
+
+    Usage:
+        >>> running = RunningMetrics()
+        >>> for chunk_metrics in per_chunk_results:
+        ...     running.add(chunk_metrics)
+        >>> running.value()
+    """
+
+    def __init__(self, list_limit: int = STREAM_LIST_LIMIT):
+        self.list_limit = list_limit
+        self.count = 0
+        self._fields: Dict[str, _RunningValue] = {}
+
+    def add(self, metrics: Dict[str, Any]) -> None:
+        """Fold one metric dict into the aggregate."""
+        self.count += 1
+        for key, value in metrics.items():
+            field = self._fields.get(key)
+            if field is None:
+                field = self._fields[key] = _RunningValue(self.list_limit)
+            field.add(value)
+
+    def value(self) -> Dict[str, Any]:
+        """Aggregated metrics of every dict added so far."""
+        return {key: field.value() for key, field in self._fields.items()}
+
+
+class _RunningValue:
+    """Running aggregate of one metric; its type is fixed by the first non-None value."""
+
+    __slots__ = ('list_limit', 'kind', 'count', 'total', 'modes', 'items', 'seen', 'nested', 'first')
+
+    def __init__(self, list_limit: int):
+        self.list_limit = list_limit
+        self.kind = None
+        self.count = 0
+        self.total = 0
+
+    def add(self, value: Any) -> None:
+        if value is None:
+            return
+        kind = _kind_of(value)
+        if self.kind is None:
+            self._start(kind, value)
+        elif kind != self.kind:
+            return  # Inconsistent type across chunks: keep the first type's aggregate
+
+        self.count += 1
+        if kind == 'number':
+            self.total += value
+        elif kind == 'bool':
+            self.total += bool(value)
+        elif kind == 'str':
+            self.modes[value] += 1
+        elif kind == 'list':
+            for item in value:
+                if len(self.items) >= self.list_limit:
+                    break
+                item_key = str(item) if not isinstance(item, (str, int, float, bool, tuple)) else item
+                if item_key not in self.seen:
+                    self.items.append(item)
+                    self.seen.add(item_key)
+        elif kind == 'dict':
+            self.nested.add(value)
+
+    def _start(self, kind: str, value: Any) -> None:
+        self.kind = kind
+        if kind == 'str':
+            self.modes = Counter()
+        elif kind == 'list':
+            self.items = []
+            self.seen = set()
+        elif kind == 'dict':
+            self.nested = RunningMetrics(self.list_limit)
+        elif kind == 'other':
+            self.first = value
+
+    def value(self) -> Any:
+        if self.kind is None:
+            return None
+        if self.kind == 'number':
+            return self.total / self.count
+        if self.kind == 'bool':
+            return self.total > self.count / 2
+        if self.kind == 'str':
+            return self.modes.most_common(1)[0][0]
+        if self.kind == 'list':
+            return list(self.items)
+        if self.kind == 'dict':
+            return self.nested.value()
+        return self.first
+
+
+def _kind_of(value: Any) -> str:
+    # bool first: bool is a subclass of int
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, (int, float)):
+        return 'number'
+    if isinstance(value, str):
+        return 'str'
+    if isinstance(value, list):
+        return 'list'
+    if isinstance(value, dict):
+        return 'dict'
+    return 'other'
+
+
+class StreamingAnalysis:
+    """
+    Running per-dimension state of one streamed document.
+
+    Usage:
+        >>> stream = StreamingAnalysis(dimensions, config)
+        >>> for chunk in iter_chunks(iter_file_text(path, size), size):
+        ...     stream.add_chunk(chunk, chunk.split('\\n'), kwargs, scheduler, deadline)
+        ...     stream.dimension_results()
+    """
+
+    def __init__(self, dimensions: Dict[str, Any], config: AnalysisConfig):
+        self.dimensions = dimensions
+        self.config = config
+        self.chunks = 0
+        self.chars = 0
+        self.word_count = 0
+        self._section_states: Dict[str, Any] = {}
+        self._running = {name: RunningMetrics() for name, dim in dimensions.items()
+                         if not dim.supports_sections}
+        self._analyzed_chars = {name: 0 for name in dimensions}
+        self._chunks_analyzed = {name: 0 for name in dimensions}
+        self._errors: Dict[str, Dict[str, Any]] = {}
+        self._stopped: Dict[str, Dict[str, Any]] = {}
+
+    def add_chunk(self, text: str, lines: List[str], dimension_kwargs: Dict[str, Dict[str, Any]],
+                  scheduler, deadline: Optional[Deadline] = None, word_count: int = 0) -> None:
+        """
+        Analyze one chunk and fold it into every dimension's running state.
+
+        Args:
+            text: Chunk text (HTML comments already stripped)
+            lines: text split into lines
+            dimension_kwargs: Per-dimension analyze() kwargs for this chunk
+            scheduler: DimensionScheduler running the non-section dimensions
+            deadline: Overall time budget of the stream
+            word_count: Prose words in the chunk
+        """
+        self.chunks += 1
+        self.chars += len(text)
+        self.word_count += word_count
+
+        sampled = {}
+        for name, dim in self.dimensions.items():
+            if name in self._stopped:
+                continue
+            if not dim.supports_sections:
+                sampled[name] = dim
+                continue
+            if deadline is not None and deadline.expired:
+                self._stopped[name] = _unfinished(deadline)
+                continue
+            try:
+                state = dim.analyze_section(text)
+                previous = self._section_states.get(name)
+                self._section_states[name] = dim.merge_section_states(
+                    [state] if previous is None else [previous, state]
+                )
+            except Exception as e:
+                self._stopped[name] = {'available': False, 'error': str(e)}
+                continue
+            self._record(name, text)
+
+        if not sampled:
+            return
+        results = scheduler.run(sampled, text, lines, self.config, dimension_kwargs, deadline)
+        for name, result in results.items():
+            if result.get('unfinished'):
+                self._stopped[name] = result
+            elif result.get('available') is False:
+                self._errors[name] = result  # e.g. a chunk too short for the dimension
+            else:
+                self._running[name].add({key: value for key, value in result.items()
+                                         if key not in _METADATA_FIELDS})
+                self._record(name, text)
+
+    def _record(self, name: str, text: str) -> None:
+        self._analyzed_chars[name] += len(text)
+        self._chunks_analyzed[name] += 1
+
+    @property
+    def unfinished(self) -> List[str]:
+        """Dimensions cut off by the deadline."""
+        return [name for name, result in self._stopped.items() if result.get('unfinished')]
+
+    def dimension_results(self) -> Dict[str, Dict[str, Any]]:
+        """Current metrics of every dimension, in the same form analyze() returns."""
+        results = {}
+        for name, dim in self.dimensions.items():
+            if name in self._stopped:
+                results[name] = dict(self._stopped[name])
+                continue
+            if not self._chunks_analyzed[name]:
+                results[name] = dict(self._errors.get(name, {'available': False,
+                                                             'error': 'no text analyzed'}))
+                continue
+            if dim.supports_sections:
+                metrics = dim.merge_sections([self._section_states[name]])
+            else:
+                metrics = self._running[name].value()
+            analyzed = self._analyzed_chars[name]
+            results[name] = {
+                **metrics,
+                'available': True,
+                'analysis_mode': self.config.mode.value,
+                'samples_analyzed': self._chunks_analyzed[name],
+                'total_text_length': self.chars,
+                'analyzed_text_length': analyzed,
+                'coverage_percentage': (analyzed / self.chars * 100.0) if self.chars > 0 else 0.0
+            }
+        return results
+
+
+def _unfinished(deadline: Deadline) -> Dict[str, Any]:
+    return {'available': False, 'unfinished': True, 'error': deadline.describe()}
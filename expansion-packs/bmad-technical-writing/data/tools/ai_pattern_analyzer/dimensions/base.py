@@ -13,6 +13,7 @@ import marko
 from marko import Markdown
 from marko.block import Quote, Heading, List as MarkoList, Paragraph, FencedCode
 from marko.inline import Link, CodeSpan
+from ai_pattern_analyzer.utils import markdown_service
 
 
 class DimensionAnalyzer(ABC):
@@ -20,9 +21,8 @@ class DimensionAnalyzer(ABC):
 
     def __init__(self):
         """Initialize the dimension analyzer with AST support."""
-        # AST parser and cache (marko)
+        # AST parser (marko); parsed ASTs are shared via utils/markdown_service.py
         self._markdown_parser = None
-        self._ast_cache = {}
 
     @abstractmethod
     def analyze(self, text: str, lines: List[str], **kwargs) -> Dict[str, Any]:
@@ -83,27 +83,17 @@ class DimensionAnalyzer(ABC):
         return self._markdown_parser
 
     def _parse_to_ast(self, text: str, cache_key: Optional[str] = None):
-        """Parse markdown to AST with caching.
+        """Parse markdown to AST via the shared, content-keyed AST cache.
 
         Args:
             text: Markdown text to parse
-            cache_key: Optional cache key for reusing parsed AST
+            cache_key: Ignored (ASTs are keyed by content); kept for compatibility
 
         Returns:
-            Parsed AST node or None if parsing fails
+            Parsed AST node (shared - do not modify) or None if parsing fails
         """
-        if cache_key and cache_key in self._ast_cache:
-            return self._ast_cache[cache_key]
-
-        parser = self._get_markdown_parser()
-        if parser is None:
-            return None
-
         try:
-            ast = parser.parse(text)
-            if cache_key:
-                self._ast_cache[cache_key] = ast
-            return ast
+            return markdown_service.parse(text)
         except Exception:
             return None
 
@@ -10,8 +10,12 @@ tiers, recommendations) so the algorithm can dynamically incorporate them withou
 core code modifications.
 """
 
+import hashlib
+import importlib.util
+import sys
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any, Optional, Union
 from collections import Counter
 
@@ -19,9 +23,56 @@ from collections import Counter
 from marko import Markdown
 from marko.block import Quote, Heading, List as MarkoList, Paragraph, FencedCode
 from marko.inline import Link, CodeSpan
+from ai_pattern_analyzer.utils import markdown_service
 
 # Configuration support
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.sampling import SampleDraw
+
+
+# Modules shared by the dimensions whose code shapes their results (lexicons,
+# tokenization, line mapping, spaCy parsing, scoring); their sources are part
+# of every dimension's default version
+SHARED_RESULT_MODULES = (
+    __name__,
+    'ai_pattern_analyzer.core.document_context',
+    'ai_pattern_analyzer.core.findings',
+    'ai_pattern_analyzer.core.sampling',
+    'ai_pattern_analyzer.scoring.dual_score',
+    'ai_pattern_analyzer.utils.line_index',
+    'ai_pattern_analyzer.utils.markdown_service',
+    'ai_pattern_analyzer.utils.pattern_matching',
+    'ai_pattern_analyzer.utils.spacy_service',
+    'ai_pattern_analyzer.utils.text_processing',
+)
+
+
+@lru_cache(maxsize=None)
+def _module_source_digest(module_name: str) -> str:
+    """Short SHA-256 of a module's source file ('unknown' if it has none)."""
+    module_file = getattr(sys.modules.get(module_name), '__file__', None)
+    if not module_file:
+        # Not imported yet: locate the source without importing it, so the
+        # digest does not depend on what the process happened to load
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            spec = None
+        module_file = spec.origin if spec is not None and spec.has_location else None
+    if not module_file:
+        return 'unknown'
+    try:
+        with open(module_file, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except OSError:
+        return 'unknown'
+
+
+@lru_cache(maxsize=None)
+def _dimension_version(module_name: str) -> str:
+    """Short SHA-256 over a dimension module's source and SHARED_RESULT_MODULES."""
+    digests = [_module_source_digest(name) for name in (module_name,) + SHARED_RESULT_MODULES]
+    return hashlib.sha256(' '.join(digests).encode()).hexdigest()[:16]
 
 
 class DimensionTier(str, Enum):
@@ -117,9 +168,8 @@ class DimensionStrategy(ABC):
 
     def __init__(self):
         """Initialize the dimension strategy with AST support."""
-        # AST parser and cache (marko) for markdown structure analysis
+        # AST parser (marko); parsed ASTs are shared via utils/markdown_service.py
         self._markdown_parser = None
-        self._ast_cache = {}
 
     # ========================================================================
     # ABSTRACT PROPERTIES - Must be implemented by all subclasses
@@ -176,6 +226,52 @@ class DimensionStrategy(ABC):
         """
         pass
 
+    @property
+    def version(self) -> str:
+        """
+        Implementation version, part of the on-disk result cache key.
+
+        Returns:
+            str: Default is a digest of the dimension's module source and of
+                 the shared helpers in SHARED_RESULT_MODULES, so a change to
+                 either invalidates cached results. Override with a fixed
+                 string to control invalidation manually.
+        """
+        return _dimension_version(type(self).__module__)
+
+    @property
+    def required_artifacts(self) -> Tuple[str, ...]:
+        """
+        Shared per-document artifacts this dimension consumes.
+
+        The DimensionScheduler builds each declared artifact once per document
+        (before any dimension that needs it runs) and passes the built values
+        in the `artifacts` keyword argument of analyze().
+
+        Returns:
+            Tuple[str, ...]: Names from core.scheduler.ARTIFACT_NAMES
+                             Examples: ("markdown_ast",), ("spacy_docs",)
+                             Default: () - only the DocumentContext is used
+        """
+        return ()
+
+    @property
+    def sampling_metric(self) -> Optional[Tuple[str, ...]]:
+        """
+        Key path of the metric whose convergence ends convergent sampling.
+
+        With sampling_strategy "convergent", sampled analysis draws samples
+        until this metric's confidence interval is narrow enough (see
+        core/sampling.py).
+
+        Returns:
+            Optional[Tuple[str, ...]]: Keys into one sample's result dict
+                                       Example: ('ai_vocabulary', 'per_1k')
+                                       Default: None - a fixed number of
+                                       samples (sampling_sections) is drawn
+        """
+        return None
+
     # ========================================================================
     # ABSTRACT METHODS - Must be implemented by all subclasses
     # ========================================================================
@@ -197,6 +293,12 @@ class DimensionStrategy(ABC):
             config (Optional[AnalysisConfig]): Analysis configuration (None = current behavior)
             **kwargs: Additional parameters including:
                 word_count (int): Pre-calculated word count for efficiency
+                context (DocumentContext): Shared per-document tokenization
+                    (words, sentences, paragraphs, prose text) built once by
+                    AIPatternAnalyzer; only valid for the full text, see
+                    document_context.context_for()
+                artifacts (Dict[str, Any]): Shared artifacts built by the
+                    DimensionScheduler for required_artifacts (full text only)
                 domain (DocumentDomain): Document type for threshold selection
                     Values: GENERAL, TECHNICAL, CREATIVE, ACADEMIC, BUSINESS
                 file_path (str, optional): File path for context/logging
@@ -359,6 +461,85 @@ class DimensionStrategy(ABC):
         """
         return []
 
+    def warm_up(self, config: Optional[AnalysisConfig] = None) -> None:
+        """
+        Optional hook to load heavy resources (models, pipelines) before analysis.
+
+        Default implementation does nothing. Dimensions backed by ML models
+        override it so long-lived processes (batch workers, the scheduler's
+        language_model artifact) pay the load cost once, up front.
+
+        Args:
+            config (Optional[AnalysisConfig]): Configuration selecting the
+                inference backend (None = DEFAULT_CONFIG)
+        """
+        return None
+
+    # ========================================================================
+    # SECTION-INCREMENTAL ANALYSIS - optional (see core/sections.py)
+    # ========================================================================
+
+    @property
+    def supports_sections(self) -> bool:
+        """
+        Whether this dimension's metrics can be merged from per-section states.
+
+        Dimensions returning True implement analyze_section() and
+        merge_sections() such that merging the states of split_sections(text)
+        gives exactly the metrics analyze() reports for text directly.
+
+        Returns:
+            bool: Default False - the dimension always analyzes whole documents
+        """
+        return False
+
+    def analyze_section(self, section_text: str) -> Any:
+        """
+        Compute the mergeable partial state of one document section.
+
+        The state must depend only on section_text and must not be mutated by
+        merge_sections(), because states are cached and reused across runs.
+
+        Args:
+            section_text: Text of one section from core.sections.split_sections()
+
+        Returns:
+            Any: JSON-serializable partial state of plain lists and dicts
+                 (counts, sums, pattern hits, ...)
+        """
+        raise NotImplementedError(f"{self.dimension_name} does not support section analysis")
+
+    def merge_sections(self, states: List[Any]) -> Dict[str, Any]:
+        """
+        Merge section states (in document order) into document-level metrics.
+
+        Args:
+            states: analyze_section() results for consecutive sections
+
+        Returns:
+            Dict[str, Any]: The metrics analyze() returns for the direct
+                            (non-sampled) path, without the metadata fields
+        """
+        raise NotImplementedError(f"{self.dimension_name} does not support section analysis")
+
+    def merge_section_states(self, states: List[Any]) -> Any:
+        """
+        Fold consecutive section states into one bounded state.
+
+        Streaming analysis (core/streaming.py) keeps a single running state
+        per dimension and folds each chunk's state into it, so the result must
+        be accepted by merge_section_states() and merge_sections() again and
+        must not grow with the length of the text.
+
+        Args:
+            states: analyze_section() or merge_section_states() results for
+                    consecutive text, in document order
+
+        Returns:
+            Any: Merged state of constant size
+        """
+        raise NotImplementedError(f"{self.dimension_name} does not support section analysis")
+
     # ========================================================================
     # BACKWARD COMPATIBILITY METHODS
     # ========================================================================
@@ -429,32 +610,26 @@ class DimensionStrategy(ABC):
 
     def _parse_to_ast(self, text: str, cache_key: Optional[str] = None) -> Any:
         """
-        Parse markdown to AST with caching.
+        Parse markdown to AST via the shared, content-keyed AST cache.
+
+        Every dimension asking for the same text gets the same AST, parsed once
+        (see utils/markdown_service.py). The AST is shared: read it, do not modify it.
 
         Args:
             text (str): Markdown text to parse
-            cache_key (Optional[str]): Optional cache key for reusing parsed AST
+            cache_key (Optional[str]): Ignored (ASTs are keyed by content);
+                kept for backward compatibility
 
         Returns:
             Any: Parsed AST node or None if parsing fails
 
         Usage:
             ```python
-            ast = self._parse_to_ast(text, cache_key='main')
+            ast = self._parse_to_ast(text)
             ```
         """
-        if cache_key and cache_key in self._ast_cache:
-            return self._ast_cache[cache_key]
-
-        parser = self._get_markdown_parser()
-        if parser is None:
-            return None
-
         try:
-            ast = parser.parse(text)
-            if cache_key:
-                self._ast_cache[cache_key] = ast
-            return ast
+            return markdown_service.parse(text)
         except Exception:
             return None
 
@@ -574,6 +749,24 @@ class DimensionStrategy(ABC):
         # No limit and no sampling - return full text
         return text
 
+    def _sample_draw(self, samples: List[Tuple[int, str]], config: Optional[AnalysisConfig] = None) -> SampleDraw:
+        """
+        Drawing of the samples returned by _prepare_text().
+
+        Iterate draw.draw(sample_results) (or draw.rounds() for batched
+        analysis) instead of the samples: with sampling_strategy "convergent"
+        drawing stops once self.sampling_metric converges. draw.drawn holds the
+        samples analyzed and draw.summary() the achieved confidence interval.
+
+        Example:
+            draw = self._sample_draw(samples, config)
+            sample_results = []
+            for position, sample_text in draw.draw(sample_results):
+                sample_results.append(self._analyze_sample(sample_text))
+            samples = draw.drawn
+        """
+        return SampleDraw(samples, config or DEFAULT_CONFIG, self.sampling_metric)
+
     def _aggregate_sampled_metrics(
         self,
         sample_metrics: List[Dict[str, Any]]
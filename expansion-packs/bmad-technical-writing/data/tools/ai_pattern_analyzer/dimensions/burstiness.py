@@ -12,9 +12,14 @@ import statistics
 from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.compact import IntSeries
+from ai_pattern_analyzer.core.deadline import check_deadline
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+from ai_pattern_analyzer.core.document_context import DocumentContext, context_for
+from ai_pattern_analyzer.core.sections import MomentStats, merge_moments
 from ai_pattern_analyzer.core.results import SentenceBurstinessIssue
 from ai_pattern_analyzer.utils.text_processing import safe_ratio
+from ai_pattern_analyzer.utils.line_index import LineIndex
 from ai_pattern_analyzer.scoring.dual_score import THRESHOLDS
 
 
@@ -60,6 +65,11 @@ class BurstinessDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes sentence and paragraph length variation (GPTZero burstiness metric)"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """Sentence length standard deviation decides when convergent sampling stops."""
+        return ('sentence_burstiness', 'stdev')
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -91,10 +101,11 @@ class BurstinessDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
                 sentence_burst = self._analyze_sentence_burstiness(sample_text)
                 paragraph_var = self._analyze_paragraph_variation(sample_text)
                 paragraph_cv = self._calculate_paragraph_cv(sample_text)
@@ -103,17 +114,21 @@ class BurstinessDimension(DimensionStrategy):
                     'paragraph_variation': paragraph_var,
                     'paragraph_cv': paragraph_cv,
                 })
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
             sentence_burst = self._analyze_sentence_burstiness(analyzed_text)
-            paragraph_var = self._analyze_paragraph_variation(analyzed_text)
+            paragraph_var = self._analyze_paragraph_variation(
+                analyzed_text, context=context_for(analyzed_text, kwargs.get('context'))
+            )
             paragraph_cv = self._calculate_paragraph_cv(analyzed_text)
             aggregated = {
                 'sentence_burstiness': sentence_burst,
@@ -122,6 +137,7 @@ class BurstinessDimension(DimensionStrategy):
             }
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -129,11 +145,66 @@ class BurstinessDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
         }
 
+    @property
+    def supports_sections(self) -> bool:
+        """Sentence and paragraph statistics merge from per-section moments."""
+        return True
+
+    def analyze_section(self, section_text: str) -> Dict[str, Any]:
+        """Sentence lengths, paragraph moments and paragraph CV moments of one section."""
+        sentences = self._sentence_length_state(section_text)
+        return {
+            'sentences': {
+                'lengths': sentences['lengths'],
+                'stats': sentences['stats'].as_list(),
+                'buckets': list(sentences['buckets']),
+            },
+            'paragraphs': self._paragraph_word_stats(section_text).as_list(),
+            'paragraph_cv': self._paragraph_cv_stats(section_text).as_list(),
+        }
+
+    def merge_sections(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge section states into the direct-path burstiness metrics."""
+        lengths = IntSeries()
+        for state in states:
+            lengths.extend(state['sentences']['lengths'])
+        sentences = {
+            'lengths': lengths,
+            'stats': merge_moments(state['sentences']['stats'] for state in states),
+            'buckets': tuple(
+                sum(state['sentences']['buckets'][i] for state in states) for i in range(3)
+            ),
+        }
+        return {
+            'sentence_burstiness': self._summarize_sentence_lengths(sentences),
+            'paragraph_variation': self._summarize_paragraph_variation(
+                merge_moments(state['paragraphs'] for state in states)
+            ),
+            'paragraph_cv': self._summarize_paragraph_cv(
+                merge_moments(state['paragraph_cv'] for state in states)
+            ),
+        }
+
+    def merge_section_states(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge section states into one; per-sentence lengths are dropped to keep it constant-size."""
+        return {
+            'sentences': {
+                'lengths': IntSeries(),
+                'stats': merge_moments(state['sentences']['stats'] for state in states).as_list(),
+                'buckets': [
+                    sum(state['sentences']['buckets'][i] for state in states) for i in range(3)
+                ],
+            },
+            'paragraphs': merge_moments(state['paragraphs'] for state in states).as_list(),
+            'paragraph_cv': merge_moments(state['paragraph_cv'] for state in states).as_list(),
+        }
+
     def analyze_detailed(self, lines: List[str], html_comment_checker=None) -> List[SentenceBurstinessIssue]:
         """
         Detailed analysis of burstiness issues with line numbers.
@@ -299,6 +370,10 @@ class BurstinessDimension(DimensionStrategy):
 
     def _analyze_sentence_burstiness(self, text: str) -> Dict:
         """Analyze sentence length variation."""
+        return self._summarize_sentence_lengths(self._sentence_length_state(text))
+
+    def _sentence_length_state(self, text: str) -> Dict[str, Any]:
+        """Sentence word counts of text, with their moments and length buckets."""
         # Remove headings and list markers for sentence analysis
         lines = []
         for line in text.splitlines():
@@ -327,7 +402,20 @@ class BurstinessDimension(DimensionStrategy):
                 if word_count > 0:  # Only count non-empty sentences
                     all_lengths.append(word_count)
 
-        if not all_lengths:
+        short = sum(1 for x in all_lengths if x <= 10)
+        medium = sum(1 for x in all_lengths if 11 <= x <= 25)
+        long = sum(1 for x in all_lengths if x >= 30)
+
+        return {
+            'lengths': IntSeries(all_lengths),
+            'stats': MomentStats.of(all_lengths),
+            'buckets': (short, medium, long),
+        }
+
+    def _summarize_sentence_lengths(self, state: Dict[str, Any]) -> Dict:
+        """Sentence burstiness metrics from a _sentence_length_state() (or merged states)."""
+        stats = state['stats']
+        if stats.count == 0:
             return {
                 'total_sentences': 0,
                 'mean': 0,
@@ -337,38 +425,45 @@ class BurstinessDimension(DimensionStrategy):
                 'short': 0,
                 'medium': 0,
                 'long': 0,
-                'lengths': []
+                'lengths': IntSeries()
             }
 
-        short = sum(1 for x in all_lengths if x <= 10)
-        medium = sum(1 for x in all_lengths if 11 <= x <= 25)
-        long = sum(1 for x in all_lengths if x >= 30)
-
+        short, medium, long = state['buckets']
         return {
-            'total_sentences': len(all_lengths),
-            'mean': round(statistics.mean(all_lengths), 1),
-            'stdev': round(statistics.stdev(all_lengths), 1) if len(all_lengths) > 1 else 0,
-            'min': min(all_lengths),
-            'max': max(all_lengths),
+            'total_sentences': stats.count,
+            'mean': round(stats.mean, 1),
+            'stdev': round(stats.stdev, 1) if stats.count > 1 else 0,
+            'min': stats.min,
+            'max': stats.max,
             'short': short,
             'medium': medium,
             'long': long,
-            'lengths': all_lengths
+            'lengths': state['lengths']
         }
 
-    def _analyze_paragraph_variation(self, text: str) -> Dict:
-        """Analyze paragraph length variation."""
-        paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()]
+    def _analyze_paragraph_variation(self, text: str, context: Optional[DocumentContext] = None) -> Dict:
+        """Analyze paragraph length variation (paragraph split from context if given)."""
+        return self._summarize_paragraph_variation(self._paragraph_word_stats(text, context))
+
+    def _paragraph_word_stats(self, text: str, context: Optional[DocumentContext] = None) -> MomentStats:
+        """Moments of paragraph word counts (headings and code blocks excluded)."""
+        if context is not None:
+            paragraphs = context.paragraphs()
+        else:
+            paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()]
         # Filter out headings and code blocks
-        para_words = []
+        stats = MomentStats()
         for para in paragraphs:
             if para.startswith('#') or '```' in para:
                 continue
             words = re.findall(r"\b[\w'-]+\b", para)
             if words:
-                para_words.append(len(words))
+                stats.add(len(words))
+        return stats
 
-        if not para_words:
+    def _summarize_paragraph_variation(self, stats: MomentStats) -> Dict:
+        """Paragraph variation metrics from paragraph word count moments."""
+        if stats.count == 0:
             return {
                 'total_paragraphs': 0,
                 'mean': 0,
@@ -378,11 +473,11 @@ class BurstinessDimension(DimensionStrategy):
             }
 
         return {
-            'total_paragraphs': len(para_words),
-            'mean': round(statistics.mean(para_words), 1),
-            'stdev': round(statistics.stdev(para_words), 1) if len(para_words) > 1 else 0,
-            'min': min(para_words),
-            'max': max(para_words)
+            'total_paragraphs': stats.count,
+            'mean': round(stats.mean, 1),
+            'stdev': round(stats.stdev, 1) if stats.count > 1 else 0,
+            'min': stats.min,
+            'max': stats.max
         }
 
     def _calculate_paragraph_cv(self, text: str) -> Dict[str, float]:
@@ -396,11 +491,15 @@ class BurstinessDimension(DimensionStrategy):
         Returns:
             Dict with mean_length, stddev, cv, score, assessment, paragraph_count
         """
+        return self._summarize_paragraph_cv(self._paragraph_cv_stats(text))
+
+    def _paragraph_cv_stats(self, text: str) -> MomentStats:
+        """Moments of paragraph lengths counted for the paragraph CV."""
         # Split by double newlines to get paragraphs
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
 
         # Filter out headings, code blocks, and very short lines
-        filtered_paragraphs = []
+        stats = MomentStats()
         for p in paragraphs:
             # Skip headings (start with #)
             if p.startswith('#'):
@@ -408,26 +507,28 @@ class BurstinessDimension(DimensionStrategy):
             # Skip code blocks
             if '```' in p:
                 continue
-            # Skip very short lines (likely not real paragraphs)
-            if len(p.split()) < 10:
+            # Count words per paragraph, skipping very short lines
+            # (likely not real paragraphs)
+            length = len(p.split())
+            if length < 10:
                 continue
-            filtered_paragraphs.append(p)
-
-        # Count words per paragraph
-        lengths = [len(p.split()) for p in filtered_paragraphs]
+            stats.add(length)
+        return stats
 
-        if len(lengths) < 3:
+    def _summarize_paragraph_cv(self, stats: MomentStats) -> Dict[str, float]:
+        """Paragraph CV metrics and score from paragraph length moments."""
+        if stats.count < 3:
             return {
                 'mean_length': 0.0,
                 'stddev': 0.0,
                 'cv': 0.0,
                 'score': 10.0,  # Benefit of doubt for insufficient data
                 'assessment': 'INSUFFICIENT_DATA',
-                'paragraph_count': len(lengths)
+                'paragraph_count': stats.count
             }
 
-        mean_length = statistics.mean(lengths)
-        stddev = statistics.stdev(lengths)
+        mean_length = stats.mean
+        stddev = stats.stdev
         cv = stddev / mean_length if mean_length > 0 else 0.0
 
         # Scoring based on research thresholds
@@ -446,7 +547,7 @@ class BurstinessDimension(DimensionStrategy):
             'cv': round(cv, 2),
             'score': score,
             'assessment': assessment,
-            'paragraph_count': len(lengths)
+            'paragraph_count': stats.count
         }
 
     def _analyze_burstiness_issues_detailed(self, lines: List[str], html_comment_checker=None) -> List[SentenceBurstinessIssue]:
@@ -457,14 +558,12 @@ class BurstinessDimension(DimensionStrategy):
         current_para = []
         para_start_line = 1
 
+        index = LineIndex.of(lines, html_comment_checker)
         for line_num, line in enumerate(lines, start=1):
-            stripped = line.strip()
-
             # Skip HTML comments, headings, and code blocks
-            if html_comment_checker and html_comment_checker(line):
-                continue
-            if stripped.startswith('#') or stripped.startswith('```'):
+            if index.skipped(line_num - 1, headings=True, fences=True):
                 continue
+            stripped = line.strip()
 
             if stripped:
                 current_para.append((line_num, line))
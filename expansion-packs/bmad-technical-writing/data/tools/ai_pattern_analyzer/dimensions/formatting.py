@@ -18,10 +18,18 @@ import statistics
 from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import check_deadline
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+from ai_pattern_analyzer.core.findings import Findings
 from ai_pattern_analyzer.core.results import EmDashInstance, FormattingIssue
 from ai_pattern_analyzer.scoring.dual_score import THRESHOLDS
 from ai_pattern_analyzer.utils.text_processing import count_words
+from ai_pattern_analyzer.utils.line_index import LineIndex
+
+# Italic span on one line between single markers (not inside **bold** or __bold__)
+_DETAILED_ITALIC_PATTERN = re.compile(
+    r'(?<!\*)\*(?!\*)[^*\n]+(?<!\*)\*(?!\*)|(?<!_)_(?!_)[^_\n]+(?<!_)_(?!_)'
+)
 
 
 class FormattingDimension(DimensionStrategy):
@@ -67,6 +75,11 @@ class FormattingDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes em-dash overuse, bold/italic patterns, and formatting consistency"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """Em-dashes per sample decide when convergent sampling stops."""
+        return ('formatting', 'em_dashes')
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -98,10 +111,11 @@ class FormattingDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
                 formatting = self._analyze_formatting(sample_text)
                 bold_italic = self._analyze_bold_italic_patterns(sample_text)
                 list_usage = self._analyze_list_usage(sample_text)
@@ -116,16 +130,21 @@ class FormattingDimension(DimensionStrategy):
                     'whitespace_patterns': whitespace,
                     'punctuation_spacing_cv': punctuation_spacing_cv,
                 })
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            formatting = self._analyze_formatting(analyzed_text)
+            findings = kwargs.get('findings')
+            if findings is not None and not findings.records(analyzed_text):
+                findings = None
+            formatting = self._analyze_formatting(analyzed_text, findings=findings)
             bold_italic = self._analyze_bold_italic_patterns(analyzed_text)
             list_usage = self._analyze_list_usage(analyzed_text)
             punctuation = self._analyze_punctuation_clustering(analyzed_text)
@@ -141,6 +160,7 @@ class FormattingDimension(DimensionStrategy):
             }
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -148,23 +168,27 @@ class FormattingDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
         }
 
-    def analyze_detailed(self, lines: List[str], html_comment_checker=None) -> Dict[str, Any]:
+    def analyze_detailed(self, lines: List[str], html_comment_checker=None,
+                         findings: Optional[Findings] = None) -> Dict[str, Any]:
         """
         Detailed analysis with line numbers and suggestions.
 
         Args:
             lines: Text split into lines
             html_comment_checker: Function to check if line is in HTML comment
+            findings: Recorder of the standard pass over the same text (em-dash
+                offsets it recorded are used instead of scanning the lines)
 
         Returns:
             Dict with detailed analysis including instances
         """
-        em_dash_instances = self._analyze_em_dashes_detailed(lines, html_comment_checker)
+        em_dash_instances = self._analyze_em_dashes_detailed(lines, html_comment_checker, findings=findings)
         formatting_issues = self._analyze_formatting_issues_detailed(lines, html_comment_checker)
 
         return {
@@ -372,10 +396,15 @@ class FormattingDimension(DimensionStrategy):
         words = re.findall(r"\b[\w'-]+\b", text)
         return len(words)
 
-    def _analyze_formatting(self, text: str) -> Dict:
-        """Analyze formatting patterns."""
+    def _analyze_formatting(self, text: str, findings=None) -> Dict:
+        """Analyze formatting patterns (recording em-dash offsets in findings, if given)."""
         # Em-dashes (— or --)
-        em_dashes = len(re.findall(r'—|--', text))
+        if findings is not None:
+            dashes = [(m.start(), m.end()) for m in re.finditer(r'—|--', text)]
+            findings.record('em_dashes', dashes)
+            em_dashes = len(dashes)
+        else:
+            em_dashes = len(re.findall(r'—|--', text))
 
         # Bold (markdown **text** or __text__)
         bold = len(re.findall(r'\*\*[^*]+\*\*|__[^_]+__', text))
@@ -431,21 +460,37 @@ class FormattingDimension(DimensionStrategy):
             'formatting_consistency': round(consistency, 3)
         }
 
-    def _analyze_em_dashes_detailed(self, lines: List[str], html_comment_checker=None) -> List[EmDashInstance]:
+    def _analyze_em_dashes_detailed(self, lines: List[str], html_comment_checker=None,
+                                    findings: Optional[Findings] = None) -> List[EmDashInstance]:
         """Track em-dashes with line numbers and context."""
         instances = []
 
-        for line_num, line in enumerate(lines, start=1):
+        recorded = findings.get('em_dashes') if findings is not None else None
+        if recorded is not None:
+            # Dashes recorded by the standard pass, grouped by line
+            by_line = [[] for _ in lines]
+            for start, end in recorded:
+                line_index = findings.line_index(start)
+                if line_index < len(lines):
+                    column = findings.column(start)
+                    by_line[line_index].append((column, column + end - start))
+        else:
+            # One scan of all lines
+            by_line = [[] for _ in lines]
+            for line_idx, column, match in LineIndex.of(lines, html_comment_checker).finditer(r'—|--', comments=False):
+                by_line[line_idx].append((column, column + len(match.group())))
+
+        for line_num, (line, dashes) in enumerate(zip(lines, by_line), start=1):
             # Skip HTML comments (metadata) and code blocks
             if html_comment_checker and html_comment_checker(line):
                 continue
             if line.strip().startswith('```'):
                 continue
 
-            for match in re.finditer(r'—|--', line):
+            for match_start, match_end in dashes:
                 # Get context around em-dash
-                start = max(0, match.start() - 30)
-                end = min(len(line), match.end() + 30)
+                start = max(0, match_start - 30)
+                end = min(len(line), match_end + 30)
                 context = f"...{line[start:end]}..."
 
                 instances.append(EmDashInstance(
@@ -460,32 +505,27 @@ class FormattingDimension(DimensionStrategy):
         """Detect excessive bold/italic usage and mechanical formatting patterns."""
         issues = []
 
-        bold_pattern = re.compile(r'\*\*[^*]+\*\*|__[^_]+__')
-        italic_pattern = re.compile(r'\*[^*]+\*|_[^_]+_')
-
-        for line_num, line in enumerate(lines, start=1):
-            stripped = line.strip()
-
+        # Words inside bold/italic spans per line, from one scan of all lines;
+        # lines without formatting cannot be flagged. [^*\n] keeps spans
+        # within a line, as scanning each line separately did; italic markers
+        # must be single, so a bold span does not count as italic too.
+        index = LineIndex.of(lines, html_comment_checker)
+        formatted_words = {}
+        for kind, pattern in ((0, r'\*\*[^*\n]+\*\*|__[^_\n]+__'), (1, _DETAILED_ITALIC_PATTERN)):
             # Skip HTML comments (metadata), headings, and code blocks
-            if html_comment_checker and html_comment_checker(line):
-                continue
-            if stripped.startswith('#') or stripped.startswith('```'):
-                continue
+            for line_idx, _, match in index.finditer(pattern, headings=True, fences=True):
+                counts = formatted_words.setdefault(line_idx, [0, 0])
+                counts[kind] += len(re.findall(r'\b\w+\b', match.group()))
 
-            if not stripped:
-                continue
+        for line_idx in sorted(formatted_words):
+            line_num, line = line_idx + 1, lines[line_idx]
+            bold_words, italic_words = formatted_words[line_idx]
 
             # Count formatting on this line
             word_count = len(re.findall(r'\b\w+\b', line))
             if word_count == 0:
                 continue
 
-            bold_matches = list(bold_pattern.finditer(line))
-            italic_matches = list(italic_pattern.finditer(line))
-
-            bold_words = sum(len(re.findall(r'\b\w+\b', match.group())) for match in bold_matches)
-            italic_words = sum(len(re.findall(r'\b\w+\b', match.group())) for match in italic_matches)
-
             bold_density = (bold_words / word_count) * 100 if word_count > 0 else 0
             italic_density = (italic_words / word_count) * 100 if word_count > 0 else 0
 
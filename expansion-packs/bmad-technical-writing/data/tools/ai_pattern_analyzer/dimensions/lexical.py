@@ -19,6 +19,7 @@ import sys
 from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import check_deadline
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
 from ai_pattern_analyzer.scoring.dual_score import THRESHOLDS
 
@@ -69,6 +70,11 @@ class LexicalDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes vocabulary diversity using TTR, MTLD, and stemmed diversity"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """Type-token diversity decides when convergent sampling stops."""
+        return ('lexical_diversity', 'diversity')
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -100,19 +106,22 @@ class LexicalDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
                 lexical = self._analyze_lexical_diversity(sample_text)
                 nltk_metrics = self._analyze_nltk_lexical(sample_text)
                 lexical.update(nltk_metrics)
                 sample_results.append({'lexical_diversity': lexical})
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
@@ -123,6 +132,7 @@ class LexicalDimension(DimensionStrategy):
             aggregated = {'lexical_diversity': lexical}
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -130,6 +140,7 @@ class LexicalDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
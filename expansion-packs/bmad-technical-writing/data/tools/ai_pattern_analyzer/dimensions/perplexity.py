@@ -11,12 +11,18 @@ import re
 from typing import Dict, List, Any, Tuple, Optional
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import check_deadline
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
 from ai_pattern_analyzer.core.results import VocabInstance, TransitionInstance
-from ai_pattern_analyzer.utils.pattern_matching import AI_VOCABULARY, FORMULAIC_TRANSITIONS
+from ai_pattern_analyzer.utils.pattern_matching import AI_VOCABULARY, FORMULAIC_TRANSITIONS, lexicon_matcher
 from ai_pattern_analyzer.utils.text_processing import count_words
+from ai_pattern_analyzer.utils.line_index import LineIndex
 from ai_pattern_analyzer.scoring.dual_score import THRESHOLDS
 
+# Hits listed in the ai_vocabulary 'words' and formulaic_transitions 'transitions' results
+_VOCABULARY_LISTED = 20
+_TRANSITIONS_LISTED = 15
+
 
 # Replacement suggestions for AI vocabulary
 AI_VOCAB_REPLACEMENTS = {
@@ -115,6 +121,11 @@ class PerplexityDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes vocabulary predictability and AI-typical word patterns"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """AI vocabulary per 1k words decides when convergent sampling stops."""
+        return ('ai_vocabulary', 'per_1k')
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -146,33 +157,51 @@ class PerplexityDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
-                ai_vocab = self._analyze_ai_vocabulary(sample_text)
-                formulaic = self._analyze_formulaic_transitions(sample_text)
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
+                vocabulary, transitions = _lexicon_matches(sample_text)
+                ai_vocab = self._summarize_ai_vocabulary(_hits_of(vocabulary), count_words(sample_text))
+                formulaic = self._summarize_formulaic_transitions(_hits_of(transitions))
                 sample_results.append({
                     'ai_vocabulary': ai_vocab,
                     'formulaic_transitions': formulaic
                 })
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            ai_vocab = self._analyze_ai_vocabulary(analyzed_text)
-            formulaic = self._analyze_formulaic_transitions(analyzed_text)
+            vocabulary, transitions = _lexicon_matches(analyzed_text)
+            findings = kwargs.get('findings')
+            if findings is not None and findings.records(analyzed_text):
+                # Record match locations for detailed analysis. The detailed report lists
+                # AI_VOCAB_REPLACEMENTS matches (they carry the suggestions), as its line scan does
+                findings.record('ai_vocab_replacements', sorted(
+                    (start, end, word, pattern_idx)
+                    for pattern_idx, matches in enumerate(
+                        lexicon_matcher(ai_vocab_replacements=tuple(AI_VOCAB_REPLACEMENTS))
+                        .scan(analyzed_text)['ai_vocab_replacements'])
+                    for start, end, word in matches
+                ))
+                findings.record('formulaic_transitions', sorted(m for matches in transitions for m in matches))
+            ai_vocab = self._summarize_ai_vocabulary(_hits_of(vocabulary), count_words(analyzed_text))
+            formulaic = self._summarize_formulaic_transitions(_hits_of(transitions))
             aggregated = {
                 'ai_vocabulary': ai_vocab,
                 'formulaic_transitions': formulaic,
             }
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -180,11 +209,52 @@ class PerplexityDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
         }
 
+    @property
+    def supports_sections(self) -> bool:
+        """Pattern hits and word counts add up across sections."""
+        return True
+
+    def analyze_section(self, section_text: str) -> Dict[str, Any]:
+        """Per-pattern vocabulary and transition hits, and the word count, of one section."""
+        vocabulary, transitions = _lexicon_matches(section_text)
+        return {
+            'vocabulary': _hits_of(vocabulary),
+            'transitions': _hits_of(transitions),
+            'word_count': count_words(section_text),
+        }
+
+    def merge_sections(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge section states into the direct-path perplexity metrics."""
+        return {
+            'ai_vocabulary': self._summarize_ai_vocabulary(
+                _merge_pattern_hits(state['vocabulary'] for state in states),
+                sum(state['word_count'] for state in states),
+                count=sum(_hit_count(state, 'vocabulary') for state in states)
+            ),
+            'formulaic_transitions': self._summarize_formulaic_transitions(
+                _merge_pattern_hits(state['transitions'] for state in states),
+                count=sum(_hit_count(state, 'transitions') for state in states)
+            ),
+        }
+
+    def merge_section_states(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge section states, keeping only the hits the summaries list plus hit counts."""
+        return {
+            'vocabulary': [hits[:_VOCABULARY_LISTED]
+                           for hits in _merge_pattern_hits(state['vocabulary'] for state in states)],
+            'vocabulary_count': sum(_hit_count(state, 'vocabulary') for state in states),
+            'transitions': [hits[:_TRANSITIONS_LISTED]
+                            for hits in _merge_pattern_hits(state['transitions'] for state in states)],
+            'transitions_count': sum(_hit_count(state, 'transitions') for state in states),
+            'word_count': sum(state['word_count'] for state in states),
+        }
+
     def analyze_detailed(self, lines: List[str], html_comment_checker=None) -> Dict[str, Any]:
         """
         Detailed analysis with line numbers and suggestions.
@@ -331,100 +401,132 @@ class PerplexityDimension(DimensionStrategy):
 
     def _analyze_ai_vocabulary(self, text: str) -> Dict:
         """Detect AI-characteristic vocabulary."""
-        words_found = []
-        for pattern in AI_VOCABULARY:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            words_found.extend([m.group() for m in matches])
+        return self._summarize_ai_vocabulary(_hits_of(_lexicon_matches(text)[0]), count_words(text))
 
-        word_count = count_words(text)
-        per_1k = (len(words_found) / word_count * 1000) if word_count > 0 else 0
+    def _summarize_ai_vocabulary(self, hits: List[List[str]], word_count: int,
+                                 count: Optional[int] = None) -> Dict:
+        """AI vocabulary metrics from per-pattern hits and the text's word count.
+
+        count overrides the number of hits when hits were truncated (streamed states).
+        """
+        words_found = [word for pattern_hits in hits for word in pattern_hits]
+        count = len(words_found) if count is None else count
+        per_1k = (count / word_count * 1000) if word_count > 0 else 0
 
         return {
-            'count': len(words_found),
+            'count': count,
             'per_1k': round(per_1k, 2),
-            'words': words_found[:20]  # Limit to first 20 for readability
+            'words': words_found[:_VOCABULARY_LISTED]  # Limit to first 20 for readability
         }
 
     def _analyze_formulaic_transitions(self, text: str) -> Dict:
         """Detect formulaic transitions."""
-        transitions_found = []
-        for pattern in FORMULAIC_TRANSITIONS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            transitions_found.extend([m.group() for m in matches])
+        return self._summarize_formulaic_transitions(_hits_of(_lexicon_matches(text)[1]))
+
+    def _summarize_formulaic_transitions(self, hits: List[List[str]], count: Optional[int] = None) -> Dict:
+        """Formulaic transition metrics from per-pattern hits (count as in _summarize_ai_vocabulary)."""
+        transitions_found = [transition for pattern_hits in hits for transition in pattern_hits]
 
         return {
-            'count': len(transitions_found),
-            'transitions': transitions_found[:15]
+            'count': len(transitions_found) if count is None else count,
+            'transitions': transitions_found[:_TRANSITIONS_LISTED]
         }
 
     def _analyze_ai_vocabulary_detailed(self, lines: List[str], html_comment_checker=None) -> List[VocabInstance]:
         """Detect AI vocabulary with line numbers and context."""
         instances = []
-
-        for line_num, line in enumerate(lines, start=1):
-            # Skip HTML comments, headings, and code blocks
-            if html_comment_checker and html_comment_checker(line):
-                continue
-            if line.strip().startswith('#') or line.strip().startswith('```'):
-                continue
-
-            for pattern, suggestions in AI_VOCAB_REPLACEMENTS.items():
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    word = match.group()
-                    # Extract context (20 chars each side)
-                    start = max(0, match.start() - 20)
-                    end = min(len(line), match.end() + 20)
-                    context = f"...{line[start:end]}..."
-
-                    instances.append(VocabInstance(
-                        line_number=line_num,
-                        word=word,
-                        context=context,
-                        full_line=line.strip(),
-                        suggestions=suggestions[:5]  # Top 5 suggestions
-                    ))
+        suggestions_of = list(AI_VOCAB_REPLACEMENTS.values())
+        matcher = lexicon_matcher(ai_vocab_replacements=tuple(AI_VOCAB_REPLACEMENTS))
+
+        # One scan of all lines; skip HTML comments, headings, and code blocks
+        index = LineIndex.of(lines, html_comment_checker)
+        for line_idx, pattern_idx, column, word in index.scan(matcher, 'ai_vocab_replacements',
+                                                              headings=True, fences=True):
+            line = lines[line_idx]
+            # Extract context (20 chars each side)
+            start = max(0, column - 20)
+            end = min(len(line), column + len(word) + 20)
+            context = f"...{line[start:end]}..."
+
+            instances.append(VocabInstance(
+                line_number=line_idx + 1,
+                word=word,
+                context=context,
+                full_line=line.strip(),
+                suggestions=suggestions_of[pattern_idx][:5]  # Top 5 suggestions
+            ))
 
         return instances
 
     def _analyze_transitions_detailed(self, lines: List[str], html_comment_checker=None) -> List[TransitionInstance]:
         """Detect formulaic transitions with context."""
         instances = []
-
-        for line_num, line in enumerate(lines, start=1):
-            # Skip HTML comments and headings
-            if html_comment_checker and html_comment_checker(line):
-                continue
-            if line.strip().startswith('#'):
-                continue
-
-            for pattern in FORMULAIC_TRANSITIONS:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    transition = match.group()
-                    # Get full sentence context
-                    context = line.strip()
-
-                    # Get suggestions from mapping (case-insensitive lookup)
-                    suggestions = None
-                    for key, values in TRANSITION_REPLACEMENTS.items():
-                        if transition.lower() == key.lower():
-                            suggestions = values
-                            break
-
-                    if suggestions is None:
-                        suggestions = ['Remove transition entirely', 'Use natural flow']
-
-                    instances.append(TransitionInstance(
-                        line_number=line_num,
-                        transition=transition,
-                        context=context,
-                        suggestions=suggestions[:5]
-                    ))
+        matcher = lexicon_matcher(formulaic_transitions=tuple(FORMULAIC_TRANSITIONS))
+
+        # One scan of all lines; skip HTML comments and headings
+        index = LineIndex.of(lines, html_comment_checker)
+        for line_idx, _, _, transition in index.scan(matcher, 'formulaic_transitions', headings=True):
+            # Get full sentence context
+            context = lines[line_idx].strip()
+
+            # Get suggestions from mapping (case-insensitive lookup)
+            suggestions = None
+            for key, values in TRANSITION_REPLACEMENTS.items():
+                if transition.lower() == key.lower():
+                    suggestions = values
+                    break
+
+            if suggestions is None:
+                suggestions = ['Remove transition entirely', 'Use natural flow']
+
+            instances.append(TransitionInstance(
+                line_number=line_idx + 1,
+                transition=transition,
+                context=context,
+                suggestions=suggestions[:5]
+            ))
 
         return instances
 
 
+def _lexicon_matches(text: str) -> Tuple[List[List[Tuple[int, int, str]]], List[List[Tuple[int, int, str]]]]:
+    """
+    (start, end, matched string) of each AI vocabulary and formulaic transition
+    pattern's matches in text, in pattern order - both lexicons in one scan.
+    """
+    matches = lexicon_matcher(
+        ai_vocabulary=tuple(AI_VOCABULARY),
+        formulaic_transitions=tuple(FORMULAIC_TRANSITIONS)
+    ).scan(text)
+    return matches['ai_vocabulary'], matches['formulaic_transitions']
+
+
+def _hits_of(matches: List[List[Tuple[int, int, str]]]) -> List[List[str]]:
+    """Matched strings of each pattern (one list per pattern) of _lexicon_matches() output."""
+    return [[match for _, _, match in pattern_matches] for pattern_matches in matches]
+
+
+def _hit_count(state: Dict[str, Any], key: str) -> int:
+    """Number of hits in a section state (merged states carry the count of truncated hits)."""
+    count = state.get(f'{key}_count')
+    return sum(len(hits) for hits in state[key]) if count is None else count
+
+
+def _merge_pattern_hits(section_hits) -> List[List[str]]:
+    """Concatenate per-pattern hits of consecutive sections, keeping pattern order."""
+    merged = None
+    for hits in section_hits:
+        if merged is None:
+            merged = [list(pattern_hits) for pattern_hits in hits]
+        else:
+            for pattern_hits, more in zip(merged, hits):
+                pattern_hits.extend(more)
+    return merged or []
+
+
 # Backward compatibility alias
 PerplexityAnalyzer = PerplexityDimension
 
 # Module-level singleton - triggers self-registration on module import
 _instance = PerplexityDimension()
+
@@ -12,10 +12,19 @@ Weight: 20.0% (highest single dimension - reflects GLTR's proven accuracy)
 Tier: ADVANCED
 
 Performance (Story 1.4.14):
-- 120-second timeout prevents hanging on large documents
+- 120-second timeout prevents hanging on large documents; timed-out or
+  deadline-cancelled ranking stops at the next model batch
 - Model caching: 80-95% faster on repeated analyses
 - Thread-safe model loading for concurrent analysis
 - First analysis: 2-10s, subsequent: ~0.1-0.5s
+- Single-pass ranking: one causal forward pass per context window ranks
+  every token at once (linear cost, no per-sample token cap)
+- Detailed mode: one document-wide rank array mapped to lines via tokenizer
+  offsets; segment ratios come from prefix sums (no per-segment model calls)
+- CPU backends: AnalysisConfig.inference_backend selects fp32 eager, int8
+  dynamic quantization or ONNX Runtime (see utils.inference_backend)
+- Batched sampling: SAMPLING/ADAPTIVE samples are padded into attention-masked
+  batches (sized by gltr_batch_token_budget) instead of one call per sample
 
 Requires dependencies: transformers, torch
 
@@ -27,12 +36,20 @@ import re
 import sys
 import statistics
 import threading
+from bisect import bisect_left, bisect_right
 from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
 from ai_pattern_analyzer.core.results import HighPredictabilitySegment
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import Deadline, DeadlineExceeded, check_deadline, deadline_scope
+from ai_pattern_analyzer.core.findings import Findings, strip_matches
+from ai_pattern_analyzer.core.profiler import model_load
 from ai_pattern_analyzer.utils.text_processing import safe_ratio
+from ai_pattern_analyzer.utils.inference_backend import (
+    DEFAULT_BACKEND, OnnxCausalLM, onnx_model_path, quantize_dynamic_int8,
+    rank_drift, validate_backend
+)
 
 # Required imports
 import torch
@@ -41,11 +58,27 @@ from transformers.utils import logging as transformers_logging
 transformers_logging.set_verbosity_error()
 
 
-# Global model instances (lazy loading with thread-safety)
-_perplexity_model = None
-_perplexity_tokenizer = None
+# Global model instances (lazy loading with thread-safety): one (model, tokenizer)
+# pair per (backend, onnx_model_dir), so overlapping analyses with different
+# backends each score with their own model
+_perplexity_models: Dict[Tuple[str, Optional[str]], Tuple[Any, Any]] = {}
 _model_lock = threading.Lock()  # Thread-safe model loading
 
+# Fallback context length when the model config does not declare one
+DEFAULT_CONTEXT_SIZE = 1024
+
+# Default tokens of left context re-encoded when a new GLTR window starts
+DEFAULT_CONTEXT_OVERLAP = 256
+
+# Default padded tokens per batched forward call (rows × longest row)
+DEFAULT_BATCH_TOKEN_BUDGET = 4096
+
+# Positions ranked per vectorized comparison (bounds the [chunk × vocab] bool matrix)
+RANK_CHUNK_SIZE = 256
+
+# Fenced code blocks, removed before ranking
+_CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]*?```')
+
 
 class PredictabilityDimension(DimensionStrategy):
     """
@@ -99,6 +132,16 @@ class PredictabilityDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes GLTR token predictability patterns (95% accuracy in AI detection)"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """GLTR top-10 token percentage decides when convergent sampling stops."""
+        return ('gltr_top10_percentage',)
+
+    @property
+    def required_artifacts(self) -> Tuple[str, ...]:
+        """GLTR language model, loaded before analysis starts."""
+        return ('language_model',)
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -116,8 +159,9 @@ class PredictabilityDimension(DimensionStrategy):
         Modes:
         - FAST: Analyze first 2000 chars (current behavior)
         - ADAPTIVE: Sample based on document length
-        - SAMPLING: User-configured sampling
-        - FULL: Analyze entire document (slow)
+        - SAMPLING: User-configured sampling (samples scored in padded batches)
+        - FULL: Analyze entire document; texts beyond the model context are
+          ranked with a sliding KV-cache window (every token gets a rank)
 
         Args:
             text: Full text content
@@ -142,33 +186,68 @@ class PredictabilityDimension(DimensionStrategy):
         """
         config = config or DEFAULT_CONFIG
         total_text_length = len(text)
+        # Passed down to _load_model(); the dimension instance is shared between analyses
+        backend = dict(backend=config.inference_backend, onnx_model_dir=config.onnx_model_dir)
 
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
         prepared = self._prepare_text(text, config, self.dimension_name)
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
-                gltr_metrics = self._calculate_gltr_metrics_with_timeout(sample_text, timeout=120)
-                sample_results.append(gltr_metrics)
+            # Score each round of samples in padded batches (one forward call per batch)
+            for batch in draw.rounds(sample_results):
+                sample_results.extend(self._calculate_gltr_metrics_batch_with_timeout(
+                    [sample_text for _, sample_text in batch],
+                    timeout=120 * len(batch),
+                    deadline=kwargs.get('deadline'),
+                    token_budget=config.gltr_batch_token_budget,
+                    context_overlap=config.gltr_context_overlap,
+                    **backend
+                ) or [])
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_gltr_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            gltr_metrics = self._calculate_gltr_metrics_with_timeout(analyzed_text, timeout=120)
-            aggregated = gltr_metrics
+            findings = kwargs.get('findings')
+            gltr_metrics = self._calculate_gltr_metrics_with_timeout(
+                analyzed_text,
+                timeout=120,
+                deadline=kwargs.get('deadline'),
+                context_overlap=config.gltr_context_overlap,
+                findings=findings if findings is not None and findings.records(analyzed_text) else None,
+                **backend
+            )
+            aggregated = gltr_metrics or {}
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
+        metadata = {
+            'analysis_mode': config.mode.value,
+            'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
+            'total_text_length': total_text_length,
+            'analyzed_text_length': analyzed_length,
+            'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
+        }
+        if not aggregated:
+            # Timed out, model failed, or too little text: nothing to score (or cache)
+            return {
+                'available': False,
+                'error': 'GLTR produced no token ranks (text too short, timed out, or model unavailable)',
+                **metadata
+            }
         return {
             'gltr_top10_percentage': aggregated.get('gltr_top10_percentage', 0.55),
             'gltr_top100_percentage': aggregated.get('gltr_top100_percentage', 0.85),
@@ -177,14 +256,12 @@ class PredictabilityDimension(DimensionStrategy):
             'gltr_rank_variance': aggregated.get('gltr_rank_variance', 100.0),
             'gltr_likelihood': aggregated.get('gltr_likelihood', 0.5),
             'available': True,
-            'analysis_mode': config.mode.value,
-            'samples_analyzed': samples_analyzed,
-            'total_text_length': total_text_length,
-            'analyzed_text_length': analyzed_length,
-            'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
+            **metadata
         }
 
-    def analyze_detailed(self, lines: List[str], html_comment_checker=None) -> List[HighPredictabilitySegment]:
+    def analyze_detailed(self, lines: List[str], html_comment_checker=None,
+                         findings: Optional[Findings] = None,
+                         config: Optional[AnalysisConfig] = None) -> List[HighPredictabilitySegment]:
         """
         Detailed analysis with line numbers and suggestions.
         Identifies high-predictability text segments.
@@ -192,11 +269,19 @@ class PredictabilityDimension(DimensionStrategy):
         Args:
             lines: Text split into lines
             html_comment_checker: Function to check if line is in HTML comment
+            findings: Recorder of the standard pass over the same text (token
+                ranks it recorded are reused instead of running the model again)
+            config: Analysis configuration selecting the inference backend
+                (None = DEFAULT_CONFIG)
 
         Returns:
             List of HighPredictabilitySegment objects
         """
-        return self._analyze_high_predictability_segments_detailed(lines, html_comment_checker)
+        config = config or DEFAULT_CONFIG
+        return self._analyze_high_predictability_segments_detailed(
+            lines, html_comment_checker, findings=findings,
+            backend=config.inference_backend, onnx_model_dir=config.onnx_model_dir
+        )
 
     # ========================================================================
     # SCORING METHODS - DimensionStrategy Contract
@@ -307,7 +392,9 @@ class PredictabilityDimension(DimensionStrategy):
     def _calculate_gltr_metrics_with_timeout(
         self,
         text: str,
-        timeout: int = 120
+        timeout: int = 120,
+        deadline: Optional[Deadline] = None,
+        **kwargs
     ) -> Optional[Dict[str, Any]]:
         """
         Calculate GLTR metrics with timeout protection (Story 1.4.14).
@@ -319,30 +406,82 @@ class PredictabilityDimension(DimensionStrategy):
         Args:
             text: Text to analyze (pre-truncated/sampled by caller)
             timeout: Timeout in seconds (default 120)
+            deadline: Analysis deadline; the timeout never outlasts it
+            **kwargs: Forwarded to _calculate_gltr_metrics (e.g. context_overlap)
 
         Returns:
             Dict with GLTR metrics, or None if timeout/error
 
+        Raises:
+            DeadlineExceeded: If the analysis deadline passed first
+
         Thread-safety:
-            Uses daemon thread for timeout enforcement.
-            Thread properly cleaned up after timeout or completion.
+            Uses daemon thread for timeout enforcement. On timeout the
+            thread is cancelled and stops at its next model batch.
+        """
+        return self._run_with_timeout(self._calculate_gltr_metrics, timeout, text, deadline=deadline, **kwargs)
+
+    def _calculate_gltr_metrics_batch_with_timeout(
+        self,
+        texts: List[str],
+        timeout: int = 120,
+        deadline: Optional[Deadline] = None,
+        **kwargs
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Calculate GLTR metrics for several samples with timeout protection.
+
+        Args:
+            texts: Sample texts to analyze
+            timeout: Timeout in seconds for the whole batch
+            deadline: Analysis deadline; the timeout never outlasts it
+            **kwargs: Forwarded to _calculate_gltr_metrics_batch (e.g. token_budget)
+
+        Returns:
+            List of GLTR metric dicts (one per text), or None if timeout/error
+
+        Raises:
+            DeadlineExceeded: If the analysis deadline passed first
+        """
+        return self._run_with_timeout(self._calculate_gltr_metrics_batch, timeout, texts, deadline=deadline, **kwargs)
+
+    @staticmethod
+    def _run_with_timeout(func, timeout: int, *args, deadline: Optional[Deadline] = None, **kwargs) -> Any:
+        """
+        Run func in a daemon worker thread, giving up after timeout seconds.
+
+        The worker runs under a child of `deadline` limited to `timeout`
+        (see core/deadline.py). Token ranking checks it between model
+        batches, so a timed-out or cancelled worker stops at its next batch
+        instead of burning CPU in the background.
+
+        Returns:
+            func's return value, or None if timeout/error
+
+        Raises:
+            DeadlineExceeded: If `deadline` expired before func finished
         """
+        budget = Deadline(timeout, parent=deadline, reason=f"GLTR analysis timed out after {timeout}s")
         result = [None]
         exception = [None]
 
         def worker():
             """Worker thread to execute GLTR calculation."""
-            try:
-                result[0] = self._calculate_gltr_metrics(text)
-            except Exception as e:
-                exception[0] = e
+            with deadline_scope(budget):
+                try:
+                    result[0] = func(*args, **kwargs)
+                except Exception as e:
+                    exception[0] = e
 
         thread = threading.Thread(target=worker, daemon=True)
         thread.start()
-        thread.join(timeout)
+        thread.join(budget.remaining())
 
-        if thread.is_alive():
-            # Timeout occurred - thread still running
+        if thread.is_alive() or isinstance(exception[0], DeadlineExceeded):
+            # Stop the worker at its next model batch
+            budget.cancel()
+            if deadline is not None and deadline.expired:
+                raise DeadlineExceeded(deadline.describe())
             print(f"Warning: GLTR analysis timed out after {timeout}s", file=sys.stderr)
             return None
 
@@ -365,10 +504,8 @@ class PredictabilityDimension(DimensionStrategy):
 
         Thread-safe via lock protection.
         """
-        global _perplexity_model, _perplexity_tokenizer
         with _model_lock:
-            _perplexity_model = None
-            _perplexity_tokenizer = None
+            _perplexity_models.clear()
 
     def _aggregate_gltr_metrics(self, sample_metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -379,6 +516,7 @@ class PredictabilityDimension(DimensionStrategy):
         - Mean rank: Mean of means
         - Rank variance: Mean of variances (simple approach; weighted variance is future enhancement)
         - Likelihood: Mean across samples
+        - Empty/None samples (timeout, too short) are ignored
 
         Args:
             sample_metrics: List of GLTR metric dicts from each sample
@@ -396,6 +534,9 @@ class PredictabilityDimension(DimensionStrategy):
             >>> result['gltr_top10_percentage']
             0.55  # Mean of 0.50, 0.60, 0.55
         """
+        # Drop samples that timed out, failed, or were too short to score
+        sample_metrics = [m for m in sample_metrics if m]
+
         if not sample_metrics:
             return {}
 
@@ -420,7 +561,14 @@ class PredictabilityDimension(DimensionStrategy):
             'gltr_likelihood': sum(likelihood_values) / len(likelihood_values),
         }
 
-    def _calculate_gltr_metrics(self, text: str) -> Dict:
+    def _calculate_gltr_metrics(
+        self,
+        text: str,
+        context_overlap: int = DEFAULT_CONTEXT_OVERLAP,
+        findings: Optional[Findings] = None,
+        backend: str = DEFAULT_BACKEND,
+        onnx_model_dir: Optional[str] = None
+    ) -> Dict:
         """
         Calculate GLTR (Giant Language Model Test Room) metrics.
 
@@ -433,6 +581,7 @@ class PredictabilityDimension(DimensionStrategy):
         - Subsequent calls: ~0.1-0.5s (cached model) + analysis time
         - Model cached at module level with thread-safe loading
         - 80-95% time reduction on repeated analyses
+        - All token ranks come from one forward pass (see _compute_token_ranks)
 
         NOTE: This method no longer truncates text - truncation/sampling
         is handled by caller via _prepare_text(). Call via
@@ -440,6 +589,12 @@ class PredictabilityDimension(DimensionStrategy):
 
         Args:
             text: Text to analyze (pre-truncated/sampled by caller)
+            context_overlap: Context carried between windows when text exceeds
+                the model context (FULL/STREAMING modes on long documents)
+            findings: Recorder for detailed analysis; gets the text offset and
+                rank of every ranked token under 'token_ranks'
+            backend: Inference backend of the model to rank with
+            onnx_model_dir: Root of exported ONNX models (onnx backend)
 
         Returns:
             Dict with GLTR metrics
@@ -451,163 +606,739 @@ class PredictabilityDimension(DimensionStrategy):
         Research: 95% accuracy on GPT-3/ChatGPT detection.
         """
         try:
-            global _perplexity_model, _perplexity_tokenizer
-
-            # Thread-safe lazy load model if not already loaded (Story 1.4.14)
-            if _perplexity_model is None:
-                with _model_lock:
-                    # Double-check after acquiring lock (another thread may have loaded it)
-                    if _perplexity_model is None:
-                        print("Loading DistilGPT-2 model for GLTR analysis (one-time setup)...", file=sys.stderr)
-                        _perplexity_model = AutoModelForCausalLM.from_pretrained('distilgpt2')
-                        _perplexity_tokenizer = AutoTokenizer.from_pretrained('distilgpt2')
-                        _perplexity_model.eval()
+            model, tokenizer = self._load_model(backend, onnx_model_dir)
 
-            # Remove code blocks
-            text = re.sub(r'```[\s\S]*?```', '', text)
-
-            # Tokenize
-            tokens = _perplexity_tokenizer.encode(text)
+            # Remove code blocks and tokenize (with offsets when recording findings)
+            if findings is not None:
+                text, offsets = strip_matches(_CODE_BLOCK_PATTERN, text)
+                encoding = tokenizer(text, return_offsets_mapping=True)
+                tokens = encoding['input_ids']
+            else:
+                text = re.sub(r'```[\s\S]*?```', '', text)
+                tokens = tokenizer.encode(text)
 
             if len(tokens) < 10:
                 return {}  # Not enough tokens for reliable analysis
 
-            ranks = []
-
-            # Performance optimization: Analyze up to 500 tokens per sample (fast, reliable)
-            # 500 tokens ≈ 2000-2500 chars ≈ 1 page per sample
-            MAX_TOKENS_PER_ANALYSIS = 500
-
-            # Analyze each token's rank in model prediction
-            for i in range(1, min(len(tokens), MAX_TOKENS_PER_ANALYSIS)):
-                input_ids = torch.tensor([tokens[:i]])
-
-                with torch.no_grad():
-                    outputs = _perplexity_model(input_ids)
-                    logits = outputs.logits[0, -1, :]
-                    probs = torch.softmax(logits, dim=-1)
-
-                    # Get rank of actual next token
-                    sorted_indices = torch.argsort(probs, descending=True)
-                    actual_token = tokens[i]
-                    rank = (sorted_indices == actual_token).nonzero(as_tuple=True)[0].item()
-                    ranks.append(rank)
+            # Single causal forward pass (sliding KV-cache window beyond model context)
+            ranks = self._compute_token_ranks(tokens, context_overlap, model=model)
 
             if not ranks:
                 return {}
 
-            # Calculate GLTR metrics
-            top10_percentage = safe_ratio(sum(1 for r in ranks if r < 10), len(ranks), 0)
-            top100_percentage = safe_ratio(sum(1 for r in ranks if r < 100), len(ranks), 0)
-            top1000_percentage = safe_ratio(sum(1 for r in ranks if r < 1000), len(ranks), 0)
-            mean_rank = sum(ranks) / len(ranks)
-            rank_variance = statistics.variance(ranks) if len(ranks) > 1 else 0
-
-            # AI likelihood based on top-10 concentration
-            # Research: AI >70%, Human <55%
-            if top10_percentage > 0.70:
-                ai_likelihood = 0.90
-            elif top10_percentage > 0.65:
-                ai_likelihood = 0.75
-            elif top10_percentage > 0.60:
-                ai_likelihood = 0.60
-            elif top10_percentage < 0.50:
-                ai_likelihood = 0.20
-            else:
-                ai_likelihood = 0.50
+            if findings is not None:
+                # ranks[i] is the rank of tokens[i + 1]
+                findings.record('token_ranks', [
+                    (offsets.to_original(start), rank)
+                    for (start, _), rank in zip(encoding['offset_mapping'][1:], ranks)
+                ])
 
-            return {
-                'gltr_top10_percentage': round(top10_percentage, 3),
-                'gltr_top100_percentage': round(top100_percentage, 3),
-                'gltr_top1000_percentage': round(top1000_percentage, 3),
-                'gltr_mean_rank': round(mean_rank, 2),
-                'gltr_rank_variance': round(rank_variance, 2),
-                'gltr_likelihood': round(ai_likelihood, 2)
-            }
+            return self._summarize_ranks(ranks)
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             print(f"Warning: GLTR analysis failed: {e}", file=sys.stderr)
             return {}
 
-    def _analyze_high_predictability_segments_detailed(self, lines: List[str], html_comment_checker=None) -> List[HighPredictabilitySegment]:
-        """Identify text segments with high GLTR scores (AI-like predictability)."""
-        issues = []
+    def _calculate_gltr_metrics_batch(
+        self,
+        texts: List[str],
+        token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET,
+        context_overlap: int = DEFAULT_CONTEXT_OVERLAP,
+        backend: str = DEFAULT_BACKEND,
+        onnx_model_dir: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate GLTR metrics for several samples with batched inference.
 
+        Samples are tokenized, padded into attention-masked batches sized by
+        token_budget, and ranked with one forward call per batch. Ranks are
+        then split back per sample and summarized individually so the result
+        feeds _aggregate_gltr_metrics() exactly like per-sample calls.
+
+        Args:
+            texts: Sample texts (pre-sampled by caller)
+            token_budget: Max padded tokens (rows × longest row) per forward call
+            context_overlap: Context carried between windows for over-long samples
+            backend: Inference backend of the model to rank with
+            onnx_model_dir: Root of exported ONNX models (onnx backend)
+
+        Returns:
+            List of GLTR metric dicts, one per text ({} if too short or failed)
+        """
         try:
-            global _perplexity_model, _perplexity_tokenizer
+            model, tokenizer = self._load_model(backend, onnx_model_dir)
+
+            # Remove code blocks and tokenize each sample
+            token_lists = [
+                tokenizer.encode(re.sub(r'```[\s\S]*?```', '', text))
+                for text in texts
+            ]
+
+            # Skip samples with too few tokens for reliable analysis
+            scorable = [i for i, tokens in enumerate(token_lists) if len(tokens) >= 10]
+            rank_lists = self._compute_token_ranks_batch(
+                [token_lists[i] for i in scorable],
+                token_budget,
+                context_overlap,
+                model=model
+            )
 
-            if _perplexity_model is None:
-                # Model not loaded yet
-                return []
+            results: List[Dict[str, Any]] = [{} for _ in texts]
+            for index, ranks in zip(scorable, rank_lists):
+                results[index] = self._summarize_ranks(ranks)
+            return results
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            print(f"Warning: GLTR analysis failed: {e}", file=sys.stderr)
+            return [{} for _ in texts]
+
+    def warm_up(self, config: Optional[AnalysisConfig] = None) -> None:
+        """Load the GLTR model for config's inference backend ahead of analyze()."""
+        config = config or DEFAULT_CONFIG
+        self._load_model(config.inference_backend, config.onnx_model_dir)
+
+    def _load_model(self, backend: str = DEFAULT_BACKEND, onnx_model_dir: Optional[str] = None):
+        """
+        Return the cached (model, tokenizer) pair of an inference backend,
+        loading it on first use (see _build_model).
+
+        Each (backend, onnx_model_dir) keeps its own cached pair, so analyses
+        with different backends can overlap and alternate without reloads.
+
+        Thread-safety:
+            Model loading protected by _model_lock (double-checked locking pattern).
+        """
+        key = (backend, onnx_model_dir)
+
+        # Thread-safe lazy load model if not already loaded (Story 1.4.14)
+        loaded = _perplexity_models.get(key)
+        if loaded is None:
+            with _model_lock:
+                # Double-check after acquiring lock (another thread may have loaded it)
+                loaded = _perplexity_models.get(key)
+                if loaded is None:
+                    print("Loading DistilGPT-2 model for GLTR analysis (one-time setup)...", file=sys.stderr)
+                    with model_load():
+                        loaded = self._build_model(backend, onnx_model_dir)
+                    _perplexity_models[key] = loaded
+
+        return loaded
+
+    @staticmethod
+    def _build_model(backend: str = DEFAULT_BACKEND, onnx_model_dir: Optional[str] = None):
+        """
+        Load distilgpt2 for an inference backend (uncached).
+
+        Args:
+            backend: 'eager' (fp32), 'int8' (dynamic quantization) or 'onnx'
+            onnx_model_dir: Root of exported ONNX models (onnx backend only)
+
+        Returns:
+            Tuple (model, tokenizer)
+        """
+        validate_backend(backend, onnx_model_dir)
+
+        if backend == 'onnx':
+            model_dir = onnx_model_path(onnx_model_dir, 'predictability')
+            return OnnxCausalLM(model_dir), AutoTokenizer.from_pretrained(model_dir)
+
+        tokenizer = AutoTokenizer.from_pretrained('distilgpt2')
+        model = AutoModelForCausalLM.from_pretrained('distilgpt2')
+        model.eval()
+        if backend == 'int8':
+            model = quantize_dynamic_int8(model)
+        return model, tokenizer
+
+    def check_backend_drift(
+        self,
+        texts: List[str],
+        backend: str,
+        onnx_model_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Measure GLTR rank drift of an inference backend against fp32 eager.
+
+        Both models rank the same tokens; see utils.inference_backend.rank_drift
+        for the reported fields (top-10 agreement, top-10 percentage delta,
+        within_tolerance).
+
+        Args:
+            texts: Representative texts to rank
+            backend: Backend to validate ('int8' or 'onnx')
+            onnx_model_dir: Root of exported ONNX models (onnx backend only)
+
+        Returns:
+            Drift metrics dict
+        """
+        reference_model, tokenizer = self._build_model(DEFAULT_BACKEND)
+        candidate_model, _ = self._build_model(backend, onnx_model_dir)
+
+        reference: List[int] = []
+        candidate: List[int] = []
+        for text in texts:
+            tokens = tokenizer.encode(text)
+            reference.extend(self._compute_token_ranks(tokens, model=reference_model))
+            candidate.extend(self._compute_token_ranks(tokens, model=candidate_model))
+
+        return {'backend': backend, **rank_drift(reference, candidate)}
+
+    @staticmethod
+    def _get_context_size(model) -> int:
+        """Return the model's maximum context length in tokens (1024 for distilgpt2)."""
+        model_config = getattr(model, 'config', None)
+        for attr in ('n_positions', 'max_position_embeddings'):
+            value = getattr(model_config, attr, None)
+            if isinstance(value, int) and value > 1:
+                return value
+        return DEFAULT_CONTEXT_SIZE
+
+    def _compute_token_ranks(
+        self,
+        tokens: List[int],
+        context_overlap: int = DEFAULT_CONTEXT_OVERLAP,
+        model=None
+    ) -> List[int]:
+        """
+        Compute the GLTR rank of every token with one causal forward pass.
+
+        A causal LM's logits at position i depend only on tokens[:i + 1], so a
+        single pass over the sequence yields the next-token distribution for
+        every prefix at once. The rank of the actual next token is the number
+        of vocabulary entries whose logit is strictly greater than its own
+        (softmax is monotonic, so this equals its position in the sorted
+        probability distribution).
+
+        Sequences longer than the model context are delegated to
+        _compute_token_ranks_sliding() so every token still gets a rank.
+
+        Args:
+            tokens: Token ids for the text
+            context_overlap: Context carried between windows for long sequences
+            model: Model to rank with (None = cached model from _load_model)
+
+        Returns:
+            List of 0-based ranks, one per token after the first
+        """
+        return self._compute_token_ranks_batch(
+            [tokens],
+            token_budget=max(len(tokens), 1),
+            context_overlap=context_overlap,
+            model=model
+        )[0]
+
+    def _compute_token_ranks_batch(
+        self,
+        token_lists: List[List[int]],
+        token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET,
+        context_overlap: int = DEFAULT_CONTEXT_OVERLAP,
+        model=None
+    ) -> List[List[int]]:
+        """
+        Rank several token sequences with padded, attention-masked batches.
+
+        Sequences are sorted by length (to minimise padding) and grouped so
+        that rows × longest row stays within token_budget. Padding is on the
+        right, so a causal model's logits for real positions are unaffected
+        and position ids start at 0 for every row. Logits are projected from
+        hidden states in RANK_CHUNK_SIZE slices, so memory holds at most one
+        [chunk × vocab] block instead of [batch × length × vocab].
 
-            # Analyze in 50-100 word chunks
-            chunk_size = 75  # words
-            current_chunk = []
-            chunk_start_line = 1
+        ONNX models only expose full logits, so their batches materialize
+        [batch × length × vocab]; lower the token budget if memory is tight.
 
-            for line_num, line in enumerate(lines, start=1):
-                stripped = line.strip()
+        Sequences longer than the model context fall back to the sliding
+        window scorer individually.
 
-                # Skip HTML comments (metadata), headings, and code blocks
-                if html_comment_checker and html_comment_checker(line):
+        Args:
+            token_lists: Token ids per sample
+            token_budget: Max padded tokens per forward call
+            context_overlap: Context carried between windows for long sequences
+            model: Model to rank with (None = cached model from _load_model)
+
+        Returns:
+            List of rank lists in the same order as token_lists
+        """
+        if model is None:
+            model, _ = self._load_model()
+        context_size = self._get_context_size(model)
+        head = model.get_output_embeddings() if hasattr(model, 'base_model') else None
+
+        rank_lists: List[List[int]] = [[] for _ in token_lists]
+
+        # Long sequences: sliding window, one at a time
+        batchable = []
+        for index, tokens in enumerate(token_lists):
+            if len(tokens) > context_size:
+                rank_lists[index] = self._compute_token_ranks_sliding(
+                    tokens, context_overlap, model=model
+                )
+            elif len(tokens) >= 2:
+                batchable.append(index)
+
+        # Group by length so padding stays small
+        batchable.sort(key=lambda i: len(token_lists[i]))
+        batches: List[List[int]] = []
+        for index in batchable:
+            length = len(token_lists[index])
+            if batches and (len(batches[-1]) + 1) * length <= token_budget:
+                batches[-1].append(index)
+            else:
+                batches.append([index])
+
+        with torch.no_grad():
+            for batch in batches:
+                check_deadline()
+                max_len = max(len(token_lists[i]) for i in batch)
+                input_ids = torch.zeros((len(batch), max_len), dtype=torch.long)
+                attention_mask = torch.zeros((len(batch), max_len), dtype=torch.long)
+                for row, index in enumerate(batch):
+                    tokens = token_lists[index]
+                    input_ids[row, :len(tokens)] = torch.tensor(tokens)
+                    attention_mask[row, :len(tokens)] = 1
+
+                if head is None:
+                    # Opaque backend (ONNX): full logits only
+                    logits = model(input_ids, attention_mask=attention_mask).logits
+                    for row, index in enumerate(batch):
+                        length = len(token_lists[index])
+                        rank_lists[index] = self._ranks_from_logits(
+                            logits[row, :length - 1],
+                            input_ids[row, 1:length]
+                        )
                     continue
-                if stripped.startswith('#') or stripped.startswith('```'):
+
+                hidden = model.base_model(
+                    input_ids=input_ids,
+                    attention_mask=attention_mask
+                ).last_hidden_state
+
+                for row, index in enumerate(batch):
+                    length = len(token_lists[index])
+                    rank_lists[index] = self._ranks_from_hidden(
+                        hidden[row, :length - 1],
+                        input_ids[row, 1:length],
+                        head
+                    )
+
+        return rank_lists
+
+    @classmethod
+    def _ranks_from_hidden(cls, hidden, targets, head) -> List[int]:
+        """
+        Project hidden states through the LM head in chunks and rank targets.
+
+        Args:
+            hidden: Tensor [positions, hidden_size] of final hidden states
+            targets: Tensor [positions] of actual next-token ids
+            head: Output embedding (LM head) module
+
+        Returns:
+            List of 0-based ranks
+        """
+        ranks: List[int] = []
+        for start in range(0, hidden.shape[0], RANK_CHUNK_SIZE):
+            logits = head(hidden[start:start + RANK_CHUNK_SIZE])
+            ranks.extend(cls._ranks_from_logits(logits, targets[start:start + RANK_CHUNK_SIZE]))
+        return ranks
+
+    def _compute_token_ranks_sliding(
+        self,
+        tokens: List[int],
+        context_overlap: int = DEFAULT_CONTEXT_OVERLAP,
+        chunk_size: int = RANK_CHUNK_SIZE,
+        model=None
+    ) -> List[int]:
+        """
+        Rank every token of an arbitrarily long sequence with a KV cache.
+
+        Tokens are fed in chunk_size steps on top of past_key_values, so each
+        token is encoded once per window and logits are only materialized for
+        the current chunk. When the cache reaches the model context, a new
+        window starts by re-encoding the last context_overlap tokens (the only
+        recomputation), which gives every later token at least that much
+        left context. Memory stays bounded by the window size regardless of
+        document length.
+
+        GPT-2 uses absolute position embeddings, so cached keys cannot be
+        shifted into a new window; re-encoding the overlap once per window
+        keeps ranks identical to a fresh forward pass over that window.
+
+        Args:
+            tokens: Token ids for the full document
+            context_overlap: Tokens of left context carried into each new window
+            chunk_size: Tokens fed per forward call
+            model: Model to rank with (None = cached model from _load_model)
+
+        Returns:
+            List of 0-based ranks, one per token after the first
+        """
+        if model is None:
+            model, _ = self._load_model()
+        window_size = self._get_context_size(model)
+        context_overlap = max(1, min(context_overlap, window_size // 2))
+
+        if not getattr(model, 'supports_kv_cache', True):
+            return self._compute_token_ranks_windowed(tokens, context_overlap, model)
+
+        ranks: List[int] = []
+        past = None
+        cache_len = 0
+        carry_logits = None  # Last logits of previous step (predicts next token)
+        pos = 0
+
+        with torch.no_grad():
+            while pos < len(tokens):
+                check_deadline()
+                if cache_len >= window_size:
+                    # Window full: restart cache from the carried-over context
+                    context = torch.tensor([tokens[pos - context_overlap:pos]])
+                    outputs = model(context, use_cache=True)
+                    past = outputs.past_key_values
+                    carry_logits = outputs.logits[0, -1:, :]
+                    cache_len = context_overlap
+
+                step = min(chunk_size, window_size - cache_len, len(tokens) - pos)
+                input_ids = torch.tensor([tokens[pos:pos + step]])
+                outputs = model(input_ids, past_key_values=past, use_cache=True)
+                past = outputs.past_key_values
+                logits = outputs.logits[0]
+
+                # logits[i] predicts tokens[pos + i + 1]; carry predicts tokens[pos]
+                if carry_logits is not None:
+                    step_logits = torch.cat([carry_logits, logits[:-1]], dim=0)
+                    targets = input_ids[0]
+                else:
+                    step_logits = logits[:-1]
+                    targets = input_ids[0, 1:]
+
+                if targets.numel() > 0:
+                    ranks.extend(self._ranks_from_logits(step_logits, targets))
+
+                carry_logits = logits[-1:]
+                cache_len += step
+                pos += step
+
+        return ranks
+
+    def _compute_token_ranks_windowed(
+        self,
+        tokens: List[int],
+        context_overlap: int,
+        model
+    ) -> List[int]:
+        """
+        Rank a long sequence with overlapping full windows (no KV cache).
+
+        Used for backends without past_key_values support (ONNX). Each window
+        re-encodes its context_overlap leading tokens and ranks only the
+        tokens not covered by the previous window, so results match the
+        cached sliding scorer.
+
+        Args:
+            tokens: Token ids for the full document
+            context_overlap: Tokens of left context carried into each new window
+            model: Model exposing model(input_ids).logits
+
+        Returns:
+            List of 0-based ranks, one per token after the first
+        """
+        window_size = self._get_context_size(model)
+        ranks: List[int] = []
+        start = 0
+        next_target = 1  # First token without a rank yet
+
+        with torch.no_grad():
+            while next_target < len(tokens):
+                check_deadline()
+                end = min(start + window_size, len(tokens))
+                input_ids = torch.tensor([tokens[start:end]])
+                logits = model(input_ids).logits[0, :-1, :]
+
+                # logits[i] predicts tokens[start + i + 1]
+                skip = next_target - start - 1
+                ranks.extend(self._ranks_from_logits(logits[skip:], input_ids[0, skip + 1:]))
+
+                next_target = end
+                start = end - context_overlap
+
+        return ranks
+
+    @staticmethod
+    def _ranks_from_logits(logits, targets) -> List[int]:
+        """
+        Vectorized rank lookup: count logits greater than each target's logit.
+
+        Processed in row chunks so the boolean comparison matrix stays small
+        (RANK_CHUNK_SIZE × vocab) regardless of sequence length.
+
+        Args:
+            logits: Tensor [positions, vocab] of next-token logits
+            targets: Tensor [positions] of actual next-token ids
+
+        Returns:
+            List of 0-based ranks
+        """
+        ranks: List[int] = []
+        for start in range(0, logits.shape[0], RANK_CHUNK_SIZE):
+            chunk = logits[start:start + RANK_CHUNK_SIZE]
+            chunk_targets = targets[start:start + RANK_CHUNK_SIZE].unsqueeze(-1)
+            target_logits = chunk.gather(1, chunk_targets)
+            ranks.extend((chunk > target_logits).sum(dim=-1).tolist())
+        return ranks
+
+    @staticmethod
+    def _summarize_ranks(ranks: List[int]) -> Dict[str, Any]:
+        """
+        Convert a token rank array into GLTR metrics.
+
+        Args:
+            ranks: 0-based token ranks
+
+        Returns:
+            Dict with GLTR metrics (empty if no ranks)
+        """
+        if not ranks:
+            return {}
+
+        top10_percentage = safe_ratio(sum(1 for r in ranks if r < 10), len(ranks), 0)
+        top100_percentage = safe_ratio(sum(1 for r in ranks if r < 100), len(ranks), 0)
+        top1000_percentage = safe_ratio(sum(1 for r in ranks if r < 1000), len(ranks), 0)
+        mean_rank = sum(ranks) / len(ranks)
+        rank_variance = statistics.variance(ranks) if len(ranks) > 1 else 0
+
+        # AI likelihood based on top-10 concentration
+        # Research: AI >70%, Human <55%
+        if top10_percentage > 0.70:
+            ai_likelihood = 0.90
+        elif top10_percentage > 0.65:
+            ai_likelihood = 0.75
+        elif top10_percentage > 0.60:
+            ai_likelihood = 0.60
+        elif top10_percentage < 0.50:
+            ai_likelihood = 0.20
+        else:
+            ai_likelihood = 0.50
+
+        return {
+            'gltr_top10_percentage': round(top10_percentage, 3),
+            'gltr_top100_percentage': round(top100_percentage, 3),
+            'gltr_top1000_percentage': round(top1000_percentage, 3),
+            'gltr_mean_rank': round(mean_rank, 2),
+            'gltr_rank_variance': round(rank_variance, 2),
+            'gltr_likelihood': round(ai_likelihood, 2)
+        }
+
+    def _analyze_high_predictability_segments_detailed(
+        self,
+        lines: List[str],
+        html_comment_checker=None,
+        chunk_size: int = 75,
+        findings: Optional[Findings] = None,
+        backend: str = DEFAULT_BACKEND,
+        onnx_model_dir: Optional[str] = None
+    ) -> List[HighPredictabilitySegment]:
+        """
+        Identify text segments with high GLTR scores (AI-like predictability).
+
+        Content lines are ranked once as a single document (see
+        _build_line_rank_index), then grouped into ~chunk_size-word segments.
+        Each segment's top-10 ratio is read from prefix sums, so every segment
+        in the document is scored without extra model calls.
+
+        Args:
+            lines: Text split into lines
+            html_comment_checker: Function to check if line is in HTML comment
+            chunk_size: Approximate words per segment
+            findings: Recorder of the standard pass (see _build_line_rank_index)
+            backend: Inference backend of the model to rank with
+            onnx_model_dir: Root of exported ONNX models (onnx backend)
+
+        Returns:
+            List of HighPredictabilitySegment objects (top-10 ratio > 0.70)
+        """
+        issues = []
+
+        try:
+            index = self._build_line_rank_index(lines, html_comment_checker, findings=findings,
+                                                backend=backend, onnx_model_dir=onnx_model_dir)
+            if index is None:
+                return []
+
+            line_numbers, line_texts, bounds, top10_prefix = index
+
+            # Group consecutive content lines into ~chunk_size-word segments
+            segments = []
+            first = 0
+            words = 0
+            for k, text in enumerate(line_texts):
+                words += len(re.findall(r'\b\w+\b', text))
+                if words >= chunk_size or k == len(line_texts) - 1:
+                    segments.append((first, k))
+                    first = k + 1
+                    words = 0
+
+            for first, last in segments:
+                lo, hi = bounds[first][0], bounds[last][1]
+                # Skip segments with too few tokens for a reliable ratio
+                if hi - lo < 10:
                     continue
 
-                if stripped:
-                    words = re.findall(r'\b\w+\b', stripped)
-                    current_chunk.extend(words)
-
-                    if len(current_chunk) >= chunk_size:
-                        # Analyze this chunk
-                        chunk_text = ' '.join(current_chunk)
-
-                        # Calculate GLTR for chunk
-                        try:
-                            tokens = _perplexity_tokenizer.encode(chunk_text, add_special_tokens=True)
-                            if len(tokens) < 10:
-                                current_chunk = []
-                                chunk_start_line = line_num + 1
-                                continue
-
-                            ranks = []
-                            for i in range(1, min(len(tokens), 100)):
-                                input_ids = torch.tensor([tokens[:i]])
-                                with torch.no_grad():
-                                    outputs = _perplexity_model(input_ids)
-                                    logits = outputs.logits[0, -1, :]
-                                    probs = torch.softmax(logits, dim=-1)
-                                    sorted_indices = torch.argsort(probs, descending=True)
-                                    actual_token = tokens[i]
-                                    rank = (sorted_indices == actual_token).nonzero(as_tuple=True)[0].item()
-                                    ranks.append(rank)
-
-                            if ranks:
-                                top10_pct = sum(1 for r in ranks if r < 10) / len(ranks)
-
-                                # High predictability: >70% in top-10
-                                if top10_pct > 0.70:
-                                    preview = chunk_text[:150] + '...' if len(chunk_text) > 150 else chunk_text
-                                    issues.append(HighPredictabilitySegment(
-                                        start_line=chunk_start_line,
-                                        end_line=line_num,
-                                        segment_preview=preview,
-                                        gltr_score=top10_pct,
-                                        problem=f'High predictability (GLTR={top10_pct:.2f}, AI threshold >0.70)',
-                                        suggestion='Rewrite with less common word choices, vary sentence structure, add unexpected turns'
-                                    ))
-
-                        except Exception as e:
-                            print(f"Warning: GLTR chunk analysis failed: {e}", file=sys.stderr)
-
-                        # Reset chunk
-                        current_chunk = []
-                        chunk_start_line = line_num + 1
+                top10_pct = (top10_prefix[hi] - top10_prefix[lo]) / (hi - lo)
+
+                # High predictability: >70% in top-10
+                if top10_pct > 0.70:
+                    segment_text = ' '.join(line_texts[first:last + 1])
+                    preview = segment_text[:150] + '...' if len(segment_text) > 150 else segment_text
+                    issues.append(HighPredictabilitySegment(
+                        start_line=line_numbers[first],
+                        end_line=line_numbers[last],
+                        segment_preview=preview,
+                        gltr_score=top10_pct,
+                        problem=f'High predictability (GLTR={top10_pct:.2f}, AI threshold >0.70)',
+                        suggestion='Rewrite with less common word choices, vary sentence structure, add unexpected turns'
+                    ))
 
         except Exception as e:
             print(f"Warning: High predictability segment analysis failed: {e}", file=sys.stderr)
 
         return issues
 
+    def analyze_line_heatmap(self, lines: List[str], html_comment_checker=None,
+                             config: Optional[AnalysisConfig] = None) -> Dict[int, float]:
+        """
+        Per-line GLTR top-10 ratio (predictability heatmap).
+
+        Args:
+            lines: Text split into lines
+            html_comment_checker: Function to check if line is in HTML comment
+            config: Analysis configuration selecting the inference backend
+                (None = DEFAULT_CONFIG)
+
+        Returns:
+            Dict mapping 1-based line number to top-10 ratio for each content
+            line with at least one ranked token ({} if GLTR is unavailable)
+        """
+        try:
+            config = config or DEFAULT_CONFIG
+            index = self._build_line_rank_index(lines, html_comment_checker, backend=config.inference_backend,
+                                                onnx_model_dir=config.onnx_model_dir)
+        except Exception as e:
+            print(f"Warning: GLTR line heatmap failed: {e}", file=sys.stderr)
+            return {}
+
+        if index is None:
+            return {}
+
+        line_numbers, _, bounds, top10_prefix = index
+        return {
+            line_num: (top10_prefix[hi] - top10_prefix[lo]) / (hi - lo)
+            for line_num, (lo, hi) in zip(line_numbers, bounds)
+            if hi > lo
+        }
+
+    def _build_line_rank_index(self, lines: List[str], html_comment_checker=None,
+                               findings: Optional[Findings] = None, backend: str = DEFAULT_BACKEND,
+                               onnx_model_dir: Optional[str] = None):
+        """
+        Rank every content token of a document once and map ranks to lines.
+
+        Content lines (not headings, code blocks, blank lines or HTML comments)
+        are joined into one document and tokenized with offset mappings. One
+        call to _compute_token_ranks() ranks the whole document (sliding window
+        beyond the model context), and each token is assigned to the line its
+        offset falls in. Top-10 hits are accumulated into a prefix-sum array,
+        so the top-10 ratio of any line range is an O(1) lookup.
+
+        If the standard pass recorded token ranks of the whole document in
+        findings, those are assigned to content lines by offset instead, and
+        the model is not run again.
+
+        Args:
+            lines: Text split into lines
+            html_comment_checker: Function to check if line is in HTML comment
+            findings: Recorder of the standard pass over the same text (lines
+                are findings.lines)
+            backend: Inference backend of the model to rank with
+            onnx_model_dir: Root of exported ONNX models (onnx backend)
+
+        Returns:
+            Tuple (line_numbers, line_texts, bounds, top10_prefix), or None if
+            the document has fewer than 10 tokens. bounds[k] is the half-open
+            range of rank indices for content line k; top10_prefix[i] counts
+            top-10 ranks among ranks[:i].
+
+        Raises:
+            Exception: If the model cannot be loaded or ranking fails
+        """
+        recorded = findings.get('token_ranks') if findings is not None else None
+
+        # Collect content lines and their start offsets in the joined document
+        line_numbers: List[int] = []
+        line_texts: List[str] = []
+        line_starts: List[int] = []
+        offset = 0
+        in_code_block = False
+
+        for line_num, line in enumerate(lines, start=1):
+            stripped = line.strip()
+
+            # Skip code blocks, headings, blank lines and HTML comments (metadata)
+            if stripped.startswith('```'):
+                in_code_block = not in_code_block
+                continue
+            if in_code_block or not stripped or stripped.startswith('#'):
+                continue
+            if html_comment_checker and html_comment_checker(line):
+                continue
+
+            line_numbers.append(line_num)
+            line_texts.append(stripped)
+            line_starts.append(offset)
+            offset += len(stripped) + 1  # '\n' separator
+
+        if not line_texts:
+            return None
+
+        if recorded is not None:
+            # Ranks from the standard pass; tokens outside content lines are dropped
+            content_lines = {line_num: k for k, line_num in enumerate(line_numbers)}
+            ranks = []
+            rank_lines = []
+            for offset, rank in recorded:
+                k = content_lines.get(findings.line_number(offset))
+                if k is not None:
+                    ranks.append(rank)
+                    rank_lines.append(k)
+            if len(ranks) < 10:
+                return None
+        else:
+            model, tokenizer = self._load_model(backend, onnx_model_dir)
+            encoding = tokenizer('\n'.join(line_texts), return_offsets_mapping=True)
+            tokens = encoding['input_ids']
+            if len(tokens) < 10:
+                return None
+
+            ranks = self._compute_token_ranks(tokens, model=model)
+
+            # ranks[i] is the rank of tokens[i + 1]; token lines are non-decreasing
+            rank_lines = [
+                bisect_right(line_starts, start) - 1
+                for start, _ in encoding['offset_mapping'][1:]
+            ]
+
+        bounds = [
+            (bisect_left(rank_lines, k), bisect_left(rank_lines, k + 1))
+            for k in range(len(line_texts))
+        ]
+
+        top10_prefix = [0]
+        for rank in ranks:
+            top10_prefix.append(top10_prefix[-1] + (rank < 10))
+
+        return line_numbers, line_texts, bounds, top10_prefix
+
 
 # Backward compatibility alias
 PredictabilityAnalyzer = PredictabilityDimension
@@ -26,6 +26,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import check_deadline
+from ai_pattern_analyzer.core.document_context import DocumentContext, context_for
 
 # Required imports
 import textstat
@@ -78,6 +80,11 @@ class ReadabilityDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes text readability using Flesch-Kincaid and related metrics"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """Flesch reading ease decides when convergent sampling stops."""
+        return ('flesch_reading_ease',)
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -117,25 +124,31 @@ class ReadabilityDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
                 readability = self._analyze_readability_patterns(sample_text)
                 sample_results.append(readability)
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            readability = self._analyze_readability_patterns(analyzed_text)
+            readability = self._analyze_readability_patterns(
+                analyzed_text, context=context_for(analyzed_text, kwargs.get('context'))
+            )
             aggregated = readability
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -143,6 +156,7 @@ class ReadabilityDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
@@ -263,7 +277,7 @@ class ReadabilityDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_readability_patterns(self, text: str) -> Dict:
+    def _analyze_readability_patterns(self, text: str, context: Optional[DocumentContext] = None) -> Dict:
         """
         Analyze readability patterns using textstat.
 
@@ -272,6 +286,8 @@ class ReadabilityDimension(DimensionStrategy):
         - Flesch-Kincaid Grade Level (US grade level)
         - Automated Readability Index
         - Average word/sentence length
+
+        Word and sentence splits come from context when it describes text.
         """
         result = {
             'flesch_reading_ease': 60.0,  # Default neutral
@@ -288,9 +304,13 @@ class ReadabilityDimension(DimensionStrategy):
             result['automated_readability_index'] = textstat.automated_readability_index(text)
 
             # Calculate basic statistics
-            words = re.findall(r'\b\w+\b', text)
-            sentences = re.split(r'[.!?]+', text)
-            sentences = [s for s in sentences if s.strip()]  # Remove empty
+            if context is not None:
+                words = context.words()
+                sentences = context.sentence_spans
+            else:
+                words = re.findall(r'\b\w+\b', text)
+                sentences = re.split(r'[.!?]+', text)
+                sentences = [s for s in sentences if s.strip()]  # Remove empty
 
             if words:
                 total_chars = sum(len(word) for word in words)
@@ -9,33 +9,110 @@ Analyzes emotional variation patterns:
 AI writing tends to show low emotional variation (variance < 0.10),
 while human writing shows natural emotional range (variance > 0.15).
 
+Performance:
+- All chunks of a text are scored in one batched pipeline call
+  (AnalysisConfig.sentiment_batch_size)
+- Chunk scores are memoized by content hash (bounded LRU), so repeated
+  paragraphs and re-analysis of edited documents only score new text
+- Chunk caps (30 paragraphs / 50 sentences) are lifted in FULL mode
+
 Refactored in Story 1.4 to use DimensionStrategy pattern with self-registration.
 """
 
+import re
+import hashlib
 import statistics
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
-from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import check_deadline
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+from ai_pattern_analyzer.core.document_context import DocumentContext, context_for
+from ai_pattern_analyzer.core.profiler import model_load
+from ai_pattern_analyzer.utils.inference_backend import (
+    DEFAULT_BACKEND, OnnxTextClassifier, onnx_model_path, quantize_dynamic_int8,
+    score_drift, validate_backend
+)
+
+SENTIMENT_MODEL = 'distilbert-base-uncased-finetuned-sst-2-english'
+
+# Chunk caps outside FULL mode (FULL scores every chunk)
+MAX_PARAGRAPHS = 30
+MAX_SENTENCES = 50
+
+# Characters of each chunk sent to the model
+MAX_CHUNK_CHARS = 512
+
+# Memoized chunk scores: (backend, content hash) -> signed score
+SENTIMENT_CACHE_SIZE = 4096
+_score_cache: 'OrderedDict[Tuple, float]' = OrderedDict()
+_score_cache_lock = threading.Lock()
+
+# Lazy load transformers: one pipeline per (backend, onnx_model_dir)
+_sentiment_pipelines: Dict[Tuple[str, Optional[str]], Any] = {}
+_pipeline_lock = threading.Lock()
+
+
+def get_sentiment_pipeline(backend: str = DEFAULT_BACKEND, onnx_model_dir: Optional[str] = None):
+    """Lazy load the sentiment analysis pipeline of an inference backend (thread-safe)."""
+    key = (backend, onnx_model_dir)
+    pipeline = _sentiment_pipelines.get(key)
+    if pipeline is None:
+        with _pipeline_lock:
+            # Double-check after acquiring lock (another thread may have loaded it)
+            pipeline = _sentiment_pipelines.get(key)
+            if pipeline is None:
+                with model_load():
+                    pipeline = build_sentiment_pipeline(backend, onnx_model_dir)
+                _sentiment_pipelines[key] = pipeline
+    return pipeline
+
+
+def clear_sentiment_cache():
+    """Clear memoized chunk sentiment scores."""
+    with _score_cache_lock:
+        _score_cache.clear()
+
+
+def build_sentiment_pipeline(backend: str = DEFAULT_BACKEND, onnx_model_dir: Optional[str] = None):
+    """
+    Build an (uncached) sentiment pipeline for an inference backend.
 
-# Lazy load transformers
-_sentiment_pipeline = None
+    Args:
+        backend: 'eager' (fp32), 'int8' (dynamic quantization) or 'onnx'
+        onnx_model_dir: Root of exported ONNX models (onnx backend only)
+
+    Returns:
+        Callable returning [{'label': ..., 'score': ...}] per input text
+    """
+    validate_backend(backend, onnx_model_dir)
 
+    if backend == 'onnx':
+        return OnnxTextClassifier(onnx_model_path(onnx_model_dir, 'sentiment'))
 
-def get_sentiment_pipeline():
-    """Lazy load sentiment analysis pipeline."""
-    global _sentiment_pipeline
-    if _sentiment_pipeline is None:
-        from transformers import pipeline
-        from transformers.utils import logging as transformers_logging
-        transformers_logging.set_verbosity_error()
+    from transformers import pipeline
+    from transformers.utils import logging as transformers_logging
+    transformers_logging.set_verbosity_error()
 
-        _sentiment_pipeline = pipeline(
+    if backend == 'int8':
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+        model = quantize_dynamic_int8(
+            AutoModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL)
+        )
+        return pipeline(
             'sentiment-analysis',
-            model='distilbert-base-uncased-finetuned-sst-2-english',
+            model=model,
+            tokenizer=AutoTokenizer.from_pretrained(SENTIMENT_MODEL),
             device=-1  # Use CPU
         )
-    return _sentiment_pipeline
+
+    return pipeline(
+        'sentiment-analysis',
+        model=SENTIMENT_MODEL,
+        device=-1  # Use CPU
+    )
 
 
 class SentimentDimension(DimensionStrategy):
@@ -81,6 +158,16 @@ class SentimentDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes emotional variation patterns and sentiment flatness detection"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """Sentiment variance decides when convergent sampling stops."""
+        return ('sentiment', 'variance')
+
+    def warm_up(self, config: Optional[AnalysisConfig] = None) -> None:
+        """Load the sentiment pipeline for config's inference backend ahead of analyze()."""
+        config = config or DEFAULT_CONFIG
+        get_sentiment_pipeline(config.inference_backend, config.onnx_model_dir)
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -106,31 +193,44 @@ class SentimentDimension(DimensionStrategy):
         """
         config = config or DEFAULT_CONFIG
         total_text_length = len(text)
+        # Passed down per call; the dimension instance is shared between analyses
+        backend = (config.inference_backend, config.onnx_model_dir)
+        batch_size = config.sentiment_batch_size
+        uncapped = config.mode == AnalysisMode.FULL
 
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
         prepared = self._prepare_text(text, config, self.dimension_name)
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
-                sentiment_results = self._analyze_sentiment_variance(sample_text)
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
+                sentiment_results = self._analyze_sentiment_variance(sample_text, batch_size, uncapped,
+                                                                     backend=backend)
                 sample_results.append({'sentiment': sentiment_results})
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            sentiment_results = self._analyze_sentiment_variance(analyzed_text)
+            sentiment_results = self._analyze_sentiment_variance(
+                analyzed_text, batch_size, uncapped,
+                context=context_for(analyzed_text, kwargs.get('context')),
+                backend=backend
+            )
             aggregated = {'sentiment': sentiment_results}
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -138,6 +238,7 @@ class SentimentDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
@@ -284,26 +385,44 @@ class SentimentDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_sentiment_variance(self, text: str) -> Dict:
+    def _analyze_sentiment_variance(
+        self,
+        text: str,
+        batch_size: int = 32,
+        uncapped: bool = False,
+        context: Optional[DocumentContext] = None,
+        backend: Tuple[str, Optional[str]] = (DEFAULT_BACKEND, None)
+    ) -> Dict:
         """
         Analyze sentiment variance across text chunks.
-        
+
         AI writing shows emotional flatness (low variance).
         Human writing shows natural emotional range (high variance).
+
+        Args:
+            text: Text to analyze
+            batch_size: Chunks per pipeline forward pass
+            uncapped: Score every chunk (FULL mode) instead of the first
+                MAX_PARAGRAPHS paragraphs / MAX_SENTENCES sentences
+            context: Shared document tokenization (paragraph/sentence splits)
+            backend: (inference_backend, onnx_model_dir) of the pipeline to score with
         """
-        pipeline = get_sentiment_pipeline()
-        
-        # Split into paragraphs (more meaningful than sentences)
-        paragraphs = [p.strip() for p in text.split('nn') if len(p.strip()) > 20]
-        
+        # Split into paragraphs on blank lines (more meaningful than sentences)
+        if context is not None:
+            paragraphs = [p for p in context.paragraphs() if len(p) > 20]
+        else:
+            paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text) if len(p.strip()) > 20]
+
         if len(paragraphs) < 3:
             # Fallback to sentences if too few paragraphs
-            import re
-            sentences = [s.strip() for s in re.split(r'[.!?]+', text) if len(s.strip()) > 20]
-            chunks = sentences[:50]  # Limit for performance
+            if context is not None:
+                sentences = [s for s in context.sentences() if len(s) > 20]
+            else:
+                sentences = [s.strip() for s in re.split(r'[.!?]+', text) if len(s.strip()) > 20]
+            chunks = sentences if uncapped else sentences[:MAX_SENTENCES]
         else:
-            chunks = paragraphs[:30]  # Limit for performance
-        
+            chunks = paragraphs if uncapped else paragraphs[:MAX_PARAGRAPHS]
+
         if len(chunks) < 3:
             # Not enough text to analyze variance
             return {
@@ -312,26 +431,10 @@ class SentimentDimension(DimensionStrategy):
                 'count': len(chunks),
                 'emotionally_flat': True
             }
-        
-        # Analyze sentiment for each chunk
-        # Pipeline returns: [{'label': 'POSITIVE', 'score': 0.9998}]
-        sentiments = []
-        for chunk in chunks:
-            try:
-                # Truncate long chunks to avoid token limit
-                chunk_text = chunk[:512]
-                result = pipeline(chunk_text)[0]
-                
-                # Convert to numeric: POSITIVE = +score, NEGATIVE = -score
-                score = result['score']
-                if result['label'] == 'NEGATIVE':
-                    score = -score
-                
-                sentiments.append(score)
-            except Exception:
-                # Skip problematic chunks
-                continue
-        
+
+        pipeline = get_sentiment_pipeline(*backend)
+        sentiments = self._score_chunks(pipeline, chunks, batch_size, cache_key=backend)
+
         if len(sentiments) < 3:
             return {
                 'variance': 0.0,
@@ -355,6 +458,112 @@ class SentimentDimension(DimensionStrategy):
             'scores': sentiments[:10]  # Store first 10 for debugging
         }
 
+    @staticmethod
+    def _score_chunks(
+        pipeline,
+        chunks: List[str],
+        batch_size: int = 32,
+        cache_key: Optional[Tuple] = None
+    ) -> List[float]:
+        """
+        Score chunks as signed sentiment (POSITIVE = +score, NEGATIVE = -score).
+
+        Chunks not already memoized are scored in a single batched pipeline
+        call. If the batch fails, chunks are retried one at a time and
+        problematic chunks are skipped.
+
+        Args:
+            pipeline: Sentiment pipeline (HF pipeline or OnnxTextClassifier)
+            chunks: Text chunks to score
+            batch_size: Chunks per forward pass
+            cache_key: Backend identity for memoization (None = no memo)
+
+        Returns:
+            Signed scores in chunk order (skipped chunks omitted)
+        """
+        # Truncate long chunks to avoid token limit
+        texts = [chunk[:MAX_CHUNK_CHARS] for chunk in chunks]
+        keys = [
+            (cache_key, hashlib.sha1(t.encode('utf-8')).hexdigest()) if cache_key is not None else None
+            for t in texts
+        ]
+
+        scores: Dict[int, float] = {}
+        if cache_key is not None:
+            with _score_cache_lock:
+                for i, key in enumerate(keys):
+                    if key in _score_cache:
+                        _score_cache.move_to_end(key)
+                        scores[i] = _score_cache[key]
+
+        # Score each distinct uncached text once
+        pending: Dict[str, List[int]] = {}
+        for i, t in enumerate(texts):
+            if i not in scores:
+                pending.setdefault(t, []).append(i)
+
+        if pending:
+            check_deadline()
+            unique = list(pending)
+            try:
+                # Pipeline returns: [{'label': 'POSITIVE', 'score': 0.9998}, ...]
+                results = pipeline(unique, batch_size=batch_size, truncation=True)
+                if len(results) != len(unique):
+                    raise ValueError("pipeline returned wrong number of results")
+            except Exception:
+                results = []
+                for t in unique:
+                    try:
+                        results.append(pipeline(t)[0])
+                    except Exception:
+                        # Skip problematic chunks
+                        results.append(None)
+
+            for t, result in zip(unique, results):
+                if result is None:
+                    continue
+                # Convert to numeric: POSITIVE = +score, NEGATIVE = -score
+                score = result['score']
+                if result['label'] == 'NEGATIVE':
+                    score = -score
+                for i in pending[t]:
+                    scores[i] = score
+
+            if cache_key is not None:
+                with _score_cache_lock:
+                    for t in unique:
+                        i = pending[t][0]
+                        if i in scores:
+                            _score_cache[keys[i]] = scores[i]
+                    while len(_score_cache) > SENTIMENT_CACHE_SIZE:
+                        _score_cache.popitem(last=False)
+
+        return [scores[i] for i in range(len(texts)) if i in scores]
+
+    def check_backend_drift(
+        self,
+        texts: List[str],
+        backend: str,
+        onnx_model_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Measure sentiment score drift of an inference backend against fp32 eager.
+
+        See utils.inference_backend.score_drift for the reported fields
+        (label agreement, max/mean score delta, within_tolerance).
+
+        Args:
+            texts: Representative text chunks to score
+            backend: Backend to validate ('int8' or 'onnx')
+            onnx_model_dir: Root of exported ONNX models (onnx backend only)
+
+        Returns:
+            Drift metrics dict
+        """
+        reference = self._score_chunks(build_sentiment_pipeline(DEFAULT_BACKEND), texts)
+        candidate = self._score_chunks(build_sentiment_pipeline(backend, onnx_model_dir), texts)
+        return {'backend': backend, **score_drift(reference, candidate)}
+
 
 # Backward compatibility alias
 SentimentAnalyzer = SentimentDimension
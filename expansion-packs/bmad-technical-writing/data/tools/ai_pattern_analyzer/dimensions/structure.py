@@ -18,8 +18,12 @@ import statistics
 from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.compact import IntSeries, Records
+from ai_pattern_analyzer.core.deadline import check_deadline
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+from ai_pattern_analyzer.core.document_context import context_for
 from ai_pattern_analyzer.core.results import HeadingIssue
+from ai_pattern_analyzer.utils.line_index import LineIndex
 from ai_pattern_analyzer.scoring.dual_score import THRESHOLDS
 from ai_pattern_analyzer.scoring.domain_thresholds import (
     DocumentDomain,
@@ -75,6 +79,16 @@ class StructureDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes heading structure, section organization, and list patterns"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """Heading count decides when convergent sampling stops."""
+        return ('headings', 'total')
+
+    @property
+    def required_artifacts(self) -> Tuple[str, ...]:
+        """Markdown AST shared with the blockquote/link/list/code-block analyses."""
+        return ('markdown_ast',)
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -96,6 +110,8 @@ class StructureDimension(DimensionStrategy):
             **kwargs: Additional parameters:
                 - word_count: Word count for AST methods
                 - domain: DocumentDomain enum for threshold selection (default: GENERAL)
+                - context/artifacts: DocumentContext and scheduler-built
+                  markdown_ast, reused when analyzing the full text
 
         Returns:
             Dict with structure analysis results
@@ -114,10 +130,11 @@ class StructureDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
                 # Phase 1-2: Basic structure analysis
                 structure = self._analyze_structure(sample_text)
                 headings = self._analyze_headings(sample_text)
@@ -178,15 +195,22 @@ class StructureDimension(DimensionStrategy):
                     'code_block_patterns': code_block_patterns,
                     'combined_structure_score': combined_score,
                 })
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
+            # Scheduler-built AST describes the full text only
+            document_ast = None
+            if context_for(analyzed_text, kwargs.get('context')) is not None:
+                document_ast = kwargs.get('artifacts', {}).get('markdown_ast')
+
             # Phase 1-2: Basic structure analysis
             structure = self._analyze_structure(analyzed_text)
             headings = self._analyze_headings(analyzed_text)
@@ -200,10 +224,10 @@ class StructureDimension(DimensionStrategy):
             heading_depth_var = self._calculate_heading_depth_variance(analyzed_text)
             code_blocks = self._analyze_code_blocks(analyzed_text)
             heading_hierarchy = self._analyze_heading_hierarchy_enhanced(analyzed_text)
-            blockquote_patterns = self._analyze_blockquote_patterns(analyzed_text, word_count)
-            link_anchor_quality = self._analyze_link_anchor_quality(analyzed_text, word_count)
-            enhanced_list_structure = self._analyze_enhanced_list_structure_ast(analyzed_text)
-            code_block_patterns = self._analyze_code_block_patterns_ast(analyzed_text)
+            blockquote_patterns = self._analyze_blockquote_patterns(analyzed_text, word_count, ast=document_ast)
+            link_anchor_quality = self._analyze_link_anchor_quality(analyzed_text, word_count, ast=document_ast)
+            enhanced_list_structure = self._analyze_enhanced_list_structure_ast(analyzed_text, ast=document_ast)
+            code_block_patterns = self._analyze_code_block_patterns_ast(analyzed_text, ast=document_ast)
 
             # Calculate multi-level combined score (if sufficient data available)
             combined_score = None
@@ -249,6 +273,7 @@ class StructureDimension(DimensionStrategy):
             }
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -256,6 +281,7 @@ class StructureDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
@@ -557,12 +583,12 @@ class StructureDimension(DimensionStrategy):
                 'score': 8.0,  # Benefit of doubt for insufficient data
                 'assessment': 'INSUFFICIENT_DATA',
                 'section_count': len(sections) - 1 if len(sections) > 1 else 0,
-                'section_lengths': [],
+                'section_lengths': IntSeries(),
                 'uniform_clusters': 0
             }
 
         # Count words per section (excluding heading line and preamble)
-        section_lengths = []
+        section_lengths = IntSeries()
         for section in sections[1:]:  # Skip preamble before first H2
             # Take only the content (skip the heading line itself)
             lines = section.split('n', 1)
@@ -723,9 +749,12 @@ class StructureDimension(DimensionStrategy):
         # Track all headings by level for parallelism detection
         headings_by_level = {}
 
-        for line_num, line in enumerate(lines, start=1):
+        # Only lines starting with '#' can be headings
+        index = LineIndex.of(lines, html_comment_checker)
+        for line_idx in index.headings.indices():
+            line_num, line = line_idx + 1, lines[line_idx]
             # Skip HTML comments (metadata)
-            if html_comment_checker and html_comment_checker(line):
+            if index.skipped(line_idx):
                 continue
 
             match = heading_pattern.match(line)
@@ -806,7 +835,7 @@ class StructureDimension(DimensionStrategy):
                 'distribution_pct': {'short': float, 'medium': float, 'long': float},
                 'score': float (0-10),
                 'assessment': str,
-                'headings': List[Dict],
+                'headings': Records of {'level', 'text', 'words'},
                 'count': int
             }
         """
@@ -820,7 +849,7 @@ class StructureDimension(DimensionStrategy):
                 'assessment': 'INSUFFICIENT_DATA',
                 'distribution': {'short': 0, 'medium': 0, 'long': 0},
                 'distribution_pct': {'short': 0.0, 'medium': 0.0, 'long': 0.0},
-                'headings': [],
+                'headings': Records(),
                 'count': 0
             }
 
@@ -863,7 +892,7 @@ class StructureDimension(DimensionStrategy):
             'distribution_pct': distribution_pct,
             'score': score,
             'assessment': assessment,
-            'headings': headings,
+            'headings': Records(headings),
             'count': total
         }
 
@@ -878,7 +907,7 @@ class StructureDimension(DimensionStrategy):
 
         Returns:
             {
-                'subsection_counts': List[int],
+                'subsection_counts': IntSeries,
                 'cv': float,
                 'score': float (0-8),
                 'assessment': str,
@@ -893,7 +922,7 @@ class StructureDimension(DimensionStrategy):
                 'cv': 0.0,
                 'score': 8.0,
                 'assessment': 'INSUFFICIENT_DATA',
-                'subsection_counts': [],
+                'subsection_counts': IntSeries(),
                 'uniform_count': 0,
                 'section_count': 0
             }
@@ -901,7 +930,7 @@ class StructureDimension(DimensionStrategy):
         # Build hierarchy - count H3s under each H2
         headings = [{'level': len(m[0]), 'text': m[1]} for m in matches]
 
-        subsection_counts = []
+        subsection_counts = IntSeries()
         current_h2_subsections = 0
         in_h2_section = False
 
@@ -982,7 +1011,7 @@ class StructureDimension(DimensionStrategy):
 
         Returns:
             {
-                'h4_counts': List[int],  # H4 counts under each H3
+                'h4_counts': IntSeries,  # H4 counts under each H3
                 'cv': float,
                 'score': float (0-6),
                 'assessment': str,
@@ -997,7 +1026,7 @@ class StructureDimension(DimensionStrategy):
                 'cv': 0.0,
                 'score': 6.0,
                 'assessment': 'INSUFFICIENT_DATA',
-                'h4_counts': [],
+                'h4_counts': IntSeries(),
                 'uniform_count': 0,
                 'h3_count': 0
             }
@@ -1005,7 +1034,7 @@ class StructureDimension(DimensionStrategy):
         # Build hierarchy - count H4s under each H3
         headings = [{'level': len(m[0]), 'text': m[1]} for m in matches]
 
-        h4_counts = []
+        h4_counts = IntSeries()
         current_h3_subsections = 0
         in_h3_section = False
 
@@ -1230,7 +1259,7 @@ class StructureDimension(DimensionStrategy):
             'heading_length_variance': round(length_variance, 2)
         }
 
-    def _analyze_blockquote_patterns(self, text: str, word_count: int) -> Dict:
+    def _analyze_blockquote_patterns(self, text: str, word_count: int, ast: Any = None) -> Dict:
         """
         Analyze blockquote usage patterns via AST.
         AI uses 2.7x more blockquotes than humans, often clustered at section starts.
@@ -1238,7 +1267,8 @@ class StructureDimension(DimensionStrategy):
         Returns dict with keys: total_blockquotes, per_page, avg_length,
         section_start_clustering, score, assessment
         """
-        ast = self._parse_to_ast(text, cache_key='blockquote')
+        if ast is None:
+            ast = self._parse_to_ast(text)
         if ast is None:
             # Fallback: basic count without AST
             bq_count = len(re.findall(r'^>\s+', text, re.MULTILINE))
@@ -1324,7 +1354,7 @@ class StructureDimension(DimensionStrategy):
 
         return count
 
-    def _analyze_link_anchor_quality(self, text: str, word_count: int) -> Dict:
+    def _analyze_link_anchor_quality(self, text: str, word_count: int, ast: Any = None) -> Dict:
         """
         Analyze link anchor text quality.
         AI defaults to generic CTAs, humans write descriptive anchors.
@@ -1332,7 +1362,8 @@ class StructureDimension(DimensionStrategy):
         Returns dict with keys: total_links, generic_count, generic_ratio,
         generic_examples, link_density, score, assessment
         """
-        ast = self._parse_to_ast(text, cache_key='links')
+        if ast is None:
+            ast = self._parse_to_ast(text)
         if ast is None:
             # Fallback to regex
             return self._analyze_link_anchor_quality_regex(text, word_count)
@@ -1446,7 +1477,7 @@ class StructureDimension(DimensionStrategy):
             'assessment': assessment
         }
 
-    def _analyze_enhanced_list_structure_ast(self, text: str) -> Dict:
+    def _analyze_enhanced_list_structure_ast(self, text: str, ast: Any = None) -> Dict:
         """
         Analyze list structure patterns via AST.
         AI creates symmetric lists, humans create asymmetric varied structures.
@@ -1454,7 +1485,8 @@ class StructureDimension(DimensionStrategy):
         Returns dict with keys: has_mixed_types, symmetry_score, avg_item_length,
         item_length_cv, score, assessment
         """
-        ast = self._parse_to_ast(text, cache_key='lists')
+        if ast is None:
+            ast = self._parse_to_ast(text)
         if ast is None:
             # Fallback: assume good if AST unavailable
             return {'score': 8.0, 'assessment': 'AST_UNAVAILABLE'}
@@ -1522,7 +1554,7 @@ class StructureDimension(DimensionStrategy):
             'assessment': assessment
         }
 
-    def _analyze_code_block_patterns_ast(self, text: str) -> Dict:
+    def _analyze_code_block_patterns_ast(self, text: str, ast: Any = None) -> Dict:
         """
         Analyze code block patterns via AST.
         AI often omits language declarations, uses uniform lengths.
@@ -1530,7 +1562,8 @@ class StructureDimension(DimensionStrategy):
         Returns dict with keys: total_blocks, with_language,
         language_declaration_ratio, avg_length, length_cv, score, assessment
         """
-        ast = self._parse_to_ast(text, cache_key='code')
+        if ast is None:
+            ast = self._parse_to_ast(text)
         if ast is None:
             # Fallback to regex
             return self._analyze_code_block_patterns_regex(text)
@@ -8,14 +8,14 @@ Analyzes syntactic complexity and patterns:
 - POS diversity
 - Syntactic repetition (structural patterns)
 
-Requires optional dependency: spaCy
+Requires optional dependency: spaCy (shared lazily-loaded pipeline, see
+utils/spacy_service.py)
 
 Research: +10% accuracy improvement with enhanced syntactic features
 
 Refactored in Story 1.4 to use DimensionStrategy pattern with self-registration.
 """
 
-import re
 import sys
 import statistics
 from typing import Dict, List, Any, Tuple, Optional
@@ -23,11 +23,13 @@ from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
 from ai_pattern_analyzer.core.results import SyntacticIssue
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import DeadlineExceeded
+from ai_pattern_analyzer.core.findings import Findings, strip_matches
 from ai_pattern_analyzer.scoring.dual_score import THRESHOLDS
+from ai_pattern_analyzer.utils import spacy_service
 
-# Required imports
-import spacy
-nlp_spacy = spacy.load('en_core_web_sm')
+# Lines per nlp.pipe batch in detailed (line-level) analysis
+DETAILED_PIPE_BATCH_SIZE = 64
 
 
 class SyntacticDimension(DimensionStrategy):
@@ -73,6 +75,20 @@ class SyntacticDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes syntactic complexity, dependency depth, and structural patterns"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """Subordination index decides when convergent sampling stops."""
+        return ('subordination_index',)
+
+    @property
+    def required_artifacts(self) -> Tuple[str, ...]:
+        """spaCy Docs for the prepared samples (shared with advanced lexical)."""
+        return ('spacy_docs',)
+
+    def warm_up(self, config: Optional[AnalysisConfig] = None) -> None:
+        """Load the shared spaCy pipeline ahead of analyze()."""
+        spacy_service.get_nlp()
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -122,25 +138,37 @@ class SyntacticDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
-                syntactic_metrics = self._analyze_syntactic_patterns(sample_text)
-                sample_results.append(syntactic_metrics)
+            # Each round of samples is parsed in one batch
+            for batch in draw.rounds(sample_results):
+                docs = self._parse_samples([sample_text for _, sample_text in batch], config)
+                for (position, sample_text), doc in zip(batch, docs):
+                    syntactic_metrics = self._analyze_syntactic_patterns(sample_text, doc=doc)
+                    sample_results.append(syntactic_metrics)
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_syntactic_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            syntactic_metrics = self._analyze_syntactic_patterns(analyzed_text)
+            doc = self._parse_samples([analyzed_text], config)[0]
+            findings = kwargs.get('findings')
+            if doc is not None and findings is not None and findings.records(analyzed_text):
+                # Sentences (with their text offsets) for detailed analysis
+                _, offsets = strip_matches(spacy_service.CODE_BLOCK_PATTERN, analyzed_text)
+                findings.record('sentences', [(offsets.to_original(sent.start_char), sent) for sent in doc.sents])
+            syntactic_metrics = self._analyze_syntactic_patterns(analyzed_text, doc=doc)
             aggregated = syntactic_metrics
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -149,23 +177,27 @@ class SyntacticDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
         }
 
-    def analyze_detailed(self, lines: List[str], html_comment_checker=None) -> List[SyntacticIssue]:
+    def analyze_detailed(self, lines: List[str], html_comment_checker=None,
+                         findings: Optional[Findings] = None) -> List[SyntacticIssue]:
         """
         Detailed analysis with line numbers and suggestions.
 
         Args:
             lines: Text split into lines
             html_comment_checker: Function to check if line is in HTML comment
+            findings: Recorder of the standard pass over the same text (sentences
+                it parsed are reused instead of parsing the lines again)
 
         Returns:
             List of SyntacticIssue objects
         """
-        return self._analyze_syntactic_issues_detailed(lines, html_comment_checker)
+        return self._analyze_syntactic_issues_detailed(lines, html_comment_checker, findings=findings)
 
     def score(self, analysis_results: Dict[str, Any]) -> tuple:
         """
@@ -297,7 +329,27 @@ class SyntacticDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_syntactic_patterns(self, text: str) -> Dict:
+    @staticmethod
+    def _parse_samples(texts: List[str], config: AnalysisConfig) -> List[Any]:
+        """
+        Parse code-stripped samples in one nlp.pipe pass via the shared spaCy service.
+
+        Returns None for every sample if parsing fails (each sample then
+        reports its own failure in _analyze_syntactic_patterns).
+        """
+        try:
+            return spacy_service.parse_many(
+                [spacy_service.strip_code_blocks(text) for text in texts],
+                batch_size=config.spacy_batch_size,
+                n_process=config.spacy_n_process
+            )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            print(f"Warning: spaCy batch parsing failed: {e}", file=sys.stderr)
+            return [None] * len(texts)
+
+    def _analyze_syntactic_patterns(self, text: str, doc: Any = None) -> Dict:
         """
         Enhanced syntactic analysis using spaCy.
 
@@ -312,16 +364,15 @@ class SyntacticDimension(DimensionStrategy):
 
         Args:
             text: Text to analyze (pre-truncated/sampled by caller)
+            doc: Pre-parsed spaCy Doc of the code-stripped text (None = parse here)
 
         Returns:
             Dict with syntactic metrics
         """
         try:
-            # Remove code blocks
-            text = re.sub(r'```[\s\S]*?```', '', text)
-
-            # Process with spaCy (now processes full text, pre-truncated/sampled by caller)
-            doc = nlp_spacy(text)
+            if doc is None:
+                # Remove code blocks, then parse via the shared (cached) pipeline
+                doc = spacy_service.parse(spacy_service.strip_code_blocks(text))
 
             # Extract sentence structures (POS patterns)
             sentence_structures = []
@@ -446,71 +497,90 @@ class SyntacticDimension(DimensionStrategy):
             'morphological_richness': sum(morphological_counts)  # Sum of unique lemmas from each sample
         }
 
-    def _analyze_syntactic_issues_detailed(self, lines: List[str], html_comment_checker=None) -> List[SyntacticIssue]:
-        """Detect syntactic complexity issues (passive voice, shallow trees, low subordination)."""
+    def _analyze_syntactic_issues_detailed(self, lines: List[str], html_comment_checker=None,
+                                           findings: Optional[Findings] = None) -> List[SyntacticIssue]:
+        """
+        Detect syntactic complexity issues (passive voice, shallow trees, low subordination).
+
+        Sentences recorded by a whole-document standard pass in findings are
+        checked on the line they start on; otherwise eligible lines are parsed
+        here in one nlp.pipe pass.
+        """
         issues = []
 
-        try:
-            for line_num, line in enumerate(lines, start=1):
-                stripped = line.strip()
+        def eligible(line: str) -> bool:
+            # Skip HTML comments (metadata), headings, code blocks, and short lines
+            stripped = line.strip()
+            if html_comment_checker and html_comment_checker(line):
+                return False
+            return len(stripped) >= 20 and not (stripped.startswith('#') or stripped.startswith('```'))
 
-                # Skip HTML comments (metadata), headings, code blocks, and short lines
-                if html_comment_checker and html_comment_checker(line):
-                    continue
-                if not stripped or stripped.startswith('#') or stripped.startswith('```') or len(stripped) < 20:
+        try:
+            recorded = findings.get('sentences') if findings is not None else None
+            if recorded is not None:
+                sentences = []
+                for offset, sent in recorded:
+                    line_index = findings.line_index(offset)
+                    if line_index < len(lines) and eligible(lines[line_index]):
+                        sentences.append((line_index + 1, sent))
+            else:
+                candidates = [(line_num, line.strip()) for line_num, line in enumerate(lines, start=1)
+                              if eligible(line)]
+                docs = spacy_service.get_nlp().pipe(
+                    [stripped for _, stripped in candidates],
+                    batch_size=DETAILED_PIPE_BATCH_SIZE
+                )
+                sentences = ((line_num, sent) for (line_num, _), doc in zip(candidates, docs)
+                             for sent in doc.sents)
+
+            for line_num, sent in sentences:
+                sent_text = sent.text.strip()
+                if len(sent_text) < 10:
                     continue
 
-                # Parse sentences on this line
-                doc = nlp_spacy(stripped)
-
-                for sent in doc.sents:
-                    sent_text = sent.text.strip()
-                    if len(sent_text) < 10:
-                        continue
-
-                    # Check for passive constructions
-                    has_passive = any(token.dep_ in ['nsubjpass', 'auxpass'] for token in sent)
-                    if has_passive:
-                        issues.append(SyntacticIssue(
-                            line_number=line_num,
-                            sentence=sent_text[:100] + '...' if len(sent_text) > 100 else sent_text,
-                            issue_type='passive',
-                            metric_value=1.0,
-                            problem='Passive voice construction (AI tends to overuse)',
-                            suggestion='Convert to active voice - identify actor and make them the subject'
-                        ))
-
-                    # Check for shallow dependency trees (depth < 3)
-                    max_depth = 0
-                    for token in sent:
-                        depth = 1
-                        current = token
-                        while current.head != current:
-                            depth += 1
-                            current = current.head
-                        max_depth = max(max_depth, depth)
-
-                    if max_depth < 3 and len(sent) > 10:
-                        issues.append(SyntacticIssue(
-                            line_number=line_num,
-                            sentence=sent_text[:100] + '...' if len(sent_text) > 100 else sent_text,
-                            issue_type='shallow',
-                            metric_value=max_depth,
-                            problem=f'Shallow syntax (depth={max_depth}, human avg=4-6)',
-                            suggestion='Add subordinate clauses, relative clauses, or prepositional phrases'
-                        ))
-
-                    # Check for low subordination (no subordinate clauses)
-                    subordinate_count = sum(1 for token in sent if token.dep_ in ['advcl', 'ccomp', 'xcomp', 'acl', 'relcl'])
-                    if subordinate_count == 0 and len(sent) > 15:
-                        issues.append(SyntacticIssue(
-                            line_number=line_num,
-                            sentence=sent_text[:100] + '...' if len(sent_text) > 100 else sent_text,
-                            issue_type='subordination',
-                            metric_value=0.0,
-                            problem='No subordinate clauses (simple construction)',
-                            suggestion='Add "because", "while", "although", or "when" clauses for complexity'
-                        ))
+                # Check for passive constructions
+                has_passive = any(token.dep_ in ['nsubjpass', 'auxpass'] for token in sent)
+                if has_passive:
+                    issues.append(SyntacticIssue(
+                        line_number=line_num,
+                        sentence=sent_text[:100] + '...' if len(sent_text) > 100 else sent_text,
+                        issue_type='passive',
+                        metric_value=1.0,
+                        problem='Passive voice construction (AI tends to overuse)',
+                        suggestion='Convert to active voice - identify actor and make them the subject'
+                    ))
+
+                # Check for shallow dependency trees (depth < 3)
+                max_depth = 0
+                for token in sent:
+                    depth = 1
+                    current = token
+                    while current.head != current:
+                        depth += 1
+                        current = current.head
+                    max_depth = max(max_depth, depth)
+
+                if max_depth < 3 and len(sent) > 10:
+                    issues.append(SyntacticIssue(
+                        line_number=line_num,
+                        sentence=sent_text[:100] + '...' if len(sent_text) > 100 else sent_text,
+                        issue_type='shallow',
+                        metric_value=max_depth,
+                        problem=f'Shallow syntax (depth={max_depth}, human avg=4-6)',
+                        suggestion='Add subordinate clauses, relative clauses, or prepositional phrases'
+                    ))
+
+                # Check for low subordination (no subordinate clauses)
+                subordinate_count = sum(1 for token in sent if token.dep_ in ['advcl', 'ccomp', 'xcomp', 'acl', 'relcl'])
+                if subordinate_count == 0 and len(sent) > 15:
+                    issues.append(SyntacticIssue(
+                        line_number=line_num,
+                        sentence=sent_text[:100] + '...' if len(sent_text) > 100 else sent_text,
+                        issue_type='subordination',
+                        metric_value=0.0,
+                        problem='No subordinate clauses (simple construction)',
+                        suggestion='Add "because", "while", "although", or "when" clauses for complexity'
+                    ))
 
         except Exception as e:
             print(f"Warning: Syntactic analysis failed: {e}", file=sys.stderr)
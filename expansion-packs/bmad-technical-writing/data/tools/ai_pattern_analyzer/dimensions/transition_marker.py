@@ -21,8 +21,12 @@ import re
 from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import check_deadline
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+from ai_pattern_analyzer.core.document_context import context_for
 from ai_pattern_analyzer.core.results import TransitionInstance  # Story 2.0: Use TransitionInstance (StylometricIssue removed in v5.0.0)
+from ai_pattern_analyzer.utils.line_index import LineIndex
+from ai_pattern_analyzer.utils.pattern_matching import TRANSITION_MARKERS, lexicon_matcher
 
 
 class TransitionMarkerDimension(DimensionStrategy):
@@ -71,6 +75,11 @@ class TransitionMarkerDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes AI-specific transition markers (however, moreover) and clustering patterns"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """AI transition markers per 1k words decides when convergent sampling stops."""
+        return ('total_ai_markers_per_1k',)
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -110,17 +119,20 @@ class TransitionMarkerDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
                 transition_markers = self._analyze_transition_markers(sample_text, **kwargs)
                 sample_results.append(transition_markers)
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
@@ -129,6 +141,7 @@ class TransitionMarkerDimension(DimensionStrategy):
             aggregated = transition_markers
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -136,6 +149,7 @@ class TransitionMarkerDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
@@ -285,16 +299,19 @@ class TransitionMarkerDimension(DimensionStrategy):
         """
         result = {}
 
-        # Count AI-specific markers: however and moreover
-        however_pattern = re.compile(r'\bhowever\b', re.IGNORECASE)
-        moreover_pattern = re.compile(r'\bmoreover\b', re.IGNORECASE)
-
-        however_count = len(however_pattern.findall(text))
-        moreover_count = len(moreover_pattern.findall(text))
+        # Count AI-specific markers: however and moreover (one scan)
+        however_matches, moreover_matches = lexicon_matcher(
+            transition_markers=tuple(TRANSITION_MARKERS)
+        ).scan(text)['transition_markers']
+        however_count = len(however_matches)
+        moreover_count = len(moreover_matches)
 
         # Calculate per 1k words
-        # Use pre-calculated word_count if provided, otherwise calculate
+        # Use pre-calculated word_count if provided, then the shared context, otherwise calculate
         total_words = kwargs.get('word_count', None)
+        context = context_for(text, kwargs.get('context'))
+        if total_words is None and context is not None:
+            total_words = context.word_count
         if total_words is None:
             total_words = len(re.findall(r'\b\w+\b', text))
 
@@ -312,50 +329,48 @@ class TransitionMarkerDimension(DimensionStrategy):
         """Detect AI-specific stylometric markers (however, moreover, clustering)."""
         issues = []
 
-        # Track "however" and "moreover" usage
-        however_pattern = re.compile(r'\bhowever\b', re.IGNORECASE)
-        moreover_pattern = re.compile(r'\bmoreover\b', re.IGNORECASE)
+        # Track "however" and "moreover" usage: one scan of all lines
+        index = LineIndex.of(lines, html_comment_checker)
+        however_matches, moreover_matches = lexicon_matcher(
+            transition_markers=tuple(TRANSITION_MARKERS)
+        ).scan(index.text)['transition_markers']
 
         # Count total words for frequency calculation
-        total_words = sum(len(re.findall(r'\b\w+\b', line)) for line in lines)
+        total_words = len(re.findall(r'\b\w+\b', index.text))
         words_in_thousands = total_words / 1000 if total_words > 0 else 1
 
-        for line_num, line in enumerate(lines, start=1):
-            stripped = line.strip()
-
+        # Marker lines in line order, "however" before "moreover" on a line
+        markers = sorted(
+            [(index.line_index(start), 0) for start, _, _ in however_matches]
+            + [(index.line_index(start), 1) for start, _, _ in moreover_matches]
+        )
+        for line_idx, marker in markers:
             # Skip HTML comments (metadata), headings, and code blocks
-            if html_comment_checker and html_comment_checker(line):
-                continue
-            if stripped.startswith('#') or stripped.startswith('```'):
+            if index.skipped(line_idx, headings=True, fences=True):
                 continue
 
-            # Check for "however" (AI: 5-10 per 1k, Human: 1-3 per 1k)
-            however_matches = list(however_pattern.finditer(line))
-            for match in however_matches:
-                context = line.strip()
+            context = lines[line_idx].strip()
+            if marker == 0:
+                # "however" (AI: 5-10 per 1k, Human: 1-3 per 1k)
                 # Story 2.0: Use TransitionInstance (StylometricIssue removed in v5.0.0)
                 issues.append(TransitionInstance(
-                    line_number=line_num,
+                    line_number=line_idx + 1,
                     transition='however',
                     context=context[:120] + '...' if len(context) > 120 else context,
                     suggestions=['Replace with: "But", "Yet", "Still"', 'Use natural flow without transition']
                 ))
-
-            # Check for "moreover" (AI: 3-7 per 1k, Human: 0-1 per 1k)
-            moreover_matches = list(moreover_pattern.finditer(line))
-            for match in moreover_matches:
-                context = line.strip()
+            else:
+                # "moreover" (AI: 3-7 per 1k, Human: 0-1 per 1k)
                 # Story 2.0: Use TransitionInstance (StylometricIssue removed in v5.0.0)
                 issues.append(TransitionInstance(
-                    line_number=line_num,
+                    line_number=line_idx + 1,
                     transition='moreover',
                     context=context[:120] + '...' if len(context) > 120 else context,
                     suggestions=['Replace with: "Also", "And", "Plus"', 'Remove transition entirely']
                 ))
 
         # Check for clusters (multiple "however" in close proximity)
-        however_lines = [i for i, line in enumerate(lines, start=1)
-                        if however_pattern.search(line)]
+        however_lines = sorted({index.line_index(start) + 1 for start, _, _ in however_matches})
         for i in range(len(however_lines) - 1):
             if however_lines[i+1] - however_lines[i] <= 3:  # Within 3 lines
                 # Story 2.0: Use TransitionInstance (StylometricIssue removed in v5.0.0)
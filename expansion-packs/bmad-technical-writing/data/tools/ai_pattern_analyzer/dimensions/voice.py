@@ -16,8 +16,11 @@ import re
 from typing import Dict, List, Any, Optional, Tuple
 from ai_pattern_analyzer.dimensions.base_strategy import DimensionStrategy
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, DEFAULT_CONFIG
+from ai_pattern_analyzer.core.deadline import check_deadline
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+from ai_pattern_analyzer.core.document_context import DocumentContext, context_for
 from ai_pattern_analyzer.scoring.dual_score import THRESHOLDS
+from ai_pattern_analyzer.utils.pattern_matching import lexicon_matcher
 
 
 class VoiceDimension(DimensionStrategy):
@@ -72,6 +75,11 @@ class VoiceDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes personal voice, conversational tone, and domain expertise"
 
+    @property
+    def sampling_metric(self) -> Tuple[str, ...]:
+        """First-person usage decides when convergent sampling stops."""
+        return ('voice', 'first_person')
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -103,26 +111,31 @@ class VoiceDimension(DimensionStrategy):
 
         # Handle sampled analysis (returns list of (position, sample_text) tuples)
         if isinstance(prepared, list):
-            samples = prepared
+            draw = self._sample_draw(prepared, config)
             sample_results = []
 
-            for position, sample_text in samples:
+            for position, sample_text in draw.draw(sample_results):
+                check_deadline(kwargs.get('deadline'))
                 voice = self._analyze_voice(sample_text)
                 technical = self._analyze_technical_depth(sample_text)
                 sample_results.append({
                     'voice': voice,
                     'technical_depth': technical
                 })
+            samples = draw.drawn
 
             # Aggregate metrics from all samples
             aggregated = self._aggregate_sampled_metrics(sample_results)
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
+            sampling = draw.summary(sample_results)
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            voice = self._analyze_voice(analyzed_text)
+            voice = self._analyze_voice(
+                analyzed_text, context=context_for(analyzed_text, kwargs.get('context'))
+            )
             technical = self._analyze_technical_depth(analyzed_text)
             aggregated = {
                 'voice': voice,
@@ -130,6 +143,7 @@ class VoiceDimension(DimensionStrategy):
             }
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
+            sampling = None
 
         # Add consistent metadata
         return {
@@ -137,6 +151,7 @@ class VoiceDimension(DimensionStrategy):
             'available': True,
             'analysis_mode': config.mode.value,
             'samples_analyzed': samples_analyzed,
+            'sampling': sampling,
             'total_text_length': total_text_length,
             'analyzed_text_length': analyzed_length,
             'coverage_percentage': (analyzed_length / total_text_length * 100.0) if total_text_length > 0 else 0.0
@@ -336,8 +351,8 @@ class VoiceDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_voice(self, text: str) -> Dict:
-        """Analyze voice and authenticity markers."""
+    def _analyze_voice(self, text: str, context: Optional[DocumentContext] = None) -> Dict:
+        """Analyze voice and authenticity markers (word count from context if given)."""
         first_person = len(re.findall(
             r"\b(I|we|my|our|us|me|I've|I'm|we've|I'd|we're|I'll|we'll)\b",
             text, re.IGNORECASE
@@ -355,8 +370,10 @@ class VoiceDimension(DimensionStrategy):
         ))
 
         # Calculate actual word count for accurate ratio calculation
-        words = re.findall(r'\b\w+\b', text)
-        total_words = len(words)
+        if context is not None:
+            total_words = context.word_count
+        else:
+            total_words = len(re.findall(r'\b\w+\b', text))
 
         return {
             'first_person': first_person,
@@ -368,9 +385,10 @@ class VoiceDimension(DimensionStrategy):
     def _analyze_technical_depth(self, text: str) -> Dict:
         """Analyze technical domain expertise signals."""
         terms_found = []
-        for pattern in self.domain_terms:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            terms_found.extend([m.group() for m in matches])
+        if self.domain_terms:
+            # Every domain term in one scan (matcher built once per term list)
+            matches = lexicon_matcher(domain_terms=tuple(self.domain_terms)).scan(text)['domain_terms']
+            terms_found = [term for term_matches in matches for _, _, term in term_matches]
 
         return {
             'count': len(terms_found),
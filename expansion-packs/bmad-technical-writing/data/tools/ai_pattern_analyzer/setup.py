@@ -38,10 +38,16 @@ setup(
             "pytest-cov>=4.1.0",
             "pytest-timeout>=2.2.0",
         ],
+        "onnx": [
+            "onnxruntime>=1.16.0",
+            "onnx>=1.14.0",
+            "onnxscript>=0.1.0",
+        ],
     },
     entry_points={
         "console_scripts": [
             "analyze-ai-patterns=ai_pattern_analyzer.cli.main:main",
+            "ai-pattern-benchmark=ai_pattern_analyzer.cli.benchmark:main",
         ],
     },
     classifiers=[
@@ -368,10 +368,8 @@ def test_multiple_legacy_and_new_dimensions_coexist():
     assert new1 is not new2
 
 
-def test_dimension_instances_do_not_share_state(sample_text):
-    """Verify dimension instances maintain independent state."""
-    lines = sample_text.split('\n')
-
+def test_dimension_instances_share_document_ast(sample_text):
+    """Verify dimension instances share one parse per document, keyed by content."""
     # Create two new dimensions
     dim1 = NewDimension()
     dim2 = NewDimension()
@@ -380,11 +378,10 @@ def test_dimension_instances_do_not_share_state(sample_text):
     ast1 = dim1._parse_to_ast(sample_text, cache_key='dim1')
     ast2 = dim2._parse_to_ast(sample_text, cache_key='dim2')
 
-    # Each should have its own cache
-    assert 'dim1' in dim1._ast_cache
-    assert 'dim1' not in dim2._ast_cache
-    assert 'dim2' in dim2._ast_cache
-    assert 'dim2' not in dim1._ast_cache
+    # One parse of the document, no per-instance caches
+    assert ast1 is ast2
+    assert not hasattr(dim1, '_ast_cache')
+    assert dim1._parse_to_ast(sample_text + "\nMore.") is not ast1
 
 
 # ============================================================================
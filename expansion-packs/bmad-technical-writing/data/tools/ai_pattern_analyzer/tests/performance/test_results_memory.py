@@ -0,0 +1,19 @@
+"""
+Results memory: a batch of compact AnalysisResults must stay well below the
+same results stored as plain lists and dicts.
+
+Runs the memory benchmark (core/benchmark.py) on a small book; the full
+20-chapter batch is `ai-pattern-benchmark memory`.
+"""
+
+import pytest
+from ai_pattern_analyzer.core.benchmark import measure_results_memory
+
+
+@pytest.mark.slow
+def test_compact_results_memory():
+    """Test compact results retain at most 75% of the list representation and serialize with a lower peak."""
+    report = measure_results_memory(chapters=5, words=5_000, profile='fast', mode='full')
+
+    assert report['retained_ratio'] < 0.75, report['representations']
+    assert report['serialize_peak_ratio'] < 1.0, report['representations']
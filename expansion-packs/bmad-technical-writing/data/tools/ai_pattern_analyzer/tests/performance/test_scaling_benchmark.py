@@ -0,0 +1,21 @@
+"""
+Scaling tests: no fast-profile dimension or pipeline may scale superlinearly.
+
+Runs the scaling benchmark harness (core/benchmark.py) on small generated
+documents; the full 1k-1M word suite is `ai-pattern-benchmark run`.
+"""
+
+import pytest
+from ai_pattern_analyzer.core.benchmark import SUPERLINEAR_EXPONENT, run_benchmarks
+
+
+@pytest.mark.slow
+def test_fast_profile_scales_linearly():
+    """Test every fast-profile series fits an exponent below SUPERLINEAR_EXPONENT."""
+    report = run_benchmarks(sizes=(2_000, 8_000, 32_000), profiles=('fast',), modes=('full',), repeat=2)
+
+    exponents = {key: series['exponent'] for key, series in report['series'].items()}
+    assert 'pipeline:fast@full' in exponents
+    assert {'dimension:perplexity@full', 'dimension:structure@full'} <= set(exponents)
+    superlinear = {key: k for key, k in exponents.items() if k is not None and k > SUPERLINEAR_EXPONENT}
+    assert not superlinear, f"Superlinear scaling: {superlinear}"
@@ -0,0 +1,123 @@
+"""
+Startup performance tests for package import, CLI and dimension profiles.
+
+Each scenario runs in a fresh interpreter (the test process has already
+imported everything), reports its wall time and the heavy ML libraries that
+ended up in sys.modules.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+HEAVY_MODULES = ('torch', 'transformers', 'spacy', 'textacy', 'scipy', 'nltk', 'textstat')
+
+# Generous bounds: measured ~0.1s for imports, fast profile analysis well under 1s
+IMPORT_BUDGET_SECONDS = 1.0
+FAST_PROFILE_BUDGET_SECONDS = 3.0
+
+
+def run_isolated(body: str) -> dict:
+    """Run `body` in a fresh interpreter; return elapsed time and heavy modules loaded."""
+    script = textwrap.dedent("""
+        import json, sys, time
+        start = time.perf_counter()
+    """) + textwrap.dedent(body) + textwrap.dedent(f"""
+        elapsed = time.perf_counter() - start
+        heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+        print(json.dumps({{'elapsed': elapsed, 'heavy': heavy}}))
+    """)
+    completed = subprocess.run(
+        [sys.executable, '-c', script],
+        capture_output=True, text=True, timeout=120
+    )
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestStartupImports:
+    """Package and CLI import must not pull in heavy ML libraries."""
+
+    def test_package_import_is_lazy(self):
+        """Test `import ai_pattern_analyzer` loads no heavy libraries."""
+        result = run_isolated("import ai_pattern_analyzer")
+
+        assert result['heavy'] == []
+        assert result['elapsed'] < IMPORT_BUDGET_SECONDS
+
+    def test_lazy_exports_resolve(self):
+        """Test public names still resolve from the package."""
+        import ai_pattern_analyzer
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        assert ai_pattern_analyzer.AIPatternAnalyzer is AIPatternAnalyzer
+        assert 'format_report' in dir(ai_pattern_analyzer)
+        with pytest.raises(AttributeError):
+            ai_pattern_analyzer.not_a_real_name
+
+    def test_cli_help_is_fast(self):
+        """Test `--help` loads no heavy libraries."""
+        result = run_isolated("""
+            import contextlib, io
+            from ai_pattern_analyzer.cli.main import main
+            with contextlib.redirect_stdout(io.StringIO()):
+                try:
+                    main(['--help'])
+                except SystemExit:
+                    pass
+        """)
+
+        assert result['heavy'] == []
+        assert result['elapsed'] < IMPORT_BUDGET_SECONDS
+
+    def test_cli_dry_run_loads_no_dimensions(self, tmp_path):
+        """Test `--dry-run` shows the config without loading ML dimensions."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Title\n\nSome text.\n")
+
+        result = run_isolated(f"""
+            import contextlib, io
+            from ai_pattern_analyzer.cli.main import main
+            with contextlib.redirect_stdout(io.StringIO()):
+                try:
+                    main([{str(doc)!r}, '--dry-run', '--profile', 'full'])
+                except SystemExit:
+                    pass
+        """)
+
+        assert result['heavy'] == []
+
+
+class TestProfileStartup:
+    """Dimension profiles import only the libraries their dimensions need."""
+
+    def test_fast_profile_never_imports_torch_or_spacy(self):
+        """Test the fast profile analyzes text without torch, transformers or spacy."""
+        result = run_isolated("""
+            from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+            from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+            config = AnalysisConfig(dimension_profile='fast')
+            analyzer = AIPatternAnalyzer(config=config)
+            analyzer.analyze_text("# Title\\n\\nFirst sentence here. Second one follows.", config=config)
+        """)
+
+        assert 'torch' not in result['heavy']
+        assert 'transformers' not in result['heavy']
+        assert 'spacy' not in result['heavy']
+        assert result['heavy'] == []
+        assert result['elapsed'] < FAST_PROFILE_BUDGET_SECONDS
+
+    def test_balanced_profile_does_not_import_spacy(self):
+        """Test spaCy (syntactic, advanced lexical) stays out of the balanced profile."""
+        result = run_isolated("""
+            from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+            from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+            AIPatternAnalyzer(config=AnalysisConfig(dimension_profile='balanced'))
+        """)
+
+        assert 'spacy' not in result['heavy']
+        assert 'torch' not in result['heavy']
@@ -0,0 +1,97 @@
+"""
+Unit tests for the `serve` command and daemon forwarding in the CLI.
+
+Tests cover:
+- `analyze-ai-patterns serve` dispatch and option validation
+- Single-file and batch analyses forwarded to a running daemon
+- --no-daemon analyzing in-process
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from ai_pattern_analyzer.cli.main import main
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.benchmark import generate_document
+from ai_pattern_analyzer.core.daemon import AnalysisDaemon
+
+FAST = AnalysisConfig(mode=AnalysisMode.FAST, dimension_profile='fast')
+FAST_ARGS = ['--mode', 'fast', '--profile', 'fast']
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    """Running daemon that the CLI finds through AI_PATTERN_DAEMON."""
+    daemon = AnalysisDaemon('127.0.0.1:0', config=FAST)
+    daemon.start()
+    monkeypatch.setenv('AI_PATTERN_DAEMON', daemon.address)
+    yield daemon
+    daemon.close()
+
+
+@pytest.fixture
+def chapters(tmp_path):
+    for i in range(2):
+        (tmp_path / f'ch{i}.md').write_text(generate_document(800 + 200 * i))
+    return tmp_path
+
+
+class TestServeCommand:
+    """Tests for `analyze-ai-patterns serve`."""
+
+    def test_serve_help(self):
+        result = CliRunner().invoke(main, ['serve', '--help'])
+
+        assert result.exit_code == 0
+        assert 'Run the local analysis daemon' in result.output
+        assert '--queue-size' in result.output
+
+    def test_socket_and_port_are_exclusive(self, tmp_path):
+        result = CliRunner().invoke(main, ['serve', '--socket', str(tmp_path / 'd.sock'), '--port', '0'])
+
+        assert result.exit_code == 2
+        assert 'mutually exclusive' in result.output
+
+    def test_invalid_preload(self):
+        result = CliRunner().invoke(main, ['serve', '--preload', 'fast,turbo'])
+
+        assert result.exit_code == 2
+
+
+class TestForwarding:
+    """Tests for analyses forwarded to a running daemon."""
+
+    def test_single_file_json(self, daemon, chapters):
+        chapter = str(chapters / 'ch0.md')
+
+        result = CliRunner().invoke(main, [chapter, '--format', 'json', '--no-score-summary'] + FAST_ARGS)
+
+        assert result.exit_code == 0, result.output
+        assert daemon.metrics.requests[('/analyze-file', 200)] == 1
+        # The daemon runs in this process, so its stderr log follows the report
+        report = json.JSONDecoder().raw_decode(result.output)[0]
+        assert report['file_path'] == chapter and report['total_words'] > 0
+
+    def test_single_file_text_saves_history(self, daemon, chapters):
+        result = CliRunner().invoke(main, [str(chapters / 'ch1.md'), '--history-notes', 'daemon run'] + FAST_ARGS)
+
+        assert result.exit_code == 0, result.output
+        assert f'Analysis daemon: {daemon.address}' in result.output
+        history = json.loads((chapters / '.ai-analysis-history' / 'ch1.history.json').read_text())
+        assert [entry['notes'] for entry in history['scores']] == ['daemon run']
+
+    def test_batch(self, daemon, chapters):
+        result = CliRunner().invoke(main, ['--batch', str(chapters), '--format', 'tsv'] + FAST_ARGS)
+
+        assert result.exit_code == 0, result.output
+        assert daemon.metrics.requests[('/batch', 200)] == 1
+        assert 'Analyzed: ch0.md' in result.output and 'Analyzed: ch1.md' in result.output
+
+    def test_no_daemon_analyzes_locally(self, daemon, chapters):
+        result = CliRunner().invoke(main, [str(chapters / 'ch0.md'), '--format', 'json', '--no-daemon']
+                                    + FAST_ARGS)
+
+        assert result.exit_code == 0, result.output
+        assert ('/analyze-file', 200) not in daemon.metrics.requests
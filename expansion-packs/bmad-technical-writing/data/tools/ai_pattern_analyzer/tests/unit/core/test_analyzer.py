@@ -17,6 +17,7 @@ import pytest
 import tempfile
 from pathlib import Path
 from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
 from ai_pattern_analyzer.core.results import AnalysisResults, DetailedAnalysis
 from ai_pattern_analyzer.scoring.dual_score import DualScore
 from ai_pattern_analyzer.history.tracker import ScoreHistory
@@ -113,9 +114,9 @@ class TestInitialization:
         """Test that HTML comment regex pattern is compiled."""
         assert analyzer._html_comment_pattern is not None
 
-    def test_init_creates_ast_cache(self, analyzer):
-        """Test that AST cache is initialized."""
-        assert analyzer._ast_cache == {}
+    def test_init_has_no_private_ast_cache(self, analyzer):
+        """Test that ASTs are cached by markdown_service, not per analyzer."""
+        assert not hasattr(analyzer, '_ast_cache')
         assert analyzer._markdown_parser is None
 
 
@@ -175,6 +176,85 @@ class TestAnalyzeFile:
         assert results.unique_words >= 0
         assert results.sentence_mean_length >= 0
 
+    def test_analyze_file_shares_document_context(self, analyzer, sample_markdown_file):
+        """Test one DocumentContext is built and passed to every dimension."""
+        from ai_pattern_analyzer.core.document_context import DocumentContext
+
+        contexts = []
+        originals = {name: dim.analyze for name, dim in analyzer.dimensions.items()}
+
+        def recording(name):
+            def analyze(text, lines, **kwargs):
+                contexts.append(kwargs.get('context'))
+                return originals[name](text, lines, **kwargs)
+            return analyze
+
+        for name, dim in analyzer.dimensions.items():
+            dim.analyze = recording(name)
+        try:
+            results = analyzer.analyze_file(sample_markdown_file)
+        finally:
+            for dim in analyzer.dimensions.values():
+                del dim.analyze
+
+        assert len(contexts) == len(analyzer.dimensions)
+        assert all(isinstance(c, DocumentContext) for c in contexts)
+        assert len({id(c) for c in contexts}) == 1
+        assert results.total_words == contexts[0].prose_word_count
+
+
+class TestAnalyzeTextAndStream:
+    """Tests for in-memory analyze_text and analyze_stream."""
+
+    def test_analyze_text_matches_analyze_file(self, analyzer, sample_markdown_file):
+        """Test in-memory analysis gives the same results as file analysis."""
+        text = Path(sample_markdown_file).read_text()
+
+        from_file = analyzer.analyze_file(sample_markdown_file)
+        from_text = analyzer.analyze_text(text, file_path=sample_markdown_file)
+
+        assert from_text.total_words == from_file.total_words
+        assert from_text.dimension_results.keys() == from_file.dimension_results.keys()
+        assert from_text.overall_assessment == from_file.overall_assessment
+
+    def test_analyze_text_touches_no_filesystem(self, analyzer):
+        """Test analyze_text never creates temp files or opens paths."""
+        from unittest.mock import patch
+
+        with patch('tempfile.NamedTemporaryFile', side_effect=AssertionError("temp file")), \
+                patch('ai_pattern_analyzer.core.analyzer.open', side_effect=AssertionError("open"),
+                      create=True):
+            results = analyzer.analyze_text("# Title\n\nSome text to analyze here. More words follow.")
+
+        assert results.file_path == '<text>'
+        assert results.total_words > 0
+
+    def test_analyze_stream(self, analyzer):
+        """Test analysis of a text stream."""
+        import io
+
+        results = analyzer.analyze_stream(io.StringIO("# Title\n\nStreamed text content."))
+
+        assert results.file_path == '<stream>'
+        assert results.total_words == 4
+
+    def test_analyze_stream_uses_stream_name(self, analyzer, sample_markdown_file):
+        """Test file streams are labelled with their name."""
+        with open(sample_markdown_file, encoding='utf-8') as f:
+            results = analyzer.analyze_stream(f)
+
+        assert results.file_path == sample_markdown_file
+
+    def test_concurrent_dimensions_match_sequential(self, analyzer, sample_markdown_file):
+        """Test the dimension scheduler gives the same results with 1 or 4 workers."""
+        text = Path(sample_markdown_file).read_text()
+
+        sequential = analyzer.analyze_text(text, config=AnalysisConfig(dimension_workers=1))
+        concurrent = analyzer.analyze_text(text, config=AnalysisConfig(dimension_workers=4))
+
+        assert list(concurrent.dimension_results) == list(sequential.dimension_results)
+        assert concurrent.dimension_results == sequential.dimension_results
+
 
 # ============================================================================
 # Preprocessing Tests
@@ -329,7 +409,9 @@ class TestAstParsing:
 
         # Should return same cached instance
         assert ast1 is ast2
-        assert 'test' in analyzer._ast_cache
+
+        # The key never returns the AST of another text
+        assert analyzer._parse_to_ast("# Other", cache_key='test') is not ast1
 
     def test_parse_to_ast_empty(self, analyzer):
         """Test AST parsing of empty text."""
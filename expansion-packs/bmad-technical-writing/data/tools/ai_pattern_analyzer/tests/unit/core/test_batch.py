@@ -0,0 +1,112 @@
+"""Unit tests for batch analysis (core/batch.py).
+
+Tests cover:
+- Serial runs reuse one analyzer and keep input order
+- A failing file is reported without stopping the batch
+- Process-pool runs return results in input order with per-file timings
+- The batch timing summary
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from ai_pattern_analyzer.cli.formatters import format_batch_summary
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+from ai_pattern_analyzer.core.batch import BatchFileResult, analyze_files, resolve_jobs
+
+
+@pytest.fixture
+def batch_files(tmp_path):
+    """Three chapters plus one file that cannot be decoded."""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"ch{i}.md"
+        path.write_text(f"# Chapter {i}\n\n" + f"Sentence number {i} is here. Another follows. " * 20)
+        paths.append(str(path))
+    bad = tmp_path / "bad.md"
+    bad.write_bytes(b'\xff\xfe\x00not utf-8')
+    paths.insert(1, str(bad))
+    return paths
+
+
+class TestSerialBatch:
+    """Tests for jobs=1 (in-process) batches."""
+
+    def test_reuses_analyzer_in_order(self):
+        analyzer = MagicMock()
+        analyzer.analyze_file.side_effect = lambda path, config: f"result:{path}"
+        config = AnalysisConfig()
+
+        outcomes = analyze_files(['b.md', 'a.md'], config, jobs=1, analyzer=analyzer)
+
+        assert [o.file_path for o in outcomes] == ['b.md', 'a.md']
+        assert [o.result for o in outcomes] == ['result:b.md', 'result:a.md']
+        assert all(o.ok and o.elapsed_seconds >= 0 for o in outcomes)
+        for call in analyzer.analyze_file.call_args_list:
+            assert call.kwargs['config'] is config
+
+    def test_failing_file_does_not_stop_batch(self):
+        analyzer = MagicMock()
+        analyzer.analyze_file.side_effect = [ValueError("broken file"), "ok"]
+        seen = []
+
+        outcomes = analyze_files(['bad.md', 'good.md'], jobs=1, analyzer=analyzer, on_result=seen.append)
+
+        assert outcomes[0].error == "broken file"
+        assert not outcomes[0].ok
+        assert outcomes[1].result == "ok"
+        assert seen == outcomes
+
+
+class TestProcessPoolBatch:
+    """Tests for jobs > 1 (spawned worker processes)."""
+
+    def test_results_in_input_order(self, batch_files):
+        config = AnalysisConfig(dimension_profile='fast')
+        completed = []
+
+        outcomes = analyze_files(batch_files, config, jobs=2, on_result=completed.append)
+
+        assert [o.file_path for o in outcomes] == batch_files
+        assert sorted(o.file_path for o in completed) == sorted(batch_files)
+
+        bad = outcomes[1]
+        assert not bad.ok
+        assert 'utf-8' in bad.error
+
+        good = [o for o in outcomes if o.ok]
+        assert len(good) == 3
+        assert all(o.result.total_words > 0 and o.elapsed_seconds > 0 for o in good)
+        assert good[0].result.file_path == batch_files[0]
+
+    def test_matches_serial_results(self, batch_files):
+        config = AnalysisConfig(dimension_profile='fast')
+
+        serial = analyze_files(batch_files, config, jobs=1)
+        pooled = analyze_files(batch_files, config, jobs=2)
+
+        for s, p in zip(serial, pooled):
+            assert s.ok == p.ok
+            if s.ok:
+                assert p.result.dimension_results == s.result.dimension_results
+
+
+class TestJobsAndSummary:
+    """Tests for job resolution and the timing summary."""
+
+    def test_resolve_jobs(self):
+        assert resolve_jobs(3) == 3
+        assert resolve_jobs(0) >= 1
+
+    def test_summary_lists_timings_and_throughput(self):
+        outcomes = [
+            BatchFileResult('/book/ch1.md', 2.0, result=object()),
+            BatchFileResult('/book/ch2.md', 4.0, error='boom'),
+        ]
+
+        summary = format_batch_summary(outcomes, elapsed_seconds=3.0, jobs=2)
+
+        assert "Completed 1 of 2 files in 3.0s (40.0 files/min, 2 jobs)" in summary
+        assert "ch1.md     2.00s" in summary
+        assert "FAILED: boom" in summary
+        assert "Slowest: ch2.md (4.00s)" in summary
@@ -0,0 +1,155 @@
+"""Unit tests for the scaling benchmark harness (core/benchmark.py, cli/benchmark.py).
+
+Tests cover:
+- Document generation and source repetition at a word count
+- Scaling exponent fit
+- Report comparison, tables and the compare command
+- Results memory comparison and the memory command
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+from ai_pattern_analyzer.cli.benchmark import main
+from ai_pattern_analyzer.core.benchmark import (
+    REPORT_VERSION, SUPERLINEAR_EXPONENT, compare, document_of_size, fit_exponent, format_comparison,
+    format_memory_report, format_report, generate_document, has_regressions, load_report,
+    measure_results_memory, save_report
+)
+
+
+def report(series):
+    return {
+        'version': REPORT_VERSION,
+        'series': {
+            key: {'sizes': {str(w): s for w, s in points.items()},
+                  'exponent': fit_exponent(list(points.items()))}
+            for key, points in series.items()
+        },
+    }
+
+
+LINEAR = {1_000: 0.01, 10_000: 0.1, 100_000: 1.0}
+QUADRATIC = {1_000: 0.01, 10_000: 1.0, 100_000: 100.0}
+
+
+class TestDocuments:
+    """Tests for generate_document() and document_of_size()."""
+
+    @pytest.mark.parametrize('words', [1_000, 10_000])
+    def test_generated_size_and_determinism(self, words):
+        text = generate_document(words)
+
+        assert words <= len(text.split()) <= words * 1.1
+        assert text == generate_document(words)
+        assert text.count('\n## ') > words // 500
+        assert '```python' in text or words < 5_000
+
+    def test_source_repeated_to_size(self):
+        source = "# Title\n\nFirst paragraph of words here.\n\nSecond paragraph.\n"
+
+        text = document_of_size(500, source)
+
+        assert 500 <= len(text.split()) < 510
+        assert text.startswith(source.rstrip('\n'))
+
+    def test_empty_source_rejected(self):
+        with pytest.raises(ValueError):
+            document_of_size(100, "   \n")
+
+
+class TestFitExponent:
+    """Tests for fit_exponent()."""
+
+    def test_linear_and_quadratic(self):
+        assert fit_exponent(list(LINEAR.items())) == pytest.approx(1.0)
+        assert fit_exponent(list(QUADRATIC.items())) == pytest.approx(2.0)
+
+    def test_noise_floor_points_ignored(self):
+        assert fit_exponent([(1_000, 0.0001), (10_000, 0.0002)]) is None
+        assert fit_exponent([(1_000, 0.0001), (10_000, 0.1), (100_000, 1.0)]) == pytest.approx(1.0)
+
+
+class TestCompare:
+    """Tests for compare() and the comparison table."""
+
+    def test_statuses(self):
+        baseline = report({'dimension:a@full': LINEAR, 'dimension:gone@full': LINEAR})
+        current = report({
+            'dimension:a@full': {1_000: 0.01, 10_000: 0.2, 100_000: 0.5},
+            'dimension:new@full': LINEAR,
+        })
+
+        rows = {(row['series'], row['size']): row['status'] for row in compare(baseline, current)}
+
+        assert rows[('dimension:a@full', 1_000)] == 'ok'
+        assert rows[('dimension:a@full', 10_000)] == 'regression'
+        assert rows[('dimension:a@full', 100_000)] == 'faster'
+        assert rows[('dimension:gone@full', 1_000)] == 'missing'
+        assert rows[('dimension:new@full', 'exponent')] == 'new'
+
+    def test_superlinear_exponent_regresses(self):
+        rows = compare(report({'pipeline:fast@full': LINEAR}), report({'pipeline:fast@full': QUADRATIC}),
+                       tolerance=1e6)
+
+        exponent = next(row for row in rows if row['size'] == 'exponent')
+        assert exponent['current'] > SUPERLINEAR_EXPONENT
+        assert exponent['status'] == 'regression'
+        assert has_regressions(rows)
+
+    def test_tables(self):
+        current = report({'pipeline:fast@full': QUADRATIC})
+
+        assert '2.00 !' in format_report(current)
+        table = format_comparison(compare(report({'pipeline:fast@full': LINEAR}), current))
+        assert 'REGRESSION' in table and '100,000' in table
+
+
+class TestReports:
+    """Tests for saved reports and the compare command."""
+
+    def test_round_trip_and_validation(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_report(report({'pipeline:fast@full': LINEAR}), str(path))
+
+        assert load_report(str(path))['series']['pipeline:fast@full']['exponent'] == pytest.approx(1.0)
+        path.write_text(json.dumps({'series': {}}))
+        with pytest.raises(ValueError):
+            load_report(str(path))
+
+    def test_compare_command_exit_code(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        current = tmp_path / "current.json"
+        save_report(report({'pipeline:fast@full': LINEAR}), str(baseline))
+        save_report(report({'pipeline:fast@full': LINEAR}), str(current))
+
+        result = CliRunner().invoke(main, ['compare', str(baseline), str(current)])
+        assert result.exit_code == 0
+        assert 'No regressions' in result.output
+
+        save_report(report({'pipeline:fast@full': QUADRATIC}), str(current))
+        result = CliRunner().invoke(main, ['compare', str(baseline), str(current)])
+        assert result.exit_code == 1
+        assert 'REGRESSION' in result.output
+
+
+class TestResultsMemory:
+    """Tests for measure_results_memory() and the memory command."""
+
+    def test_compact_smaller_than_lists(self):
+        report = measure_results_memory(chapters=2, words=1500)
+
+        compact, plain = report['representations']['compact'], report['representations']['list']
+        assert report['documents'] == 2 and report['words_per_document'] == 1500
+        assert 0 < compact['retained_bytes'] < plain['retained_bytes']
+        assert report['retained_ratio'] == pytest.approx(compact['retained_bytes'] / plain['retained_bytes'])
+        assert compact['serialize_peak_bytes'] > 0 and plain['serialize_peak_bytes'] > 0
+        table = format_memory_report(report)
+        assert 'compact/list: retained' in table and '2 documents x 1,500 words' in table
+
+    def test_memory_command(self):
+        result = CliRunner().invoke(main, ['memory', '--chapters', '1', '--words', '500'])
+
+        assert result.exit_code == 0
+        assert 'REPRESENTATION' in result.output and 'compact' in result.output
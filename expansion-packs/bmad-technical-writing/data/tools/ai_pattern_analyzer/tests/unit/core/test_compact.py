@@ -0,0 +1,191 @@
+"""Unit tests for compact result storage (core/compact.py).
+
+Tests cover:
+- IntSeries list compatibility, copying and pickling
+- Records materialization and equality
+- slotted() dataclasses
+- to_plain() / json_default() and AnalysisResults.to_dict()
+- Dimensions returning compact series
+"""
+
+import copy
+import json
+import pickle
+import statistics
+from dataclasses import asdict, dataclass, field
+from typing import List
+
+import pytest
+from ai_pattern_analyzer.core.compact import (
+    IntSeries, Records, compact_ints, json_default, slotted, to_plain
+)
+from ai_pattern_analyzer.core.results import AnalysisResults, VocabInstance
+
+
+def make_results(**overrides):
+    values = dict(
+        file_path='doc.md', total_words=100, total_sentences=3, total_paragraphs=1,
+        ai_vocabulary_count=0, ai_vocabulary_per_1k=0.0, ai_vocabulary_list=[],
+        formulaic_transitions_count=0, formulaic_transitions_list=[],
+        sentence_mean_length=10.0, sentence_stdev=2.0, sentence_min=8, sentence_max=12,
+        sentence_range=(8, 12), short_sentences_count=1, medium_sentences_count=2,
+        long_sentences_count=0, sentence_lengths=[8, 10, 12],
+        paragraph_mean_words=30.0, paragraph_stdev=0.0, paragraph_range=(30, 30),
+        unique_words=50, lexical_diversity=0.5, bullet_list_lines=0, numbered_list_lines=0,
+        total_headings=0, heading_depth=0, h1_count=0, h2_count=0, h3_count=0, h4_plus_count=0,
+        headings_per_page=0.0, heading_parallelism_score=0.0, verbose_headings_count=0,
+        avg_heading_length=0.0, first_person_count=0, direct_address_count=0, contraction_count=0,
+        domain_terms_count=0, domain_terms_list=[], em_dash_count=0, em_dashes_per_page=0.0,
+        bold_markdown_count=0, italic_markdown_count=0,
+    )
+    values.update(overrides)
+    return AnalysisResults(**values)
+
+
+class TestIntSeries:
+    """Tests for IntSeries and compact_ints()."""
+
+    def test_behaves_like_list(self):
+        series = IntSeries([12, 7, 31, 300])
+
+        assert series == [12, 7, 31, 300] and not series != [12, 7, 31, 300]
+        assert series != [12, 7]
+        assert repr(series) == '[12, 7, 31, 300]'
+        assert series[1] == 7 and series[-1] == 300
+        assert isinstance(series[1:3], IntSeries) and series[1:3] == [7, 31]
+        assert statistics.mean(series) == 87.5
+        assert sorted(series) == [7, 12, 31, 300]
+        assert series.itemsize == 4
+
+    def test_copy_and_pickle_keep_type(self):
+        series = IntSeries([1, 2, 3])
+
+        for clone in (copy.copy(series), copy.deepcopy(series), pickle.loads(pickle.dumps(series))):
+            assert type(clone) is IntSeries and clone == [1, 2, 3]
+        assert copy.deepcopy(series) is not series
+
+    @pytest.mark.parametrize('values', [[1.5, 2], [-1, 2], [True, 2], [2 ** 40], ['a']])
+    def test_compact_ints_leaves_other_values(self, values):
+        assert compact_ints(values) is values
+
+    def test_compact_ints(self):
+        series = IntSeries([1])
+        assert compact_ints(series) is series
+        assert compact_ints(None) is None
+        assert type(compact_ints([0, 5])) is IntSeries
+
+
+class TestRecords:
+    """Tests for Records."""
+
+    RECORDS = [{'level': 2, 'text': 'Intro', 'words': 1}, {'level': 3, 'text': 'The cache', 'words': 2}]
+
+    def test_materializes_records(self):
+        records = Records(self.RECORDS)
+
+        assert len(records) == 2
+        assert records[1] == {'level': 3, 'text': 'The cache', 'words': 2}
+        assert records[-1]['text'] == 'The cache'
+        assert records[0:1] == self.RECORDS[:1]
+        assert list(records) == self.RECORDS and records == self.RECORDS
+        assert repr(records) == repr(self.RECORDS)
+        assert type(records.column('words')) is IntSeries
+        assert records.column('text') == ('Intro', 'The cache')
+        with pytest.raises(IndexError):
+            records[2]
+
+    def test_empty_copy_and_pickle(self):
+        assert Records() == [] and len(Records()) == 0
+        records = Records(self.RECORDS)
+        assert pickle.loads(pickle.dumps(records)) == records
+        assert copy.deepcopy(records) == records
+        with pytest.raises(AttributeError):
+            records.extra = 1
+
+
+class TestSlotted:
+    """Tests for slotted()."""
+
+    def test_dataclass_gets_slots(self):
+        @slotted
+        @dataclass
+        class Point:
+            x: int
+            tags: List[str] = field(default_factory=list)
+            label: str = 'p'
+
+        point = Point(1)
+
+        assert not hasattr(point, '__dict__')
+        assert point == Point(1, [], 'p') and point.tags == []
+        assert Point(2).tags is not point.tags
+        with pytest.raises(AttributeError):
+            point.other = 1
+        assert copy.deepcopy(point) == point
+        assert asdict(point) == {'x': 1, 'tags': [], 'label': 'p'}
+
+    def test_results_dataclasses_are_slotted(self):
+        instance = VocabInstance(line_number=1, word='delve', context='c', full_line='l', suggestions=[])
+        results = make_results()
+
+        assert not hasattr(instance, '__dict__') and not hasattr(results, '__dict__')
+        assert pickle.loads(pickle.dumps(instance)) == instance
+        assert pickle.loads(pickle.dumps(results)) == results
+
+
+class TestSerialization:
+    """Tests for to_plain(), json_default() and AnalysisResults.to_dict()."""
+
+    def test_results_store_series_compactly(self):
+        results = make_results(subsection_counts=[2, 3], em_dash_positions=[0, 0, 4])
+
+        assert type(results.sentence_lengths) is IntSeries
+        assert type(results.subsection_counts) is IntSeries
+        assert results.h4_counts is None
+        assert results.em_dash_positions == [0, 0, 4]
+
+    def test_to_dict_matches_asdict_of_lists(self):
+        headings = Records(TestRecords.RECORDS)
+        results = make_results(dimension_results={'structure': {'headings': headings, 'counts': IntSeries([1])}})
+
+        data = results.to_dict()
+
+        assert data['sentence_lengths'] == [8, 10, 12] and type(data['sentence_lengths']) is list
+        assert data['dimension_results'] == {'structure': {'headings': TestRecords.RECORDS, 'counts': [1]}}
+        assert type(data['dimension_results']['structure']['headings']) is list
+        assert data['sentence_range'] == (8, 12)
+        assert results.to_dict(shallow=True)['sentence_lengths'] is results.sentence_lengths
+
+    def test_json_without_copy(self):
+        results = make_results(dimension_results={'burstiness': {'lengths': IntSeries([3, 4])}})
+
+        shallow = json.dumps(results.to_dict(shallow=True), default=json_default)
+
+        assert json.loads(shallow) == json.loads(json.dumps(results.to_dict()))
+        with pytest.raises(TypeError):
+            json.dumps({'value': object()}, default=json_default)
+
+    def test_to_plain_nested_dataclasses(self):
+        instance = VocabInstance(line_number=1, word='delve', context='c', full_line='l', suggestions=['dig'])
+        assert to_plain({'items': [instance], 'pair': (IntSeries([1]), 2)}) == {
+            'items': [asdict(instance)], 'pair': ([1], 2)
+        }
+
+
+class TestDimensionSeries:
+    """Tests for dimensions returning compact series."""
+
+    def test_burstiness_and_structure(self):
+        from ai_pattern_analyzer.core.benchmark import generate_document
+        from ai_pattern_analyzer.dimensions.burstiness import BurstinessDimension
+        from ai_pattern_analyzer.dimensions.structure import StructureDimension
+
+        text = generate_document(3000)
+
+        burstiness = BurstinessDimension()._analyze_sentence_burstiness(text)
+        structure = StructureDimension()
+        headings = structure._calculate_heading_length_analysis(text)['headings']
+
+        assert type(burstiness['lengths']) is IntSeries and len(burstiness['lengths']) == burstiness['total_sentences']
+        assert type(headings) is Records and headings[0]['level'] == 1
+        assert type(structure._calculate_section_variance(text)['section_lengths']) is IntSeries
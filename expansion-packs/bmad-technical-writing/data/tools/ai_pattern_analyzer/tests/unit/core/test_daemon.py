@@ -0,0 +1,287 @@
+"""Unit tests for the analysis daemon (core/daemon.py).
+
+Tests cover:
+- Addresses and request configs; loopback-only binding
+- Endpoints: analyze-text/-file/batch parity with in-process analysis, errors
+- Unix socket transport, state file and find_daemon()
+- Bounded queue (503), per-request deadlines (504, partial results), /metrics
+"""
+
+import http.client
+import json
+import os
+import stat
+import threading
+import time
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.benchmark import generate_document
+from ai_pattern_analyzer.core.daemon import (
+    AnalysisDaemon, DaemonClient, DaemonError, DaemonUnavailable, config_from_request,
+    config_to_request, find_daemon, parse_address
+)
+from ai_pattern_analyzer.core.results import AnalysisResults
+
+FAST = AnalysisConfig(mode=AnalysisMode.FAST, dimension_profile='fast')
+
+
+@pytest.fixture(scope='module')
+def fast_analyzer():
+    from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+    return AIPatternAnalyzer(config=FAST)
+
+
+@pytest.fixture
+def daemon(fast_analyzer):
+    """Daemon on a free local port serving the module's fast analyzer."""
+    daemon = AnalysisDaemon('127.0.0.1:0', config=FAST, analyzer_factory=lambda config, terms: fast_analyzer)
+    daemon.start()
+    yield daemon
+    daemon.close()
+
+
+@pytest.fixture
+def chapter(tmp_path):
+    path = tmp_path / 'chapter.md'
+    path.write_text(generate_document(1500))
+    return path
+
+
+class GatedAnalyzer:
+    """Analyzer stub whose analyses run until a gate opens or their deadline passes."""
+
+    def __init__(self, results):
+        self.results = results
+        self.gate = threading.Event()
+        self.running = threading.Event()
+
+    def analyze_text(self, text, config=None, file_path='<text>', deadline=None):
+        self.running.set()
+        while not self.gate.is_set() and not deadline.expired:
+            time.sleep(0.01)
+        return self.results
+
+
+class TestAddressesAndConfig:
+    """Tests for parse_address() and request configs."""
+
+    def test_parse_address(self):
+        assert parse_address('unix:/run/a.sock') == ('unix', '/run/a.sock')
+        assert parse_address('http://127.0.0.1:8765') == ('tcp', ('127.0.0.1', 8765))
+        assert parse_address('localhost:9000/') == ('tcp', ('localhost', 9000))
+        with pytest.raises(ValueError):
+            parse_address('localhost')
+
+    def test_config_round_trip(self):
+        config = AnalysisConfig(mode=AnalysisMode.SAMPLING, sampling_sections=7, dimension_profile='full')
+
+        values = json.loads(json.dumps(config_to_request(config)))
+        restored = config_from_request(values)
+
+        assert values['mode'] == 'sampling'
+        assert restored.mode == AnalysisMode.SAMPLING
+        assert restored.sampling_sections == 7 and restored.dimension_profile == 'full'
+        assert config_from_request(None, FAST) is FAST
+        assert config_from_request({'sampling_sections': 3}, FAST).dimension_profile == 'fast'
+
+    @pytest.mark.parametrize('values', [{'dimension_workers': 2}, {'mode': 'turbo'}, ['mode'],
+                                        {'cache_dir': '/tmp/elsewhere'}])
+    def test_invalid_config(self, values):
+        with pytest.raises(DaemonError) as error:
+            config_from_request(values)
+        assert error.value.status == 400
+
+    @pytest.mark.parametrize('address', ['0.0.0.0:0', '192.0.2.1:0', 'example.com:0'])
+    def test_non_loopback_host_refused(self, address):
+        with pytest.raises(ValueError, match='loopback'):
+            AnalysisDaemon(address, config=FAST)
+
+
+class TestEndpoints:
+    """Tests for the analysis endpoints and error responses."""
+
+    def test_analyze_text_matches_local(self, daemon, fast_analyzer):
+        text = generate_document(1500)
+        client = DaemonClient(daemon.address)
+
+        remote = client.analyze_text(text, FAST, file_path='doc.md')
+        local = fast_analyzer.analyze_text(text, config=FAST, file_path='doc.md')
+
+        assert isinstance(remote, AnalysisResults)
+        assert remote.sentence_range == local.sentence_range and isinstance(remote.sentence_range, tuple)
+        assert remote.total_words == local.total_words
+        assert remote.sentence_lengths == local.sentence_lengths
+        assert remote.overall_score == local.overall_score
+        assert set(remote.dimension_results) == set(local.dimension_results)
+        assert client.health()['analyzers'] == ['fast']
+
+    def test_analyze_file_tracks_history(self, daemon, chapter):
+        client = DaemonClient(daemon.address)
+        score = {'detection_target': 30.0, 'quality_target': 85.0, 'track_history': True,
+                 'history_notes': 'first pass'}
+
+        results = client.analyze_file(str(chapter), FAST, score=score)
+
+        assert results.file_path == str(chapter)
+        assert results.metadata['analysis_mode'] == 'fast'
+        history = json.loads((chapter.parent / '.ai-analysis-history' / 'chapter.history.json').read_text())
+        assert [entry['notes'] for entry in history['scores']] == ['first pass']
+
+    def test_batch_reports_failed_files(self, daemon, chapter, tmp_path):
+        missing = tmp_path / 'missing.md'
+
+        outcomes = DaemonClient(daemon.address).analyze_files([str(chapter), str(missing)], FAST)
+
+        assert [outcome.file_path for outcome in outcomes] == [str(chapter), str(missing)]
+        assert outcomes[0].ok and outcomes[0].result.total_words > 0
+        assert not outcomes[1].ok and 'not found' in outcomes[1].error
+
+    def test_missing_file_is_404(self, daemon, tmp_path):
+        with pytest.raises(DaemonError) as error:
+            DaemonClient(daemon.address).analyze_file(str(tmp_path / 'missing.md'), FAST)
+        assert error.value.status == 404
+
+    @pytest.mark.parametrize('method, endpoint, body, status', [
+        ('GET', '/nowhere', None, 404),
+        ('GET', '/analyze-text', None, 405),
+        ('POST', '/analyze-text', b'{not json', 400),
+        ('POST', '/analyze-text', b'{"text": 3}', 400),
+        ('POST', '/batch', b'{"paths": "a.md"}', 400),
+        ('POST', '/analyze-text', b'{"text": "x", "deadline_seconds": 0}', 400),
+        ('POST', '/analyze-text', b'{"text": "x", "config": {"profiling": true}}', 400),
+    ])
+    def test_bad_requests(self, daemon, method, endpoint, body, status):
+        host, port = parse_address(daemon.address)[1]
+        connection = http.client.HTTPConnection(host, port, timeout=5)
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        connection.request(method, endpoint, body=body, headers=headers)
+        response = connection.getresponse()
+
+        assert response.status == status
+        assert 'error' in json.loads(response.read())
+        connection.close()
+
+    @pytest.mark.parametrize('headers', [{}, {'Content-Type': 'text/plain'},
+                                         {'Content-Type': 'application/x-www-form-urlencoded'}])
+    def test_non_json_content_type_is_415(self, daemon, headers):
+        host, port = parse_address(daemon.address)[1]
+        connection = http.client.HTTPConnection(host, port, timeout=5)
+        connection.request('POST', '/analyze-text', body=b'{"text": "x"}', headers=headers)
+        response = connection.getresponse()
+
+        assert response.status == 415
+        assert 'application/json' in json.loads(response.read())['error']
+        connection.close()
+        assert daemon.metrics.files_analyzed == 0
+
+
+class TestUnixSocket:
+    """Tests for the Unix socket transport, the state file and find_daemon()."""
+
+    def test_serve_and_discover(self, tmp_path, fast_analyzer, monkeypatch):
+        monkeypatch.delenv('AI_PATTERN_DAEMON', raising=False)
+        socket_path = tmp_path / 'd.sock'
+        state_file = tmp_path / 'daemon.json'
+        daemon = AnalysisDaemon(f'unix:{socket_path}', config=FAST, state_file=state_file,
+                                analyzer_factory=lambda config, terms: fast_analyzer)
+        daemon.start()
+        try:
+            assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+            assert json.loads(state_file.read_text())['address'] == f'unix:{socket_path}'
+
+            client = find_daemon(state_file)
+            assert client is not None and client.health()['status'] == 'ok'
+            assert client.analyze_text('One sentence here. And another one.', FAST).total_words > 0
+        finally:
+            daemon.close()
+
+        assert not socket_path.exists() and not state_file.exists()
+        state_file.write_text(json.dumps({'address': f'unix:{socket_path}'}))
+        assert find_daemon(state_file) is None
+
+    def test_environment_address(self, daemon, monkeypatch, tmp_path):
+        monkeypatch.setenv('AI_PATTERN_DAEMON', daemon.address)
+        assert find_daemon(tmp_path / 'none.json').address == daemon.address
+
+        monkeypatch.setenv('AI_PATTERN_DAEMON', '127.0.0.1:1')
+        assert find_daemon() is None
+
+    def test_unreachable_daemon(self, tmp_path):
+        with pytest.raises(DaemonUnavailable):
+            DaemonClient(f"unix:{tmp_path / 'none.sock'}").health()
+
+
+class TestQueueAndDeadlines:
+    """Tests for the bounded queue, per-request deadlines and /metrics."""
+
+    @pytest.fixture
+    def gated(self, fast_analyzer):
+        return GatedAnalyzer(fast_analyzer.analyze_text('A short text. With two sentences.', config=FAST))
+
+    def test_full_queue_is_refused(self, gated):
+        with AnalysisDaemon('127.0.0.1:0', config=FAST, queue_size=1,
+                            analyzer_factory=lambda config, terms: gated) as daemon:
+            daemon.start()
+            client = DaemonClient(daemon.address)
+            outcomes = []
+            threads = [threading.Thread(target=lambda: outcomes.append(client.analyze_text('x')))
+                       for _ in range(2)]
+            threads[0].start()
+            assert gated.running.wait(5)
+            threads[1].start()
+            while client.health()['queue_depth'] < 1:
+                time.sleep(0.01)
+
+            with pytest.raises(DaemonUnavailable) as error:
+                client.analyze_text('x')
+            assert error.value.status == 503
+
+            gated.gate.set()
+            for thread in threads:
+                thread.join(10)
+            assert len(outcomes) == 2
+            assert 'ai_pattern_daemon_requests_total{endpoint="/analyze-text",status="503"} 1' in client.metrics()
+
+    def test_queued_request_times_out(self, gated):
+        with AnalysisDaemon('127.0.0.1:0', config=FAST,
+                            analyzer_factory=lambda config, terms: gated) as daemon:
+            daemon.start()
+            client = DaemonClient(daemon.address)
+            blocker = threading.Thread(target=lambda: client.analyze_text('x'))
+            blocker.start()
+            assert gated.running.wait(5)
+
+            start = time.perf_counter()
+            with pytest.raises(DaemonError) as error:
+                client.analyze_text('x', deadline_seconds=0.3)
+
+            assert error.value.status == 504
+            assert time.perf_counter() - start < 2
+            gated.gate.set()
+            blocker.join(10)
+
+    def test_running_request_returns_at_deadline(self, gated):
+        with AnalysisDaemon('127.0.0.1:0', config=FAST,
+                            analyzer_factory=lambda config, terms: gated) as daemon:
+            daemon.start()
+            client = DaemonClient(daemon.address)
+
+            start = time.perf_counter()
+            results = client.analyze_text('x', deadline_seconds=0.3)
+
+            assert results.total_words == gated.results.total_words
+            assert 0.3 <= time.perf_counter() - start < 2
+
+    def test_metrics(self, daemon):
+        client = DaemonClient(daemon.address)
+        client.analyze_text('One sentence here. And another one.', FAST)
+
+        metrics = client.metrics()
+
+        assert '# TYPE ai_pattern_daemon_requests_total counter' in metrics
+        assert 'ai_pattern_daemon_requests_total{endpoint="/analyze-text",status="200"} 1' in metrics
+        assert 'ai_pattern_daemon_request_duration_seconds_count{endpoint="/analyze-text"} 1' in metrics
+        assert 'ai_pattern_daemon_files_analyzed_total 1' in metrics
+        assert 'ai_pattern_daemon_queue_capacity 16' in metrics
+        assert 'ai_pattern_daemon_analyzer_load_seconds{profile="fast",backend="eager"}' in metrics
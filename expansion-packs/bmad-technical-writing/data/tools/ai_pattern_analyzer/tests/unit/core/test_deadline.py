@@ -0,0 +1,173 @@
+"""Unit tests for the analysis deadline (core/deadline.py).
+
+Tests cover:
+- Deadline budgets, cancellation, parents and pickling
+- check_deadline() and deadline_scope()
+- The scheduler reports cut-off dimensions as unfinished and their threads stop
+- AIPatternAnalyzer returns partial results listing unfinished dimensions
+- The GLTR timeout worker actually stops instead of running on
+"""
+
+import pickle
+import threading
+import time
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+from ai_pattern_analyzer.core.deadline import (
+    Deadline, DeadlineExceeded, check_deadline, current_deadline, deadline_scope
+)
+from ai_pattern_analyzer.core.scheduler import DimensionScheduler
+
+
+class SpinningDimension:
+    """Dimension that works until its deadline is cancelled, recording when it stopped."""
+
+    required_artifacts = ()
+
+    def __init__(self, name):
+        self.dimension_name = name
+        self.stopped = threading.Event()
+
+    def analyze(self, text, lines=None, config=None, **kwargs):
+        try:
+            while True:
+                check_deadline()  # the scheduler installs kwargs['deadline'] as current
+                time.sleep(0.01)
+        finally:
+            self.stopped.set()
+
+
+class QuickDimension:
+    required_artifacts = ()
+
+    def __init__(self, name):
+        self.dimension_name = name
+
+    def analyze(self, text, lines=None, config=None, **kwargs):
+        return {'available': True, 'deadline_passed': kwargs.get('deadline') is not None}
+
+
+class TestDeadline:
+    """Tests for the Deadline object."""
+
+    def test_budget_and_cancel(self):
+        deadline = Deadline(60)
+
+        assert 0 < deadline.remaining() <= 60
+        assert not deadline.expired
+        deadline.cancel()
+        assert deadline.expired
+        with pytest.raises(DeadlineExceeded, match="60s"):
+            deadline.check()
+
+    def test_unbounded_deadline_only_expires_when_cancelled(self):
+        deadline = Deadline()
+
+        assert deadline.remaining() is None
+        deadline.check()
+        deadline.cancel()
+        assert deadline.expired
+
+    def test_child_expires_with_parent(self):
+        parent = Deadline(60)
+        child = Deadline(30, parent=parent)
+
+        assert child.remaining() <= 30
+        parent.cancel()
+        assert child.expired
+        assert Deadline(0.0).expired
+
+    def test_pickles_remaining_time(self):
+        restored = pickle.loads(pickle.dumps(Deadline(60)))
+
+        assert 0 < restored.remaining() <= 60
+        assert "60s" in restored.describe()
+
+    def test_scope_sets_current_deadline(self):
+        deadline = Deadline()
+
+        with deadline_scope(deadline):
+            assert current_deadline() is deadline
+            deadline.cancel()
+            with pytest.raises(DeadlineExceeded):
+                check_deadline()
+        assert current_deadline() is None
+        check_deadline()  # no deadline installed: never raises
+
+
+class TestSchedulerDeadline:
+    """Tests for deadline enforcement in DimensionScheduler."""
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_overrun_reported_unfinished_and_stopped(self, workers):
+        spinning = SpinningDimension('slow')
+        dims = {'quick': QuickDimension('quick'), 'slow': spinning}
+        config = AnalysisConfig(dimension_workers=workers)
+
+        start = time.perf_counter()
+        results = DimensionScheduler().run(dims, "Text.", ["Text."], config, deadline=Deadline(0.3))
+
+        assert time.perf_counter() - start < 5
+        assert results['quick'] == {'available': True, 'deadline_passed': True}
+        assert results['slow']['available'] is False
+        assert results['slow']['unfinished'] is True
+        assert "0.3s" in results['slow']['error']
+        assert spinning.stopped.wait(2), "dimension kept running after the deadline"
+
+    def test_expired_deadline_skips_dimensions(self):
+        deadline = Deadline(0.0)
+        results = DimensionScheduler()._run_sequential(
+            {'quick': QuickDimension('quick')}, "Text.", ["Text."], AnalysisConfig(),
+            {'quick': {'config': AnalysisConfig(), 'deadline': deadline}}
+        )
+
+        assert results['quick']['unfinished'] is True
+
+
+class TestAnalyzerDeadline:
+    """Tests for partial AnalysisResults."""
+
+    def test_partial_results_mark_unfinished_dimensions(self):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = AnalysisConfig(dimension_profile='fast', max_analysis_time_seconds=0.3)
+        analyzer = AIPatternAnalyzer(config=config)
+        spinning = SpinningDimension('burstiness')
+        analyzer.dimensions['burstiness'].analyze = spinning.analyze
+        try:
+            results = analyzer.analyze_text("# Title\n\nA sentence here. Another one.", config=config)
+        finally:
+            del analyzer.dimensions['burstiness'].analyze
+
+        assert results.unfinished_dimensions == ['burstiness']
+        assert results.dimension_results['burstiness']['unfinished'] is True
+        assert results.dimension_results['perplexity']['available'] is True
+        assert spinning.stopped.wait(2)
+
+
+class TestGltrTimeout:
+    """The GLTR timeout cancels its worker instead of abandoning it."""
+
+    def test_timed_out_worker_stops(self):
+        from ai_pattern_analyzer.dimensions.predictability import PredictabilityDimension
+
+        stopped = threading.Event()
+
+        def ranking(text):
+            try:
+                while True:
+                    check_deadline()
+                    time.sleep(0.01)
+            finally:
+                stopped.set()
+
+        assert PredictabilityDimension._run_with_timeout(ranking, 0.2, "text") is None
+        assert stopped.wait(2)
+
+    def test_expired_analysis_deadline_raises(self):
+        from ai_pattern_analyzer.dimensions.predictability import PredictabilityDimension
+
+        deadline = Deadline(0.2)
+        with pytest.raises(DeadlineExceeded):
+            PredictabilityDimension._run_with_timeout(lambda text: time.sleep(1), 60, "text", deadline=deadline)
@@ -0,0 +1,99 @@
+"""Unit tests for DocumentContext.
+
+Tests cover:
+- Spans match the regex splits dimensions used before (no metric drift)
+- Line offsets for \\n and \\r\\n line endings
+- Code-free prose text and word count
+- applies_to()/context_for() for truncated views
+- Dimensions produce identical results with and without a context
+"""
+
+import re
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.document_context import DocumentContext, context_for
+
+
+SAMPLE_TEXTS = [
+    "",
+    "   \n\n  ",
+    "One sentence only",
+    "# Heading\n\nFirst paragraph. It has two sentences!\n\n\n  Second one?  Yes...\n",
+    "Dr. Smith's well-known co-author said: \"It's fine.\"\r\n\r\nNext line.\r\nLast",
+    "Intro text.\n\n```python\nx = 1. y = 2!\n```\n\nOutro text with   spaces .\n \t\nEnd",
+]
+
+
+@pytest.mark.parametrize('text', SAMPLE_TEXTS)
+class TestSpansMatchRegexSplits:
+    """Context splits must equal the per-dimension regex splits they replace."""
+
+    def test_words(self, text):
+        ctx = DocumentContext.from_text(text)
+        assert ctx.words() == re.findall(r'\b\w+\b', text)
+        assert ctx.word_count == len(re.findall(r'\b\w+\b', text))
+
+    def test_sentences(self, text):
+        ctx = DocumentContext.from_text(text)
+        assert ctx.sentences() == [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+
+    def test_paragraphs(self, text):
+        ctx = DocumentContext.from_text(text)
+        assert ctx.paragraphs() == [p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()]
+
+    def test_prose(self, text):
+        ctx = DocumentContext.from_text(text)
+        prose = re.sub(r'```[\s\S]*?```', '', text)
+        assert ctx.prose_text == prose
+        assert ctx.prose_word_count == len(re.findall(r"\b[\w'-]+\b", prose))
+
+    def test_line_offsets(self, text):
+        ctx = DocumentContext.from_text(text)
+        assert list(ctx.lines) == text.splitlines()
+        for offset, line in zip(ctx.line_offsets, ctx.lines):
+            assert text[offset:offset + len(line)] == line
+
+
+class TestDocumentContext:
+    """Tests for context immutability and applicability."""
+
+    def test_is_immutable(self):
+        ctx = DocumentContext.from_text("Some text.")
+        with pytest.raises(AttributeError):
+            ctx.text = "Other text."
+
+    def test_context_for_full_text_only(self):
+        text = "Alpha beta. Gamma delta."
+        ctx = DocumentContext.from_text(text)
+
+        assert context_for(text, ctx) is ctx
+        assert context_for(str(text), ctx) is ctx
+        assert context_for(text[:10], ctx) is None
+        assert context_for(text, None) is None
+
+
+DIMENSION_TEXT = (
+    "# Report\n\n"
+    "We measured the results carefully. However, the data was noisy! "
+    "You'll see why in the next section.\n\n"
+    "The second paragraph explains the method in detail. It uses three steps. "
+    "Moreover, each step is validated independently by our team.\n\n"
+    "```python\nprint('code is ignored.')\n```\n\n"
+    "Finally, the third paragraph is a short conclusion that wraps everything up nicely.\n"
+)
+
+
+@pytest.mark.parametrize('module_name', ['readability', 'voice', 'burstiness', 'transition_marker'])
+def test_dimension_results_unchanged_with_context(module_name):
+    """Test dimensions return the same metrics with and without a shared context."""
+    import importlib
+
+    dim = importlib.import_module(f'ai_pattern_analyzer.dimensions.{module_name}')._instance
+    config = AnalysisConfig(mode=AnalysisMode.FULL)
+    ctx = DocumentContext.from_text(DIMENSION_TEXT)
+
+    without = dim.analyze(DIMENSION_TEXT, DIMENSION_TEXT.splitlines(), config=config)
+    with_ctx = dim.analyze(DIMENSION_TEXT, DIMENSION_TEXT.splitlines(), config=config, context=ctx)
+
+    assert with_ctx == without
@@ -0,0 +1,173 @@
+"""Unit tests for match locations recorded by the standard pass (core/findings.py).
+
+Tests cover:
+- Offset mapping through stripped spans (HTML comments, code blocks)
+- Line numbers of analyzed-text offsets in the source file
+- Detailed findings built from recorded matches equal the line scans
+- GLTR line rank index built from recorded token ranks
+"""
+
+import re
+from unittest.mock import patch
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.findings import Findings, strip_matches
+from ai_pattern_analyzer.dimensions.predictability import PredictabilityDimension
+
+COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+
+DOCUMENT = """# Caching Guide
+
+<!-- metadata
+spans several lines, robust and pivotal -->
+We delve into caching. Furthermore, a robust cache needs eviction — always.
+
+## Eviction
+
+It is important to note that eviction trims the cache. <!-- note: leverage --> We leverage
+sizes per entry -- so the total stays bounded. Moreover, the pivotal part is the policy.
+
+```python
+cache.put(key, value)  # robust
+```
+
+In addition, expiry is holistic and seamless.
+"""
+
+
+@pytest.fixture
+def analyzer():
+    from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+    return AIPatternAnalyzer(config=AnalysisConfig(dimension_profile='fast'))
+
+
+FULL = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast', max_analysis_time_seconds=None)
+
+
+class TestOffsets:
+    """Tests for strip_matches() and Findings offset mapping."""
+
+    def test_strip_matches_maps_back_to_original(self):
+        text = "a<!--x-->bc<!--yy\nzz-->d\n<!---->e"
+        stripped, offsets = strip_matches(COMMENT, text)
+
+        assert stripped == COMMENT.sub('', text)
+        for offset, char in enumerate(stripped):
+            assert text[offsets.to_original(offset)] == char
+
+    def test_line_numbers_in_source(self):
+        findings = Findings(DOCUMENT)
+        analyzed = findings.bind(COMMENT)
+
+        for word in ('delve', 'Eviction', 'We leverage', 'holistic'):
+            offset = analyzed.index(word)
+            line_number = findings.line_number(offset)
+            line = DOCUMENT.splitlines()[line_number - 1]
+            assert line[findings.column(offset):].startswith(word)
+
+    def test_records(self):
+        findings = Findings(DOCUMENT)
+        analyzed = findings.bind(COMMENT)
+
+        assert findings.records(analyzed)
+        assert not findings.records(analyzed[:100])
+        assert 'ai_vocabulary' not in findings
+        findings.record('ai_vocabulary', [(0, 5, 'delve')])
+        assert findings.get('ai_vocabulary') == [(0, 5, 'delve')]
+
+
+class TestDetailedFromRecords:
+    """Tests for analyze_file_detailed() findings built from recorded matches."""
+
+    def _scan(self, analyzer, helper):
+        analyzer.lines = DOCUMENT.splitlines()
+        return [(item.line_number, getattr(item, 'word', getattr(item, 'transition', None)))
+                for item in getattr(analyzer, helper)()]
+
+    def test_standard_pass_records_matches(self, analyzer):
+        findings = Findings(DOCUMENT)
+        results = analyzer.analyze_text(DOCUMENT, config=FULL, findings=findings)
+
+        vocabulary = findings.get('ai_vocab_replacements')
+        assert [word for _, _, word, _ in vocabulary] == \
+            [m.group() for m in re.finditer(r'delve|robust|leverage|pivotal|holistic|seamless',
+                                            findings.analyzed_text, re.IGNORECASE)]
+        assert results.dimension_results['perplexity']['ai_vocabulary']['count'] == len(vocabulary)
+        assert len(findings.get('em_dashes')) == 2
+
+    def test_sampled_pass_records_nothing(self, analyzer):
+        findings = Findings(DOCUMENT)
+        config = AnalysisConfig(mode=AnalysisMode.FAST, dimension_profile='fast')
+        with patch('ai_pattern_analyzer.dimensions.perplexity.PerplexityDimension._prepare_text',
+                   return_value=[(0, DOCUMENT[:200])]):
+            analyzer.analyze_text(DOCUMENT, config=config, findings=findings)
+
+        assert findings.get('ai_vocab_replacements') is None
+
+    def test_vocabulary_matches_line_scan(self, analyzer, tmp_path):
+        path = tmp_path / "guide.md"
+        path.write_text(DOCUMENT, encoding='utf-8')
+        scanned = sorted(self._scan(analyzer, '_analyze_ai_vocabulary_detailed'))
+
+        detailed = analyzer.analyze_file_detailed(str(path), config=FULL)
+
+        assert sorted((item.line_number, item.word) for item in detailed.ai_vocabulary) == scanned
+        robust = next(item for item in detailed.ai_vocabulary if item.word == 'robust')
+        assert robust.suggestions == analyzer.AI_VOCAB_REPLACEMENTS[r'\brobust(ness)?\b']
+        assert 'robust' in robust.context
+
+    def test_vocabulary_identical_to_line_scan(self, analyzer, tmp_path):
+        # Words of only one of the AI vocabulary lexicons, and several per line
+        document = DOCUMENT + ("\nAt the end of the day it facilitated and facilitates a robust, "
+                               "robust and seamless\noptimization.\n")
+        path = tmp_path / "guide.md"
+        path.write_text(document, encoding='utf-8')
+        config = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast', max_analysis_time_seconds=None,
+                                cache_dir=str(tmp_path / 'cache'))
+
+        recorded = analyzer.analyze_file_detailed(str(path), config=config).ai_vocabulary
+        # Served from the cache, so nothing is recorded and the lines are scanned
+        cached = analyzer.analyze_file_detailed(str(path), config=config).ai_vocabulary
+        analyzer.lines = document.splitlines()
+        scanned = analyzer._analyze_ai_vocabulary_detailed()
+
+        assert recorded == scanned == cached
+        assert [item.word for item in recorded if item.line_number == 18] == \
+            ['robust', 'robust', 'facilitates', 'seamless']
+        assert all(item.suggestions != ['Use a plainer word'] for item in recorded)
+
+    def test_transitions_and_em_dashes_match_line_scan(self, analyzer, tmp_path):
+        path = tmp_path / "guide.md"
+        path.write_text(DOCUMENT, encoding='utf-8')
+        transitions = sorted(self._scan(analyzer, '_analyze_transitions_detailed'))
+        dashes = [item.line_number for item in analyzer._analyze_em_dashes_detailed()]
+
+        detailed = analyzer.analyze_file_detailed(str(path), config=FULL)
+
+        assert transitions == [(5, 'Furthermore,'), (10, 'Moreover,'), (16, 'In addition,')]
+        assert sorted((item.line_number, item.transition) for item in detailed.transitions) == transitions
+        assert [item.line_number for item in detailed.em_dashes] == dashes
+        assert detailed.transitions[0].suggestions == analyzer.TRANSITION_REPLACEMENTS['Furthermore,']
+
+
+class TestRecordedTokenRanks:
+    """Tests for the GLTR line rank index built from recorded token ranks."""
+
+    def test_ranks_assigned_to_content_lines(self):
+        findings = Findings(DOCUMENT)
+        analyzed = findings.bind(COMMENT)
+        words = list(re.finditer(r'\w+', analyzed))
+        findings.record('token_ranks', [(m.start(), 0 if i % 2 else 50) for i, m in enumerate(words)])
+        dimension = PredictabilityDimension()
+
+        with patch.object(dimension, '_load_model', side_effect=AssertionError("model loaded")):
+            index = dimension._build_line_rank_index(findings.lines, findings=findings)
+
+        line_numbers, line_texts, bounds, top10_prefix = index
+        assert 1 not in line_numbers  # heading
+        assert 5 in line_numbers
+        for (lo, hi), line_num in zip(bounds, line_numbers):
+            on_line = [i for i, m in enumerate(words) if findings.line_number(m.start()) == line_num]
+            assert hi - lo == len(on_line)
+            assert top10_prefix[hi] - top10_prefix[lo] == sum(1 for i in on_line if i % 2)
@@ -0,0 +1,111 @@
+"""Unit tests for per-stage profiling (core/profiler.py).
+
+Tests cover:
+- Stage measurements (wall/CPU time, allocation peak, model-load time)
+- Table, dict and Chrome trace output
+- Profiled analyze_text(): every artifact and dimension recorded, sequentially
+"""
+
+import json
+import time
+import tracemalloc
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.profiler import StageProfiler, model_load
+
+DOCUMENT = """# Caching Guide
+
+We delve into caching. Furthermore, a robust cache needs an eviction policy.
+
+## Eviction
+
+Moreover, eviction trims the cache to ninety percent of its budget.
+"""
+
+
+class TestStageProfiler:
+    """Tests for StageProfiler stages and model_load()."""
+
+    def test_records_wall_cpu_and_allocation(self):
+        profiler = StageProfiler()
+        with profiler.stage('allocate', 'dimension') as profile:
+            data = [bytes(1024) for _ in range(4096)]
+            profile.samples_analyzed = 3
+        profiler.close()
+
+        stage = profiler.stages[0]
+        assert (stage.name, stage.kind, stage.samples_analyzed) == ('allocate', 'dimension', 3)
+        assert stage.wall_seconds > 0 and stage.cpu_seconds > 0
+        assert stage.peak_alloc_bytes >= 4 * 1024 * 1024
+        assert len(data) == 4096
+        assert not tracemalloc.is_tracing()
+
+    def test_model_load_split_from_inference(self):
+        profiler = StageProfiler()
+        with profiler.stage('predictability', 'dimension'):
+            with model_load():
+                with model_load():  # nested loaders count once
+                    time.sleep(0.02)
+            time.sleep(0.01)
+        profiler.close()
+
+        stage = profiler.stages[0]
+        assert len(stage.model_loads) == 1
+        assert 0.02 <= stage.model_load_seconds < stage.wall_seconds
+        assert stage.inference_seconds == pytest.approx(stage.wall_seconds - stage.model_load_seconds)
+
+    def test_model_load_outside_stage_is_noop(self):
+        with model_load():
+            pass
+
+    def test_outputs(self, tmp_path):
+        profiler = StageProfiler()
+        with profiler.stage('spacy_docs', 'artifact'):
+            with model_load():
+                pass
+        with profiler.stage('syntactic', 'dimension'):
+            pass
+        profiler.close()
+
+        restored = StageProfiler.from_dict(json.loads(json.dumps(profiler.to_dict())))
+        assert restored.stages == profiler.stages
+        table = restored.format_table()
+        assert 'spacy_docs' in table and 'syntactic' in table and 'TOTAL' in table
+
+        path = tmp_path / "run.trace.json"
+        restored.write_chrome_trace(str(path))
+        events = json.loads(path.read_text())['traceEvents']
+        spans = [event for event in events if event['ph'] == 'X']
+        assert [event['name'] for event in spans] == ['spacy_docs', 'spacy_docs model load', 'syntactic']
+        assert spans[0]['ts'] <= spans[1]['ts'] and spans[2]['ts'] >= spans[0]['ts'] + spans[0]['dur']
+
+
+class TestProfiledAnalysis:
+    """Tests for analyze_text() with config.profiling."""
+
+    def test_every_stage_recorded_sequentially(self):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast', profiling=True,
+                                dimension_workers=4)
+        analyzer = AIPatternAnalyzer(config=config)
+        results = analyzer.analyze_text(DOCUMENT, config=config)
+
+        stages = StageProfiler.from_dict(results.metadata['profile']).stages
+        assert [stage.name for stage in stages] == \
+            ['document_context', 'markdown_ast'] + list(analyzer.dimensions)
+        for stage in stages:
+            if stage.kind == 'dimension':
+                assert stage.samples_analyzed == 1
+        for earlier, later in zip(stages, stages[1:]):
+            assert later.start_seconds >= earlier.start_seconds + earlier.wall_seconds
+        assert not tracemalloc.is_tracing()
+
+    def test_disabled_by_default(self):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast')
+        results = AIPatternAnalyzer(config=config).analyze_text(DOCUMENT, config=config)
+
+        assert 'profile' not in results.metadata
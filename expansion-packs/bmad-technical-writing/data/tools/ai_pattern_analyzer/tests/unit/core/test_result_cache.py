@@ -0,0 +1,231 @@
+"""Unit tests for the on-disk dimension result cache.
+
+Tests cover:
+- Round trips, persistence across instances and hit/miss counters
+- JSON payloads; pickled entries are discarded, never unpickled
+- Size-based least-recently-used eviction
+- Key composition (content, dimension, version, result-affecting config only)
+- AIPatternAnalyzer reuse across profile upgrades; failures are not cached
+"""
+
+import json
+import pickle
+from unittest.mock import patch
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.compact import IntSeries
+from ai_pattern_analyzer.core.result_cache import (
+    DimensionResultCache, content_hash, result_key
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DimensionResultCache(str(tmp_path / 'cache'))
+    yield cache
+    cache.close()
+
+
+class TestDimensionResultCache:
+    """Tests for storage and eviction."""
+
+    def test_round_trip(self, cache):
+        result = {'available': True, 'score': 1.5, 'pairs': [[1, 'a']]}
+
+        assert cache.get('k') is None
+        cache.put('k', 'burstiness', result)
+
+        assert cache.get('k') == result
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_persists_across_instances(self, tmp_path):
+        first = DimensionResultCache(str(tmp_path))
+        first.put('k', 'voice', {'available': True})
+        first.close()
+
+        second = DimensionResultCache(str(tmp_path))
+        try:
+            assert second.get('k') == {'available': True}
+        finally:
+            second.close()
+
+    def test_evicts_least_recently_used(self, cache):
+        payload = {'blob': 'x' * 1000}
+        cache.put('old', 'a', payload)
+        cache.put('recent', 'b', payload)
+        cache.get('old')  # 'recent' is now the least recently used entry
+
+        cache.max_bytes = 2500
+        cache.put('new', 'c', payload)
+
+        assert cache.get('recent') is None
+        assert cache.get('old') == payload
+        assert cache.get('new') == payload
+        assert cache.total_bytes() <= 2500
+
+    def test_unreadable_entry_is_a_miss(self, cache):
+        cache.put('k', 'a', {'available': True})
+        with cache._conn:
+            cache._conn.execute("UPDATE results SET payload = ? WHERE key = 'k'", (b'garbage',))
+
+        assert cache.get('k') is None
+        assert len(cache) == 0
+
+    def test_payload_is_json(self, cache):
+        cache.put('k', 'a', {'available': True, 'lengths': IntSeries([3, 5])})
+
+        payload = cache._conn.execute("SELECT payload FROM results WHERE key = 'k'").fetchone()[0]
+        assert json.loads(payload) == {'available': True, 'lengths': [3, 5]}
+        assert cache.get('k') == {'available': True, 'lengths': [3, 5]}
+
+    def test_pickled_entry_is_not_executed(self, cache, tmp_path):
+        marker = tmp_path / 'executed'
+
+        class Exploit:
+            def __reduce__(self):
+                return (open, (str(marker), 'w'))
+
+        cache.put('k', 'a', {'available': True})
+        with cache._conn:
+            cache._conn.execute("UPDATE results SET payload = ? WHERE key = 'k'",
+                                (pickle.dumps(Exploit()),))
+
+        assert cache.get('k') is None
+        assert not marker.exists()
+        assert len(cache) == 0
+
+
+class TestResultKey:
+    """Tests for what the cache key depends on."""
+
+    def key(self, config=None, text='Some text.', dimension='voice', version='v1'):
+        return result_key(content_hash(text), dimension, version, config or AnalysisConfig())
+
+    def test_depends_on_content_dimension_and_version(self):
+        base = self.key()
+
+        assert self.key(text='Other text.') != base
+        assert self.key(dimension='lexical') != base
+        assert self.key(version='v2') != base
+
+    def test_depends_on_result_affecting_config(self):
+        base = self.key()
+
+        assert self.key(AnalysisConfig(mode=AnalysisMode.FULL)) != base
+        assert self.key(AnalysisConfig(sampling_sections=9)) != base
+        assert self.key(AnalysisConfig(inference_backend='int8')) != base
+        assert self.key(AnalysisConfig(dimension_overrides={'voice': {'max_chars': 10}})) != base
+
+    def test_ignores_profile_and_scheduling(self):
+        base = self.key()
+
+        assert self.key(AnalysisConfig(dimension_profile='full')) == base
+        assert self.key(AnalysisConfig(dimension_workers=1, spacy_batch_size=2)) == base
+        assert self.key(AnalysisConfig(dimension_overrides={'lexical': {'max_chars': 10}})) == base
+
+    def test_dimension_version_tracks_source(self):
+        from ai_pattern_analyzer.dimensions.burstiness import BurstinessDimension
+        from ai_pattern_analyzer.dimensions.voice import VoiceDimension
+
+        assert BurstinessDimension().version == BurstinessDimension().version
+        assert BurstinessDimension().version != VoiceDimension().version
+
+    def test_dimension_version_tracks_shared_modules(self):
+        from ai_pattern_analyzer.dimensions import base_strategy
+
+        assert 'ai_pattern_analyzer.utils.pattern_matching' in base_strategy.SHARED_RESULT_MODULES
+        assert 'unknown' not in [base_strategy._module_source_digest(name)
+                                 for name in base_strategy.SHARED_RESULT_MODULES]
+
+
+TEXT = "# Notes\n\nThe first sentence is short. The second one is a little longer than that!\n"
+
+
+class TestAnalyzerCaching:
+    """Tests for cached dimension results in AIPatternAnalyzer."""
+
+    def test_profile_upgrade_reuses_computed_dimensions(self, tmp_path):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        fast = AnalysisConfig(dimension_profile='fast', cache_dir=str(tmp_path))
+        balanced = AnalysisConfig(dimension_profile='balanced', cache_dir=str(tmp_path))
+        AIPatternAnalyzer(config=fast).analyze_text(TEXT, config=fast)
+
+        analyzer = AIPatternAnalyzer(config=balanced)
+        computed = []
+        originals = {name: dim.analyze for name, dim in analyzer.dimensions.items()}
+
+        def recording(name):
+            def analyze(text, lines, **kwargs):
+                computed.append(name)
+                return originals[name](text, lines, **kwargs)
+            return analyze
+
+        for name, dim in analyzer.dimensions.items():
+            dim.analyze = recording(name)
+        try:
+            results = analyzer.analyze_text(TEXT, config=balanced)
+        finally:
+            for dim in analyzer.dimensions.values():
+                del dim.analyze
+
+        assert sorted(computed) == sorted(['voice', 'lexical', 'readability', 'sentiment'])
+        assert list(results.dimension_results) == list(analyzer.dimensions)
+
+    def test_cached_results_match_uncached(self, tmp_path):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        cached_config = AnalysisConfig(dimension_profile='fast', cache_dir=str(tmp_path))
+        analyzer = AIPatternAnalyzer(config=cached_config)
+
+        analyzer.analyze_text(TEXT, config=cached_config)
+        from_cache = analyzer.analyze_text(TEXT, config=cached_config)
+        uncached = analyzer.analyze_text(TEXT, config=AnalysisConfig(dimension_profile='fast'))
+
+        assert analyzer._result_caches[str(tmp_path)].hits == 4
+        assert from_cache.dimension_results == uncached.dimension_results
+
+    def test_shared_lexicon_change_invalidates(self, tmp_path, monkeypatch):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+        from ai_pattern_analyzer.dimensions import base_strategy
+        from ai_pattern_analyzer.utils import pattern_matching
+
+        def clear_versions():
+            base_strategy._module_source_digest.cache_clear()
+            base_strategy._dimension_version.cache_clear()
+
+        config = AnalysisConfig(dimension_profile='fast', cache_dir=str(tmp_path / 'cache'))
+        analyzer = AIPatternAnalyzer(config=config)
+        analyzer.analyze_text(TEXT, config=config)
+        cache = analyzer._result_caches[config.cache_dir]
+
+        # Same source, same key
+        analyzer.analyze_text(TEXT, config=config)
+        assert cache.hits == 4
+
+        # Add a word to a lexicon that lives in utils/pattern_matching.py
+        edited = tmp_path / 'pattern_matching.py'
+        with open(pattern_matching.__file__) as f:
+            edited.write_text(f.read().replace("AI_VOCABULARY = [", "AI_VOCABULARY = [\n    r'\\bsynergiz\\w*\\b',", 1))
+        monkeypatch.setattr(pattern_matching, '__file__', str(edited))
+        clear_versions()
+        try:
+            analyzer.analyze_text(TEXT, config=config)
+        finally:
+            monkeypatch.undo()
+            clear_versions()
+
+        assert cache.hits == 4
+        assert len(cache) == 8
+
+    def test_failed_results_not_cached(self, tmp_path):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = AnalysisConfig(dimension_profile='fast', cache_dir=str(tmp_path))
+        analyzer = AIPatternAnalyzer(config=config)
+
+        with patch.object(analyzer.dimensions['burstiness'], 'analyze', side_effect=RuntimeError("boom")):
+            analyzer.analyze_text(TEXT, config=config)
+
+        assert len(analyzer._result_caches[str(tmp_path)]) == 3
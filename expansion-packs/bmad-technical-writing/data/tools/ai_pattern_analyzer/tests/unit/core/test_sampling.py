@@ -0,0 +1,186 @@
+"""Unit tests for convergence-driven sampling (core/sampling.py).
+
+Tests cover:
+- Confidence intervals and the spread drawing order
+- Stratified, paragraph-aligned samples ("convergent" extract_samples())
+- SampleDraw: stopping on convergence, budget and failed rounds; summaries
+- Dimensions and analyze_text() reporting the achieved interval
+"""
+
+import math
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.benchmark import generate_document
+from ai_pattern_analyzer.core.sampling import (
+    SampleDraw, confidence_interval, metric_value, spread_order, stratified_samples, t_critical
+)
+
+
+def convergent(**overrides):
+    return AnalysisConfig(mode=AnalysisMode.SAMPLING, sampling_strategy='convergent', **overrides)
+
+
+SAMPLES = [(index * 100, f"sample {index}") for index in range(16)]
+
+
+class TestStatistics:
+    """Tests for t_critical(), confidence_interval() and spread_order()."""
+
+    def test_confidence_interval(self):
+        mean, half_width = confidence_interval([1.0, 2.0, 3.0])
+
+        assert mean == pytest.approx(2.0)
+        assert half_width == pytest.approx(t_critical(2) * 1.0 / math.sqrt(3))
+        assert confidence_interval([4.0, 4.0, 4.0]) == (4.0, 0.0)
+        assert confidence_interval([5.0])[1] == math.inf
+        assert t_critical(100) == 1.96
+
+    @pytest.mark.parametrize('count', [1, 5, 12, 16])
+    def test_spread_order_is_spread_permutation(self, count):
+        order = spread_order(count)
+
+        assert sorted(order) == list(range(count))
+        if count >= 4:
+            # The first two samples are the first stratum and the middle one
+            assert order[:2] == [0, count // 2]
+
+    def test_spread_order_power_of_two(self):
+        assert spread_order(8) == [0, 4, 2, 6, 1, 5, 3, 7]
+
+
+class TestStratifiedSamples:
+    """Tests for stratified_samples() and the "convergent" extract_samples()."""
+
+    def test_paragraph_aligned_strata(self):
+        text = generate_document(6000)
+
+        samples = stratified_samples(text, 8, 1000)
+
+        assert len(samples) == 8
+        for position, sample in samples:
+            assert position == 0 or text[position - 2:position] == '\n\n'
+            assert 500 <= len(sample) <= 1000
+            assert text[position:position + len(sample)] == sample
+        # One sample per stratum
+        strata = sorted(int(position // (len(text) / 8)) for position, _ in samples)
+        assert len(set(strata)) >= 7
+
+    def test_budget_limited_by_text_length(self):
+        assert len(stratified_samples("word " * 1000, 16, 2000)) == 2
+
+    def test_extract_samples_convergent(self):
+        text = generate_document(6000)
+        config = convergent(sampling_max_samples=6, sampling_chars_per_section=1000)
+
+        assert config.extract_samples(text) == stratified_samples(text, 6, 1000)
+
+
+class TestSampleDraw:
+    """Tests for SampleDraw."""
+
+    def run(self, draw, values):
+        results = []
+        for index, (position, _) in enumerate(draw.draw(results)):
+            results.append({'metric': {'value': values[index % len(values)]}})
+        return results
+
+    def test_constant_metric_stops_at_min_samples(self):
+        draw = SampleDraw(SAMPLES, convergent(sampling_min_samples=3), ('metric', 'value'))
+
+        results = self.run(draw, [2.0])
+
+        assert len(results) == 3 and draw.drawn == SAMPLES[:3]
+        summary = draw.summary(results)
+        assert summary['converged'] is True
+        assert summary['samples'] == 3 and summary['budget'] == 16
+        assert summary['ci_half_width'] == 0.0 and summary['metric'] == 'metric.value'
+
+    def test_noisy_metric_uses_budget(self):
+        draw = SampleDraw(SAMPLES, convergent(sampling_ci_width=0.01), ('metric', 'value'))
+
+        results = self.run(draw, [1.0, 9.0, 3.0, 12.0])
+
+        assert len(results) == 16
+        summary = draw.summary(results)
+        assert summary['converged'] is False
+        assert summary['ci_relative_width'] > 0.01 and summary['target_relative_width'] == 0.01
+
+    def test_wider_target_converges_sooner(self):
+        values = [10.0, 11.0, 9.0, 10.5, 9.5]
+        narrow = SampleDraw(SAMPLES, convergent(sampling_ci_width=0.02), ('metric', 'value'))
+        wide = SampleDraw(SAMPLES, convergent(sampling_ci_width=0.2), ('metric', 'value'))
+
+        assert len(self.run(wide, values)) < len(self.run(narrow, values))
+
+    def test_fixed_strategy_draws_every_sample(self):
+        config = AnalysisConfig(mode=AnalysisMode.SAMPLING, sampling_strategy='even')
+        draw = SampleDraw(SAMPLES[:5], config, ('metric', 'value'))
+
+        results = self.run(draw, [2.0])
+
+        assert len(results) == 5
+        assert draw.summary(results)['target_relative_width'] is None
+
+    def test_without_metric_draws_sampling_sections(self):
+        draw = SampleDraw(SAMPLES, convergent(sampling_sections=4), None)
+
+        assert len(self.run(draw, [2.0])) == 4
+        assert draw.summary([])['converged'] is False
+
+    def test_rounds(self):
+        draw = SampleDraw(SAMPLES, convergent(sampling_min_samples=3), ('metric', 'value'))
+        results = []
+        batches = []
+        for batch in draw.rounds(results):
+            batches.append(len(batch))
+            results.extend({'metric': {'value': 5.0}} for _ in batch)
+
+        assert batches == [3]
+        assert len(draw.drawn) == 3
+
+    def test_rounds_without_values_end(self):
+        draw = SampleDraw(SAMPLES, convergent(sampling_min_samples=3), ('metric', 'value'))
+        results = []
+        for batch in draw.rounds(results):
+            results.extend({} for _ in batch)  # e.g. a failed model
+
+        assert len(draw.drawn) == 3
+
+    def test_metric_value(self):
+        assert metric_value({'a': {'b': 3}}, ('a', 'b')) == 3.0
+        assert metric_value({'a': {'b': True}}, ('a', 'b')) is None
+        assert metric_value({'a': None}, ('a', 'b')) is None
+
+
+class TestSampledAnalysis:
+    """Tests for dimensions and analyze_text() with convergent sampling."""
+
+    def test_dimension_reports_sampling(self):
+        from ai_pattern_analyzer.dimensions.readability import ReadabilityDimension
+
+        text = generate_document(20000)
+        result = ReadabilityDimension().analyze(text, text.splitlines(), config=convergent())
+
+        sampling = result['sampling']
+        assert sampling['metric'] == 'flesch_reading_ease'
+        assert result['samples_analyzed'] == sampling['samples'] <= sampling['budget'] == 16
+        assert result['analyzed_text_length'] < len(text)
+
+    def test_direct_analysis_has_no_sampling(self):
+        from ai_pattern_analyzer.dimensions.readability import ReadabilityDimension
+
+        result = ReadabilityDimension().analyze("Short text. Two sentences.", [],
+                                                config=AnalysisConfig(mode=AnalysisMode.FULL))
+
+        assert result['sampling'] is None
+
+    def test_results_metadata(self):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = convergent(dimension_profile='fast')
+        results = AIPatternAnalyzer(config=config).analyze_text(generate_document(20000), config=config)
+
+        sampling = results.metadata['sampling']
+        assert {'perplexity', 'burstiness'} <= set(sampling)
+        assert all(1 <= entry['samples'] <= entry['budget'] for entry in sampling.values())
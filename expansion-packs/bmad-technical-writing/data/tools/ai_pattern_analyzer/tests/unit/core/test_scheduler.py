@@ -0,0 +1,264 @@
+"""Unit tests for DimensionScheduler.
+
+Tests cover:
+- Results keep dimension order and match sequential execution
+- Shared artifacts are built once and handed to every consumer
+- Independent dimensions run concurrently
+- Per-dimension budgets turn overruns into available=False results and stop the thread
+- Failing dimensions and artifact builders are isolated
+- Structure reuses the scheduler-built markdown AST
+- Process-pool execution matches thread execution
+- Shutting the process pool down cancels queued dimensions (Python 3.8 pools)
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+from ai_pattern_analyzer.core import scheduler as scheduler_module
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+from ai_pattern_analyzer.core.deadline import Deadline, DeadlineExceeded, check_deadline
+from ai_pattern_analyzer.core.document_context import DocumentContext
+from ai_pattern_analyzer.core.scheduler import DimensionScheduler
+
+
+class FakeDimension:
+    """Minimal dimension: records the artifacts it saw, optionally runs `work`."""
+
+    def __init__(self, name, artifacts=(), work=None):
+        self.dimension_name = name
+        self.required_artifacts = tuple(artifacts)
+        self.work = work
+        self.seen_artifacts = None
+
+    def analyze(self, text, lines=None, config=None, **kwargs):
+        self.seen_artifacts = kwargs.get('artifacts')
+        if self.work:
+            self.work()
+        return {'available': True, 'name': self.dimension_name, 'length': len(text)}
+
+
+def run(dimensions, **config_kwargs):
+    """Run fake dimensions through a fresh scheduler."""
+    config = AnalysisConfig(**config_kwargs)
+    return DimensionScheduler().run(dimensions, "Some text.", ["Some text."], config)
+
+
+class TestScheduling:
+    """Tests for ordering, sharing and concurrency."""
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_results_in_dimension_order(self, workers):
+        dims = {name: FakeDimension(name) for name in ['zeta', 'alpha', 'mid']}
+
+        results = run(dims, dimension_workers=workers)
+
+        assert list(results) == ['zeta', 'alpha', 'mid']
+        assert results['alpha'] == {'available': True, 'name': 'alpha', 'length': 10}
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_artifact_built_once_for_all_consumers(self, workers):
+        calls = []
+
+        def builder(text, config, consumers):
+            calls.append(len(consumers))
+            return object()
+
+        dims = {
+            'first': FakeDimension('first', ['markdown_ast']),
+            'second': FakeDimension('second', ['markdown_ast']),
+            'plain': FakeDimension('plain'),
+        }
+        with patch.dict(scheduler_module.ARTIFACT_BUILDERS, {'markdown_ast': builder}):
+            run(dims, dimension_workers=workers)
+
+        assert calls == [2]
+        assert dims['first'].seen_artifacts['markdown_ast'] is dims['second'].seen_artifacts['markdown_ast']
+
+    def test_independent_dimensions_run_concurrently(self):
+        # Both dimensions must be inside analyze() at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        dims = {name: FakeDimension(name, work=barrier.wait) for name in ['a', 'b']}
+
+        results = run(dims, dimension_workers=2)
+
+        assert all(result['available'] for result in results.values())
+
+    def test_dimension_waits_for_its_artifact(self):
+        order = []
+
+        def slow_builder(text, config, consumers):
+            time.sleep(0.1)
+            order.append('built')
+            return 'ast'
+
+        dims = {'consumer': FakeDimension('consumer', ['markdown_ast'], work=lambda: order.append('ran'))}
+        with patch.dict(scheduler_module.ARTIFACT_BUILDERS, {'markdown_ast': slow_builder}):
+            run(dims, dimension_workers=4)
+
+        assert order == ['built', 'ran']
+        assert dims['consumer'].seen_artifacts == {'markdown_ast': 'ast'}
+
+    def test_unknown_executor_rejected(self):
+        with pytest.raises(ValueError, match="dimension_executor"):
+            run({'a': FakeDimension('a')}, dimension_executor='gpu')
+
+
+class TestBudgetsAndFailures:
+    """Tests for per-dimension budgets and failure isolation."""
+
+    def test_overrun_reported_unavailable(self):
+        dims = {
+            'slow': FakeDimension('slow', work=lambda: time.sleep(2)),
+            'fast': FakeDimension('fast'),
+        }
+
+        start = time.perf_counter()
+        results = run(dims, dimension_workers=2, dimension_timeout_seconds=0.2)
+        elapsed = time.perf_counter() - start
+
+        assert results['slow']['available'] is False
+        assert 'timed out' in results['slow']['error']
+        assert results['fast']['available'] is True
+        assert elapsed < 1.5
+
+    def test_timed_out_dimension_frees_its_slot(self):
+        dims = {
+            'slow': FakeDimension('slow', work=lambda: time.sleep(2)),
+            'next': FakeDimension('next'),
+        }
+
+        start = time.perf_counter()
+        results = run(dims, dimension_workers=1, dimension_timeout_seconds=0.2)
+
+        assert results['next']['available'] is True
+        assert time.perf_counter() - start < 1.5
+
+    def test_timed_out_dimension_stops_at_next_check(self):
+        stopped = threading.Event()
+
+        def work():
+            try:
+                while True:
+                    check_deadline()
+                    time.sleep(0.01)
+            except DeadlineExceeded:
+                stopped.set()
+                raise
+
+        results = run({'slow': FakeDimension('slow', work=work)}, dimension_timeout_seconds=0.2)
+
+        assert results['slow'] == {'available': False, 'error': 'timed out after 0.2s'}
+        assert stopped.wait(2)
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_failing_dimension_isolated(self, workers):
+        def boom():
+            raise RuntimeError("broken")
+
+        dims = {'bad': FakeDimension('bad', work=boom), 'good': FakeDimension('good')}
+
+        results = run(dims, dimension_workers=workers)
+
+        assert results['bad'] == {'available': False, 'error': 'broken'}
+        assert results['good']['available'] is True
+
+    def test_failed_artifact_is_none(self):
+        def broken_builder(text, config, consumers):
+            raise RuntimeError("no parser")
+
+        dims = {'consumer': FakeDimension('consumer', ['markdown_ast'])}
+        with patch.dict(scheduler_module.ARTIFACT_BUILDERS, {'markdown_ast': broken_builder}):
+            results = run(dims, dimension_workers=4)
+
+        assert results['consumer']['available'] is True
+        assert dims['consumer'].seen_artifacts == {'markdown_ast': None}
+
+
+STRUCTURE_TEXT = (
+    "# Guide\n\n> A quote opens the section.\n\n"
+    "Read [the docs](https://example.com) first.\n\n"
+    "- one\n- two\n  - nested\n\n```python\nprint('x')\n```\n"
+)
+
+
+class TestDimensionArtifacts:
+    """Tests for real dimensions consuming scheduler artifacts."""
+
+    def test_structure_reuses_markdown_ast(self):
+        from ai_pattern_analyzer.dimensions.structure import StructureDimension
+
+        dim = StructureDimension()
+        config = AnalysisConfig()
+        lines = STRUCTURE_TEXT.splitlines()
+        expected = dim.analyze(STRUCTURE_TEXT, lines, config=config)
+
+        fresh = StructureDimension()
+        artifacts = DimensionScheduler.build_artifacts({'structure': fresh}, STRUCTURE_TEXT, config)
+        with patch.object(fresh, '_parse_to_ast') as mock_parse:
+            result = fresh.analyze(
+                STRUCTURE_TEXT, lines, config=config,
+                context=DocumentContext.from_text(STRUCTURE_TEXT), artifacts=artifacts
+            )
+
+        mock_parse.assert_not_called()
+        assert result == expected
+
+    def test_process_executor_matches_threads(self):
+        from ai_pattern_analyzer.core.dimension_loader import DimensionLoader
+        from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+
+        names = ['burstiness', 'formatting']
+        DimensionLoader().load_dimensions(names)
+        dims = {name: DimensionRegistry.get(name) for name in names}
+        text = "First paragraph here. It has words.\n\nSecond paragraph — with a dash.\n"
+        kwargs = {name: {'context': DocumentContext.from_text(text)} for name in names}
+
+        scheduler = DimensionScheduler()
+        try:
+            threaded = scheduler.run(dims, text, text.splitlines(), AnalysisConfig(), kwargs)
+            processed = scheduler.run(
+                dims, text, text.splitlines(),
+                AnalysisConfig(dimension_workers=2, dimension_executor='process'), kwargs
+            )
+        finally:
+            scheduler.shutdown()
+
+        assert processed == threaded
+
+
+class Python38Pool:
+    """Process pool stand-in with Python 3.8's shutdown() (no cancel_futures); never runs work."""
+
+    def __init__(self):
+        self.futures = []
+        self.shut_down = False
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True):
+        self.shut_down = True
+
+
+class TestProcessPoolShutdown:
+    """Tests for shutting the process pool down."""
+
+    def test_deadline_cancels_queued_dimensions(self):
+        pool = Python38Pool()
+        scheduler = DimensionScheduler()
+        scheduler._process_pool = pool
+        dims = {name: FakeDimension(name) for name in ('burstiness', 'formatting')}
+        config = AnalysisConfig(dimension_workers=2, dimension_executor='process')
+
+        with patch.object(scheduler, '_get_process_pool', return_value=pool):
+            results = scheduler.run(dims, "Some text.", ["Some text."], config, deadline=Deadline(0.2))
+
+        assert pool.shut_down and scheduler._process_pool is None
+        assert len(pool.futures) == 2 and all(future.cancelled() for future in pool.futures)
+        assert all(result.get('unfinished') for result in results.values())
+        assert not scheduler._process_futures
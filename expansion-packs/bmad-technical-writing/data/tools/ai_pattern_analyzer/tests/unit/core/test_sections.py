@@ -0,0 +1,196 @@
+"""Unit tests for section-level incremental analysis (core/sections.py).
+
+Tests cover:
+- Heading-boundary splitting (lossless, fence-aware incl. mid-line ```, only at paragraph breaks)
+- MomentStats merging and exact agreement with the statistics module
+- Merged section states match from-scratch analyze() for every section-capable dimension
+- Re-runs only re-process edited sections (in memory and via the on-disk cache)
+"""
+
+import random
+import statistics
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.document_context import DocumentContext
+from ai_pattern_analyzer.core.result_cache import DimensionResultCache
+from ai_pattern_analyzer.core.sections import (
+    MomentStats, SectionStateCache, analyze_by_sections, merge_moments, split_sections
+)
+from ai_pattern_analyzer.dimensions.burstiness import BurstinessDimension
+from ai_pattern_analyzer.dimensions.perplexity import PerplexityDimension
+
+
+DOCUMENT = """# Chapter 3: Caching
+
+Furthermore, caching is a pivotal technique. It is important to note that a robust cache
+needs an eviction policy. Short one. We will delve into the details.
+
+## Eviction
+
+- Least recently used entries go first.
+- Sizes are tracked per entry so the total stays bounded.
+
+Moreover, eviction trims to ninety percent. That avoids evicting on every insert, which would
+leverage nothing and cost a lot when the cache is full and busy with many concurrent writers.
+
+```python
+# Not a heading
+cache.put(key, value)
+```
+## Invalidation
+Keys include the module source digest. In summary, code changes invalidate entries.
+
+### Notes
+
+Additionally, the cache is content addressed. It is safe to share between processes because
+SQLite serializes the writers, and each reader sees a consistent snapshot of the table.
+"""
+
+FULL = AnalysisConfig(mode=AnalysisMode.FULL)
+
+
+class TestSplitSections:
+    """Tests for split_sections()."""
+
+    def test_sections_concatenate_to_document(self):
+        sections = split_sections(DOCUMENT)
+
+        assert ''.join(section.text for section in sections) == DOCUMENT
+        assert [section.index for section in sections] == list(range(len(sections)))
+
+    def test_cuts_only_at_headings_after_blank_lines(self):
+        sections = split_sections(DOCUMENT)
+
+        # '## Invalidation' follows a fence line, '# Not a heading' is code
+        firsts = [section.text.splitlines()[0] for section in sections]
+        assert firsts == ['# Chapter 3: Caching', '## Eviction', '### Notes']
+        assert sections[1].start_line == DOCUMENT.splitlines().index('## Eviction') + 1
+
+    def test_no_cut_between_inline_backtick_pair(self):
+        text = "# One\n\nOpen ``` mid-line.\n\n## Inside\n\nClose ``` here.\n\n## Two\n\nText."
+
+        firsts = [section.text.splitlines()[0] for section in split_sections(text)]
+
+        assert firsts == ['# One', '## Two']
+
+    def test_hash_depends_on_section_text_only(self):
+        edited = DOCUMENT.replace('Short one.', 'Short.')
+        before, after = split_sections(DOCUMENT), split_sections(edited)
+
+        assert [s.hash == t.hash for s, t in zip(before, after)] == [False, True, True]
+
+    def test_text_without_headings_is_one_section(self):
+        assert len(split_sections("Just a paragraph.\n\nAnd another.")) == 1
+        assert split_sections("")[0].text == ""
+
+
+class TestMomentStats:
+    """Tests for mergeable moments."""
+
+    def test_matches_statistics_module(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            values = [rng.randint(1, 60) for _ in range(rng.randint(2, 40))]
+            stats = MomentStats.of(values)
+
+            assert stats.mean == statistics.mean(values)
+            assert stats.stdev == statistics.stdev(values)
+            assert (stats.min, stats.max) == (min(values), max(values))
+
+    def test_merge_equals_combined_samples(self):
+        parts = [[3, 9, 4], [], [12], [7, 7]]
+
+        merged = merge_moments(MomentStats.of(part) for part in parts)
+
+        assert merged == MomentStats.of([3, 9, 4, 12, 7, 7])
+        assert MomentStats.of(parts[0]).count == 3  # inputs are not modified
+
+
+class TestSectionParity:
+    """Merged section states must equal a from-scratch analysis."""
+
+    @pytest.mark.parametrize('dimension_class', [BurstinessDimension, PerplexityDimension])
+    @pytest.mark.parametrize('config', [FULL, AnalysisConfig()])
+    def test_merged_matches_direct_analysis(self, dimension_class, config):
+        dim = dimension_class()
+        direct = dim.analyze(DOCUMENT, DOCUMENT.splitlines(), config,
+                             context=DocumentContext.from_text(DOCUMENT))
+
+        merged = analyze_by_sections(dim, DOCUMENT, config, SectionStateCache())
+
+        assert merged == direct
+
+    @pytest.mark.parametrize('dimension_class', [BurstinessDimension, PerplexityDimension])
+    def test_states_round_trip_through_disk_cache(self, dimension_class, tmp_path):
+        dim = dimension_class()
+        store = DimensionResultCache(str(tmp_path))
+        try:
+            analyze_by_sections(dim, DOCUMENT, FULL, SectionStateCache(), store)
+            reloaded = analyze_by_sections(dim, DOCUMENT, FULL, SectionStateCache(), store)
+        finally:
+            store.close()
+
+        assert store.hits == len(split_sections(DOCUMENT))
+        assert reloaded == dim.analyze(DOCUMENT, DOCUMENT.splitlines(), FULL)
+
+    def test_sampled_config_falls_back(self):
+        config = AnalysisConfig(mode=AnalysisMode.SAMPLING, sampling_sections=2,
+                                sampling_chars_per_section=200)
+
+        assert analyze_by_sections(BurstinessDimension(), DOCUMENT * 10, config, SectionStateCache()) is None
+
+
+class TestIncrementalReruns:
+    """Re-runs only re-process sections whose text changed."""
+
+    def count_sections(self, dim):
+        analyzed = []
+        original = dim.analyze_section
+
+        def analyze_section(text):
+            analyzed.append(text)
+            return original(text)
+
+        dim.analyze_section = analyze_section
+        return analyzed
+
+    def test_only_edited_section_reprocessed(self):
+        dim = BurstinessDimension()
+        states = SectionStateCache()
+        analyzed = self.count_sections(dim)
+        edited = DOCUMENT.replace('Short one.', 'Now it is a much longer sentence than before.')
+
+        analyze_by_sections(dim, DOCUMENT, FULL, states)
+        result = analyze_by_sections(dim, edited, FULL, states)
+
+        assert len(analyzed) == 3 + 1
+        assert result == dim.analyze(edited, edited.splitlines(), FULL)
+
+    def test_states_survive_lru_bound(self):
+        states = SectionStateCache(max_entries=2)
+        for key in 'abc':
+            states.put(key, {'state': key})
+
+        assert len(states) == 2
+        assert states.get('a') is None
+        assert states.get('c') == {'state': 'c'}
+
+    def test_analyzer_uses_sections_and_disk_cache(self, tmp_path):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast',
+                                incremental_sections=True, cache_dir=str(tmp_path))
+        edited = DOCUMENT.replace('### Notes', '### More notes')
+        AIPatternAnalyzer(config=config).analyze_text(DOCUMENT, config=config)
+
+        # A fresh analyzer (empty memory cache) reads unchanged sections from disk
+        analyzer = AIPatternAnalyzer(config=config)
+        analyzed = self.count_sections(analyzer.dimensions['perplexity'])
+        results = analyzer.analyze_text(edited, config=config)
+
+        scratch_config = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast')
+        scratch = AIPatternAnalyzer(config=scratch_config).analyze_text(edited, config=scratch_config)
+
+        assert analyzed == [split_sections(edited)[2].text]
+        assert results.dimension_results == scratch.dimension_results
@@ -0,0 +1,207 @@
+"""Unit tests for bounded-memory streaming analysis (core/streaming.py).
+
+Tests cover:
+- File reading (buffered and memory-mapped) and chunk cutting
+- RunningMetrics folds like _aggregate_sampled_metrics() with bounded lists
+- Streamed section-capable dimensions equal a FULL analysis
+- analyze_iter() snapshots, analyze_file() in STREAMING mode, and the deadline
+"""
+
+import pytest
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+from ai_pattern_analyzer.core.deadline import Deadline
+from ai_pattern_analyzer.core.streaming import (
+    RunningMetrics, iter_chunks, iter_file_text
+)
+from ai_pattern_analyzer.dimensions.burstiness import BurstinessDimension
+
+
+SECTION = """## Section {n}
+
+Furthermore, caching is a pivotal technique. It is important to note that a robust cache
+needs an eviction policy. Short one. We will delve into the details of section {n}.
+
+- Least recently used entries go first.
+- Sizes are tracked per entry so the total stays bounded.
+
+<!-- reviewer note {n}: keep this paragraph -->
+Moreover, eviction trims to ninety percent. That avoids evicting on every insert, which would
+leverage nothing and cost a lot when the cache is full and busy with many concurrent writers.
+
+```python
+# Not a heading
+cache.put(key, value)
+```
+
+"""
+
+BOOK = "# Anthology\n\n" + "".join(SECTION.format(n=n) for n in range(40))
+
+# ``` pairs opened and closed mid-line, several paragraphs apart
+INLINE_FENCES = "# Inline fences\n\n" + (
+    "Type ``` to open an inline fence in this paragraph.\n\n"
+    + "Several words sit here between the markers, and they are code to the stripper.\n\n" * 4
+    + "Then ``` closes it again, and prose resumes with more words to count.\n\n"
+) * 30
+
+
+def stream_config(**overrides):
+    settings = dict(mode=AnalysisMode.STREAMING, dimension_profile='fast',
+                    max_analysis_time_seconds=None, stream_chunk_chars=2000)
+    settings.update(overrides)
+    return AnalysisConfig(**settings)
+
+
+class TestChunking:
+    """Tests for iter_file_text() and iter_chunks()."""
+
+    @pytest.mark.parametrize('mmap_threshold', [0, 1 << 30])
+    def test_reads_file_text(self, tmp_path, mmap_threshold):
+        path = tmp_path / "book.md"
+        path.write_bytes("Café — naïve\r\nsecond line\r\n".encode('utf-8') * 50)
+
+        blocks = list(iter_file_text(str(path), 7, mmap_threshold=mmap_threshold))
+
+        assert ''.join(blocks) == path.read_text(encoding='utf-8')
+
+    def test_chunks_are_lossless_and_cut_at_breaks(self):
+        chunks = list(iter_chunks([BOOK[i:i + 300] for i in range(0, len(BOOK), 300)], 2000))
+
+        assert ''.join(chunks) == BOOK
+        assert len(chunks) > 5
+        for chunk in chunks[1:]:
+            assert chunk.startswith('## Section')
+        for chunk in chunks:
+            assert chunk.count('<!--') == chunk.count('-->')
+            assert chunk.count('```') % 2 == 0
+
+    def test_long_section_cut_at_paragraph_break(self):
+        text = "# One section\n\n" + "A paragraph of words here.\n\n" * 200
+
+        chunks = list(iter_chunks([text], 1000))
+
+        assert ''.join(chunks) == text
+        assert all(chunk.endswith('\n\n') for chunk in chunks[:-1])
+
+    def test_never_cuts_between_inline_backtick_pairs(self):
+        chunks = list(iter_chunks([INLINE_FENCES], 300))
+
+        assert ''.join(chunks) == INLINE_FENCES
+        assert len(chunks) > 5
+        assert all(chunk.count('```') % 2 == 0 for chunk in chunks)
+
+    def test_oversized_paragraph_cut_at_line_break(self):
+        text = "one long line of text\n" * 1000
+
+        chunks = list(iter_chunks([text], 1000))
+
+        assert ''.join(chunks) == text
+        assert max(len(chunk) for chunk in chunks) <= 4 * 1000 + 22
+
+
+class TestRunningMetrics:
+    """Tests for the running sample aggregate."""
+
+    def test_matches_sampled_aggregation(self):
+        samples = [
+            {'score': 85, 'flat': True, 'label': 'LOW', 'words': ['delve'],
+             'nested': {'mean': 2.0, 'level': 'HIGH'}, 'optional': None},
+            {'score': 90, 'flat': False, 'label': 'LOW', 'words': ['robust', 'delve'],
+             'nested': {'mean': 4.0, 'level': 'LOW'}, 'optional': None},
+            {'score': 88, 'flat': False, 'label': 'HIGH', 'words': ['leverage'],
+             'nested': {'mean': 6.0, 'level': 'LOW'}, 'optional': None},
+        ]
+        running = RunningMetrics()
+        for sample in samples:
+            running.add(sample)
+
+        assert running.value() == BurstinessDimension()._aggregate_sampled_metrics(samples)
+
+    def test_lists_are_bounded(self):
+        running = RunningMetrics(list_limit=5)
+        for n in range(100):
+            running.add({'items': [f"item-{n}-{i}" for i in range(3)]})
+
+        assert len(running.value()['items']) == 5
+        assert running.count == 100
+
+
+class TestAnalyzeIter:
+    """Tests for AIPatternAnalyzer.analyze_iter()."""
+
+    @pytest.fixture
+    def book(self, tmp_path):
+        path = tmp_path / "anthology.md"
+        path.write_text(BOOK, encoding='utf-8')
+        return str(path)
+
+    def test_progressive_snapshots(self, book):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = stream_config()
+        snapshots = list(AIPatternAnalyzer(config=config).analyze_iter(book, config=config))
+
+        progress = [snapshot.stream_progress for snapshot in snapshots]
+        assert len(snapshots) > 5
+        assert progress == sorted(progress) and progress[-1] == 1.0
+        assert snapshots[0].total_words < snapshots[-1].total_words
+        final = snapshots[-1].dimension_results
+        assert final['structure']['samples_analyzed'] == len(snapshots)
+        assert final['formatting']['coverage_percentage'] == 100.0
+
+    def test_section_dimensions_match_full_analysis(self, book):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        full_config = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast')
+        full = AIPatternAnalyzer(config=full_config).analyze_file(book, config=full_config)
+        config = stream_config()
+        streamed = AIPatternAnalyzer(config=config).analyze_file(book, config=config)
+
+        assert streamed.stream_progress == 1.0
+        assert streamed.dimension_results['perplexity']['ai_vocabulary'] == \
+            full.dimension_results['perplexity']['ai_vocabulary']
+        assert streamed.dimension_results['perplexity']['formulaic_transitions'] == \
+            full.dimension_results['perplexity']['formulaic_transitions']
+        expected = dict(full.dimension_results['burstiness']['sentence_burstiness'], lengths=[])
+        assert streamed.dimension_results['burstiness']['sentence_burstiness'] == expected
+        assert streamed.paragraph_stdev == full.paragraph_stdev
+        assert streamed.burstiness_score == full.burstiness_score
+
+    def test_total_words_match_full_analysis_with_inline_fences(self, tmp_path):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        path = tmp_path / "inline.md"
+        path.write_text(INLINE_FENCES, encoding='utf-8')
+        full_config = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast')
+        full = AIPatternAnalyzer(config=full_config).analyze_file(str(path), config=full_config)
+        config = stream_config(stream_chunk_chars=300)
+
+        snapshots = list(AIPatternAnalyzer(config=config).analyze_iter(str(path), config=config))
+
+        assert len(snapshots) > 5
+        assert snapshots[-1].total_words == full.total_words
+
+    def test_empty_file(self, tmp_path):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        path = tmp_path / "empty.md"
+        path.write_text("", encoding='utf-8')
+        config = stream_config()
+
+        snapshots = list(AIPatternAnalyzer(config=config).analyze_iter(str(path), config=config))
+
+        assert len(snapshots) == 1
+        assert snapshots[0].stream_progress == 1.0
+        assert snapshots[0].total_words == 0
+
+    def test_expired_deadline_stops_stream(self, book):
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = stream_config()
+        snapshots = list(AIPatternAnalyzer(config=config).analyze_iter(
+            book, config=config, deadline=Deadline(0.0)
+        ))
+
+        assert len(snapshots) == 1
+        assert snapshots[0].stream_progress < 1.0
+        assert {'perplexity', 'burstiness'} <= set(snapshots[0].unfinished_dimensions)
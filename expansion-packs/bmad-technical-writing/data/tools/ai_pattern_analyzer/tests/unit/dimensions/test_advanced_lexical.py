@@ -412,7 +412,7 @@ class TestAdvancedLexicalDiversityCalculation:
 class TestTextacyLexicalDiversityCalculation:
     """Tests for _calculate_textacy_lexical_diversity() helper method."""
 
-    @patch('ai_pattern_analyzer.dimensions.advanced_lexical.nlp_spacy')
+    @patch('ai_pattern_analyzer.utils.spacy_service.parse')
     def test_mattr_calculation(self, mock_nlp, dimension):
         """Test MATTR calculation."""
         # Mock spacy doc with iterable tokens for RTTR calculation
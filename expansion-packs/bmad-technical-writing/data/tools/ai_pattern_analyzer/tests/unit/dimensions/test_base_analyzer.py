@@ -56,11 +56,10 @@ def hello():
 class TestInit:
     """Tests for __init__ method."""
 
-    def test_init_creates_parser_cache(self, analyzer):
-        """Test that init creates AST cache."""
+    def test_init_creates_parser_without_private_cache(self, analyzer):
+        """Test that init creates the parser slot; ASTs are cached by markdown_service."""
         assert hasattr(analyzer, '_markdown_parser')
-        assert hasattr(analyzer, '_ast_cache')
-        assert analyzer._ast_cache == {}
+        assert not hasattr(analyzer, '_ast_cache')
 
 
 class TestAbstractMethods:
@@ -175,21 +174,22 @@ class TestParseToAst:
         assert hasattr(ast, 'children')
 
     def test_parse_to_ast_caching(self, analyzer, markdown_text):
-        """Test AST caching behavior."""
-        # Parse with cache key
+        """Test AST caching is keyed by content, not by cache_key."""
         ast1 = analyzer._parse_to_ast(markdown_text, cache_key="test_key")
-        assert "test_key" in analyzer._ast_cache
 
-        # Should return cached version
+        # Same text: cached version
+        assert analyzer._parse_to_ast(markdown_text, cache_key="other_key") is ast1
+
+        # Different text under the same key: never a stale AST
         ast2 = analyzer._parse_to_ast("different text", cache_key="test_key")
-        assert ast2 is ast1  # Same object
+        assert ast2 is not ast1
 
     def test_parse_to_ast_no_cache_key(self, analyzer, markdown_text):
-        """Test parsing without caching."""
+        """Test parsing without a cache key still shares the parsed AST."""
         ast = analyzer._parse_to_ast(markdown_text)
 
         assert ast is not None
-        assert len(analyzer._ast_cache) == 0
+        assert analyzer._parse_to_ast(markdown_text) is ast
 
     def test_parse_to_ast_empty_text(self, analyzer):
         """Test parsing empty text."""
@@ -325,7 +325,7 @@ class TestIntegration:
             assert isinstance(text, str)
 
         # Verify caching
-        assert "integration" in analyzer._ast_cache
+        assert analyzer._parse_to_ast(markdown_text) is ast
 
     def test_dimension_methods_work_together(self, analyzer):
         """Test that all dimension methods work together."""
@@ -436,12 +436,21 @@ def test_parse_to_ast_caching(dimension, markdown_text):
 
 
 def test_parse_to_ast_different_cache_keys(dimension, markdown_text):
-    """Test different cache keys store separately."""
+    """Test ASTs are keyed by content, whatever the cache key."""
     ast1 = dimension._parse_to_ast(markdown_text, cache_key='key1')
     ast2 = dimension._parse_to_ast(markdown_text, cache_key='key2')
 
-    # Different cache keys, so different objects (re-parsed)
+    # Same content, so one parse
+    assert ast1 is ast2
+
+
+def test_parse_to_ast_different_text_same_cache_key(dimension, markdown_text):
+    """Test a fixed cache key never returns the AST of another text."""
+    ast1 = dimension._parse_to_ast(markdown_text, cache_key='fixed')
+    ast2 = dimension._parse_to_ast("# Another document", cache_key='fixed')
+
     assert ast1 is not ast2
+    assert ast2.children[0].children[0].children == 'Another document'
 
 
 def test_parse_to_ast_no_cache_key(dimension, markdown_text):
@@ -449,8 +458,8 @@ def test_parse_to_ast_no_cache_key(dimension, markdown_text):
     ast1 = dimension._parse_to_ast(markdown_text)
     ast2 = dimension._parse_to_ast(markdown_text)
 
-    # No caching, so different objects
-    assert ast1 is not ast2
+    # Content-keyed cache, so the same object
+    assert ast1 is ast2
 
 
 def test_walk_ast_find_headings(dimension, markdown_text):
@@ -640,6 +649,3 @@ def test_ast_cache_persists_across_calls(dimension, markdown_text):
 
     # Should be the exact same object from cache
     assert ast1 is ast2
-
-    # Verify cache was actually used (check internal state)
-    assert 'persist_test' in dimension._ast_cache
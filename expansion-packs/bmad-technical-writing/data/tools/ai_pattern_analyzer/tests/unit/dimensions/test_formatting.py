@@ -292,6 +292,19 @@ class TestAnalyzeFormattingIssuesDetailed:
         italic_issues = [i for i in issues if 'italic' in i.issue_type.lower()]
         assert len(italic_issues) > 0
 
+    def test_bold_is_not_counted_as_italic(self, analyzer):
+        """Test **bold** and __bold__ spans are not reported as italics too."""
+        lines = [
+            "This has **too** **much** **bold** __text__ __here__.",
+            "This has **bold** words and *one* *two* *three* italic ones."
+        ]
+        issues = analyzer._analyze_formatting_issues_detailed(lines)
+
+        assert [(i.line_number, i.issue_type) for i in issues] == \
+            [(1, 'bold_dense'), (2, 'italic_dense')]
+        italic = issues[1]
+        assert italic.density == pytest.approx(30.0)
+
     def test_formatting_issues_line_numbers(self, analyzer):
         """Test that line numbers are tracked."""
         lines = [
@@ -7,6 +7,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from ai_pattern_analyzer.dimensions.predictability import PredictabilityDimension
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
+from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
 
 
 @pytest.fixture
@@ -73,9 +74,8 @@ class TestDimensionMetadata:
 class TestAnalyzeMethod:
     """Tests for analyze() method - must ONLY collect GLTR metrics."""
 
-    @patch('ai_pattern_analyzer.dimensions.predictability._perplexity_model')
-    @patch('ai_pattern_analyzer.dimensions.predictability._perplexity_tokenizer')
-    def test_analyze_returns_gltr_metrics_only(self, mock_tokenizer, mock_model, dimension):
+    @patch.dict('ai_pattern_analyzer.dimensions.predictability._perplexity_models', clear=True)
+    def test_analyze_returns_gltr_metrics_only(self, dimension):
         """Test analyze() collects ONLY GLTR metrics (no HDD, Yule's K, MATTR, etc.)."""
         # Mock GLTR calculation to return fake metrics
         with patch.object(dimension, '_calculate_gltr_metrics', return_value={
@@ -109,6 +109,17 @@ class TestAnalyzeMethod:
             assert 'available' in result
             assert result['available'] is True
 
+    @pytest.mark.parametrize('metrics', [None, {}])
+    def test_analyze_without_ranks_is_unavailable(self, dimension, metrics):
+        """Test a timed-out or failed GLTR pass reports unavailable instead of neutral values."""
+        with patch.object(dimension, '_calculate_gltr_metrics_with_timeout', return_value=metrics):
+            result = dimension.analyze("Sample text for GLTR analysis.")
+
+        assert result['available'] is False
+        assert 'no token ranks' in result['error']
+        assert 'gltr_top10_percentage' not in result
+        assert result['samples_analyzed'] == 1
+
     def test_analyze_handles_empty_text(self, dimension):
         """Test analyze() handles empty text gracefully."""
         result = dimension.analyze("")
@@ -267,8 +278,7 @@ class TestGetTiers:
 class TestGLTRMetricCalculation:
     """Tests for _calculate_gltr_metrics() helper method."""
 
-    @patch('ai_pattern_analyzer.dimensions.predictability._perplexity_model', None)
-    @patch('ai_pattern_analyzer.dimensions.predictability._perplexity_tokenizer', None)
+    @patch.dict('ai_pattern_analyzer.dimensions.predictability._perplexity_models', clear=True)
     def test_gltr_loads_model_lazily(self, dimension):
         """Test GLTR loads model on first use (lazy loading)."""
         # This would trigger model loading in real scenario
@@ -300,6 +310,300 @@ class TestGLTRMetricCalculation:
         result = dimension._calculate_gltr_metrics(text_with_code)
         assert isinstance(result, dict)
 
+    def test_ranks_from_logits_counts_greater_logits(self, dimension):
+        """Test vectorized rank equals count of logits above the target's logit."""
+        import torch
+
+        logits = torch.tensor([
+            [0.1, 0.9, 0.5, 0.3],  # target 2 -> only 0.9 is greater -> rank 1
+            [2.0, 1.0, 0.0, 3.0],  # target 3 -> highest -> rank 0
+            [0.0, 0.1, 0.2, 0.3],  # target 0 -> lowest -> rank 3
+        ])
+        targets = torch.tensor([2, 3, 0])
+
+        assert dimension._ranks_from_logits(logits, targets) == [1, 0, 3]
+
+    def test_ranks_from_logits_matches_argsort_rank(self, dimension):
+        """Test vectorized ranks match the argsort-based rank lookup."""
+        import torch
+
+        torch.manual_seed(0)
+        logits = torch.randn(300, 1000)  # More rows than one comparison chunk
+        targets = torch.randint(0, 1000, (300,))
+
+        expected = []
+        for row, target in zip(logits, targets):
+            sorted_indices = torch.argsort(torch.softmax(row, dim=-1), descending=True)
+            expected.append((sorted_indices == target).nonzero(as_tuple=True)[0].item())
+
+        assert dimension._ranks_from_logits(logits, targets) == expected
+
+    def test_summarize_ranks(self, dimension):
+        """Test rank array converts into GLTR metrics."""
+        ranks = [0, 5, 50, 500, 5000]
+        result = dimension._summarize_ranks(ranks)
+
+        assert result['gltr_top10_percentage'] == 0.4
+        assert result['gltr_top100_percentage'] == 0.6
+        assert result['gltr_top1000_percentage'] == 0.8
+        assert result['gltr_mean_rank'] == 1111.0
+        assert result['gltr_likelihood'] == 0.2
+
+    def test_summarize_ranks_empty(self, dimension):
+        """Test empty rank array returns empty metrics."""
+        assert dimension._summarize_ranks([]) == {}
+
+
+class TestSlidingWindowRanks:
+    """Tests for KV-cache sliding-window ranking of texts beyond model context."""
+
+    @pytest.fixture
+    def tiny_model(self):
+        """Randomly initialised GPT-2 with a 64-token context (no download)."""
+        import torch
+        from transformers import GPT2Config, GPT2LMHeadModel
+
+        torch.manual_seed(0)
+        config = GPT2Config(vocab_size=200, n_positions=64, n_embd=32, n_layer=2, n_head=2)
+        return GPT2LMHeadModel(config).eval()
+
+    @pytest.fixture
+    def tokens(self):
+        """Token ids spanning several 64-token windows."""
+        import random
+
+        rng = random.Random(0)
+        return [rng.randrange(200) for _ in range(300)]
+
+    def test_every_token_after_first_is_ranked(self, dimension, tiny_model, tokens):
+        """Test sliding window reports a rank for every token after the first."""
+        with patch.object(dimension, '_load_model', return_value=(tiny_model, None)):
+            ranks = dimension._compute_token_ranks_sliding(tokens, context_overlap=16, chunk_size=10)
+
+        assert len(ranks) == len(tokens) - 1
+
+    def test_first_window_matches_single_pass(self, dimension, tiny_model, tokens):
+        """Test cached chunked ranking matches one forward pass in the first window."""
+        with patch.object(dimension, '_load_model', return_value=(tiny_model, None)):
+            sliding = dimension._compute_token_ranks_sliding(tokens, context_overlap=16, chunk_size=10)
+            single = dimension._compute_token_ranks(tokens[:64])
+
+        assert sliding[:63] == single
+
+    def test_later_window_uses_overlap_context(self, dimension, tiny_model, tokens):
+        """Test tokens in a later window are ranked with the carried-over context."""
+        with patch.object(dimension, '_load_model', return_value=(tiny_model, None)):
+            sliding = dimension._compute_token_ranks_sliding(tokens, context_overlap=16, chunk_size=10)
+            # Second window = 16 context tokens (48-63) + 48 new tokens (64-111)
+            reference = dimension._compute_token_ranks(tokens[48:112])
+
+        assert sliding[63:111] == reference[15:63]
+
+    def test_long_sequence_dispatches_to_sliding(self, dimension, tiny_model, tokens):
+        """Test _compute_token_ranks no longer truncates beyond model context."""
+        with patch.object(dimension, '_load_model', return_value=(tiny_model, None)):
+            ranks = dimension._compute_token_ranks(tokens, context_overlap=16)
+
+        assert len(ranks) == len(tokens) - 1
+
+
+class TestBatchedRanks:
+    """Tests for padded multi-sample GLTR ranking (SAMPLING/ADAPTIVE modes)."""
+
+    @pytest.fixture
+    def tiny_model(self):
+        """Randomly initialised GPT-2 with a 64-token context (no download)."""
+        import torch
+        from transformers import GPT2Config, GPT2LMHeadModel
+
+        torch.manual_seed(0)
+        config = GPT2Config(vocab_size=200, n_positions=64, n_embd=32, n_layer=2, n_head=2)
+        return GPT2LMHeadModel(config).eval()
+
+    @pytest.fixture
+    def token_lists(self):
+        """Samples of uneven length, including one beyond the model context."""
+        import random
+
+        rng = random.Random(1)
+        return [[rng.randrange(200) for _ in range(n)] for n in (40, 12, 64, 25, 100, 1)]
+
+    def _reference_ranks(self, tokens, model):
+        """Unbatched, unpadded ranks from a plain forward pass."""
+        import torch
+
+        with torch.no_grad():
+            input_ids = torch.tensor([tokens])
+            logits = model(input_ids).logits[0, :-1, :]
+        return PredictabilityDimension._ranks_from_logits(logits, input_ids[0, 1:])
+
+    def test_batched_ranks_match_unbatched(self, dimension, tiny_model, token_lists):
+        """Test padded batches give the same ranks as one pass per sample."""
+        with patch.object(dimension, '_load_model', return_value=(tiny_model, None)):
+            batched = dimension._compute_token_ranks_batch(token_lists, token_budget=128, context_overlap=16)
+            sliding = dimension._compute_token_ranks_sliding(token_lists[4], context_overlap=16)
+
+        for tokens, ranks in zip(token_lists[:4], batched[:4]):
+            assert ranks == self._reference_ranks(tokens, tiny_model)
+        assert batched[4] == sliding
+        assert batched[5] == []
+
+    def test_token_budget_bounds_batch_size(self, dimension, tiny_model, token_lists):
+        """Test each forward call stays within the padded token budget."""
+        shapes = []
+        original = tiny_model.base_model.forward
+
+        def record(input_ids=None, **kwargs):
+            shapes.append(tuple(input_ids.shape))
+            return original(input_ids=input_ids, **kwargs)
+
+        with patch.object(dimension, '_load_model', return_value=(tiny_model, None)), \
+             patch.object(tiny_model.base_model, 'forward', side_effect=record):
+            dimension._compute_token_ranks_batch(token_lists[:4], token_budget=80)
+
+        assert len(shapes) > 1
+        assert all(rows * length <= 80 or rows == 1 for rows, length in shapes)
+
+    def test_metrics_batch_skips_short_samples(self, dimension):
+        """Test samples under 10 tokens yield {} without blocking the others."""
+        mock_tokenizer = MagicMock()
+        mock_tokenizer.encode.side_effect = lambda text: list(range(len(text.split())))
+
+        with patch.object(dimension, '_load_model', return_value=(MagicMock(), mock_tokenizer)), \
+             patch.object(dimension, '_compute_token_ranks_batch', return_value=[[0] * 11]) as mock_batch:
+            results = dimension._calculate_gltr_metrics_batch(["too short", "word " * 12])
+
+        assert results[0] == {}
+        assert results[1]['gltr_top10_percentage'] == 1.0
+        assert len(mock_batch.call_args[0][0]) == 1
+
+    def test_sampled_analyze_uses_single_batch_call(self, dimension):
+        """Test SAMPLING mode scores all samples through one batched call."""
+        config = AnalysisConfig(mode=AnalysisMode.SAMPLING, sampling_sections=3,
+                                sampling_chars_per_section=100)
+        sample_metrics = {'gltr_top10_percentage': 0.6, 'gltr_top100_percentage': 0.8,
+                          'gltr_top1000_percentage': 0.9, 'gltr_mean_rank': 30.0,
+                          'gltr_rank_variance': 50.0, 'gltr_likelihood': 0.4}
+
+        with patch.object(dimension, '_calculate_gltr_metrics_batch',
+                          return_value=[sample_metrics, {}, sample_metrics]) as mock_batch:
+            result = dimension.analyze("word " * 200, config=config)
+
+        assert mock_batch.call_count == 1
+        assert len(mock_batch.call_args[0][0]) == 3
+        assert result['gltr_top10_percentage'] == 0.6
+        assert result['samples_analyzed'] == 3
+
+
+class TestInferenceBackends:
+    """Tests for eager/int8/onnx backend selection in GLTR ranking."""
+
+    @pytest.fixture
+    def tiny_model(self):
+        """Randomly initialised GPT-2 with a 64-token context (no download)."""
+        import torch
+        from transformers import GPT2Config, GPT2LMHeadModel
+
+        torch.manual_seed(0)
+        config = GPT2Config(vocab_size=200, n_positions=64, n_embd=32, n_layer=2, n_head=2)
+        return GPT2LMHeadModel(config).eval()
+
+    @pytest.fixture
+    def tokens(self):
+        """Token ids spanning several 64-token windows."""
+        import random
+
+        rng = random.Random(2)
+        return [rng.randrange(200) for _ in range(200)]
+
+    def test_analyze_keeps_a_model_per_backend(self, dimension):
+        """Test each configured backend gets its own cached model (no reload when alternating)."""
+        PredictabilityDimension.clear_model_cache()
+        int8 = AnalysisConfig(mode=AnalysisMode.FAST, inference_backend='int8')
+        eager = AnalysisConfig(mode=AnalysisMode.FAST)
+        used = []
+
+        def calculate(text, **kwargs):
+            used.append(dimension._load_model(kwargs['backend'], kwargs['onnx_model_dir']))
+            return {}
+
+        with patch.object(PredictabilityDimension, '_build_model',
+                          side_effect=lambda backend, onnx_model_dir: (MagicMock(name=backend), MagicMock())) as mock_build, \
+             patch.object(dimension, '_calculate_gltr_metrics', side_effect=calculate):
+            for config in (int8, eager, int8, eager):
+                dimension.analyze("Sample text", config=config)
+
+        assert [c.args for c in mock_build.call_args_list] == [('int8', None), ('eager', None)]
+        assert used[0] is used[2] and used[1] is used[3] and used[0] is not used[1]
+        assert not hasattr(dimension, '_backend')
+        PredictabilityDimension.clear_model_cache()
+
+    def test_concurrent_loads_build_model_once(self, dimension):
+        """Test threads loading the same backend at once share one build."""
+        import threading
+        import time
+
+        PredictabilityDimension.clear_model_cache()
+        start = threading.Barrier(4)
+        loaded = []
+
+        def build(backend, onnx_model_dir):
+            time.sleep(0.05)
+            return MagicMock(), MagicMock()
+
+        def load():
+            start.wait()
+            loaded.append(dimension._load_model('int8'))
+
+        with patch.object(PredictabilityDimension, '_build_model', side_effect=build) as mock_build:
+            threads = [threading.Thread(target=load) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_build.call_count == 1
+        assert all(pair is loaded[0] for pair in loaded)
+        PredictabilityDimension.clear_model_cache()
+
+    def test_onnx_ranks_match_eager(self, dimension, tiny_model, tokens, tmp_path):
+        """Test ONNX backend (no KV cache) ranks long texts like the eager path."""
+        pytest.importorskip('onnxruntime')
+        from ai_pattern_analyzer.utils.inference_backend import OnnxCausalLM, export_onnx_model
+
+        export_onnx_model(tiny_model, None, str(tmp_path))
+        onnx_model = OnnxCausalLM(str(tmp_path))
+
+        eager = dimension._compute_token_ranks(tokens, context_overlap=16, model=tiny_model)
+        onnx = dimension._compute_token_ranks(tokens, context_overlap=16, model=onnx_model)
+        batched = dimension._compute_token_ranks_batch([tokens[:30], tokens[:50]], model=onnx_model)
+
+        assert len(onnx) == len(tokens) - 1
+        assert rank_agreement(eager, onnx) > 0.99
+        assert rank_agreement(batched[1], eager[:49]) > 0.99
+
+    def test_check_backend_drift_reports_rank_agreement(self, dimension, tiny_model, tokens):
+        """Test drift check ranks the same tokens with reference and candidate models."""
+        import copy
+        from ai_pattern_analyzer.utils.inference_backend import quantize_dynamic_int8
+
+        tokenizer = MagicMock()
+        tokenizer.encode.return_value = tokens[:60]
+        quantized = quantize_dynamic_int8(copy.deepcopy(tiny_model))
+
+        with patch.object(PredictabilityDimension, '_build_model',
+                          side_effect=[(tiny_model, tokenizer), (quantized, tokenizer)]):
+            drift = dimension.check_backend_drift(["some text"], 'int8')
+
+        assert drift['backend'] == 'int8'
+        assert drift['tokens'] == 59
+        assert drift['top10_agreement'] > 0.9
+
+
+def rank_agreement(reference, candidate):
+    """Fraction of positions with identical ranks."""
+    return sum(a == b for a, b in zip(reference, candidate)) / len(reference)
+
 
 class TestAnalyzeDetailed:
     """Tests for analyze_detailed() method."""
@@ -335,6 +639,79 @@ class TestAnalyzeDetailed:
         assert isinstance(result, list)
 
 
+class TestLineRankIndex:
+    """Tests for document-wide ranking mapped to lines (detailed mode)."""
+
+    @pytest.fixture
+    def word_tokenizer(self):
+        """Whitespace tokenizer returning ids and character offset mappings."""
+        import re
+
+        def tokenize(text, return_offsets_mapping=False):
+            matches = list(re.finditer(r'\S+', text))
+            return {
+                'input_ids': list(range(len(matches))),
+                'offset_mapping': [(m.start(), m.end()) for m in matches]
+            }
+
+        return tokenize
+
+    def test_heatmap_maps_ranks_to_content_lines(self, dimension, word_tokenizer):
+        """Test per-line ratios skip headings/code and use each line's tokens."""
+        lines = [
+            "alpha beta gamma delta",   # tokens 0-3 (ranks for 1-3)
+            "# Heading is skipped",
+            "epsilon zeta eta theta",   # tokens 4-7
+            "```",
+            "code inside fence",
+            "```",
+            "iota kappa lambda mu",     # tokens 8-11
+        ]
+        ranks = [0, 0, 0] + [0, 50, 50, 50] + [5, 500, 500, 500]
+
+        with patch.object(dimension, '_load_model', return_value=(MagicMock(), word_tokenizer)), \
+             patch.object(dimension, '_compute_token_ranks', return_value=ranks) as mock_ranks:
+            heatmap = dimension.analyze_line_heatmap(lines)
+
+        assert mock_ranks.call_count == 1
+        assert heatmap == {1: 1.0, 3: 0.25, 7: 0.25}
+
+    def test_every_segment_scored_with_one_ranking_pass(self, dimension, word_tokenizer):
+        """Test long documents are fully segmented without per-chunk model calls."""
+        lines = [' '.join(f"w{i}_{j}" for j in range(10)) for i in range(300)]
+        ranks = [0] * (300 * 10 - 1)
+
+        with patch.object(dimension, '_load_model', return_value=(MagicMock(), word_tokenizer)), \
+             patch.object(dimension, '_compute_token_ranks', return_value=ranks) as mock_ranks:
+            segments = dimension.analyze_detailed(lines)
+
+        assert mock_ranks.call_count == 1
+        # 8-line (80-word) segments: 37 full segments + 4 trailing lines
+        assert len(segments) == 38
+        assert segments[0].start_line == 1 and segments[0].end_line == 8
+        assert segments[-1].end_line == 300
+        assert all(seg.gltr_score == 1.0 for seg in segments)
+
+    def test_low_predictability_segments_not_flagged(self, dimension, word_tokenizer):
+        """Test segments at or below the 0.70 threshold are not reported."""
+        lines = [' '.join(f"w{i}_{j}" for j in range(10)) for i in range(16)]
+        ranks = [0, 100] * 80
+
+        with patch.object(dimension, '_load_model', return_value=(MagicMock(), word_tokenizer)), \
+             patch.object(dimension, '_compute_token_ranks', return_value=ranks[:159]):
+            segments = dimension.analyze_detailed(lines)
+
+        assert segments == []
+
+    def test_model_unavailable_warns(self, dimension, capsys):
+        """Test detailed analysis reports model failures instead of silently skipping."""
+        with patch.object(dimension, '_load_model', side_effect=RuntimeError("no model")):
+            segments = dimension.analyze_detailed(["Some content line here."])
+
+        assert segments == []
+        assert "no model" in capsys.readouterr().err
+
+
 class TestBackwardCompatibility:
     """Tests for backward compatibility alias."""
 
@@ -428,19 +805,17 @@ class TestModelCaching:
         assert callable(PredictabilityDimension.clear_model_cache)
 
     def test_clear_model_cache_resets_globals(self, dimension):
-        """Test clear_model_cache() clears global model variables."""
+        """Test clear_model_cache() clears the per-backend model cache."""
         import ai_pattern_analyzer.dimensions.predictability as pred_module
 
         # Set mock values
-        pred_module._perplexity_model = "mock_model"
-        pred_module._perplexity_tokenizer = "mock_tokenizer"
+        pred_module._perplexity_models[('eager', None)] = ("mock_model", "mock_tokenizer")
 
         # Clear cache
         PredictabilityDimension.clear_model_cache()
 
-        # Should be None after clearing
-        assert pred_module._perplexity_model is None
-        assert pred_module._perplexity_tokenizer is None
+        # Should be empty after clearing
+        assert pred_module._perplexity_models == {}
 
     def test_model_loading_is_thread_safe(self, dimension):
         """Test model loading uses lock for thread safety."""
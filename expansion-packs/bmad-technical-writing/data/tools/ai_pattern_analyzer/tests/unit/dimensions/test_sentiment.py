@@ -5,7 +5,7 @@ Story 1.4.6 - Adding missing test file for sentiment dimension.
 
 import pytest
 from unittest.mock import Mock, patch
-from ai_pattern_analyzer.dimensions.sentiment import SentimentDimension
+from ai_pattern_analyzer.dimensions.sentiment import SentimentDimension, clear_sentiment_cache
 from ai_pattern_analyzer.core.dimension_registry import DimensionRegistry
 from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
 
@@ -298,3 +298,136 @@ class TestBackwardCompatibility:
         assert result1['available'] == result2['available']
         if result1['available'] and result2['available']:
             assert result1['sentiment']['variance'] == result2['sentiment']['variance']
+
+
+class TestInferenceBackend:
+    """Tests for inference backend selection (eager/int8/onnx)."""
+
+    def test_analyze_uses_configured_backend(self, dimension, varied_sentiment_text):
+        """Test analyze() requests the pipeline for config.inference_backend."""
+        pipeline = Mock(side_effect=lambda texts, **kw: [{'label': 'POSITIVE', 'score': 0.9}] * len(texts))
+        config = AnalysisConfig(mode=AnalysisMode.FULL, inference_backend='onnx',
+                                onnx_model_dir='/models')
+
+        with patch('ai_pattern_analyzer.dimensions.sentiment.get_sentiment_pipeline',
+                   return_value=pipeline) as mock_get:
+            result = dimension.analyze(varied_sentiment_text, config=config)
+
+        mock_get.assert_called_once_with('onnx', '/models')
+        assert result['sentiment']['count'] >= 3
+
+    def test_pipelines_are_cached_per_backend(self):
+        """Test each backend keeps its own pipeline, built once even under concurrent loads."""
+        import threading
+        import ai_pattern_analyzer.dimensions.sentiment as sentiment_module
+
+        start = threading.Barrier(4)
+        loaded = []
+
+        def load(backend):
+            start.wait()
+            loaded.append((backend, sentiment_module.get_sentiment_pipeline(backend)))
+
+        with patch.dict(sentiment_module._sentiment_pipelines, clear=True), \
+             patch('ai_pattern_analyzer.dimensions.sentiment.build_sentiment_pipeline',
+                   side_effect=lambda backend, onnx_model_dir: Mock(name=backend)) as mock_build:
+            threads = [threading.Thread(target=load, args=(backend,))
+                       for backend in ('eager', 'int8', 'eager', 'int8')]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert sorted(c.args for c in mock_build.call_args_list) == [('eager', None), ('int8', None)]
+            assert set(sentiment_module._sentiment_pipelines) == {('eager', None), ('int8', None)}
+        for backend, pipeline in loaded:
+            assert pipeline is dict(loaded)[backend]
+
+    def test_check_backend_drift_compares_signed_scores(self, dimension):
+        """Test drift check scores the same chunks with both pipelines."""
+        reference = Mock(side_effect=lambda texts, **kw: [{'label': 'POSITIVE', 'score': 0.90}] * len(texts))
+        candidate = Mock(side_effect=lambda texts, **kw: [{'label': 'POSITIVE', 'score': 0.88}] * len(texts))
+
+        with patch('ai_pattern_analyzer.dimensions.sentiment.build_sentiment_pipeline',
+                   side_effect=[reference, candidate]):
+            drift = dimension.check_backend_drift(["chunk one", "chunk two"], 'int8')
+
+        assert drift['backend'] == 'int8'
+        assert drift['chunks'] == 2
+        assert drift['label_agreement'] == 1.0
+        assert drift['max_score_delta'] == pytest.approx(0.02)
+        assert drift['within_tolerance'] is True
+
+
+class TestBatchedScoring:
+    """Tests for batched, memoized chunk scoring."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        """Start each test with an empty score memo."""
+        clear_sentiment_cache()
+        yield
+        clear_sentiment_cache()
+
+    @pytest.fixture
+    def pipeline(self):
+        """Pipeline mock scoring texts containing 'bad' as NEGATIVE."""
+        return Mock(side_effect=lambda texts, **kw: [
+            {'label': 'NEGATIVE' if 'bad' in t else 'POSITIVE', 'score': 0.9} for t in texts
+        ])
+
+    def test_paragraphs_split_on_blank_lines(self, dimension, pipeline):
+        """Test paragraphs are separated by blank lines, not the literal 'nn'."""
+        text = "\n\n".join(f"Paragraph number {i} is long enough to count." for i in range(4))
+
+        with patch('ai_pattern_analyzer.dimensions.sentiment.get_sentiment_pipeline', return_value=pipeline):
+            result = dimension._analyze_sentiment_variance(text)
+
+        assert result['count'] == 4
+        assert pipeline.call_args[0][0][0] == "Paragraph number 0 is long enough to count."
+
+    def test_chunks_scored_in_one_batched_call(self, dimension, pipeline):
+        """Test all chunks go through a single pipeline call with batch_size."""
+        chunks = [f"chunk {i} with enough text" for i in range(10)]
+
+        scores = dimension._score_chunks(pipeline, chunks, batch_size=4)
+
+        assert pipeline.call_count == 1
+        assert pipeline.call_args[1]['batch_size'] == 4
+        assert scores == [0.9] * 10
+
+    def test_scores_memoized_by_content(self, dimension, pipeline):
+        """Test repeated chunks are only sent to the model once."""
+        key = ('eager', None)
+
+        dimension._score_chunks(pipeline, ["good text one", "bad text two"], cache_key=key)
+        scores = dimension._score_chunks(pipeline, ["bad text two", "good text one", "new text"], cache_key=key)
+
+        assert scores == [-0.9, 0.9, 0.9]
+        assert pipeline.call_count == 2
+        assert pipeline.call_args[0][0] == ["new text"]
+
+    def test_batch_failure_falls_back_per_chunk(self, dimension):
+        """Test a failing batch is retried per chunk, skipping bad chunks."""
+        def flaky(texts, **kw):
+            if isinstance(texts, list):
+                raise RuntimeError("batch failed")
+            if 'boom' in texts:
+                raise RuntimeError("chunk failed")
+            return [{'label': 'POSITIVE', 'score': 0.5}]
+
+        scores = dimension._score_chunks(Mock(side_effect=flaky), ["fine one", "boom", "fine two"])
+
+        assert scores == [0.5, 0.5]
+
+    def test_full_mode_lifts_chunk_cap(self, dimension, pipeline):
+        """Test FULL mode scores every paragraph while other modes cap at 30."""
+        text = "\n\n".join(f"Paragraph {i} has plenty of words in it." for i in range(40))
+
+        with patch('ai_pattern_analyzer.dimensions.sentiment.get_sentiment_pipeline', return_value=pipeline):
+            full = dimension.analyze(text, config=AnalysisConfig(mode=AnalysisMode.FULL))
+            clear_sentiment_cache()
+            default = dimension._analyze_sentiment_variance(text)
+
+        assert full['sentiment']['count'] == 40
+        assert default['count'] == 30
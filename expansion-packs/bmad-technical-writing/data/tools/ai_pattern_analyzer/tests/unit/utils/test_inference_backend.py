@@ -0,0 +1,171 @@
+"""
+Tests for inference_backend utilities.
+
+Tests cover backend validation, int8 dynamic quantization, ONNX Runtime
+sessions (skipped without onnxruntime) and accuracy-drift helpers. Models are
+tiny randomly initialised configs, so no downloads are needed.
+"""
+
+import pytest
+import torch
+from ai_pattern_analyzer.utils.inference_backend import (
+    INFERENCE_BACKENDS,
+    OnnxCausalLM,
+    OnnxTextClassifier,
+    export_onnx_model,
+    quantize_dynamic_int8,
+    rank_drift,
+    score_drift,
+    validate_backend
+)
+
+
+@pytest.fixture
+def tiny_lm():
+    """Randomly initialised GPT-2 with a 64-token context."""
+    from transformers import GPT2Config, GPT2LMHeadModel
+
+    torch.manual_seed(0)
+    config = GPT2Config(vocab_size=200, n_positions=64, n_embd=32, n_layer=2, n_head=2)
+    return GPT2LMHeadModel(config).eval()
+
+
+@pytest.fixture
+def word_tokenizer():
+    """Word-level fast tokenizer with a small fixed vocabulary."""
+    from tokenizers import Tokenizer, models, pre_tokenizers
+    from transformers import PreTrainedTokenizerFast
+
+    vocab = {'[PAD]': 0, '[UNK]': 1, '[CLS]': 2, '[SEP]': 3}
+    for word in "the cat sat on a mat and was very happy sad today".split():
+        vocab[word] = len(vocab)
+    tokenizer = Tokenizer(models.WordLevel(vocab=vocab, unk_token='[UNK]'))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer, pad_token='[PAD]', unk_token='[UNK]'
+    )
+
+
+class TestValidateBackend:
+    """Tests for backend validation."""
+
+    def test_known_backends(self):
+        """Test eager and int8 need no extra settings."""
+        assert INFERENCE_BACKENDS == ('eager', 'int8', 'onnx')
+        validate_backend('eager')
+        validate_backend('int8')
+        validate_backend('onnx', '/models')
+
+    def test_unknown_backend(self):
+        """Test unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown inference backend"):
+            validate_backend('fp16')
+
+    def test_onnx_requires_model_dir(self):
+        """Test onnx backend requires a model directory."""
+        with pytest.raises(ValueError, match="onnx_model_dir"):
+            validate_backend('onnx')
+
+
+class TestQuantizeDynamicInt8:
+    """Tests for int8 dynamic quantization."""
+
+    def test_conv1d_projections_are_quantized(self, tiny_lm):
+        """Test GPT-2 Conv1D layers are converted and quantized."""
+        quantized = quantize_dynamic_int8(tiny_lm)
+
+        attn = quantized.transformer.h[0].attn.c_attn
+        assert 'quantized.dynamic' in type(attn).__module__
+        assert 'quantized.dynamic' in type(quantized.lm_head).__module__
+
+    def test_logits_close_to_fp32(self, tiny_lm):
+        """Test quantized logits stay close to the fp32 reference."""
+        import copy
+
+        input_ids = torch.randint(0, 200, (1, 40))
+        with torch.no_grad():
+            reference = tiny_lm(input_ids).logits
+            quantized = quantize_dynamic_int8(copy.deepcopy(tiny_lm))(input_ids).logits
+
+        assert (reference - quantized).abs().max() < 0.1
+
+
+class TestOnnxBackend:
+    """Tests for ONNX Runtime sessions (requires onnxruntime)."""
+
+    def test_causal_lm_matches_eager(self, tiny_lm, tmp_path):
+        """Test exported causal LM logits match eager logits with padding."""
+        pytest.importorskip('onnxruntime')
+        export_onnx_model(tiny_lm, None, str(tmp_path))
+        onnx_model = OnnxCausalLM(str(tmp_path))
+
+        input_ids = torch.randint(0, 200, (2, 20))
+        attention_mask = torch.ones_like(input_ids)
+        attention_mask[1, 12:] = 0
+        with torch.no_grad():
+            reference = tiny_lm(input_ids, attention_mask=attention_mask).logits
+
+        logits = onnx_model(input_ids, attention_mask=attention_mask).logits
+        assert torch.allclose(logits[0], reference[0], atol=1e-4)
+        assert torch.allclose(logits[1, :12], reference[1, :12], atol=1e-4)
+        assert onnx_model.config.n_positions == 64
+
+    def test_text_classifier_matches_pipeline_format(self, word_tokenizer, tmp_path):
+        """Test ONNX classifier returns pipeline-style label/score dicts."""
+        pytest.importorskip('onnxruntime')
+        from transformers import DistilBertConfig, DistilBertForSequenceClassification
+
+        torch.manual_seed(0)
+        config = DistilBertConfig(
+            vocab_size=len(word_tokenizer), dim=32, hidden_dim=64, n_layers=2, n_heads=2,
+            id2label={0: 'NEGATIVE', 1: 'POSITIVE'}, label2id={'NEGATIVE': 0, 'POSITIVE': 1}
+        )
+        model = DistilBertForSequenceClassification(config).eval()
+        export_onnx_model(model, word_tokenizer, str(tmp_path))
+
+        classifier = OnnxTextClassifier(str(tmp_path))
+        results = classifier(["the cat sat on a mat", "was very sad today"])
+
+        encoded = word_tokenizer(["the cat sat on a mat", "was very sad today"],
+                                 padding=True, return_tensors='pt')
+        with torch.no_grad():
+            probs = torch.softmax(model(**encoded).logits, dim=-1)
+
+        assert [r['label'] for r in results] == [config.id2label[int(i)] for i in probs.argmax(-1)]
+        assert results[0]['score'] == pytest.approx(float(probs[0].max()), abs=1e-4)
+        assert len(classifier("the cat")) == 1
+
+
+class TestDriftHelpers:
+    """Tests for rank and score drift metrics."""
+
+    def test_rank_drift_identical(self):
+        """Test identical ranks report no drift."""
+        drift = rank_drift([0, 5, 20, 3], [0, 5, 20, 3])
+
+        assert drift['exact_rank_agreement'] == 1.0
+        assert drift['top10_agreement'] == 1.0
+        assert drift['top10_percentage_delta'] == 0.0
+        assert drift['within_tolerance'] is True
+
+    def test_rank_drift_bucket_change(self):
+        """Test a token crossing the top-10 boundary is reported."""
+        drift = rank_drift([0, 9, 20, 3], [0, 10, 20, 4])
+
+        assert drift['exact_rank_agreement'] == 0.5
+        assert drift['top10_agreement'] == 0.75
+        assert drift['top10_percentage_delta'] == 0.25
+        assert drift['within_tolerance'] is False
+
+    def test_rank_drift_empty(self):
+        """Test empty input is never within tolerance."""
+        assert rank_drift([], [])['within_tolerance'] is False
+
+    def test_score_drift(self):
+        """Test sentiment score drift metrics."""
+        drift = score_drift([0.9, -0.8, 0.1], [0.88, -0.79, -0.05])
+
+        assert drift['chunks'] == 3
+        assert drift['label_agreement'] == pytest.approx(2 / 3)
+        assert drift['max_score_delta'] == pytest.approx(0.15)
+        assert drift['within_tolerance'] is False
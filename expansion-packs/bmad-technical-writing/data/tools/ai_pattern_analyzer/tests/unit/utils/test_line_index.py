@@ -0,0 +1,115 @@
+"""
+Tests for line_index utilities.
+
+Tests cover line intervals, offset-to-line mapping, skipped lines, and
+single-scan matching compared with scanning each line.
+"""
+
+import re
+
+import pytest
+from ai_pattern_analyzer.utils.line_index import LineIndex, LineIntervals
+from ai_pattern_analyzer.utils.pattern_matching import AI_VOCABULARY, LexiconMatcher
+
+
+def html_comment_checker(line):
+    return '<!--' in line or '-->' in line
+
+
+LINES = [
+    "# Title with delve",
+    "We delve into robust code.",
+    "<!-- robust metadata -->",
+    "   ## Indented heading",
+    "```python",
+    "x = robust",
+    "```",
+    "A paradigm",
+    "shift and a paradigm shift.",
+    "",
+    "Robust, robust and ROBUST.",
+]
+
+
+class TestLineIntervals:
+    """Tests for LineIntervals."""
+
+    def test_merges_consecutive_lines(self):
+        intervals = LineIntervals([1, 2, 3, 7, 9, 10])
+
+        assert list(intervals) == [(1, 4), (7, 8), (9, 11)]
+        assert list(intervals.indices()) == [1, 2, 3, 7, 9, 10]
+        assert len(intervals) == 3
+
+    @pytest.mark.parametrize('line_idx,inside', [(0, False), (1, True), (3, True), (4, False), (7, True), (11, False)])
+    def test_membership(self, line_idx, inside):
+        assert (line_idx in LineIntervals([1, 2, 3, 7, 9, 10])) is inside
+
+
+class TestLineIndex:
+    """Tests for LineIndex."""
+
+    def test_offsets_to_lines(self):
+        index = LineIndex(LINES)
+
+        for line_idx, line in enumerate(LINES):
+            start = index.line_starts[line_idx]
+            assert index.text[start:index.line_end(line_idx)] == line
+            assert index.line_index(start) == line_idx
+            assert index.line_index(index.line_end(line_idx)) == line_idx
+
+    def test_skipped_line_kinds(self):
+        index = LineIndex(LINES, html_comment_checker)
+
+        assert list(index.comments.indices()) == [2]
+        assert list(index.headings.indices()) == [0, 3]
+        assert list(index.fences.indices()) == [4, 6]
+        assert index.skipped(2) and not index.skipped(0)
+        assert index.skipped(3, headings=True) and index.skipped(6, comments=False, fences=True)
+        assert list(LineIndex(LINES).comments) == []
+
+    @pytest.mark.parametrize('skip', [
+        dict(), dict(headings=True), dict(headings=True, fences=True), dict(comments=False),
+    ])
+    def test_finditer_equals_line_scan(self, skip):
+        index = LineIndex(LINES, html_comment_checker)
+        pattern = re.compile(r'\brobust\b|\bparadigm\s+shift\b', re.IGNORECASE)
+
+        expected = [
+            (line_idx, match.start(), match.group())
+            for line_idx, line in enumerate(LINES) if not index.skipped(line_idx, **skip)
+            for match in pattern.finditer(line)
+        ]
+
+        assert [(i, column, m.group()) for i, column, m in index.finditer(pattern, **skip)] == expected
+        # "paradigm" / "shift" across lines 7-8 matches the joined text only
+        assert 'paradigm\nshift' in [m.group() for m in pattern.finditer(index.text)]
+
+    def test_scan_in_line_then_pattern_order(self):
+        index = LineIndex(LINES, html_comment_checker)
+        matcher = LexiconMatcher({'vocabulary': AI_VOCABULARY})
+
+        expected = [
+            (line_idx, pattern_idx, match.start(), match.group())
+            for line_idx, line in enumerate(LINES) if not index.skipped(line_idx, headings=True, fences=True)
+            for pattern_idx, pattern in enumerate(AI_VOCABULARY)
+            for match in re.finditer(pattern, line, re.IGNORECASE)
+        ]
+
+        assert index.scan(matcher, 'vocabulary', headings=True, fences=True) == expected
+        assert len(expected) >= 5
+
+    def test_of_reuses_index_for_same_lines(self):
+        lines = list(LINES)
+
+        index = LineIndex.of(lines, html_comment_checker)
+
+        assert LineIndex.of(lines, html_comment_checker) is index
+        assert LineIndex.of(lines) is not index
+        assert LineIndex.of(list(LINES), html_comment_checker) is not index
+
+    def test_empty_lines(self):
+        index = LineIndex([])
+
+        assert index.text == ''
+        assert list(index.finditer(r'\w+')) == []
@@ -0,0 +1,96 @@
+"""
+Tests for the shared markdown AST service.
+
+Tests cover content-keyed caching, the LRU bound, release at the end of an
+analysis scope, and one parse per document across the structure dimension.
+"""
+
+import pytest
+from unittest.mock import patch
+from marko import Markdown
+from ai_pattern_analyzer.utils import markdown_service
+
+DOCUMENT = """# Guide
+
+> A quote to start.
+
+- [click here](https://example.com)
+- [the caching guide](https://example.com/cache)
+
+```python
+print("hi")
+```
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_service():
+    """Start every test without cached ASTs."""
+    markdown_service.clear_cache()
+    yield
+    markdown_service.clear_cache()
+
+
+class TestParse:
+    """Tests for parse()."""
+
+    def test_identical_text_parsed_once(self):
+        ast = markdown_service.parse(DOCUMENT)
+
+        assert markdown_service.parse(DOCUMENT) is ast
+        assert markdown_service.parse(DOCUMENT + "\nMore.") is not ast
+
+    def test_cache_is_bounded(self):
+        for n in range(markdown_service.AST_CACHE_SIZE + 5):
+            markdown_service.parse(f"# Document {n}\n")
+
+        assert markdown_service.cached_count() == markdown_service.AST_CACHE_SIZE
+
+
+class TestAnalysisScope:
+    """Tests for analysis_scope()."""
+
+    def test_released_when_analysis_finishes(self):
+        kept = markdown_service.parse("# Parsed before the analysis\n")
+        with markdown_service.analysis_scope():
+            ast = markdown_service.parse(DOCUMENT)
+            assert markdown_service.parse(DOCUMENT) is ast
+
+        assert markdown_service.cached_count() == 1
+        assert markdown_service.parse("# Parsed before the analysis\n") is kept
+
+    def test_nested_scopes_release_at_outermost_exit(self):
+        with markdown_service.analysis_scope():
+            with markdown_service.analysis_scope():
+                ast = markdown_service.parse(DOCUMENT)
+            assert markdown_service.parse(DOCUMENT) is ast
+
+        assert markdown_service.cached_count() == 0
+
+
+class TestSharedAcrossDimensions:
+    """One marko parse per document for the whole analysis."""
+
+    def test_structure_parses_document_once(self):
+        from ai_pattern_analyzer.core.analysis_config import AnalysisConfig, AnalysisMode
+        from ai_pattern_analyzer.core.analyzer import AIPatternAnalyzer
+
+        config = AnalysisConfig(mode=AnalysisMode.FULL, dimension_profile='fast')
+        analyzer = AIPatternAnalyzer(config=config)
+        original = Markdown.parse
+        with patch.object(Markdown, 'parse', autospec=True, side_effect=original) as parse:
+            analyzer.analyze_text(DOCUMENT, config=config)
+            analyzer.analyze_text(DOCUMENT.replace('Guide', 'Manual'), config=config)
+
+        assert parse.call_count == 2
+        assert markdown_service.cached_count() == 0
+
+    def test_no_stale_ast_between_documents(self):
+        from ai_pattern_analyzer.dimensions.structure import StructureDimension
+
+        dimension = StructureDimension()
+        first = dimension._analyze_link_anchor_quality(DOCUMENT, 30)
+        second = dimension._analyze_link_anchor_quality("# No links here\n\nJust prose.\n", 30)
+
+        assert first['total_links'] == 2
+        assert second['total_links'] == 0
@@ -1,7 +1,8 @@
 """
 Tests for pattern_matching utilities.
 
-Tests cover pattern compilation, matching, and AI vocabulary detection.
+Tests cover pattern compilation, matching, AI vocabulary detection, and
+single-scan lexicon matching.
 """
 
 import pytest
@@ -11,7 +12,10 @@ from ai_pattern_analyzer.utils.pattern_matching import (
     AI_VOCABULARY,
     FORMULAIC_TRANSITIONS,
     DOMAIN_TERMS_DEFAULT,
-    AI_VOCAB_REPLACEMENTS
+    AI_VOCAB_REPLACEMENTS,
+    TRANSITION_MARKERS,
+    LexiconMatcher,
+    lexicon_matcher
 )
 
 
@@ -431,6 +435,75 @@ class TestConstants:
         assert len(AI_VOCAB_REPLACEMENTS['delve']) > 0
 
 
+class TestLexiconMatcher:
+    """Tests for LexiconMatcher single-scan matching."""
+
+    TEXT = (
+        "Furthermore, we delve into robust, holistic ecosystems. However, delving "
+        "deeper is moreover crucial; In conclusion, it's a robust-robust tapestry. "
+        "Moreover the API uses Kubernetes and Docker. We, I and we again."
+    )
+
+    @staticmethod
+    def separate_scans(patterns, text):
+        return [[(m.start(), m.end(), m.group()) for m in re.finditer(p, text, re.IGNORECASE)]
+                for p in patterns]
+
+    def test_equals_separate_scans(self):
+        """Test every lexicon's matches equal one finditer per pattern."""
+        lexicons = {
+            'ai_vocabulary': AI_VOCABULARY,
+            'formulaic_transitions': FORMULAIC_TRANSITIONS,
+            'domain_terms': DOMAIN_TERMS_DEFAULT + [r'\bKubernetes\b', r'\bDocker\b'],
+            'transition_markers': TRANSITION_MARKERS,
+        }
+
+        result = LexiconMatcher(lexicons).scan(self.TEXT)
+
+        for name, patterns in lexicons.items():
+            assert result[name] == self.separate_scans(patterns, self.TEXT)
+        assert sum(map(len, result['ai_vocabulary'])) >= 5
+
+    def test_overlapping_and_unprefixed_patterns(self):
+        """Test same-start, overlapping, non-boundary and prefix-less patterns."""
+        patterns = [r'\brobust\b', r'\brob\w*', r'bust', r'(\w)\1', r'\b(I|we)\b', r'robust-robust']
+        text = "robust-robust robbed; We, I and wee balloons"
+
+        result = LexiconMatcher({'lexicon': patterns}).scan(text)
+
+        assert result['lexicon'] == self.separate_scans(patterns, text)
+
+    def test_hits_and_empty_text(self):
+        """Test hits() drops offsets and empty text yields empty lists."""
+        matcher = LexiconMatcher({'markers': TRANSITION_MARKERS})
+
+        assert matcher.hits("However, moreover. HOWEVER") == {'markers': [['However', 'HOWEVER'], ['moreover']]}
+        assert matcher.scan("") == {'markers': [[], []]}
+
+    def test_case_sensitive_flags(self):
+        """Test flags are honoured for prefix scanning."""
+        matcher = LexiconMatcher({'terms': [r'\bAPI\b']}, flags=0)
+
+        assert matcher.hits("api API") == {'terms': [['API']]}
+
+    def test_shared_matcher_cached(self):
+        """Test lexicon_matcher() builds each lexicon set once."""
+        first = lexicon_matcher(transition_markers=tuple(TRANSITION_MARKERS))
+
+        assert lexicon_matcher(transition_markers=tuple(TRANSITION_MARKERS)) is first
+        assert lexicon_matcher(markers=tuple(TRANSITION_MARKERS)) is not first
+
+    def test_pattern_matcher_lexicons(self):
+        """Test PatternMatcher exposes a matcher over its lexicons."""
+        matcher = PatternMatcher(domain_terms=[r'\bPython\b'])
+
+        result = matcher.lexicon_matcher.hits("Python developers leverage Python")
+
+        assert result['domain_terms'] == [['Python', 'Python']]
+        assert ['leverage'] in result['ai_vocabulary']
+        assert set(result) == {'ai_vocabulary', 'formulaic_transitions', 'domain_terms'}
+
+
 class TestIntegration:
     """Integration tests for pattern matching."""
 
@@ -0,0 +1,136 @@
+"""
+Tests for the shared spaCy service.
+
+Tests cover lazy loading with disabled components, nlp.pipe batching,
+content-hash Doc caching and code-block stripping. A blank English pipeline
+with a sentencizer stands in for en_core_web_sm, so no model download is needed.
+"""
+
+import pytest
+import spacy
+from unittest.mock import patch
+from ai_pattern_analyzer.utils import spacy_service
+
+
+@pytest.fixture
+def blank_nlp():
+    """Blank English pipeline with sentence boundaries."""
+    nlp = spacy.blank('en')
+    nlp.add_pipe('sentencizer')
+    return nlp
+
+
+@pytest.fixture(autouse=True)
+def reset_service():
+    """Start every test without a loaded pipeline or cached Docs."""
+    spacy_service.clear_cache(unload_model=True)
+    yield
+    spacy_service.clear_cache(unload_model=True)
+
+
+class TestGetNlp:
+    """Tests for lazy pipeline loading."""
+
+    def test_loaded_once_with_ner_disabled(self, blank_nlp):
+        """Test the model loads on first use only, without NER."""
+        with patch('spacy.load', return_value=blank_nlp) as mock_load:
+            assert spacy_service.get_nlp() is blank_nlp
+            assert spacy_service.get_nlp() is blank_nlp
+
+        mock_load.assert_called_once_with('en_core_web_sm', disable=['ner'])
+
+    def test_not_loaded_on_dimension_import(self):
+        """Test importing the spaCy dimensions does not load the model."""
+        import importlib
+        import ai_pattern_analyzer.dimensions.syntactic as syntactic
+
+        with patch('spacy.load') as mock_load:
+            importlib.reload(syntactic)
+
+        mock_load.assert_not_called()
+
+
+class TestParseMany:
+    """Tests for batched parsing and Doc caching."""
+
+    def test_parses_in_order(self, blank_nlp):
+        """Test Docs are returned in input order."""
+        with patch('spacy.load', return_value=blank_nlp):
+            docs = spacy_service.parse_many(["First text.", "Second text."])
+
+        assert [doc.text for doc in docs] == ["First text.", "Second text."]
+
+    def test_single_pipe_call_with_settings(self, blank_nlp):
+        """Test uncached texts go through one nlp.pipe call."""
+        with patch('spacy.load', return_value=blank_nlp), \
+                patch.object(blank_nlp, 'pipe', wraps=blank_nlp.pipe) as mock_pipe:
+            spacy_service.parse_many(["a b c", "d e f", "g h i"], batch_size=2, n_process=1)
+
+        mock_pipe.assert_called_once()
+        assert mock_pipe.call_args.kwargs == {'batch_size': 2, 'n_process': 1}
+
+    def test_cached_docs_are_reused(self, blank_nlp):
+        """Test a second parse of the same text reuses the cached Doc."""
+        with patch('spacy.load', return_value=blank_nlp), \
+                patch.object(blank_nlp, 'pipe', wraps=blank_nlp.pipe) as mock_pipe:
+            first = spacy_service.parse("Shared sample text.")
+            second = spacy_service.parse_many(["Shared sample text.", "New text."])
+
+        assert second[0] is first
+        assert mock_pipe.call_count == 2
+        assert mock_pipe.call_args.args[0] == ["New text."]
+
+    def test_duplicate_texts_parsed_once(self, blank_nlp):
+        """Test duplicate texts in one call share a single Doc."""
+        with patch('spacy.load', return_value=blank_nlp):
+            docs = spacy_service.parse_many(["Same.", "Same."])
+
+        assert docs[0] is docs[1]
+
+    def test_cache_is_bounded(self, blank_nlp):
+        """Test the Doc cache evicts least recently used entries."""
+        with patch('spacy.load', return_value=blank_nlp), \
+                patch.object(spacy_service, 'DOC_CACHE_SIZE', 2):
+            first = spacy_service.parse("one")
+            spacy_service.parse("two")
+            spacy_service.parse("three")
+
+            assert spacy_service.parse("one") is not first
+
+    def test_explicit_pipeline_bypasses_cache(self, blank_nlp):
+        """Test an explicit nlp neither loads the shared model nor caches."""
+        with patch('spacy.load') as mock_load:
+            docs = spacy_service.parse_many(["Private text."], nlp=blank_nlp)
+
+        mock_load.assert_not_called()
+        assert docs[0].text == "Private text."
+        assert not spacy_service._doc_cache
+
+
+class TestStripCodeBlocks:
+    """Tests for code-block stripping."""
+
+    def test_removes_fenced_code(self):
+        """Test fenced code blocks are removed."""
+        text = "Before.\n```python\nx = 1\n```\nAfter."
+        assert spacy_service.strip_code_blocks(text) == "Before.\n\nAfter."
+
+
+class TestDimensionSharing:
+    """Tests for Doc reuse across the spaCy dimensions."""
+
+    def test_syntactic_and_lexical_share_doc(self, blank_nlp):
+        """Test both dimensions parse the same sample only once."""
+        from ai_pattern_analyzer.core.analysis_config import AnalysisConfig
+        from ai_pattern_analyzer.dimensions.syntactic import SyntacticDimension
+        from ai_pattern_analyzer.dimensions.advanced_lexical import AdvancedLexicalDimension
+
+        config = AnalysisConfig()
+        text = "The report was written by the team. It explains the results clearly.\n"
+        with patch('spacy.load', return_value=blank_nlp), \
+                patch.object(blank_nlp, 'pipe', wraps=blank_nlp.pipe) as mock_pipe:
+            syntactic_docs = SyntacticDimension._parse_samples([text], config)
+            lexical_docs = AdvancedLexicalDimension._parse_samples([text], config)
+
+        assert syntactic_docs[0] is lexical_docs[0]
+        assert mock_pipe.call_count == 1
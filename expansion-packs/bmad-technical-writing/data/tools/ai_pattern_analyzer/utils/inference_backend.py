@@ -0,0 +1,316 @@
+"""
+CPU inference backends for the transformer-based dimensions.
+
+Predictability (distilgpt2) and sentiment (distilbert SST-2) can run on one of:
+
+- eager: fp32 PyTorch (default, reference accuracy)
+- int8:  torch dynamic int8 quantization of all Linear layers (GPT-2's Conv1D
+         projections are converted to Linear first so they are quantized too)
+- onnx:  ONNX Runtime session loaded from a local exported model directory
+         (requires the optional `onnxruntime` package)
+
+ONNX model directories are laid out per dimension under
+AnalysisConfig.onnx_model_dir, e.g. `<dir>/predictability/model.onnx` and
+`<dir>/sentiment/model.onnx`, each next to its tokenizer and config files.
+export_onnx_model() writes that layout from a loaded transformers model.
+
+Drift helpers (rank_drift, score_drift) compare a backend's output against
+the fp32 reference so quantized/exported models can be validated before use.
+"""
+
+import os
+import warnings
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+# torch is imported inside each function so importing this module (e.g. via the
+# sentiment dimension) stays cheap until a model is actually built or run
+
+
+INFERENCE_BACKENDS = ('eager', 'int8', 'onnx')
+DEFAULT_BACKEND = 'eager'
+
+# ONNX file name inside each per-dimension model directory
+ONNX_MODEL_FILENAME = 'model.onnx'
+
+# Drift tolerances against the fp32 reference
+TOP10_PERCENTAGE_TOLERANCE = 0.02   # absolute change in GLTR top-10 percentage
+SENTIMENT_SCORE_TOLERANCE = 0.05    # absolute change in signed sentiment score
+
+
+def validate_backend(backend: str, onnx_model_dir: Optional[str] = None) -> None:
+    """
+    Validate a backend name and its required settings.
+
+    Raises:
+        ValueError: If backend is unknown, or onnx is selected without a model dir
+    """
+    if backend not in INFERENCE_BACKENDS:
+        raise ValueError(
+            f"Unknown inference backend '{backend}'. "
+            f"Valid backends: {', '.join(INFERENCE_BACKENDS)}"
+        )
+    if backend == 'onnx' and not onnx_model_dir:
+        raise ValueError("The 'onnx' inference backend requires onnx_model_dir")
+
+
+def onnx_model_path(onnx_model_dir: str, dimension_name: str) -> str:
+    """Return the exported model directory for a dimension."""
+    return os.path.join(onnx_model_dir, dimension_name)
+
+
+def quantize_dynamic_int8(model):
+    """
+    Apply torch dynamic int8 quantization to a model's Linear layers.
+
+    GPT-2 style Conv1D projections (weight stored as [in, out]) are first
+    rewritten as equivalent nn.Linear modules, otherwise quantize_dynamic
+    would leave all attention/MLP projections in fp32.
+
+    Args:
+        model: Loaded fp32 transformers model (modified in place)
+
+    Returns:
+        Quantized model in eval mode
+    """
+    import torch
+
+    _convert_conv1d_to_linear(model)
+    model.eval()
+
+    with warnings.catch_warnings():
+        # torch.ao.quantization emits deprecation warnings on newer torch
+        warnings.simplefilter('ignore')
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+def _convert_conv1d_to_linear(model) -> None:
+    """Replace transformers Conv1D modules with equivalent nn.Linear modules."""
+    import torch
+
+    try:
+        from transformers.pytorch_utils import Conv1D
+    except ImportError:
+        return
+
+    for module in list(model.modules()):
+        for name, child in list(module.named_children()):
+            if isinstance(child, Conv1D):
+                in_features, out_features = child.weight.shape
+                linear = torch.nn.Linear(in_features, out_features)
+                with torch.no_grad():
+                    linear.weight.copy_(child.weight.t())
+                    linear.bias.copy_(child.bias)
+                setattr(module, name, linear)
+
+
+def _load_onnx_session(model_dir: str):
+    """Create a CPU ONNX Runtime session for <model_dir>/model.onnx."""
+    try:
+        import onnxruntime
+    except ImportError as e:
+        raise ImportError(
+            "The 'onnx' inference backend requires onnxruntime "
+            "(pip install onnxruntime)"
+        ) from e
+
+    path = os.path.join(model_dir, ONNX_MODEL_FILENAME)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"ONNX model not found: {path}")
+
+    return onnxruntime.InferenceSession(path, providers=['CPUExecutionProvider'])
+
+
+class OnnxCausalLM:
+    """
+    Causal LM backed by an ONNX Runtime session.
+
+    Callable like a transformers model for the subset GLTR needs:
+    model(input_ids, attention_mask=None).logits. The exported graph has no
+    KV-cache inputs, so callers must re-encode context instead of passing
+    past_key_values.
+    """
+
+    supports_kv_cache = False
+
+    def __init__(self, model_dir: str):
+        from transformers import AutoConfig
+
+        self.session = _load_onnx_session(model_dir)
+        self.config = AutoConfig.from_pretrained(model_dir)
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def eval(self):
+        """No-op (parity with torch modules)."""
+        return self
+
+    def __call__(self, input_ids, attention_mask=None, **kwargs):
+        import torch
+
+        if attention_mask is None:
+            attention_mask = torch.ones_like(input_ids)
+
+        feeds = {'input_ids': input_ids.numpy()}
+        if 'attention_mask' in self._input_names:
+            feeds['attention_mask'] = attention_mask.numpy()
+        if 'position_ids' in self._input_names:
+            position_ids = (attention_mask.cumsum(-1) - 1).clamp(min=0)
+            feeds['position_ids'] = position_ids.numpy()
+
+        logits = self.session.run(['logits'], feeds)[0]
+        return SimpleNamespace(logits=torch.from_numpy(logits))
+
+
+class OnnxTextClassifier:
+    """
+    Text-classification pipeline backed by an ONNX Runtime session.
+
+    Returns the same shape as transformers' sentiment-analysis pipeline:
+    a list of {'label': ..., 'score': ...} dicts, one per input text.
+    """
+
+    def __init__(self, model_dir: str, max_length: int = 512):
+        from transformers import AutoConfig, AutoTokenizer
+
+        self.session = _load_onnx_session(model_dir)
+        self.config = AutoConfig.from_pretrained(model_dir)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_length = max_length
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def __call__(
+        self,
+        texts: Union[str, Sequence[str]],
+        batch_size: int = 32,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        if isinstance(texts, str):
+            texts = [texts]
+
+        step = max(1, batch_size)
+        results = []
+        for start in range(0, len(texts), step):
+            results.extend(self._classify(list(texts[start:start + step])))
+        return results
+
+    def _classify(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run one padded batch through the session."""
+        import torch
+
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors='np'
+        )
+        feeds = {name: encoded[name] for name in self._input_names if name in encoded}
+        logits = torch.from_numpy(self.session.run(['logits'], feeds)[0])
+        probs = torch.softmax(logits, dim=-1)
+        scores, labels = probs.max(dim=-1)
+
+        return [
+            {'label': self.config.id2label[int(label)], 'score': float(score)}
+            for label, score in zip(labels, scores)
+        ]
+
+
+def export_onnx_model(model, tokenizer, output_dir: str) -> str:
+    """
+    Export a transformers model (input_ids, attention_mask -> logits) to ONNX.
+
+    Writes model.onnx plus the tokenizer and config into output_dir so the
+    directory can be used as `<onnx_model_dir>/<dimension_name>`.
+
+    Args:
+        model: Loaded causal-LM or sequence-classification model
+        tokenizer: Matching tokenizer (saved alongside the model)
+        output_dir: Destination directory (created if missing)
+
+    Returns:
+        Path to the written model.onnx
+    """
+    import torch
+
+    class _LogitsOnly(torch.nn.Module):
+        def __init__(self, wrapped):
+            super().__init__()
+            self.wrapped = wrapped
+
+        def forward(self, input_ids, attention_mask):
+            return self.wrapped(
+                input_ids=input_ids, attention_mask=attention_mask, use_cache=False
+            ).logits
+
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, ONNX_MODEL_FILENAME)
+
+    wrapper = _LogitsOnly(model).eval()
+    dummy = torch.ones((1, 8), dtype=torch.long)
+    dynamic = {0: 'batch', 1: 'sequence'}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            wrapper,
+            (dummy, torch.ones_like(dummy)),
+            path,
+            input_names=['input_ids', 'attention_mask'],
+            output_names=['logits'],
+            dynamic_axes={'input_ids': dynamic, 'attention_mask': dynamic, 'logits': dynamic}
+        )
+
+    model.config.save_pretrained(output_dir)
+    if tokenizer is not None:
+        tokenizer.save_pretrained(output_dir)
+    return path
+
+
+def rank_drift(reference: List[int], candidate: List[int]) -> Dict[str, Any]:
+    """
+    Compare GLTR ranks from a backend against the fp32 reference.
+
+    Returns:
+        Dict with token count, exact rank agreement, top-10 bucket agreement,
+        absolute top-10 percentage delta and whether it is within tolerance
+    """
+    count = min(len(reference), len(candidate))
+    if count == 0:
+        return {'tokens': 0, 'within_tolerance': False}
+
+    reference, candidate = reference[:count], candidate[:count]
+    ref_top10 = [r < 10 for r in reference]
+    cand_top10 = [r < 10 for r in candidate]
+    delta = abs(sum(ref_top10) - sum(cand_top10)) / count
+
+    return {
+        'tokens': count,
+        'exact_rank_agreement': sum(a == b for a, b in zip(reference, candidate)) / count,
+        'top10_agreement': sum(a == b for a, b in zip(ref_top10, cand_top10)) / count,
+        'top10_percentage_delta': delta,
+        'within_tolerance': delta <= TOP10_PERCENTAGE_TOLERANCE
+    }
+
+
+def score_drift(reference: List[float], candidate: List[float]) -> Dict[str, Any]:
+    """
+    Compare signed sentiment scores from a backend against the fp32 reference.
+
+    Returns:
+        Dict with chunk count, label (sign) agreement, max/mean absolute score
+        delta and whether the max delta is within tolerance
+    """
+    count = min(len(reference), len(candidate))
+    if count == 0:
+        return {'chunks': 0, 'within_tolerance': False}
+
+    deltas = [abs(a - b) for a, b in zip(reference[:count], candidate[:count])]
+
+    return {
+        'chunks': count,
+        'label_agreement': sum((a < 0) == (b < 0) for a, b in zip(reference, candidate)) / count,
+        'max_score_delta': max(deltas),
+        'mean_score_delta': sum(deltas) / count,
+        'within_tolerance': max(deltas) <= SENTIMENT_SCORE_TOLERANCE
+    }
@@ -0,0 +1,177 @@
+"""
+Offset-to-line index for the line-level detailed scanners.
+
+The detailed analyses report findings by line. They used to loop over every
+line, check whether it was an HTML comment, heading or code fence line, and
+run every pattern on it - lines x patterns regex calls. LineIndex joins the
+lines into one text once, so each pattern (or a whole lexicon, through
+LexiconMatcher) scans the document once; a bisect over the line start offsets
+maps every match to its line and column, and the skipped lines are looked up
+in precomputed line intervals.
+
+A match is reported only if it lies within one line, as a per-line scan
+would find it (patterns with \\s can otherwise span a line break).
+
+Usage:
+    >>> index = LineIndex.of(lines, html_comment_checker)
+    >>> for line_idx, column, match in index.finditer(pattern, headings=True, fences=True):
+    ...     line = lines[line_idx]
+"""
+
+import re
+from bisect import bisect_right
+from typing import Callable, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
+
+from ai_pattern_analyzer.utils.pattern_matching import LexiconMatcher
+
+
+class LineIntervals:
+    """Sorted, merged [start, end) intervals of line indices with bisect membership."""
+
+    __slots__ = ('_starts', '_ends')
+
+    def __init__(self, line_indices: Sequence[int] = ()):
+        """
+        Args:
+            line_indices: Line indices in ascending order
+        """
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        for line_idx in line_indices:
+            if self._ends and self._ends[-1] == line_idx:
+                self._ends[-1] = line_idx + 1
+            else:
+                self._starts.append(line_idx)
+                self._ends.append(line_idx + 1)
+
+    def __contains__(self, line_idx: int) -> bool:
+        position = bisect_right(self._starts, line_idx) - 1
+        return position >= 0 and line_idx < self._ends[position]
+
+    def indices(self) -> Iterator[int]:
+        """Every line index in the intervals, ascending."""
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(zip(self._starts, self._ends))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+
+class LineIndex:
+    """
+    Line start offsets and skipped-line intervals of a list of lines.
+
+    Lines are joined with '\\n' into self.text; offsets are in that text.
+    Skipped lines come in three kinds, selected per query as each detailed
+    scanner skips a different set:
+      - comments: lines the html_comment_checker flags (none without a checker)
+      - headings: lines whose stripped text starts with '#'
+      - fences: lines whose stripped text starts with '```'
+    """
+
+    _cached: Optional[Tuple[Sequence[str], Optional[Callable], 'LineIndex']] = None
+
+    def __init__(self, lines: Sequence[str], html_comment_checker: Optional[Callable[[str], bool]] = None):
+        """
+        Build the index.
+
+        Args:
+            lines: Document lines (without line terminators)
+            html_comment_checker: Predicate flagging HTML comment lines (optional)
+        """
+        self.lines = lines
+        self.text = '\n'.join(lines)
+        self.line_starts = [0] * len(lines)
+        offset = 0
+        for line_idx, line in enumerate(lines):
+            self.line_starts[line_idx] = offset
+            offset += len(line) + 1
+
+        self.comments = LineIntervals(
+            [i for i, line in enumerate(lines) if html_comment_checker(line)] if html_comment_checker else ()
+        )
+        self.headings = self._lines_matching(r'^[^\S\n]*#')
+        self.fences = self._lines_matching(r'^[^\S\n]*```')
+
+    @classmethod
+    def of(cls, lines: Sequence[str], html_comment_checker: Optional[Callable[[str], bool]] = None) -> 'LineIndex':
+        """
+        Index of lines, reusing the last one built for the same lines list.
+
+        analyze_file_detailed() passes one lines list to every dimension's
+        detailed analysis, so the index is built once per report.
+        """
+        cached = cls._cached
+        if cached is not None and cached[0] is lines and cached[1] == html_comment_checker:
+            return cached[2]
+        index = cls(lines, html_comment_checker)
+        cls._cached = (lines, html_comment_checker, index)
+        return index
+
+    def _lines_matching(self, pattern: str) -> LineIntervals:
+        """Intervals of the lines where a MULTILINE pattern matches."""
+        lines = []
+        for match in re.finditer(pattern, self.text, re.MULTILINE):
+            line_idx = self.line_index(match.start())
+            if not lines or lines[-1] != line_idx:
+                lines.append(line_idx)
+        return LineIntervals(lines)
+
+    def line_index(self, offset: int) -> int:
+        """0-based line of an offset in self.text."""
+        return bisect_right(self.line_starts, offset) - 1
+
+    def line_end(self, line_idx: int) -> int:
+        """Offset just past the last character of a line."""
+        return self.line_starts[line_idx] + len(self.lines[line_idx])
+
+    def skipped(self, line_idx: int, comments: bool = True, headings: bool = False,
+                fences: bool = False) -> bool:
+        """Whether a line is one of the selected kinds of skipped lines."""
+        return ((comments and line_idx in self.comments)
+                or (headings and line_idx in self.headings)
+                or (fences and line_idx in self.fences))
+
+    def _locate(self, start: int, end: int, skip: Tuple[bool, bool, bool]) -> Optional[Tuple[int, int]]:
+        """(line index, column) of a match within one non-skipped line, else None."""
+        line_idx = self.line_index(start)
+        if end > self.line_end(line_idx) or self.skipped(line_idx, *skip):
+            return None
+        return line_idx, start - self.line_starts[line_idx]
+
+    def finditer(self, pattern: Union[str, Pattern], flags: int = 0, comments: bool = True,
+                 headings: bool = False, fences: bool = False) -> Iterator[Tuple[int, int, 're.Match']]:
+        """
+        Matches of one pattern on the non-skipped lines, in one scan.
+
+        Yields:
+            (line index, column, match) in text order
+        """
+        compiled = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        skip = (comments, headings, fences)
+        for match in compiled.finditer(self.text):
+            located = self._locate(match.start(), match.end(), skip)
+            if located is not None:
+                yield located[0], located[1], match
+
+    def scan(self, matcher: LexiconMatcher, lexicon: str, comments: bool = True, headings: bool = False,
+             fences: bool = False) -> List[Tuple[int, int, int, str]]:
+        """
+        Matches of every pattern of a lexicon on the non-skipped lines, in one scan.
+
+        Returns:
+            (line index, pattern index, column, matched string) sorted as a
+            line-by-line, pattern-by-pattern scan would find them
+        """
+        skip = (comments, headings, fences)
+        located = []
+        for pattern_idx, matches in enumerate(matcher.scan(self.text)[lexicon]):
+            for start, end, matched in matches:
+                position = self._locate(start, end, skip)
+                if position is not None:
+                    located.append((position[0], pattern_idx, position[1], matched))
+        located.sort()
+        return located
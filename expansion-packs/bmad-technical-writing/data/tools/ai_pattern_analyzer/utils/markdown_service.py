@@ -0,0 +1,98 @@
+"""
+Shared marko parsing service for markdown AST analysis.
+
+Dimensions used to keep their own unbounded AST caches under fixed keys
+('blockquote', 'links', ...): one document was parsed up to four times per
+dimension, and a long-lived analyzer returned the previous file's AST for the
+next file. Every AST now comes from parse(), which keeps parsed documents in
+one small LRU keyed by content hash, so a document is parsed once however
+many dimensions (or the scheduler's markdown_ast artifact) ask for it.
+
+An analysis run wraps its dimensions in analysis_scope(); ASTs parsed during
+the run are released when the last active scope exits, so they do not
+outlive the analysis that needed them.
+
+Usage:
+    >>> with markdown_service.analysis_scope():
+    ...     ast = markdown_service.parse(text)  # parsed
+    ...     ast = markdown_service.parse(text)  # cached
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Iterator, Set
+
+from marko import Markdown
+
+# Parsed documents kept for reuse (the document plus a few samples)
+AST_CACHE_SIZE = 8
+
+_parser = None
+_ast_cache: 'OrderedDict[str, Any]' = OrderedDict()
+_lock = threading.Lock()
+_active_scopes = 0
+_scoped_keys: Set[str] = set()
+
+
+def parse(text: str) -> Any:
+    """
+    Parse markdown to a marko Document, reusing the cached AST of identical text.
+
+    Thread-safety:
+        Parsing holds _lock, so concurrent requests for the same text parse
+        it once (marko parsing is pure Python and would hold the GIL anyway).
+    """
+    global _parser
+    key = _content_key(text)
+    with _lock:
+        ast = _ast_cache.get(key)
+        if ast is not None:
+            _ast_cache.move_to_end(key)
+            return ast
+
+        if _parser is None:
+            _parser = Markdown()
+        ast = _parser.parse(text)
+        _ast_cache[key] = ast
+        while len(_ast_cache) > AST_CACHE_SIZE:
+            _ast_cache.popitem(last=False)
+        if _active_scopes:
+            _scoped_keys.add(key)
+        return ast
+
+
+@contextmanager
+def analysis_scope() -> Iterator[None]:
+    """Release ASTs parsed inside the scope once no analysis scope is active."""
+    global _active_scopes
+    with _lock:
+        _active_scopes += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _active_scopes -= 1
+            if _active_scopes == 0:
+                for key in _scoped_keys:
+                    _ast_cache.pop(key, None)
+                _scoped_keys.clear()
+
+
+def cached_count() -> int:
+    """Number of ASTs currently cached."""
+    with _lock:
+        return len(_ast_cache)
+
+
+def clear_cache() -> None:
+    """Drop every cached AST."""
+    with _lock:
+        _ast_cache.clear()
+        _scoped_keys.clear()
+
+
+def _content_key(text: str) -> str:
+    """Content hash used as the AST cache key."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
@@ -2,11 +2,18 @@
 Pattern matching utilities and constants.
 
 This module contains all regex patterns and constants used for detecting
-AI-generated content markers.
+AI-generated content markers, and LexiconMatcher, which finds the matches of
+every pattern of several lexicons in a single scan of the text.
 """
 
 import re
-from typing import List, Optional, Dict
+from functools import lru_cache
+try:  # Python 3.11+
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants
+    import sre_parse
+from typing import List, Optional, Dict, Mapping, Sequence, Tuple
 
 
 # ============================================================================
@@ -56,6 +63,9 @@ DOMAIN_TERMS_DEFAULT = [
     r'\bSIEM\b', r'\bIDS\b', r'\bIPS\b',
 ]
 
+# AI-specific stylometric transition markers (transition_marker dimension)
+TRANSITION_MARKERS = [r'\bhowever\b', r'\bmoreover\b']
+
 # AI vocabulary replacement suggestions
 AI_VOCAB_REPLACEMENTS = {
     'delve': ['explore', 'examine', 'investigate', 'study'],
@@ -113,6 +123,13 @@ class PatternMatcher:
             re.compile(pattern, re.IGNORECASE) for pattern in self.domain_terms
         ]
 
+        # AI vocabulary, transitions and domain terms in one scan
+        self._lexicon_matcher = LexiconMatcher({
+            'ai_vocabulary': AI_VOCABULARY,
+            'formulaic_transitions': FORMULAIC_TRANSITIONS,
+            'domain_terms': self.domain_terms,
+        })
+
         # Formatting patterns
         self._bold_pattern = re.compile(r'\*\*[^*]+\*\*|__[^_]+__')
         self._italic_pattern = re.compile(r'\*[^*]+\*|_[^_]+_')
@@ -146,6 +163,11 @@ class PatternMatcher:
         """Get compiled domain term patterns."""
         return self._domain_patterns
 
+    @property
+    def lexicon_matcher(self) -> 'LexiconMatcher':
+        """Get the single-scan matcher of AI vocabulary, transitions and domain terms."""
+        return self._lexicon_matcher
+
     @property
     def bold_pattern(self) -> re.Pattern:
         """Get bold formatting pattern."""
@@ -185,3 +207,161 @@ class PatternMatcher:
     def contraction_pattern(self) -> re.Pattern:
         """Get contraction pattern."""
         return self._contraction_pattern
+
+
+# ============================================================================
+# SINGLE-SCAN LEXICON MATCHING
+# ============================================================================
+
+# Matches of one pattern: (start, end, matched text), in text order
+Matches = List[Tuple[int, int, str]]
+
+
+def _literal_prefix(pattern: re.Pattern) -> Tuple[bool, str]:
+    """
+    Leading word boundary and literal prefix of a compiled pattern.
+
+    Returns:
+        (starts with \\b, literal characters every match starts with);
+        the prefix is '' when the pattern starts with anything else
+    """
+    ops = list(sre_parse.parse(pattern.pattern, pattern.flags))
+    boundary = bool(ops) and ops[0][0] == sre_constants.AT and ops[0][1] == sre_constants.AT_BOUNDARY
+    prefix = []
+    for op, value in ops[1 if boundary else 0:]:
+        if op != sre_constants.LITERAL:
+            break
+        prefix.append(chr(value))
+    return boundary, ''.join(prefix)
+
+
+def _trie_pattern(prefixes: List[str]) -> str:
+    """Regex matching any of the literal prefixes, branching one character at a time."""
+    tree: Dict[str, dict] = {}
+    for prefix in prefixes:
+        node = tree
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return emit(tree)
+
+
+class LexiconMatcher:
+    """
+    Finds every pattern of several lexicons in one scan of the text.
+
+    Scanning a text once per pattern (re.finditer in a loop) costs one pass
+    per pattern, so it grows with the lexicon. Python's re tries the branches
+    of an alternation one by one, so one combined alternation costs about the
+    same. LexiconMatcher instead builds a character trie of the patterns'
+    literal prefixes ('delv' for \\bdelv(e|es|ing)\\b) and compiles it as
+    one regex. A single finditer then visits only the positions where some
+    prefix occurs, in time independent of the lexicon size. At each of those
+    positions, only the patterns with that prefix are matched.
+
+    Results equal a separate re.finditer(pattern, text, flags) per pattern,
+    including overlapping matches of different patterns. A pattern without a
+    literal prefix (for example \\b(I|we)\\b) gets its own finditer pass.
+
+    Usage:
+        >>> matcher = LexiconMatcher({'vocabulary': AI_VOCABULARY, 'transitions': FORMULAIC_TRANSITIONS})
+        >>> matches = matcher.scan(text)
+        >>> matches['vocabulary'][0]  # matches of AI_VOCABULARY[0]
+        [(120, 125, 'delve'), ...]
+    """
+
+    def __init__(self, lexicons: Mapping[str, Sequence[str]], flags: int = re.IGNORECASE):
+        """
+        Compile the prefix scanners of every lexicon.
+
+        Args:
+            lexicons: Lexicon name -> regex patterns
+            flags: re flags applied to every pattern
+
+        Raises:
+            re.error: If a pattern does not compile
+        """
+        self.lexicons = {name: list(patterns) for name, patterns in lexicons.items()}
+        self.flags = flags
+        # Flat pattern index -> lexicon name
+        self._owners = [name for name, patterns in self.lexicons.items() for _ in patterns]
+        self._patterns = [re.compile(pattern, flags)
+                          for patterns in self.lexicons.values() for pattern in patterns]
+        self._fold = str.lower if flags & re.IGNORECASE else (lambda text: text)
+
+        by_boundary: Dict[bool, Dict[str, List[int]]] = {True: {}, False: {}}
+        self._separate: List[int] = []
+        for pattern_id, pattern in enumerate(self._patterns):
+            boundary, prefix = _literal_prefix(pattern)
+            if prefix:
+                by_boundary[boundary].setdefault(self._fold(prefix), []).append(pattern_id)
+            else:
+                self._separate.append(pattern_id)
+
+        # (prefix scanner, folded prefix -> pattern ids, distinct prefix lengths)
+        self._scanners = []
+        for boundary, by_prefix in by_boundary.items():
+            if by_prefix:
+                trie = _trie_pattern(sorted(by_prefix))
+                scanner = re.compile((r'\b' if boundary else '') + f'(?={trie})', flags)
+                lengths = sorted({len(prefix) for prefix in by_prefix})
+                self._scanners.append((scanner, by_prefix, lengths))
+
+    def scan(self, text: str) -> Dict[str, List[Matches]]:
+        """
+        Find the matches of every pattern in one pass.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Lexicon name -> per-pattern match lists, in lexicon order
+        """
+        found: List[Matches] = [[] for _ in self._patterns]
+        ends = [0] * len(self._patterns)
+        for scanner, by_prefix, lengths in self._scanners:
+            longest = lengths[-1]
+            for candidate in scanner.finditer(text):
+                start = candidate.start()
+                window = self._fold(text[start:start + longest])
+                for length in lengths:
+                    for pattern_id in by_prefix.get(window[:length], ()):
+                        # A pattern's own matches never overlap (finditer semantics)
+                        if start < ends[pattern_id]:
+                            continue
+                        match = self._patterns[pattern_id].match(text, start)
+                        if match is not None:
+                            found[pattern_id].append((start, match.end(), match.group()))
+                            ends[pattern_id] = match.end()
+
+        for pattern_id in self._separate:
+            found[pattern_id] = [(m.start(), m.end(), m.group()) for m in self._patterns[pattern_id].finditer(text)]
+
+        result: Dict[str, List[Matches]] = {name: [] for name in self.lexicons}
+        for name, matches in zip(self._owners, found):
+            result[name].append(matches)
+        return result
+
+    def hits(self, text: str) -> Dict[str, List[List[str]]]:
+        """Matched strings per pattern (as scan(), without offsets)."""
+        return {name: [[matched for _, _, matched in matches] for matches in per_pattern]
+                for name, per_pattern in self.scan(text).items()}
+
+
+@lru_cache(maxsize=32)
+def lexicon_matcher(**lexicons: Tuple[str, ...]) -> LexiconMatcher:
+    """
+    Shared LexiconMatcher for lexicons given as tuples (built once per process).
+
+    Usage:
+        >>> lexicon_matcher(ai_vocabulary=tuple(AI_VOCABULARY)).scan(text)
+    """
+    return LexiconMatcher(lexicons)
@@ -0,0 +1,136 @@
+"""
+Shared spaCy service for the syntactic and advanced lexical dimensions.
+
+One process-wide `en_core_web_sm` pipeline, loaded lazily on first use with
+components no dimension needs (NER) disabled. Importing a dimension no
+longer pays the multi-second model load, and only one copy of the model is
+held in memory.
+
+Texts are parsed through `nlp.pipe` (configurable batch_size / n_process)
+and the resulting Docs are kept in a small LRU keyed by content hash, so
+dimensions that parse the same (code-stripped) sample reuse one Doc instead
+of parsing it twice.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+from ai_pattern_analyzer.core.deadline import check_deadline
+from ai_pattern_analyzer.core.profiler import model_load
+
+SPACY_MODEL = 'en_core_web_sm'
+
+# Pipeline components no dimension uses (syntactic needs tagger/parser/lemmatizer,
+# advanced lexical needs tokens and lexical attributes)
+DISABLED_COMPONENTS = ('ner',)
+
+# Fenced code blocks are never parsed
+CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]*?```')
+
+# Parsed Docs kept for reuse across dimensions (one per sample is enough)
+DOC_CACHE_SIZE = 32
+
+_nlp = None
+_nlp_lock = threading.Lock()
+_doc_cache: 'OrderedDict[str, object]' = OrderedDict()
+_doc_cache_lock = threading.Lock()
+
+
+def get_nlp():
+    """
+    Return the shared spaCy pipeline, loading it on first use.
+
+    Thread-safety:
+        Loading protected by _nlp_lock (double-checked locking pattern).
+    """
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                with model_load():
+                    import spacy
+                    _nlp = spacy.load(SPACY_MODEL, disable=list(DISABLED_COMPONENTS))
+    return _nlp
+
+
+def strip_code_blocks(text: str) -> str:
+    """Remove fenced code blocks (dimensions share Docs for identical cleaned text)."""
+    return CODE_BLOCK_PATTERN.sub('', text)
+
+
+def parse(text: str):
+    """Parse a single text (cached by content hash)."""
+    return parse_many([text])[0]
+
+
+def parse_many(
+    texts: Sequence[str],
+    batch_size: int = 8,
+    n_process: int = 1,
+    nlp=None
+) -> List:
+    """
+    Parse texts with nlp.pipe, reusing cached Docs for texts seen recently.
+
+    Args:
+        texts: Texts to parse
+        batch_size: Texts per nlp.pipe batch
+        n_process: Worker processes for nlp.pipe (1 = in-process)
+        nlp: Pipeline to use (None = shared pipeline from get_nlp())
+
+    Returns:
+        List of spaCy Docs in the same order as texts
+    """
+    shared = nlp is None
+    keys = [_content_key(text) for text in texts]
+    docs: List[Optional[object]] = [None] * len(texts)
+
+    if shared:
+        with _doc_cache_lock:
+            for i, key in enumerate(keys):
+                if key in _doc_cache:
+                    _doc_cache.move_to_end(key)
+                    docs[i] = _doc_cache[key]
+
+    # Parse each distinct uncached text once
+    pending = OrderedDict()
+    for i, text in enumerate(texts):
+        if docs[i] is None:
+            pending.setdefault(keys[i], (text, []))[1].append(i)
+
+    if pending:
+        pipeline = get_nlp() if shared else nlp
+        parsed = pipeline.pipe(
+            [text for text, _ in pending.values()],
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        for (key, (_, indices)), doc in zip(pending.items(), parsed):
+            check_deadline()
+            for i in indices:
+                docs[i] = doc
+            if shared:
+                with _doc_cache_lock:
+                    _doc_cache[key] = doc
+                    while len(_doc_cache) > DOC_CACHE_SIZE:
+                        _doc_cache.popitem(last=False)
+
+    return docs
+
+
+def clear_cache(unload_model: bool = False) -> None:
+    """Drop cached Docs (and optionally the loaded pipeline)."""
+    global _nlp
+    with _doc_cache_lock:
+        _doc_cache.clear()
+    if unload_model:
+        with _nlp_lock:
+            _nlp = None
+
+
+def _content_key(text: str) -> str:
+    """Content hash used as the Doc cache key."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()